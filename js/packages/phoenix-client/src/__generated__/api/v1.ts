@@ -138,7 +138,7 @@ export interface paths {
         };
         get?: never;
         put?: never;
-        /** Upload dataset from JSON, CSV, or PyArrow */
+        /** Upload dataset from JSON, JSONL, CSV, or PyArrow */
         post: operations["uploadDataset"];
         delete?: never;
         options?: never;
@@ -301,6 +301,26 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/v1/experiments/{experiment_id}/runs/batch": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /**
+         * Create runs for an experiment in bulk
+         * @description Creates many runs of an experiment at once. The IDs of the runs are returned in the order of the runs in the request body. Runs that have already been submitted are left as they are and have no ID in the response.
+         */
+        post: operations["createExperimentRuns"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/v1/experiment_evaluations": {
         parameters: {
             query?: never;
@@ -318,6 +338,26 @@ export interface paths {
         patch?: never;
         trace?: never;
     };
+    "/v1/experiment_evaluations/batch": {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        get?: never;
+        put?: never;
+        /**
+         * Create or update evaluations for experiment runs in bulk
+         * @description Creates or updates many evaluations of experiment runs at once. The IDs of the evaluations are returned in the order of the evaluations in the request body.
+         */
+        post: operations["upsertExperimentEvaluations"];
+        delete?: never;
+        options?: never;
+        head?: never;
+        patch?: never;
+        trace?: never;
+    };
     "/v1/projects/{project_identifier}/spans/otlpv1": {
         parameters: {
             query?: never;
@@ -739,6 +779,27 @@ export interface components {
              */
             id: string;
         };
+        /** CreateExperimentRunsRequestBody */
+        CreateExperimentRunsRequestBody: {
+            /**
+             * Data
+             * @description The experiment runs to create
+             */
+            data: components["schemas"]["ExperimentRun"][];
+        };
+        /** CreateExperimentRunsResponseBody */
+        CreateExperimentRunsResponseBody: {
+            /** Data */
+            data: components["schemas"]["CreateExperimentRunsResponseBodyData"][];
+        };
+        /** CreateExperimentRunsResponseBodyData */
+        CreateExperimentRunsResponseBodyData: {
+            /**
+             * Id
+             * @description The ID of the newly created experiment run, or null if the run for the same dataset example and repetition has already been submitted
+             */
+            id: string | null;
+        };
         /** CreateProjectRequestBody */
         CreateProjectRequestBody: {
             /** Name */
@@ -915,6 +976,46 @@ export interface components {
              */
             explanation?: string | null;
         };
+        /** ExperimentRun */
+        ExperimentRun: {
+            /**
+             * Dataset Example Id
+             * @description The ID of the dataset example used in the experiment run
+             */
+            dataset_example_id: string;
+            /**
+             * Output
+             * @description The output of the experiment task
+             */
+            output: unknown;
+            /**
+             * Repetition Number
+             * @description The repetition number of the experiment run
+             */
+            repetition_number: number;
+            /**
+             * Start Time
+             * Format: date-time
+             * @description The start time of the experiment run
+             */
+            start_time: string;
+            /**
+             * End Time
+             * Format: date-time
+             * @description The end time of the experiment run
+             */
+            end_time: string;
+            /**
+             * Trace Id
+             * @description The ID of the corresponding trace (if one exists)
+             */
+            trace_id?: string | null;
+            /**
+             * Error
+             * @description Optional error message if the experiment run encountered an error
+             */
+            error?: string | null;
+        };
         /** ExperimentRunResponse */
         ExperimentRunResponse: {
             /**
@@ -1074,6 +1175,8 @@ export interface components {
         /** ListDatasetExamplesResponseBody */
         ListDatasetExamplesResponseBody: {
             data: components["schemas"]["ListDatasetExamplesData"];
+            /** Next Cursor */
+            next_cursor?: string | null;
         };
         /** ListDatasetVersionsResponseBody */
         ListDatasetVersionsResponseBody: {
@@ -1894,6 +1997,19 @@ export interface components {
              */
             id: string;
         };
+        /** UpsertExperimentEvaluationsRequestBody */
+        UpsertExperimentEvaluationsRequestBody: {
+            /**
+             * Data
+             * @description The experiment evaluations to be upserted
+             */
+            data: components["schemas"]["UpsertExperimentEvaluationRequestBody"][];
+        };
+        /** UpsertExperimentEvaluationsResponseBody */
+        UpsertExperimentEvaluationsResponseBody: {
+            /** Data */
+            data: components["schemas"]["UpsertExperimentEvaluationResponseBodyData"][];
+        };
         /** ValidationError */
         ValidationError: {
             /** Location */
@@ -2448,6 +2564,10 @@ export interface operations {
             query?: {
                 /** @description The ID of the dataset version (if omitted, returns data from the latest version) */
                 version_id?: string | null;
+                /** @description Cursor for pagination */
+                cursor?: string | null;
+                /** @description The max number of examples to return at a time (if omitted, returns all of the examples) */
+                limit?: number | null;
             };
             header?: never;
             path: {
@@ -2971,6 +3091,59 @@ export interface operations {
             };
         };
     };
+    createExperimentRuns: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path: {
+                experiment_id: string;
+            };
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["CreateExperimentRunsRequestBody"];
+            };
+        };
+        responses: {
+            /** @description Experiment runs created successfully */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["CreateExperimentRunsResponseBody"];
+                };
+            };
+            /** @description Forbidden */
+            403: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "text/plain": string;
+                };
+            };
+            /** @description Experiment or dataset example not found */
+            404: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "text/plain": string;
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     upsertExperimentEvaluation: {
         parameters: {
             query?: never;
@@ -3022,6 +3195,57 @@ export interface operations {
             };
         };
     };
+    upsertExperimentEvaluations: {
+        parameters: {
+            query?: never;
+            header?: never;
+            path?: never;
+            cookie?: never;
+        };
+        requestBody: {
+            content: {
+                "application/json": components["schemas"]["UpsertExperimentEvaluationsRequestBody"];
+            };
+        };
+        responses: {
+            /** @description Successful Response */
+            200: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["UpsertExperimentEvaluationsResponseBody"];
+                };
+            };
+            /** @description Forbidden */
+            403: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "text/plain": string;
+                };
+            };
+            /** @description Experiment run not found */
+            404: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "text/plain": string;
+                };
+            };
+            /** @description Validation Error */
+            422: {
+                headers: {
+                    [name: string]: unknown;
+                };
+                content: {
+                    "application/json": components["schemas"]["HTTPValidationError"];
+                };
+            };
+        };
+    };
     spanSearch: {
         parameters: {
             query?: {
@@ -34,6 +34,10 @@ class CreateExperimentRunResponseBodyData(TypedDict):
     id: str
 
 
+class CreateExperimentRunsResponseBodyData(TypedDict):
+    id: Optional[str]
+
+
 class CreateProjectRequestBody(TypedDict):
     name: str
     description: NotRequired[str]
@@ -90,6 +94,16 @@ class ExperimentEvaluationResult(TypedDict):
     explanation: NotRequired[str]
 
 
+class ExperimentRun(TypedDict):
+    dataset_example_id: str
+    output: Any
+    repetition_number: int
+    start_time: str
+    end_time: str
+    trace_id: NotRequired[str]
+    error: NotRequired[str]
+
+
 class ExperimentRunResponse(TypedDict):
     dataset_example_id: str
     output: Any
@@ -135,6 +149,7 @@ class ListDatasetExamplesData(TypedDict):
 
 class ListDatasetExamplesResponseBody(TypedDict):
     data: ListDatasetExamplesData
+    next_cursor: NotRequired[str]
 
 
 class ListDatasetVersionsResponseBody(TypedDict):
@@ -314,6 +329,14 @@ class UpsertExperimentEvaluationResponseBodyData(TypedDict):
     id: str
 
 
+class UpsertExperimentEvaluationsRequestBody(TypedDict):
+    data: Sequence[UpsertExperimentEvaluationRequestBody]
+
+
+class UpsertExperimentEvaluationsResponseBody(TypedDict):
+    data: Sequence[UpsertExperimentEvaluationResponseBodyData]
+
+
 class ValidationError(TypedDict):
     loc: Sequence[Union[str, int]]
     msg: str
@@ -372,6 +395,14 @@ class CreateExperimentRunResponseBody(TypedDict):
     data: CreateExperimentRunResponseBodyData
 
 
+class CreateExperimentRunsRequestBody(TypedDict):
+    data: Sequence[ExperimentRun]
+
+
+class CreateExperimentRunsResponseBody(TypedDict):
+    data: Sequence[CreateExperimentRunsResponseBodyData]
+
+
 class CreateProjectResponseBody(TypedDict):
     data: Project
 
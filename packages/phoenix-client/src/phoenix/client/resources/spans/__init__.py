@@ -1,8 +1,10 @@
+import asyncio
 import base64
 import logging
 from datetime import datetime, timezone, tzinfo
-from io import StringIO
-from typing import TYPE_CHECKING, Iterable, Optional, Sequence, Union, cast
+from io import BufferedReader, RawIOBase, StringIO
+from queue import Queue
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Mapping, Optional, Sequence, Union, cast
 
 import httpx
 
@@ -17,6 +19,7 @@ from phoenix.client.types.spans import (
 logger = logging.getLogger(__name__)
 
 DEFAULT_TIMEOUT_IN_SECONDS = 5
+DEFAULT_SPAN_CHUNK_SIZE = 10_000
 _LOCAL_TIMEZONE = datetime.now(timezone.utc).astimezone().tzinfo
 _MAX_SPAN_IDS_PER_REQUEST = 100
 
@@ -50,6 +53,7 @@ class Spans:
         project_identifier: Optional[str] = None,
         project_name: Optional[str] = None,
         timeout: Optional[int] = DEFAULT_TIMEOUT_IN_SECONDS,
+        chunk_size: Optional[int] = None,
     ) -> "pd.DataFrame":
         """
         Retrieves spans based on the provided filter conditions.
@@ -64,6 +68,10 @@ class Spans:
                 to also specify by the project id.
             project_identifier: Optional project identifier (name or id) to filter by.
             timeout: Optional request timeout in seconds.
+            chunk_size: If provided, the server streams the spans as Arrow record batches of up
+                to this many spans, which are concatenated as they arrive. This bounds the
+                memory used by the server for large queries, and requires pyarrow. See also
+                `iter_spans_dataframes`.
 
         Returns:
             pandas DataFrame
@@ -84,6 +92,8 @@ class Spans:
             "limit": limit,
             "root_spans_only": root_spans_only,
         }
+        if chunk_size is not None:
+            _require_pyarrow()
 
         try:
             import pandas as pd
@@ -105,6 +115,16 @@ class Spans:
                 else:
                     project_name = project_identifier
 
+            if chunk_size is not None:
+                dfs = list(
+                    _iter_span_chunks(
+                        self._client,
+                        {**request_body, "chunk_size": chunk_size},
+                        project_name=project_name,
+                        timeout=timeout,
+                    )
+                )
+                return pd.concat(dfs) if len(dfs) > 1 else dfs[0]
             response = self._client.post(
                 url="v1/spans",
                 headers={"accept": "application/json"},
@@ -134,6 +154,65 @@ class Spans:
                 "Install it with 'pip install pandas'"
             )
 
+    def iter_spans_dataframes(
+        self,
+        *,
+        query: Optional[SpanQuery] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: int = 1000,
+        root_spans_only: Optional[bool] = None,
+        project_identifier: Optional[str] = None,
+        timeout: Optional[int] = DEFAULT_TIMEOUT_IN_SECONDS,
+        chunk_size: int = DEFAULT_SPAN_CHUNK_SIZE,
+    ) -> Iterator["pd.DataFrame"]:
+        """
+        Retrieves spans based on the provided filter conditions, in chunks that are yielded as
+        the server streams them, so that neither the server nor the client needs to hold all
+        of the spans in memory at once.
+
+        Args:
+            query: A SpanQuery object defining the query criteria.
+            start_time: Optional start time for filtering.
+            end_time: Optional end time for filtering.
+            limit: Maximum number of spans to return.
+            root_spans_only: Whether to return only root spans.
+            project_identifier: Optional project identifier (name or id) to filter by.
+            timeout: Optional timeout in seconds for each chunk.
+            chunk_size: Maximum number of spans in each chunk.
+
+        Returns:
+            An iterator of pandas DataFrames. The attribute columns of each DataFrame are
+            those present in its chunk.
+
+        Raises:
+            ImportError: If pandas or pyarrow is not installed
+            TimeoutError: If the request times out.
+        """
+        _require_pyarrow()
+        project_name = project_identifier
+        if project_identifier and _is_node_id(project_identifier, node_type="Project"):
+            project_response = self._client.get(
+                url=f"v1/projects/{project_identifier}",
+                headers={"accept": "application/json"},
+                timeout=timeout,
+            )
+            project_response.raise_for_status()
+            project_name = project_response.json()["data"]["name"]
+        request_body = {
+            "queries": [(query or SpanQuery()).to_dict()],
+            "start_time": _to_iso_format(_normalize_datetime(start_time)),
+            "end_time": _to_iso_format(_normalize_datetime(end_time)),
+            "limit": limit,
+            "root_spans_only": root_spans_only,
+            "chunk_size": chunk_size,
+        }
+        for df in _iter_span_chunks(
+            self._client, request_body, project_name=project_name, timeout=timeout
+        ):
+            if not df.empty:
+                yield df
+
     def get_span_annotations_dataframe(
         self,
         *,
@@ -313,6 +392,7 @@ class AsyncSpans:
         project_name: Optional[str] = None,
         project_identifier: Optional[str] = None,
         timeout: Optional[int] = DEFAULT_TIMEOUT_IN_SECONDS,
+        chunk_size: Optional[int] = None,
     ) -> "pd.DataFrame":
         """
         Retrieves spans based on the provided filter conditions.
@@ -327,6 +407,9 @@ class AsyncSpans:
                 to also specify by the project id.
             project_identifier: Optional project identifier (name or id) to filter by.
             timeout: Optional request timeout in seconds.
+            chunk_size: If provided, the server streams the spans as Arrow record batches of up
+                to this many spans, which bounds the memory used by the server for large
+                queries. Requires pyarrow.
 
         Returns:
             pandas DataFrame
@@ -347,6 +430,8 @@ class AsyncSpans:
             "limit": limit,
             "root_spans_only": root_spans_only,
         }
+        if chunk_size is not None:
+            _require_pyarrow()
 
         try:
             import pandas as pd
@@ -368,6 +453,17 @@ class AsyncSpans:
                 else:
                     project_name = project_identifier
 
+            if chunk_size is not None:
+                async with self._client.stream(
+                    "POST",
+                    url="v1/spans",
+                    headers={"accept": "application/x-pandas-arrow"},
+                    params={"project_name": project_name} if project_name else None,
+                    json={**request_body, "chunk_size": chunk_size},
+                    timeout=timeout,
+                ) as response:
+                    dfs = await _aread_span_chunks(response)
+                return pd.concat(dfs) if len(dfs) > 1 else dfs[0]
             response = await self._client.post(
                 url="v1/spans",
                 headers={"accept": "application/json"},
@@ -606,6 +702,137 @@ def _process_span_dataframe(response: httpx.Response) -> "pd.DataFrame":
         return pd.DataFrame()
 
 
+def _iter_span_chunks(
+    client: httpx.Client,
+    request_body: Mapping[str, Any],
+    *,
+    project_name: Optional[str],
+    timeout: Optional[int],
+) -> Iterator["pd.DataFrame"]:
+    """Streams the chunks of a span query, as they arrive, from a server that supports it."""
+    try:
+        with client.stream(
+            "POST",
+            url="v1/spans",
+            headers={"accept": "application/x-pandas-arrow"},
+            params={"project_name": project_name} if project_name else None,
+            json=request_body,
+            timeout=timeout,
+        ) as response:
+            yield from _read_span_chunks(response, response.iter_bytes())
+    except httpx.TimeoutException as error:
+        raise TimeoutError(_timeout_error_message(timeout)) from error
+
+
+def _read_span_chunks(
+    response: httpx.Response,
+    content: Iterator[bytes],
+) -> Iterator["pd.DataFrame"]:
+    """
+    Reads the chunks of a streamed span query response, each of which is an Arrow IPC stream
+    of its own, since the attribute columns can differ from chunk to chunk.
+    """
+    import pandas as pd
+    import pyarrow as pa  # type: ignore[import-untyped]
+
+    if response.status_code == 404:
+        yield pd.DataFrame()
+        return
+    if response.is_error:
+        response.read()
+        response.raise_for_status()
+    _require_arrow_response(response)
+    source = BufferedReader(_ResponseStream(content))
+    while source.peek(1):
+        with pa.ipc.open_stream(source) as reader:
+            yield reader.read_pandas()
+
+
+async def _aread_span_chunks(response: httpx.Response) -> list["pd.DataFrame"]:
+    """
+    Reads the chunks of a streamed span query response as they arrive. The Arrow reader is
+    blocking, so it runs in a worker thread, fed with the bytes of the response.
+    """
+    import pandas as pd
+
+    if response.status_code == 404:
+        return [pd.DataFrame()]
+    if response.is_error:
+        await response.aread()
+        response.raise_for_status()
+    _require_arrow_response(response)
+    content: "Queue[Optional[bytes]]" = Queue()
+
+    async def feed() -> None:
+        try:
+            async for chunk in response.aiter_bytes():
+                content.put(chunk)
+        finally:
+            content.put(None)
+
+    loop = asyncio.get_running_loop()
+    dfs: list["pd.DataFrame"]
+    dfs, _ = await asyncio.gather(
+        loop.run_in_executor(
+            None, lambda: list(_read_span_chunks(response, iter(content.get, None)))
+        ),
+        feed(),
+    )
+    return dfs
+
+
+def _require_arrow_response(response: httpx.Response) -> None:
+    if "arrow" not in response.headers.get("Content-Type", ""):
+        raise ValueError("The server does not support streaming span queries.")
+
+
+def _require_pyarrow() -> None:
+    try:
+        import pyarrow as pa
+
+        _ = pa  # Prevent unused symbol error
+    except ImportError:
+        raise ImportError(
+            "pyarrow is required to stream spans in chunks. Install it with 'pip install pyarrow'"
+        )
+
+
+class _ResponseStream(RawIOBase):
+    """A readable file over the chunks of bytes of a streaming response."""
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = chunks
+        self._chunk = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._chunk:
+            if (chunk := next(self._chunks, None)) is None:
+                return 0
+            self._chunk = chunk
+        size = min(len(buffer), len(self._chunk))
+        buffer[:size], self._chunk = self._chunk[:size], self._chunk[size:]
+        return size
+
+
+def _timeout_error_message(timeout: Optional[int]) -> str:
+    return (
+        (
+            f"The request timed out after {timeout} seconds. The timeout can be increased "
+            "by passing a larger value to the `timeout` parameter "
+            "and can be disabled altogether by passing `None`."
+        )
+        if timeout is not None
+        else (
+            "The request timed out. The timeout can be adjusted by "
+            "passing a number of seconds to the `timeout` parameter "
+            "and can be disabled altogether by passing `None`."
+        )
+    )
+
+
 def _is_node_id(s: str, node_type: str) -> bool:
     try:
         decoded = base64.b64decode(s, validate=True)
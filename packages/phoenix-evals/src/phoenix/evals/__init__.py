@@ -37,9 +37,11 @@ from .models import (
     AnthropicModel,
     BedrockModel,
     GeminiModel,
+    InMemoryCache,
     LiteLLMModel,
     MistralAIModel,
     OpenAIModel,
+    SQLiteCache,
     VertexAIModel,
 )
 from .retrievals import compute_precisions_at_k
@@ -66,6 +68,8 @@ __all__ = [
     "BedrockModel",
     "LiteLLMModel",
     "MistralAIModel",
+    "InMemoryCache",
+    "SQLiteCache",
     "PromptTemplate",
     "ClassificationTemplate",
     "CODE_READABILITY_PROMPT_RAILS_MAP",
@@ -190,7 +190,8 @@ def llm_classify(
             not be parsed. The output dataframe also includes three additional columns in the
             output dataframe: `exceptions`, `execution_status`, and `execution_seconds` containing
             details about execution errors that may have occurred during the classification as well
-            as the total runtime of each classification (in seconds).
+            as the total runtime of each classification (in seconds). If the model has a response
+            cache, the `cache_hits` and `cache_misses` columns count the lookups in the cache.
     """
     concurrency = concurrency or model.default_concurrency
     # clients need to be reloaded to ensure that async evals work properly
@@ -285,7 +286,7 @@ def llm_classify(
                 processed_data = input_data
 
             prompt = _map_template(_normalize_to_series(processed_data))
-            response = await verbose_model._async_generate(
+            response = await verbose_model._async_cached_generate(
                 prompt, instruction=system_instruction, **model_kwargs
             )
         inference, explanation = _process_response(response)
@@ -303,7 +304,7 @@ def llm_classify(
                 processed_data = input_data
 
             prompt = _map_template(_normalize_to_series(processed_data))
-            response = verbose_model._generate(
+            response = verbose_model._cached_generate(
                 prompt, instruction=system_instruction, **model_kwargs
             )
         inference, explanation = _process_response(response)
@@ -354,6 +355,14 @@ def llm_classify(
             **({"exceptions": [[repr(exc) for exc in excs] for excs in all_exceptions]}),
             **({"execution_status": [status.value for status in classification_statuses]}),
             **({"execution_seconds": [runtime for runtime in execution_times]}),
+            **(
+                {
+                    "cache_hits": [details.cache_hits for details in execution_details],
+                    "cache_misses": [details.cache_misses for details in execution_details],
+                }
+                if model.cache is not None
+                else {}
+            ),
         },
         index=dataframe_index,
     )
@@ -398,20 +407,16 @@ def run_evals(
             as model invocation parameters and details about retries and snapping to
             rails.
 
-        concurrency (Optional[int], default=None): The number of concurrent evals
-            if async submission is possible. If not provided, a recommended default
-            concurrency is set on a per-model basis.
+        concurrency (Optional[int], default=None): The maximum number of concurrent
+            evals per model if async submission is possible. If not provided, a
+            recommended default concurrency is set on a per-model basis. The evals of
+            all the evaluators are scheduled together, and the number of concurrent
+            evals of each model adapts to the rate limit of the model.
 
     Returns:
         List[DataFrame]: A list of dataframes, one for each evaluator, all of
             which have the same number of rows as the input dataframe.
     """
-    # use the minimum default concurrency of all the models
-    if concurrency is None:
-        if len(evaluators) == 0:
-            concurrency = 1
-        else:
-            concurrency = min(evaluator.default_concurrency for evaluator in evaluators)
 
     # use the maximum timeout of all the evaluators
     timeout = max(
@@ -455,6 +460,8 @@ def run_evals(
         exit_on_error=True,
         fallback_return_value=(None, None, None),
         timeout=timeout,
+        model_fn=lambda payload: payload.evaluator._model,
+        group_fn=lambda payload: id(payload.evaluator),
     )
 
     total_records = len(dataframe)
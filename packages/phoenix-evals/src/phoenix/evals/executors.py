@@ -2,16 +2,22 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import math
 import signal
 import threading
 import time
+from collections import defaultdict, deque
 from contextlib import contextmanager
 from enum import Enum
 from typing import (
     Any,
+    AsyncIterator,
     Callable,
     Coroutine,
+    Deque,
+    Dict,
     Generator,
+    Hashable,
     List,
     Optional,
     Protocol,
@@ -23,6 +29,8 @@ from typing import (
 from tqdm.auto import tqdm
 
 from phoenix.evals.exceptions import PhoenixException
+from phoenix.evals.models.cache import CacheStatistics, record_cache_statistics
+from phoenix.evals.models.rate_limiters import AdaptiveTokenBucket
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +54,15 @@ class ExecutionDetails:
         self.exceptions: List[Exception] = []
         self.status = ExecutionStatus.DID_NOT_RUN
         self.execution_seconds: float = 0
+        self.cache_statistics = CacheStatistics()
+
+    @property
+    def cache_hits(self) -> int:
+        return self.cache_statistics.hits
+
+    @property
+    def cache_misses(self) -> int:
+        return self.cache_statistics.misses
 
     def fail(self) -> None:
         self.status = ExecutionStatus.FAILED
@@ -163,7 +180,8 @@ class AsyncExecutor(Executor):
 
             try:
                 task_start_time = time.time()
-                generate_task = asyncio.create_task(self.generate(payload))
+                with record_cache_statistics(execution_details[index].cache_statistics):
+                    generate_task = asyncio.create_task(self.generate(payload))
                 termination_event_watcher = asyncio.create_task(termination_event.wait())
                 done, pending = await asyncio.wait(
                     [generate_task, termination_event_watcher],
@@ -284,6 +302,307 @@ class AsyncExecutor(Executor):
         return asyncio.run(self.execute(inputs))
 
 
+class ConcurrencyWindow:
+    """
+    An adaptive limit on the number of requests in flight to one model.
+
+    A model is saturated when the number of requests in flight is its allowed request rate
+    times its latency (Little's law). The window tracks the latency of completed requests and
+    reads the allowed rate from the `AdaptiveTokenBucket` of the model's rate limiter, so that
+    it shrinks when the bucket backs off after rate limit errors and grows back as the bucket
+    recovers. Until the first request completes, and for models without a token bucket, the
+    window is as large as allowed.
+
+    Args:
+        max_concurrency (int): The largest size of the window.
+
+        throttler (Optional[AdaptiveTokenBucket], optional): The token bucket of the model's
+            rate limiter. Defaults to None.
+
+        headroom (float, optional): The multiple of the saturating number of requests to
+            allow in flight, so that the window keeps up as the allowed rate increases.
+            Defaults to 2.
+
+        latency_smoothing (float, optional): The weight of the latest request in the moving
+            average of latencies. Defaults to 0.2.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        throttler: Optional[AdaptiveTokenBucket] = None,
+        headroom: float = 2,
+        latency_smoothing: float = 0.2,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.throttler = throttler
+        self.headroom = headroom
+        self.latency_smoothing = latency_smoothing
+        self.latency: Optional[float] = None
+        self.in_flight = 0
+
+    @property
+    def size(self) -> int:
+        if self.throttler is None or self.latency is None:
+            return self.max_concurrency
+        saturating = self.headroom * self.throttler.rate * self.latency
+        return max(1, min(self.max_concurrency, math.ceil(saturating)))
+
+    def is_full(self) -> bool:
+        return self.in_flight >= self.size
+
+    def record_latency(self, seconds: float) -> None:
+        if self.latency is None:
+            self.latency = seconds
+        else:
+            self.latency += self.latency_smoothing * (seconds - self.latency)
+
+
+class ModelScheduler(Executor):
+    """
+    Asynchronously executes tasks that call many models, e.g. the (evaluator, row) pairs of
+    several evaluators, with one adaptive concurrency window per model.
+
+    Unlike `AsyncExecutor`, which runs a fixed number of consumers over all the tasks, tasks
+    are queued per model, and each model gets as many requests in flight as its
+    `ConcurrencyWindow` allows, so that every model is kept busy up to its rate limit
+    regardless of how slow or throttled the others are. Tasks are started in input order per
+    model, and retries go to the front of their model's queue.
+
+    Results can be streamed with `stream`, which yields the results of each group (e.g. each
+    evaluator) in input order, or collected with `execute` and `run`.
+
+    Args:
+        generation_fn (Callable[[Any], Coroutine[Any, Any, Any]]): A coroutine function that
+            generates tasks to be executed.
+
+        model_fn (Callable[[Any], Any]): Returns the model called by the task of an input.
+            Models of the same class and name share a concurrency window, which uses the
+            token bucket of the rate limiter of the first such model.
+
+        group_fn (Optional[Callable[[Any], Hashable]], optional): Returns the group of an
+            input, within which `stream` yields results in input order. Defaults to None, i.e.
+            a single group.
+
+        concurrency (Optional[int], optional): The maximum number of requests in flight per
+            model. Defaults to None, i.e. the `default_concurrency` of each model.
+
+        tqdm_bar_format (Optional[str], optional): The format string for the progress bar.
+            Defaults to None.
+
+        max_retries (int, optional): The maximum number of times to retry on exceptions.
+            Defaults to 10.
+
+        exit_on_error (bool, optional): Whether to exit execution on the first encountered error.
+            Defaults to True.
+
+        fallback_return_value (Union[Unset, Any], optional): The fallback return value for tasks
+            that encounter errors. Defaults to _unset.
+
+        termination_signal (signal.Signals, optional): The signal handled to terminate the executor.
+
+        timeout (Optional[int], optional): The number of seconds after which a task is
+            requeued. Defaults to 120.
+    """
+
+    def __init__(
+        self,
+        generation_fn: Callable[[Any], Coroutine[Any, Any, Any]],
+        model_fn: Callable[[Any], Any],
+        group_fn: Optional[Callable[[Any], Hashable]] = None,
+        concurrency: Optional[int] = None,
+        tqdm_bar_format: Optional[str] = None,
+        max_retries: int = 10,
+        exit_on_error: bool = True,
+        fallback_return_value: Union[Unset, Any] = _unset,
+        termination_signal: signal.Signals = signal.SIGINT,
+        timeout: Optional[int] = None,
+    ):
+        self.generate = generation_fn
+        self.model_fn = model_fn
+        self.group_fn = group_fn
+        self.concurrency = concurrency
+        self.fallback_return_value = fallback_return_value
+        self.tqdm_bar_format = tqdm_bar_format
+        self.max_retries = max_retries
+        self.exit_on_error = exit_on_error
+        self.termination_signal = termination_signal
+        self.timeout: int = timeout or 120
+
+    def _window(self, model: Any) -> ConcurrencyWindow:
+        max_concurrency = self.concurrency
+        if max_concurrency is None:
+            max_concurrency = int(getattr(model, "default_concurrency", 3))
+        rate_limiter = getattr(model, "_rate_limiter", None)
+        return ConcurrencyWindow(
+            max_concurrency=max_concurrency,
+            throttler=getattr(rate_limiter, "_throttler", None),
+        )
+
+    async def _dispatch(
+        self,
+        inputs: Sequence[Any],
+        indices: Deque[int],
+        window: ConcurrencyWindow,
+        outputs: List[Any],
+        execution_details: List[ExecutionDetails],
+        on_done: Callable[[int], None],
+        termination_event: asyncio.Event,
+        progress_bar: tqdm[Any],
+    ) -> None:
+        retry_counts: Dict[int, int] = defaultdict(int)
+        tasks: Dict[asyncio.Task[Any], Tuple[int, float]] = {}
+        try:
+            while (indices or tasks) and not termination_event.is_set():
+                while indices and not window.is_full():
+                    index = indices.popleft()
+                    with record_cache_statistics(execution_details[index].cache_statistics):
+                        task = asyncio.create_task(
+                            asyncio.wait_for(self.generate(inputs[index]), self.timeout)
+                        )
+                    tasks[task] = index, time.time()
+                    window.in_flight += 1
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    index, task_start_time = tasks.pop(task)
+                    window.in_flight -= 1
+                    execution_details[index].log_runtime(task_start_time)
+                    exc = task.exception()
+                    if exc is None:
+                        window.record_latency(time.time() - task_start_time)
+                        outputs[index] = task.result()
+                        execution_details[index].complete()
+                        progress_bar.update()
+                        on_done(index)
+                    elif isinstance(exc, asyncio.TimeoutError):
+                        tqdm.write("Worker timeout, requeuing")
+                        # timeouts are requeued without counting as retries
+                        indices.appendleft(index)
+                    else:
+                        assert isinstance(exc, Exception)
+                        execution_details[index].log_exception(exc)
+                        retry_count = retry_counts[index]
+                        is_phoenix_exception = isinstance(exc, PhoenixException)
+                        if retry_count < self.max_retries and not is_phoenix_exception:
+                            tqdm.write(
+                                f"Exception in worker on attempt {retry_count + 1}: "
+                                f"raised {repr(exc)}"
+                            )
+                            tqdm.write("Requeuing...")
+                            retry_counts[index] += 1
+                            indices.appendleft(index)
+                        else:
+                            execution_details[index].fail()
+                            tqdm.write(f"Retries exhausted after {retry_count + 1} attempts: {exc}")
+                            if self.exit_on_error:
+                                termination_event.set()
+                            else:
+                                progress_bar.update()
+                            on_done(index)
+        finally:
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.wait(tasks)
+
+    async def stream(
+        self, inputs: Sequence[Any]
+    ) -> AsyncIterator[Tuple[int, Any, ExecutionDetails]]:
+        """
+        Executes the tasks and yields the index, output and execution details of each input
+        as soon as it and all of the preceding inputs of its group are done. Every input is
+        yielded once, with the fallback return value if it did not run.
+        """
+        termination_event = asyncio.Event()
+
+        def termination_handler(signum: int, frame: Any) -> None:
+            termination_event.set()
+            tqdm.write("Process was interrupted. The return value will be incomplete...")
+
+        original_handler = signal.signal(self.termination_signal, termination_handler)
+        outputs = [self.fallback_return_value] * len(inputs)
+        execution_details = [ExecutionDetails() for _ in range(len(inputs))]
+        progress_bar = tqdm(
+            total=len(inputs),
+            bar_format=self.tqdm_bar_format,
+            disable=self.tqdm_bar_format is None,
+        )
+
+        windows: Dict[Hashable, ConcurrencyWindow] = {}
+        model_queues: Dict[Hashable, Deque[int]] = defaultdict(deque)
+        group_queues: Dict[Hashable, Deque[int]] = defaultdict(deque)
+        group_of: List[Hashable] = []
+        for index, input in enumerate(inputs):
+            model = self.model_fn(input)
+            key = (type(model), getattr(model, "_model_name", id(model)))
+            if key not in windows:
+                windows[key] = self._window(model)
+            model_queues[key].append(index)
+            group = self.group_fn(input) if self.group_fn is not None else None
+            group_queues[group].append(index)
+            group_of.append(group)
+
+        done = [False] * len(inputs)
+        ready: asyncio.Queue[Optional[int]] = asyncio.Queue()
+
+        def on_done(index: int) -> None:
+            done[index] = True
+            group_queue = group_queues[group_of[index]]
+            while group_queue and done[group_queue[0]]:
+                ready.put_nowait(group_queue.popleft())
+
+        async def dispatch_all() -> None:
+            try:
+                await asyncio.gather(
+                    *(
+                        self._dispatch(
+                            inputs,
+                            model_queues[key],
+                            window,
+                            outputs,
+                            execution_details,
+                            on_done,
+                            termination_event,
+                            progress_bar,
+                        )
+                        for key, window in windows.items()
+                    )
+                )
+            finally:
+                # inputs that did not run are yielded last, in order
+                for group_queue in group_queues.values():
+                    while group_queue:
+                        ready.put_nowait(group_queue.popleft())
+                ready.put_nowait(None)
+
+        dispatcher = asyncio.create_task(dispatch_all())
+        try:
+            while (ready_index := await ready.get()) is not None:
+                yield ready_index, outputs[ready_index], execution_details[ready_index]
+            await dispatcher
+        finally:
+            if not dispatcher.done():
+                termination_event.set()
+                dispatcher.cancel()
+                try:
+                    await dispatcher
+                except asyncio.CancelledError:
+                    pass
+            progress_bar.close()
+            signal.signal(self.termination_signal, original_handler)
+
+    async def execute(self, inputs: Sequence[Any]) -> Tuple[List[Any], List[ExecutionDetails]]:
+        outputs = [self.fallback_return_value] * len(inputs)
+        execution_details = [ExecutionDetails() for _ in range(len(inputs))]
+        async for index, output, details in self.stream(inputs):
+            outputs[index] = output
+            execution_details[index] = details
+        return outputs, execution_details
+
+    def run(self, inputs: Sequence[Any]) -> Tuple[List[Any], List[ExecutionDetails]]:
+        return asyncio.run(self.execute(inputs))
+
+
 class SyncExecutor(Executor):
     """
     Synchronous executor for generating outputs from inputs using a given generation function.
@@ -358,7 +677,8 @@ class SyncExecutor(Executor):
                         if self._TERMINATE:
                             return outputs, execution_details
                         try:
-                            result = self.generate(input)
+                            with record_cache_statistics(execution_details[index].cache_statistics):
+                                result = self.generate(input)
                             outputs[index] = result
                             execution_details[index].complete()
                             progress_bar.update()
@@ -387,13 +707,21 @@ def get_executor_on_sync_context(
     sync_fn: Callable[[Any], Any],
     async_fn: Callable[[Any], Coroutine[Any, Any, Any]],
     run_sync: bool = False,
-    concurrency: int = 3,
+    concurrency: Optional[int] = 3,
     tqdm_bar_format: Optional[str] = None,
     max_retries: int = 10,
     exit_on_error: bool = True,
     fallback_return_value: Union[Unset, Any] = _unset,
     timeout: Optional[int] = None,
+    model_fn: Optional[Callable[[Any], Any]] = None,
+    group_fn: Optional[Callable[[Any], Hashable]] = None,
 ) -> Executor:
+    """
+    Returns a `SyncExecutor` if async execution is not possible in the current context, and
+    otherwise an `AsyncExecutor`, or a `ModelScheduler` if `model_fn` is provided, in which
+    case `concurrency` is the maximum concurrency per model, and defaults to the default
+    concurrency of each model if None.
+    """
     if threading.current_thread() is not threading.main_thread():
         # run evals synchronously if not in the main thread
 
@@ -421,7 +749,7 @@ def get_executor_on_sync_context(
 
     if _running_event_loop_exists():
         if getattr(asyncio, "_nest_patched", False):
-            return AsyncExecutor(
+            return _get_async_executor(
                 async_fn,
                 concurrency=concurrency,
                 tqdm_bar_format=tqdm_bar_format,
@@ -429,6 +757,8 @@ def get_executor_on_sync_context(
                 exit_on_error=exit_on_error,
                 fallback_return_value=fallback_return_value,
                 timeout=timeout,
+                model_fn=model_fn,
+                group_fn=group_fn,
             )
         else:
             logger.warning(
@@ -444,8 +774,35 @@ def get_executor_on_sync_context(
                 fallback_return_value=fallback_return_value,
             )
     else:
-        return AsyncExecutor(
+        return _get_async_executor(
+            async_fn,
+            concurrency=concurrency,
+            tqdm_bar_format=tqdm_bar_format,
+            max_retries=max_retries,
+            exit_on_error=exit_on_error,
+            fallback_return_value=fallback_return_value,
+            timeout=timeout,
+            model_fn=model_fn,
+            group_fn=group_fn,
+        )
+
+
+def _get_async_executor(
+    async_fn: Callable[[Any], Coroutine[Any, Any, Any]],
+    concurrency: Optional[int],
+    tqdm_bar_format: Optional[str],
+    max_retries: int,
+    exit_on_error: bool,
+    fallback_return_value: Union[Unset, Any],
+    timeout: Optional[int],
+    model_fn: Optional[Callable[[Any], Any]],
+    group_fn: Optional[Callable[[Any], Hashable]],
+) -> Executor:
+    if model_fn is not None:
+        return ModelScheduler(
             async_fn,
+            model_fn=model_fn,
+            group_fn=group_fn,
             concurrency=concurrency,
             tqdm_bar_format=tqdm_bar_format,
             max_retries=max_retries,
@@ -453,6 +810,15 @@ def get_executor_on_sync_context(
             fallback_return_value=fallback_return_value,
             timeout=timeout,
         )
+    return AsyncExecutor(
+        async_fn,
+        concurrency=concurrency or 3,
+        tqdm_bar_format=tqdm_bar_format,
+        max_retries=max_retries,
+        exit_on_error=exit_on_error,
+        fallback_return_value=fallback_return_value,
+        timeout=timeout,
+    )
 
 
 def _running_event_loop_exists() -> bool:
@@ -96,7 +96,7 @@ def llm_generate(
     ) -> Dict[str, Any]:
         index, prompt = enumerated_prompt
         with set_verbosity(model, verbose) as verbose_model:
-            response = await verbose_model._async_generate(
+            response = await verbose_model._async_cached_generate(
                 prompt,
                 instruction=system_instruction,
             )
@@ -112,7 +112,7 @@ def llm_generate(
     ) -> Dict[str, Any]:
         index, prompt = enumerated_prompt
         with set_verbosity(model, verbose) as verbose_model:
-            response = verbose_model._generate(
+            response = verbose_model._cached_generate(
                 prompt,
                 instruction=system_instruction,
             )
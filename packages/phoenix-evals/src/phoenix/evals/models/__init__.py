@@ -1,6 +1,7 @@
 from .anthropic import AnthropicModel
 from .base import BaseModel, set_verbosity
 from .bedrock import BedrockModel
+from .cache import InMemoryCache, ResponseCache, SQLiteCache
 from .litellm import LiteLLMModel
 from .mistralai import MistralAIModel
 from .openai import OpenAIModel
@@ -17,4 +18,7 @@ __all__ = [
     "GeminiModel",
     "VertexAIModel",
     "MistralAIModel",
+    "ResponseCache",
+    "InMemoryCache",
+    "SQLiteCache",
 ]
@@ -1,11 +1,12 @@
 import logging
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
-from dataclasses import dataclass, field
-from typing import Any, Generator, Optional, Sequence
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Generator, Optional, Sequence
 
 from typing_extensions import TypeVar, Union
 
+from phoenix.evals.models.cache import ResponseCache, cache_key, record_cache_lookup
 from phoenix.evals.models.rate_limiters import RateLimiter
 from phoenix.evals.templates import MultimodalPrompt
 
@@ -43,6 +44,7 @@ class BaseModel(ABC):
     default_concurrency: int = 20
     _verbose: bool = False
     _rate_limiter: RateLimiter = field(default_factory=RateLimiter)
+    cache: Optional[ResponseCache] = field(default=None, repr=False)
 
     def __new__(cls, *args: Any, **kwargs: Any) -> "BaseModel":
         assert not args, (
@@ -82,7 +84,7 @@ class BaseModel(ABC):
                 f"{type(instruction)}."
             )
 
-        return self._generate(prompt=prompt, instruction=instruction, **kwargs)
+        return self._cached_generate(prompt=prompt, instruction=instruction, **kwargs)
 
     def verbose_generation_info(self) -> str:
         # if defined, returns additional model-specific information to display if `generate` is
@@ -97,6 +99,67 @@ class BaseModel(ABC):
     def _generate(self, prompt: Union[str, MultimodalPrompt], **kwargs: Any) -> str:
         raise NotImplementedError
 
+    @property
+    def _cache_invocation_params(self) -> Dict[str, Any]:
+        """
+        The parameters that, along with the model name and the prompt, determine the
+        response, as far as the cache is concerned. They must be JSON values, so that the
+        key is the same across instances and processes. Without explicit invocation
+        parameters, the public fields with JSON values are used, which leaves out clients,
+        sessions and credentials.
+        """
+        if isinstance(params := getattr(self, "invocation_params", None), dict):
+            return params
+        if callable(invocation_parameters := getattr(self, "invocation_parameters", None)):
+            return dict(invocation_parameters())
+        return {
+            f.name: value
+            for f in fields(self)
+            if not f.name.startswith("_")
+            and f.name not in ("default_concurrency", "cache")
+            and _is_json_value(value := getattr(self, f.name))
+        }
+
+    def _cache_key(self, prompt: Union[str, MultimodalPrompt], **kwargs: Any) -> str:
+        return cache_key(
+            f"{type(self).__name__}:{self._model_name}",
+            self._cache_invocation_params,
+            prompt,
+            **kwargs,
+        )
+
+    async def _async_cached_generate(
+        self, prompt: Union[str, MultimodalPrompt], **kwargs: Any
+    ) -> str:
+        """
+        Same as `_async_generate`, but looks up the response in the cache first, if the
+        model has one. Cache hits don't go through the rate limiter.
+        """
+        if self.cache is None:
+            return await self._async_generate(prompt, **kwargs)
+        key = self._cache_key(prompt, **kwargs)
+        response = self.cache.get(key)
+        record_cache_lookup(hit=response is not None)
+        if response is None:
+            response = await self._async_generate(prompt, **kwargs)
+            self.cache.set(key, response)
+        return response
+
+    def _cached_generate(self, prompt: Union[str, MultimodalPrompt], **kwargs: Any) -> str:
+        """
+        Same as `_generate`, but looks up the response in the cache first, if the model
+        has one. Cache hits don't go through the rate limiter.
+        """
+        if self.cache is None:
+            return self._generate(prompt, **kwargs)
+        key = self._cache_key(prompt, **kwargs)
+        response = self.cache.get(key)
+        record_cache_lookup(hit=response is not None)
+        if response is None:
+            response = self._generate(prompt, **kwargs)
+            self.cache.set(key, response)
+        return response
+
     @staticmethod
     def _raise_import_error(
         package_name: str, package_display_name: str = "", package_min_version: str = ""
@@ -112,3 +175,13 @@ class BaseModel(ABC):
         else:
             msg += f"`pip install {package_name}`."
         raise ImportError(msg)
+
+
+def _is_json_value(value: Any) -> bool:
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(_is_json_value(v) for v in value)
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and _is_json_value(v) for k, v in value.items())
+    return False
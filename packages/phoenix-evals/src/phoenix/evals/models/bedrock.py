@@ -85,6 +85,12 @@ class BedrockModel(BaseModel):
     def _model_name(self) -> str:
         return self.model_id
 
+    @property
+    def _cache_invocation_params(self) -> Dict[str, Any]:
+        # the parameters of the Converse request, without the client or the session
+        request = self._create_request_body(MultimodalPrompt.from_string(""))
+        return {key: value for key, value in request.items() if key != "messages"}
+
     def _init_client(self) -> None:
         if not self.client:
             if self.session:
@@ -0,0 +1,272 @@
+"""
+Response caches for LLM calls.
+
+A cache is opt-in and attached to a model, e.g. `OpenAIModel(model="gpt-4o",
+cache=SQLiteCache("evals.db"))`. Responses are keyed by a hash of the model, its
+invocation parameters and the rendered prompt, so that re-running an eval after changing
+something downstream of the LLM, such as the rails or the post-processing of the
+responses, does not send the same prompts to the provider again. Cache hits skip the rate
+limiter, and the number of hits and misses of each evaluated record is available in its
+`ExecutionDetails`.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Generator, Optional, Tuple, Union
+
+from phoenix.evals.templates import MultimodalPrompt
+
+
+class CacheStatistics:
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+
+_cache_statistics: ContextVar[Optional[CacheStatistics]] = ContextVar(
+    "cache_statistics", default=None
+)
+
+
+@contextmanager
+def record_cache_statistics(statistics: CacheStatistics) -> Generator[None, None, None]:
+    """
+    Counts the cache hits and misses of the LLM calls made in the current context, i.e. in
+    the current thread or task and in the tasks it creates, in the given statistics.
+    """
+    token = _cache_statistics.set(statistics)
+    try:
+        yield
+    finally:
+        _cache_statistics.reset(token)
+
+
+def record_cache_lookup(hit: bool) -> None:
+    if (statistics := _cache_statistics.get()) is None:
+        return
+    if hit:
+        statistics.hits += 1
+    else:
+        statistics.misses += 1
+
+
+def cache_key(
+    model_name: str,
+    invocation_params: Dict[str, Any],
+    prompt: Union[str, MultimodalPrompt],
+    **kwargs: Any,
+) -> str:
+    """
+    Returns a key identifying an LLM call by the model, its invocation parameters, the
+    rendered prompt and any other arguments of the call, such as the instruction. The
+    invocation parameters and the arguments must be JSON values, so that the key is stable
+    across processes; a `TypeError` is raised otherwise.
+    """
+    if isinstance(prompt, str):
+        prompt = MultimodalPrompt.from_string(prompt)
+    content = json.dumps(
+        {
+            "model": model_name,
+            "invocation_params": invocation_params,
+            "prompt": [(part.content_type.value, part.content) for part in prompt.parts],
+            "kwargs": {k: v for k, v in kwargs.items() if v is not None},
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+class ResponseCache(ABC):
+    """
+    A store of LLM responses by cache key. Implementations must be thread-safe.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]: ...
+
+    @abstractmethod
+    def set(self, key: str, response: str) -> None: ...
+
+    @abstractmethod
+    def clear(self) -> None: ...
+
+
+class InMemoryCache(ResponseCache):
+    """
+    A least-recently-used cache held in memory.
+
+    Args:
+        max_entries (int, optional): The maximum number of responses to keep. Defaults to
+            10,000.
+
+        max_bytes (int, optional): The maximum total size of the responses to keep, in
+            bytes. Defaults to no limit.
+
+        ttl_seconds (float, optional): How long a response is kept, in seconds. Defaults to
+            no limit.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        max_bytes: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._ttl_seconds = ttl_seconds
+        # key -> (response, size, expiration time)
+        self._entries: "OrderedDict[str, Tuple[str, int, float]]" = OrderedDict()
+        self._num_bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            if (entry := self._entries.get(key)) is None:
+                return None
+            response, _, expires_at = entry
+            if expires_at <= time.time():
+                self._pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def set(self, key: str, response: str) -> None:
+        size = len(response.encode())
+        if self._max_bytes is not None and size > self._max_bytes:
+            return
+        expires_at = time.time() + self._ttl_seconds if self._ttl_seconds else float("inf")
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+            self._entries[key] = (response, size, expires_at)
+            self._num_bytes += size
+            while len(self._entries) > self._max_entries or (
+                self._max_bytes is not None and self._num_bytes > self._max_bytes
+            ):
+                self._pop(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._num_bytes = 0
+
+    def _pop(self, key: str) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._num_bytes -= size
+
+
+class SQLiteCache(ResponseCache):
+    """
+    A least-recently-used cache persisted in a SQLite database, which can be shared by
+    processes.
+
+    Args:
+        path (str or os.PathLike): The path to the database file, which is created if it
+            does not exist.
+
+        max_bytes (int, optional): The approximate maximum total size of the responses to
+            keep, in bytes. Defaults to 1 GiB.
+
+        ttl_seconds (float, optional): How long a response is kept, in seconds. Defaults to
+            no limit.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        max_bytes: int = 2**30,
+        ttl_seconds: Optional[float] = None,
+    ) -> None:
+        self._max_bytes = max_bytes
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            os.fspath(path), check_same_thread=False, isolation_level=None
+        )
+        self._connection.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS ix_responses_accessed_at ON responses (accessed_at);
+            """
+        )
+        # The size is tracked in memory and only recomputed when it exceeds the maximum,
+        # since other processes may be writing to the same database.
+        self._num_bytes = self._total_bytes()
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT response, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            response, expires_at = row
+            if expires_at <= now:
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+            self._connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+        return str(response)
+
+    def set(self, key: str, response: str) -> None:
+        size = len(response.encode())
+        if size > self._max_bytes:
+            return
+        now = time.time()
+        expires_at = now + self._ttl_seconds if self._ttl_seconds else float("inf")
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses (key, response, size, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, response, size, expires_at, now),
+            )
+            self._num_bytes += size
+            if self._num_bytes > self._max_bytes:
+                self._evict(now)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._connection.execute("DELETE FROM responses")
+            self._num_bytes = 0
+
+    def _evict(self, now: float) -> None:
+        self._connection.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+        self._num_bytes = self._total_bytes()
+        if self._num_bytes <= self._max_bytes:
+            return
+        # Evict down to 90% of the maximum so that eviction doesn't run on every insertion.
+        excess = self._num_bytes - int(0.9 * self._max_bytes)
+        self._connection.execute(
+            """
+            DELETE FROM responses WHERE key IN (
+                SELECT key FROM (
+                    SELECT key, size, SUM(size) OVER (ORDER BY accessed_at, key) AS cumulative_size
+                    FROM responses
+                ) WHERE cumulative_size - size < ?
+            )
+            """,
+            (excess,),
+        )
+        self._num_bytes = self._total_bytes()
+
+    def _total_bytes(self) -> int:
+        cursor = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses")
+        return int(cursor.fetchone()[0])
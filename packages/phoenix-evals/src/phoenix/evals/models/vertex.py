@@ -91,6 +91,11 @@ class GeminiModel(BaseModel):
     def _model_name(self) -> str:
         return self.model
 
+    @property
+    def _cache_invocation_params(self) -> Dict[str, Any]:
+        # the credentials don't determine the response
+        return self.generation_config
+
     def reload_client(self) -> None:
         self._init_client()
 
@@ -2,9 +2,11 @@ import asyncio
 import os
 import platform
 import queue
+import random
 import signal
 import threading
 import time
+from collections import Counter
 from unittest.mock import AsyncMock, Mock
 
 import nest_asyncio
@@ -12,10 +14,13 @@ import pytest
 
 from phoenix.evals.executors import (
     AsyncExecutor,
+    ConcurrencyWindow,
     ExecutionStatus,
+    ModelScheduler,
     SyncExecutor,
     get_executor_on_sync_context,
 )
+from phoenix.evals.models.rate_limiters import AdaptiveTokenBucket
 
 # AsyncExecutor tests
 
@@ -211,6 +216,107 @@ async def test_async_executor_retries():
     mock_generate.call_count == 4, "1 initial call + 3 retries"
 
 
+# ModelScheduler tests
+
+
+class FakeModel:
+    def __init__(self, name: str, default_concurrency: int, latency: float = 0.01) -> None:
+        self._model_name = name
+        self.default_concurrency = default_concurrency
+        self.latency = latency
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, payload: int) -> int:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+        finally:
+            self.in_flight -= 1
+        return payload
+
+
+async def test_model_scheduler_executes_with_a_window_per_model():
+    slow = FakeModel("slow", default_concurrency=2, latency=0.05)
+    fast = FakeModel("fast", default_concurrency=5)
+    inputs = [(slow, i) for i in range(10)] + [(fast, i) for i in range(50)]
+
+    async def generate(payload):
+        model, i = payload
+        return await model(i)
+
+    executor = ModelScheduler(generate, model_fn=lambda payload: payload[0], max_retries=0)
+    outputs, statuses = await executor.execute(inputs)
+    assert outputs == [i for _, i in inputs]
+    assert all(status.status == ExecutionStatus.COMPLETED for status in statuses)
+    assert slow.max_in_flight == 2
+    assert fast.max_in_flight == 5
+
+
+async def test_model_scheduler_streams_results_in_order_per_group():
+    models = [FakeModel(name, default_concurrency=4) for name in ("a", "b")]
+
+    async def generate(payload):
+        group, i = payload
+        await asyncio.sleep(random.random() / 100)
+        return await models[i % 2](i)
+
+    inputs = [(group, i) for group in range(3) for i in range(20)]
+    executor = ModelScheduler(
+        generate,
+        model_fn=lambda payload: models[payload[1] % 2],
+        group_fn=lambda payload: payload[0],
+        max_retries=0,
+    )
+    streamed = [(index, output) async for index, output, _ in executor.stream(inputs)]
+    assert sorted(index for index, _ in streamed) == list(range(len(inputs)))
+    for group in range(3):
+        assert [(index, output) for index, output in streamed if inputs[index][0] == group] == [
+            (index, i) for index, (g, i) in enumerate(inputs) if g == group
+        ]
+
+
+async def test_model_scheduler_retries_and_exits_on_error():
+    model = FakeModel("model", default_concurrency=1)
+    attempts = Counter()
+
+    async def generate(payload: int) -> int:
+        attempts[payload] += 1
+        if payload == 1 and attempts[payload] < 3:
+            raise RuntimeError("transient")
+        if payload == 2:
+            raise ValueError("test error")
+        return payload
+
+    executor = ModelScheduler(
+        generate, model_fn=lambda _: model, max_retries=3, fallback_return_value=52
+    )
+    outputs, statuses = await executor.execute([0, 1, 2, 3])
+    assert outputs == [0, 1, 52, 52]
+    assert [status.status for status in statuses] == [
+        ExecutionStatus.COMPLETED,
+        ExecutionStatus.COMPLETED_WITH_RETRIES,
+        ExecutionStatus.FAILED,
+        ExecutionStatus.DID_NOT_RUN,
+    ]
+    assert attempts == {0: 1, 1: 3, 2: 4}
+
+
+def test_concurrency_window_follows_token_bucket_rate():
+    throttler = AdaptiveTokenBucket(initial_per_second_request_rate=10)
+    window = ConcurrencyWindow(max_concurrency=20, throttler=throttler)
+    assert window.size == 20, "the window is fully open until latency is known"
+    window.record_latency(0.5)
+    assert window.size == 10, "twice the requests needed to saturate 10 req/s at 0.5s latency"
+    throttler.rate /= 4
+    assert window.size == 3
+    throttler.rate /= 100
+    assert window.size == 1
+    window.in_flight = 1
+    assert window.is_full()
+
+
 # SyncExecutor tests
 
 
@@ -455,6 +561,17 @@ def test_executor_factory_returns_async_in_sync_context():
     assert isinstance(executor, AsyncExecutor)
 
 
+def test_executor_factory_returns_model_scheduler_in_sync_context_given_model_fn():
+    def sync_fn():
+        pass
+
+    async def async_fn():
+        pass
+
+    executor = get_executor_on_sync_context(sync_fn, async_fn, model_fn=lambda _: None)
+    assert isinstance(executor, ModelScheduler)
+
+
 def test_executor_factory_returns_sync_in_sync_context_if_asked():
     def sync_fn():
         pass
@@ -0,0 +1,166 @@
+from dataclasses import dataclass
+from typing import Any, List, Union
+from unittest import mock
+
+import pandas as pd
+import pytest
+
+from phoenix.evals import llm_classify
+from phoenix.evals.models.base import BaseModel
+from phoenix.evals.models.bedrock import BedrockModel
+from phoenix.evals.models.cache import InMemoryCache, SQLiteCache, cache_key
+from phoenix.evals.models.rate_limiters import RateLimiter
+from phoenix.evals.templates import MultimodalPrompt
+
+
+@dataclass
+class EchoModel(BaseModel):
+    model: str = "echo"
+    temperature: float = 0.0
+
+    def __post_init__(self) -> None:
+        self._rate_limiter = RateLimiter()
+        self.prompts: List[str] = []
+
+    @property
+    def _model_name(self) -> str:
+        return self.model
+
+    def _generate(self, prompt: Union[str, MultimodalPrompt], **kwargs: Any) -> str:
+        @self._rate_limiter.limit
+        def _completion(prompt: str) -> str:
+            self.prompts.append(prompt)
+            return "irrelevant" if "irrelevant" in prompt else "relevant"
+
+        return _completion(str(prompt))
+
+    async def _async_generate(self, prompt: Union[str, MultimodalPrompt], **kwargs: Any) -> str:
+        @self._rate_limiter.alimit
+        async def _completion(prompt: str) -> str:
+            self.prompts.append(prompt)
+            return "irrelevant" if "irrelevant" in prompt else "relevant"
+
+        return await _completion(str(prompt))
+
+
+def test_in_memory_cache_evicts_least_recently_used_entries():
+    cache = InMemoryCache(max_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    assert cache.get("a") == "1"
+    cache.set("c", "3")
+    assert cache.get("b") is None
+    assert cache.get("a") == "1"
+    assert cache.get("c") == "3"
+
+
+def test_in_memory_cache_evicts_entries_beyond_max_bytes():
+    cache = InMemoryCache(max_bytes=10)
+    cache.set("a", "x" * 4)
+    cache.set("b", "x" * 4)
+    cache.set("c", "x" * 4)
+    cache.set("d", "x" * 11)
+    assert cache.get("a") is None
+    assert cache.get("b") == "x" * 4
+    assert cache.get("c") == "x" * 4
+    assert cache.get("d") is None
+
+
+@pytest.mark.parametrize(
+    "make_cache",
+    [
+        pytest.param(lambda _: InMemoryCache(ttl_seconds=10), id="in-memory"),
+        pytest.param(lambda path: SQLiteCache(path / "cache.db", ttl_seconds=10), id="sqlite"),
+    ],
+)
+def test_cache_expires_entries_after_ttl(make_cache, tmp_path):
+    cache = make_cache(tmp_path)
+    with mock.patch("time.time", return_value=1000.0):
+        cache.set("a", "1")
+    with mock.patch("time.time", return_value=1009.0):
+        assert cache.get("a") == "1"
+    with mock.patch("time.time", return_value=1010.0):
+        assert cache.get("a") is None
+
+
+def test_sqlite_cache_persists_and_evicts_least_recently_used_entries(tmp_path):
+    path = tmp_path / "cache.db"
+    cache = SQLiteCache(path, max_bytes=10)
+    with mock.patch("time.time", return_value=1.0):
+        cache.set("a", "x" * 4)
+    with mock.patch("time.time", return_value=2.0):
+        cache.set("b", "x" * 4)
+    with mock.patch("time.time", return_value=3.0):
+        assert cache.get("a") == "x" * 4
+    cache = SQLiteCache(path, max_bytes=10)
+    with mock.patch("time.time", return_value=4.0):
+        assert cache.get("b") == "x" * 4
+        cache.set("c", "x" * 4)
+        assert cache.get("a") is None
+        assert cache.get("b") == "x" * 4
+        assert cache.get("c") == "x" * 4
+
+
+def test_cache_key_depends_on_model_invocation_params_and_prompt():
+    model = EchoModel(cache=InMemoryCache())
+    key = model._cache_key("prompt", instruction=None)
+    assert key == model._cache_key(MultimodalPrompt.from_string("prompt"))
+    assert key != model._cache_key("other prompt")
+    assert key != model._cache_key("prompt", instruction="be concise")
+    assert key != EchoModel(temperature=1.0)._cache_key("prompt")
+    assert key != EchoModel(model="other")._cache_key("prompt")
+
+
+@dataclass
+class EchoModelWithClient(EchoModel):
+    client: Any = None
+
+
+def test_cache_key_is_the_same_for_separately_built_models():
+    # clients, sessions and credentials have a repr that differs between instances
+    assert EchoModelWithClient(client=object())._cache_key("prompt") == EchoModelWithClient(
+        client=object()
+    )._cache_key("prompt")
+    bedrock_key = BedrockModel(client=mock.MagicMock())._cache_key("prompt")
+    assert bedrock_key == BedrockModel(client=mock.MagicMock())._cache_key("prompt")
+    assert bedrock_key != BedrockModel(client=mock.MagicMock(), top_k=5)._cache_key("prompt")
+
+
+def test_cache_key_rejects_values_that_are_not_json():
+    with pytest.raises(TypeError):
+        cache_key("model", {"client": object()}, "prompt")
+
+
+@pytest.mark.parametrize("run_sync", [True, False])
+def test_llm_classify_reuses_cached_responses(run_sync):
+    model = EchoModel(cache=InMemoryCache())
+    dataframe = pd.DataFrame({"input": ["relevant", "irrelevant", "also relevant"]})
+
+    def classify():
+        return llm_classify(
+            dataframe,
+            model,
+            template="{input}",
+            rails=["relevant", "irrelevant"],
+            run_sync=run_sync,
+            progress_bar_format=None,
+        )
+
+    result = classify()
+    assert result["label"].tolist() == ["relevant", "irrelevant", "relevant"]
+    assert result["cache_hits"].tolist() == [0, 0, 0]
+    assert result["cache_misses"].tolist() == [1, 1, 1]
+    assert len(model.prompts) == 3
+    with mock.patch.object(model._rate_limiter, "_throttler") as throttler:
+        result = classify()
+    assert not throttler.mock_calls
+    assert result["label"].tolist() == ["relevant", "irrelevant", "relevant"]
+    assert result["cache_hits"].tolist() == [1, 1, 1]
+    assert result["cache_misses"].tolist() == [0, 0, 0]
+    assert len(model.prompts) == 3
+
+
+def test_model_without_cache_calls_the_provider_every_time():
+    model = EchoModel()
+    assert model("prompt") == model("prompt") == "relevant"
+    assert model.prompts == ["prompt", "prompt"]
@@ -0,0 +1,177 @@
+"""
+Dataset Snapshots Benchmark
+
+Builds a dataset in a SQLite database with many examples and versions, each version
+patching some of the examples, and prints the time taken to read the examples of the
+latest version, of a version halfway through the history, and the first page of the
+examples of the latest version, for each way of finding the revisions of a version:
+
+- group by: the latest revision of each example as of the version, found by grouping all
+  of the revisions of the dataset up to the version (the previous behavior)
+- snapshot: the snapshot ranges of the dataset that contain the version, which are kept by
+  a trigger as revisions are inserted (see `phoenix.db.models.DatasetSnapshotRange`)
+
+Usage:
+    python scripts/perf/dataset_snapshots.py
+    python scripts/perf/dataset_snapshots.py --num-examples 100000 --num-versions 300
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+from collections.abc import Callable
+from time import perf_counter
+from typing import Any, Optional
+
+import sqlean
+from sqlalchemy import Engine, Select, and_, create_engine, func, insert, select
+from sqlalchemy.orm import Session
+
+from phoenix.db import models
+from phoenix.db.helpers import get_dataset_example_revisions
+
+DEFAULT_NUM_EXAMPLES = 20_000
+DEFAULT_NUM_VERSIONS = 100
+DEFAULT_PATCHES_PER_VERSION = 200
+DEFAULT_PAGE_SIZE = 50
+DEFAULT_ITERATIONS = 10
+DATASET_ID = 1
+
+
+def make_dataset(
+    engine: Engine,
+    num_examples: int,
+    num_versions: int,
+    patches_per_version: int,
+) -> None:
+    rng = random.Random(42)
+    with Session(engine) as session, session.begin():
+        session.execute(insert(models.Dataset).values(id=DATASET_ID, name="dataset", metadata_={}))
+        session.execute(
+            insert(models.DatasetVersion),
+            [
+                {"id": version_id, "dataset_id": DATASET_ID, "metadata_": {}}
+                for version_id in range(1, num_versions + 1)
+            ],
+        )
+        session.execute(
+            insert(models.DatasetExample),
+            [
+                {"id": example_id, "dataset_id": DATASET_ID}
+                for example_id in range(1, num_examples + 1)
+            ],
+        )
+        revisions = [
+            {"dataset_example_id": example_id, "dataset_version_id": 1, "revision_kind": "CREATE"}
+            for example_id in range(1, num_examples + 1)
+        ]
+        for version_id in range(2, num_versions + 1):
+            revisions.extend(
+                {
+                    "dataset_example_id": example_id,
+                    "dataset_version_id": version_id,
+                    "revision_kind": "PATCH",
+                }
+                for example_id in rng.sample(range(1, num_examples + 1), patches_per_version)
+            )
+        session.execute(
+            insert(models.DatasetExampleRevision),
+            [
+                {**revision, "input": {"i": 1}, "output": {"o": 1}, "metadata_": {}}
+                for revision in revisions
+            ],
+        )
+
+
+def group_by(version_id: Optional[int]) -> Select[tuple[models.DatasetExampleRevision]]:
+    table = models.DatasetExampleRevision
+    latest = (
+        select(
+            table.dataset_example_id,
+            func.max(table.dataset_version_id).label("dataset_version_id"),
+        )
+        .join(models.DatasetExample)
+        .where(models.DatasetExample.dataset_id == DATASET_ID)
+        .group_by(table.dataset_example_id)
+    )
+    if version_id is not None:
+        latest = latest.where(table.dataset_version_id <= version_id)
+    subq = latest.subquery()
+    return (
+        select(table)
+        .join(
+            subq,
+            and_(
+                table.dataset_example_id == subq.c.dataset_example_id,
+                table.dataset_version_id == subq.c.dataset_version_id,
+            ),
+        )
+        .where(table.revision_kind != "DELETE")
+        .order_by(table.dataset_example_id)
+    )
+
+
+def snapshot(version_id: Optional[int]) -> Select[tuple[models.DatasetExampleRevision]]:
+    return get_dataset_example_revisions(version_id, dataset_id=DATASET_ID).order_by(
+        models.DatasetSnapshotRange.dataset_example_id
+    )
+
+
+def measure(read: Callable[[], Any], iterations: int) -> float:
+    read()  # warm up
+    start = perf_counter()
+    for _ in range(iterations):
+        read()
+    return (perf_counter() - start) / iterations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--num-examples", type=int, default=DEFAULT_NUM_EXAMPLES)
+    parser.add_argument("--num-versions", type=int, default=DEFAULT_NUM_VERSIONS)
+    parser.add_argument("--patches-per-version", type=int, default=DEFAULT_PATCHES_PER_VERSION)
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    args = parser.parse_args()
+
+    print(
+        f"num_examples={args.num_examples} num_versions={args.num_versions} "
+        f"patches_per_version={args.patches_per_version} iterations={args.iterations}"
+    )
+    engine = create_engine("sqlite://", creator=lambda: sqlean.connect(":memory:"))
+    models.Base.metadata.create_all(engine)
+    make_dataset(engine, args.num_examples, args.num_versions, args.patches_per_version)
+
+    def read(stmt: Select[Any]) -> Callable[[], int]:
+        def _read() -> int:
+            with engine.connect() as conn:
+                return len(conn.execute(stmt).all())
+
+        return _read
+
+    for name, version_id, limit in [
+        ("latest version", None, None),
+        ("middle version", args.num_versions // 2, None),
+        ("first page", None, args.page_size),
+    ]:
+        print(f"{name}:")
+        before, after = group_by(version_id), snapshot(version_id)
+        if limit is not None:
+            before, after = before.limit(limit), after.limit(limit)
+        # The revisions are read from the table, but only the lengths of their inputs are
+        # returned, so that decoding them, which takes as long either way, doesn't dominate.
+        columns = (
+            models.DatasetExampleRevision.id,
+            func.length(models.DatasetExampleRevision.input),
+        )
+        before, after = before.with_only_columns(*columns), after.with_only_columns(*columns)
+        assert read(before)() == read(after)()
+        before_time = measure(read(before), args.iterations)
+        print(f"  group by: {before_time * 1e3:10,.1f}ms")
+        after_time = measure(read(after), args.iterations)
+        print(f"  snapshot: {after_time * 1e3:10,.1f}ms  ({before_time / after_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""
+Dataset Streaming Benchmark
+
+Uploads a gzipped CSV file of examples into a dataset and exports the dataset as CSV and
+as JSONL, printing the time taken and the peak memory allocated by Python for each way of
+handling the file:
+
+- buffered: the file is read, decompressed and decoded as a whole, its examples are
+  inserted one at a time, and the export is built in memory from all of the examples
+  (the previous behavior)
+- streaming: the file is parsed one chunk at a time and its examples are inserted in
+  batches, and the export is written one batch of examples at a time, as read from a
+  server-side cursor (see `phoenix.server.api.routers.v1.datasets`)
+
+Peak memory is measured with `tracemalloc` in a separate run, so it doesn't slow down the
+timed run, and it doesn't include the memory allocated by the database itself.
+
+Usage:
+    python scripts/perf/dataset_streaming.py
+    python scripts/perf/dataset_streaming.py --num-examples 500000 --value-size 200
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import csv
+import gzip
+import io
+import os
+import tempfile
+import tracemalloc
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from time import perf_counter
+from typing import Any
+
+import pandas as pd
+from sqlalchemy import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from phoenix.db import models
+from phoenix.db.engines import aio_sqlite_engine
+from phoenix.db.insertion.dataset import (
+    ExampleContent,
+    add_dataset_examples,
+    insert_dataset,
+    insert_dataset_example,
+    insert_dataset_example_revision,
+    insert_dataset_version,
+)
+from phoenix.server.api.routers.v1.datasets import (
+    FileContentEncoding,
+    _get_content_csv,
+    _get_content_jsonl_openai_ft,
+    _get_db_examples,
+    _process_csv,
+    _stream_content,
+    _stream_content_csv,
+)
+from phoenix.server.types import DbSessionFactory
+
+DEFAULT_NUM_EXAMPLES = 100_000
+DEFAULT_VALUE_SIZE = 100
+INPUT_KEYS = frozenset(["question", "context"])
+OUTPUT_KEYS = frozenset(["answer"])
+METADATA_KEYS = frozenset(["source"])
+DATASET_GLOBAL_ID = "RGF0YXNldDox"  # Dataset:1
+
+
+def make_file(path: str, num_examples: int, value_size: int) -> int:
+    """Writes the file and returns its size before compression."""
+    with gzip.open(path, "wt", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["question", "context", "answer", "source"])
+        for i in range(num_examples):
+            writer.writerow([f"question {i}", "x" * value_size, f"answer {i}", f"source {i % 10}"])
+        f.flush()
+        return f.buffer.tell()
+
+
+@asynccontextmanager
+async def fresh_db() -> AsyncIterator[DbSessionFactory]:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        url = make_url(f"sqlite+aiosqlite:///{os.path.join(temp_dir, 'phoenix.db')}")
+        engine = aio_sqlite_engine(url, migrate=False)
+        async with engine.begin() as conn:
+            await conn.run_sync(models.Base.metadata.create_all)
+        sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
+
+        @asynccontextmanager
+        async def db() -> AsyncIterator[Any]:
+            async with sessionmaker.begin() as session:
+                yield session
+
+        try:
+            yield DbSessionFactory(db=db, dialect="sqlite")
+        finally:
+            await engine.dispose()
+
+
+async def upload_buffered(db: DbSessionFactory, path: str) -> None:
+    with open(path, "rb") as f:
+        content = gzip.decompress(f.read())
+    rows = list(csv.DictReader(io.StringIO(content.decode())))
+    async with db() as session:
+        created_at = datetime.now(timezone.utc)
+        dataset_id = await insert_dataset(session, "dataset", created_at=created_at)
+        dataset_version_id = await insert_dataset_version(
+            session, dataset_id, created_at=created_at
+        )
+        for row in rows:
+            example = ExampleContent(
+                input={k: row.get(k) for k in INPUT_KEYS},
+                output={k: row.get(k) for k in OUTPUT_KEYS},
+                metadata={k: row.get(k) for k in METADATA_KEYS},
+            )
+            dataset_example_id = await insert_dataset_example(
+                session, dataset_id, created_at=created_at
+            )
+            await insert_dataset_example_revision(
+                session,
+                dataset_version_id,
+                dataset_example_id,
+                input=example.input,
+                output=example.output,
+                metadata=example.metadata,
+                created_at=created_at,
+            )
+
+
+async def upload_streaming(db: DbSessionFactory, path: str) -> None:
+    with open(path, "rb") as f:
+        examples = _process_csv(f, FileContentEncoding.GZIP, INPUT_KEYS, OUTPUT_KEYS, METADATA_KEYS)
+        async with db() as session:
+            await add_dataset_examples(session, "dataset", examples)
+
+
+async def upload_into_fresh_db(
+    upload: Callable[[DbSessionFactory, str], Awaitable[None]],
+    path: str,
+) -> None:
+    async with fresh_db() as db:
+        await upload(db, path)
+
+
+async def export_buffered(db: DbSessionFactory, get_content: Callable[..., bytes]) -> int:
+    async with db() as session:
+        _, stmt = await _get_db_examples(session=session, id=DATASET_GLOBAL_ID, version_id=None)
+        examples = [r async for r in await session.stream_scalars(stmt)]
+    if get_content is _get_content_csv:
+        records = [
+            {
+                "example_id": ex.dataset_example_id,
+                **{f"input_{k}": v for k, v in ex.input.items()},
+                **{f"output_{k}": v for k, v in ex.output.items()},
+                **{f"metadata_{k}": v for k, v in ex.metadata_.items()},
+            }
+            for ex in examples
+        ]
+        return len(pd.DataFrame.from_records(records).to_csv(index=False).encode())
+    return len(get_content(examples))
+
+
+async def export_streaming(
+    db: DbSessionFactory,
+    stream: Callable[..., AsyncIterator[bytes]],
+    *args: Any,
+) -> int:
+    async with db() as session:
+        _, stmt = await _get_db_examples(session=session, id=DATASET_GLOBAL_ID, version_id=None)
+    return sum([len(chunk) async for chunk in stream(db, stmt, *args)])
+
+
+async def measure(run: Callable[[], Awaitable[Any]]) -> tuple[float, float]:
+    """Returns the time in seconds and the peak traced memory in MB of separate runs."""
+    start = perf_counter()
+    await run()
+    seconds = perf_counter() - start
+    tracemalloc.start()
+    try:
+        await run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return seconds, peak / 2**20
+
+
+async def amain(num_examples: int, value_size: int) -> None:
+    with tempfile.TemporaryDirectory() as temp_dir:
+        path = os.path.join(temp_dir, "examples.csv.gz")
+        file_size = make_file(path, num_examples, value_size)
+        print(
+            f"num_examples={num_examples} value_size={value_size} "
+            f"file_size={file_size / 2**20:.1f}MB ({os.path.getsize(path) / 2**20:.1f}MB gzipped)"
+        )
+        print("upload:")
+        for name, upload in [("buffered", upload_buffered), ("streaming", upload_streaming)]:
+            seconds, peak = await measure(lambda: upload_into_fresh_db(upload, path))
+            print(f"  {name:<10} {seconds:8.2f}s {peak:10.1f}MB peak")
+        async with fresh_db() as db:
+            await upload_streaming(db, path)
+            for fmt, get_content, stream, args in [
+                ("csv", _get_content_csv, _stream_content_csv, ()),
+                (
+                    "jsonl",
+                    _get_content_jsonl_openai_ft,
+                    _stream_content,
+                    (_get_content_jsonl_openai_ft,),
+                ),
+            ]:
+                print(f"export {fmt}:")
+                for name, run in [
+                    ("buffered", lambda: export_buffered(db, get_content)),
+                    ("streaming", lambda: export_streaming(db, stream, *args)),
+                ]:
+                    seconds, peak = await measure(run)
+                    print(f"  {name:<10} {seconds:8.2f}s {peak:10.1f}MB peak")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--num-examples", type=int, default=DEFAULT_NUM_EXAMPLES)
+    parser.add_argument("--value-size", type=int, default=DEFAULT_VALUE_SIZE)
+    args = parser.parse_args()
+    asyncio.run(amain(args.num_examples, args.value_size))
+
+
+if __name__ == "__main__":
+    main()
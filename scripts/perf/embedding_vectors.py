@@ -0,0 +1,130 @@
+"""
+Embedding Vectors Benchmark
+
+Saves inferences with an embedding, loads them back and computes the Euclidean distance
+drift of the embedding over time, as the server does for the GraphQL `driftTimeSeries`
+field of embeddings, printing the memory allocated for the vectors and the time taken:
+
+- objects: the vectors in a column of objects, i.e. one `numpy.ndarray` per row, read
+  from the parquet file of the inferences, which is how they used to be stored
+- matrix: the vectors in a `VectorArray`, i.e. one float32 matrix mapped into memory from
+  the directory of the inferences (see `phoenix.inferences.vectors`), whose pages are
+  cached by the operating system rather than allocated by the process
+
+Usage:
+    python scripts/perf/embedding_vectors.py
+    python scripts/perf/embedding_vectors.py --num-rows 1000000 --embedding-size 1536
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from phoenix.core.model_schema import Column
+from phoenix.inferences.vectors import VectorArray
+from phoenix.metrics.metrics import EuclideanDistance
+from phoenix.metrics.timeseries import timeseries
+
+DEFAULT_NUM_ROWS = 100_000
+DEFAULT_EMBEDDING_SIZE = 512
+DEFAULT_DAYS = 30
+DEFAULT_ITERATIONS = 3
+
+
+def make_data(num_rows: int, embedding_size: int, days: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    t0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    seconds = np.sort(rng.integers(0, days * 24 * 3600, size=num_rows))
+    index = pd.DatetimeIndex(t0 + pd.to_timedelta(seconds, unit="s"))
+    embeddings = list(rng.normal(size=(num_rows, embedding_size)))
+    return pd.DataFrame({"v": embeddings}, index=index)
+
+
+def allocated(load: Callable[[], Any]) -> int:
+    """
+    Bytes allocated by `load` and still held by what it returns, by Python and NumPy
+    as well as by Arrow, whose buffers back the vectors read from parquet files.
+    """
+    arrow_bytes = pa.total_allocated_bytes()
+    tracemalloc.start()
+    try:
+        _ = load()
+        return tracemalloc.get_traced_memory()[0] + pa.total_allocated_bytes() - arrow_bytes
+    finally:
+        tracemalloc.stop()
+
+
+def measure(compute: Callable[[], Any], iterations: int) -> float:
+    compute()  # warm up
+    start = perf_counter()
+    for _ in range(iterations):
+        compute()
+    return (perf_counter() - start) / iterations
+
+
+def drift(df: pd.DataFrame) -> Callable[[], Any]:
+    metric = EuclideanDistance(operand=Column("v"), reference_data=df.iloc[: len(df) // 10])
+    return lambda: df.pipe(
+        timeseries(
+            start_time=df.index[0].floor("h"),
+            end_time=df.index[-1].ceil("h"),
+            evaluation_window=timedelta(hours=72),
+            sampling_interval=timedelta(hours=1),
+        ),
+        metrics=(metric,),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--num-rows", type=int, default=DEFAULT_NUM_ROWS)
+    parser.add_argument("--embedding-size", type=int, default=DEFAULT_EMBEDDING_SIZE)
+    parser.add_argument("--days", type=int, default=DEFAULT_DAYS)
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    args = parser.parse_args()
+
+    print(
+        f"num_rows={args.num_rows} embedding_size={args.embedding_size} "
+        f"days={args.days} iterations={args.iterations}"
+    )
+    df = make_data(args.num_rows, args.embedding_size, args.days)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        parquet_file, vectors_directory = Path(temp_dir) / "data.parquet", Path(temp_dir) / "v"
+        df.to_parquet(parquet_file)
+        VectorArray.from_vectors(df["v"]).save(vectors_directory)
+
+        def load_objects() -> pd.DataFrame:
+            loaded = pd.read_parquet(parquet_file)
+            return loaded.assign(v=loaded["v"].map(np.asarray))
+
+        def load_matrix() -> pd.DataFrame:
+            return pd.DataFrame({"v": VectorArray.load(vectors_directory)}, index=df.index)
+
+        objects_bytes, matrix_bytes = allocated(load_objects), allocated(load_matrix)
+        print("memory:")
+        print(f"  objects: {objects_bytes / 2**20:10,.1f}MiB")
+        print(f"  matrix:  {matrix_bytes / 2**20:10,.1f}MiB  ({objects_bytes / matrix_bytes:.1f}x)")
+        for name, before, after in [
+            ("load", load_objects, load_matrix),
+            ("euclideanDistance", drift(load_objects()), drift(load_matrix())),
+        ]:
+            print(f"{name}:")
+            before_time = measure(before, args.iterations)
+            print(f"  objects: {before_time * 1e3:10,.1f}ms")
+            after_time = measure(after, args.iterations)
+            print(f"  matrix:  {after_time * 1e3:10,.1f}ms  ({before_time / after_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
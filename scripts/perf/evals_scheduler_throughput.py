@@ -0,0 +1,159 @@
+"""
+Evals Scheduler Throughput Benchmark
+
+Runs several evaluators over the same rows against a local fake OpenAI-compatible server,
+which serves two models with different latencies and rate limits, and prints the
+throughput of each way of executing the (evaluator, row) pairs:
+
+- async executor: a fixed number of consumers shared by all models (the previous
+  behavior of `run_evals`)
+- model scheduler: one adaptive concurrency window per model
+
+Usage:
+    python scripts/perf/evals_scheduler_throughput.py
+    python scripts/perf/evals_scheduler_throughput.py --rows 500 --concurrency 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import socket
+import threading
+import time
+from collections import defaultdict, deque
+from typing import Any
+
+import pandas as pd
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from phoenix.evals import LLMEvaluator, OpenAIModel
+from phoenix.evals.executors import AsyncExecutor, ModelScheduler
+from phoenix.evals.templates import ClassificationTemplate
+
+# model name -> (latency in seconds, rate limit in requests per minute)
+MODELS = {
+    "fake-fast": (0.2, 3000),
+    "fake-slow": (1.0, 600),
+}
+EVALUATORS_PER_MODEL = {"fake-fast": 3, "fake-slow": 2}
+
+
+def fake_llm_app() -> Starlette:
+    request_times: dict[str, deque[float]] = defaultdict(deque)
+
+    async def chat_completions(request: Request) -> JSONResponse:
+        body = await request.json()
+        model = body["model"]
+        latency, rate_limit = MODELS[model]
+        now = time.monotonic()
+        times = request_times[model]
+        while times and times[0] < now - 60:
+            times.popleft()
+        if len(times) >= rate_limit:
+            return JSONResponse(
+                {"error": {"message": "Rate limit reached", "type": "requests"}},
+                status_code=429,
+            )
+        times.append(now)
+        await asyncio.sleep(latency)
+        return JSONResponse(
+            {
+                "id": "chatcmpl-fake",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": model,
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": "relevant"},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+            }
+        )
+
+    return Starlette(routes=[Route("/v1/chat/completions", chat_completions, methods=["POST"])])
+
+
+def start_server() -> str:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    server = uvicorn.Server(
+        uvicorn.Config(fake_llm_app(), host="127.0.0.1", port=port, log_level="error")
+    )
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return f"http://127.0.0.1:{port}/v1"
+
+
+def evaluators(base_url: str) -> list[LLMEvaluator]:
+    template = ClassificationTemplate(
+        rails=["relevant", "unrelated"],
+        template="Is {reference} relevant to {query}?",
+    )
+    models = {
+        model: OpenAIModel(
+            model=model,
+            base_url=base_url,
+            api_key="fake",
+            # stay below the rate limit of the fake server, as one would in practice
+            initial_rate_limit=MODELS[model][1] // 60 // 2,
+        )
+        for model in MODELS
+    }
+    return [
+        LLMEvaluator(models[model], template)
+        for model, count in EVALUATORS_PER_MODEL.items()
+        for _ in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+
+    base_url = start_server()
+    dataframe = pd.DataFrame(
+        {"query": [f"query {i}" for i in range(args.rows)], "reference": "reference"}
+    )
+    evaluators_ = evaluators(base_url)
+    payloads = [(evaluator, row) for evaluator in evaluators_ for _, row in dataframe.iterrows()]
+
+    async def generate(payload: tuple[LLMEvaluator, Any]) -> Any:
+        evaluator, row = payload
+        return await evaluator.aevaluate(row, use_function_calling_if_available=False)
+
+    executors = {
+        "async executor": AsyncExecutor(generate, concurrency=args.concurrency, max_retries=0),
+        "model scheduler": ModelScheduler(
+            generate,
+            model_fn=lambda payload: payload[0]._model,
+            group_fn=lambda payload: id(payload[0]),
+            concurrency=args.concurrency,
+            max_retries=0,
+        ),
+    }
+    print(f"  {len(payloads)} evals of {args.rows} rows by {len(EVALUATORS_PER_MODEL)} models")
+    for name, executor in executors.items():
+        for evaluator in evaluators_:
+            # the clients are bound to the event loop of the previous run
+            evaluator.reload_client()
+        start = time.perf_counter()
+        outputs, _ = executor.run(payloads)
+        seconds = time.perf_counter() - start
+        assert all(label == "relevant" for label, *_ in outputs)
+        print(f"  {name:<16} {seconds:8.1f}s {len(payloads) / seconds:8.1f} evals/s")
+
+
+if __name__ == "__main__":
+    main()
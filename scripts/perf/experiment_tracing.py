@@ -0,0 +1,146 @@
+"""
+Experiment Tracing Benchmark
+
+Runs tasks that each produce a few spans, the way `run_experiment` traces its tasks, with
+their spans exported to a local stand-in collector that takes a while to respond to each
+export, and prints the throughput of the tasks, including the final flush of the spans, at
+several concurrencies for each span processor:
+
+- simple: `SimpleSpanProcessor`, which exports every span as it ends, blocking the event
+  loop, and so every task, for the duration of the export (the previous behavior)
+- batch: `BatchSpanProcessor`, which exports spans in batches from a background thread, as
+  configured by `phoenix.experiments.functions._get_tracer`
+
+Usage:
+    python scripts/perf/experiment_tracing.py
+    python scripts/perf/experiment_tracing.py --tasks 500 --spans-per-task 10 --concurrency 1 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import socket
+import threading
+import time
+from collections.abc import Callable
+from urllib.parse import urljoin
+
+import uvicorn
+from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.trace import Tracer
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+from phoenix.config import get_base_url
+from phoenix.experiments.functions import _get_tracer
+
+DEFAULT_TASKS = 200
+DEFAULT_SPANS_PER_TASK = 5
+DEFAULT_TASK_SECONDS = 0.05
+DEFAULT_EXPORT_SECONDS = 0.01
+DEFAULT_CONCURRENCY = (1, 10, 50)
+
+
+class Collector:
+    def __init__(self, export_seconds: float) -> None:
+        self.export_seconds = export_seconds
+        self.num_spans = 0
+
+    async def export(self, request: Request) -> Response:
+        export_request = ExportTraceServiceRequest.FromString(await request.body())
+        self.num_spans += sum(
+            len(scope_spans.spans)
+            for resource_spans in export_request.resource_spans
+            for scope_spans in resource_spans.scope_spans
+        )
+        await asyncio.sleep(self.export_seconds)
+        return Response()
+
+    def start(self) -> str:
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            port = s.getsockname()[1]
+        app = Starlette(routes=[Route("/v1/traces", self.export, methods=["POST"])])
+        server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="error"))
+        threading.Thread(target=server.run, daemon=True).start()
+        while not server.started:
+            time.sleep(0.01)
+        return f"http://127.0.0.1:{port}"
+
+
+def simple_tracer() -> tuple[Tracer, TracerProvider]:
+    tracer_provider = TracerProvider()
+    tracer_provider.add_span_processor(
+        SimpleSpanProcessor(OTLPSpanExporter(endpoint=urljoin(get_base_url(), "v1/traces")))
+    )
+    return tracer_provider.get_tracer(__name__), tracer_provider
+
+
+def batch_tracer() -> tuple[Tracer, TracerProvider]:
+    tracer, _, tracer_provider = _get_tracer("benchmark")
+    return tracer, tracer_provider
+
+
+def tasks_per_second(
+    get_tracer: Callable[[], tuple[Tracer, TracerProvider]],
+    num_tasks: int,
+    spans_per_task: int,
+    task_seconds: float,
+    concurrency: int,
+) -> float:
+    tracer, tracer_provider = get_tracer()
+
+    async def task(semaphore: asyncio.Semaphore) -> None:
+        async with semaphore:
+            with tracer.start_as_current_span("Task"):
+                for i in range(spans_per_task - 1):
+                    with tracer.start_as_current_span(f"step {i}"):
+                        await asyncio.sleep(task_seconds / (spans_per_task - 1))
+
+    async def run_tasks() -> None:
+        # a semaphore rather than an executor, whose own overhead would dominate at low
+        # concurrency
+        semaphore = asyncio.Semaphore(concurrency)
+        await asyncio.gather(*(task(semaphore) for _ in range(num_tasks)))
+
+    start = time.perf_counter()
+    asyncio.run(run_tasks())
+    tracer_provider.shutdown()  # flushes the spans
+    return num_tasks / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--tasks", type=int, default=DEFAULT_TASKS)
+    parser.add_argument("--spans-per-task", type=int, default=DEFAULT_SPANS_PER_TASK)
+    parser.add_argument("--task-seconds", type=float, default=DEFAULT_TASK_SECONDS)
+    parser.add_argument("--export-seconds", type=float, default=DEFAULT_EXPORT_SECONDS)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=DEFAULT_CONCURRENCY)
+    args = parser.parse_args()
+
+    collector = Collector(args.export_seconds)
+    os.environ["PHOENIX_COLLECTOR_ENDPOINT"] = collector.start()
+    print(
+        f"tasks={args.tasks} spans_per_task={args.spans_per_task} "
+        f"task_seconds={args.task_seconds} export_seconds={args.export_seconds}"
+    )
+    for concurrency in args.concurrency:
+        print(f"concurrency={concurrency}:")
+        for name, get_tracer in [("simple", simple_tracer), ("batch", batch_tracer)]:
+            collector.num_spans = 0
+            throughput = tasks_per_second(
+                get_tracer, args.tasks, args.spans_per_task, args.task_seconds, concurrency
+            )
+            assert collector.num_spans == args.tasks * args.spans_per_task
+            print(f"  {name:<7} {throughput:8.1f} tasks/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""
+Inference Time Series Benchmark
+
+Computes the data quality and drift time series of a primary inference set, as the GraphQL
+`dataQualityTimeSeries` and `driftTimeSeries` fields of dimensions and embeddings do, printing
+the average time per time series:
+
+- groupby: one `pandas.Grouper` per sampling offset, each grouping all rows and computing
+  the metric on each group, which is how `phoenix.metrics.timeseries` used to do it
+- segments: `phoenix.metrics.timeseries`, which computes partial sums of the segments
+  between the edges of the evaluation windows in one pass and adds them up per window
+
+Usage:
+    python scripts/perf/inference_timeseries.py
+    python scripts/perf/inference_timeseries.py --num-rows 1000000 --window-hours 168
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable, Iterator
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from itertools import accumulate, repeat
+from time import perf_counter
+from typing import Any, cast
+
+import numpy as np
+import pandas as pd
+
+from phoenix.core.model_schema import Column
+from phoenix.metrics import Metric, multi_calculate
+from phoenix.metrics.binning import QuantileBinning
+from phoenix.metrics.metrics import PSI, Count, EuclideanDistance, Mean, PercentEmpty, Quantile
+from phoenix.metrics.timeseries import row_interval_from_sorted_time_index, timeseries
+
+DEFAULT_NUM_ROWS = 200_000
+DEFAULT_DAYS = 30
+DEFAULT_WINDOW_HOURS = 168
+DEFAULT_INTERVAL_HOURS = 1
+DEFAULT_EMBEDDING_SIZE = 32
+DEFAULT_ITERATIONS = 3
+
+
+def make_data(num_rows: int, days: int, embedding_size: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Returns primary and reference inferences with a numeric feature, which is 5% missing,
+    and an embedding, sorted by timestamp.
+    """
+    rng = np.random.default_rng(42)
+    t0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    seconds = np.sort(rng.integers(0, days * 24 * 3600, size=num_rows))
+    index = pd.DatetimeIndex(t0 + pd.to_timedelta(seconds, unit="s"))
+    x = rng.normal(size=num_rows)
+    x[rng.random(size=num_rows) < 0.05] = np.nan
+    embeddings = list(rng.normal(size=(num_rows, embedding_size)))
+    primary = pd.DataFrame({"x": x, "v": embeddings}, index=index)
+    return primary, primary.sample(frac=0.1, random_state=0).sort_index()
+
+
+def groupby_timeseries(
+    dataframe: pd.DataFrame,
+    *,
+    metrics: tuple[Metric, ...],
+    start_time: datetime,
+    end_time: datetime,
+    evaluation_window: timedelta,
+    sampling_interval: timedelta,
+) -> pd.DataFrame:
+    """
+    `phoenix.metrics.timeseries` before the segments.
+    """
+
+    def groupers() -> Iterator[tuple[datetime, datetime, pd.Grouper]]:
+        total_time_span = end_time - start_time
+        divisible = evaluation_window % sampling_interval == timedelta()
+        if divisible and evaluation_window < total_time_span:
+            max_offset = evaluation_window
+        else:
+            max_offset = total_time_span
+        for offset in accumulate(repeat(sampling_interval), initial=timedelta()):
+            if offset >= max_offset:
+                return
+            grouper = pd.Grouper(  # type: ignore
+                freq=evaluation_window,
+                origin=end_time,
+                offset=-offset,
+                label="right",
+                sort=False,
+            )
+            time_stop = end_time - offset
+            time_start = (
+                start_time - evaluation_window if divisible else time_stop - evaluation_window
+            )
+            yield time_start, time_stop, grouper
+
+    results = [pd.DataFrame()]
+    for time_start, time_stop, grouper in groupers():
+        row_start, row_stop = row_interval_from_sorted_time_index(
+            cast(pd.DatetimeIndex, dataframe.index), time_start, time_stop
+        )
+        res = (
+            dataframe.iloc[row_start:row_stop]
+            .groupby(grouper, group_keys=True)
+            .apply(partial(multi_calculate, calcs=metrics))
+        )
+        results.append(res.loc[slice(start_time, end_time), :])
+    return pd.concat(results, verify_integrity=True)
+
+
+def measure(compute: Callable[[], Any], iterations: int) -> float:
+    compute()  # warm up
+    start = perf_counter()
+    for _ in range(iterations):
+        compute()
+    return (perf_counter() - start) / iterations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--num-rows", type=int, default=DEFAULT_NUM_ROWS)
+    parser.add_argument("--days", type=int, default=DEFAULT_DAYS)
+    parser.add_argument("--window-hours", type=int, default=DEFAULT_WINDOW_HOURS)
+    parser.add_argument("--interval-hours", type=int, default=DEFAULT_INTERVAL_HOURS)
+    parser.add_argument("--embedding-size", type=int, default=DEFAULT_EMBEDDING_SIZE)
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    args = parser.parse_args()
+
+    print(
+        f"num_rows={args.num_rows} days={args.days} window_hours={args.window_hours} "
+        f"interval_hours={args.interval_hours} embedding_size={args.embedding_size} "
+        f"iterations={args.iterations}"
+    )
+    primary, reference = make_data(args.num_rows, args.days, args.embedding_size)
+    parameters = dict(
+        start_time=primary.index[0].floor("h"),
+        end_time=primary.index[-1].ceil("h"),
+        evaluation_window=timedelta(hours=args.window_hours),
+        sampling_interval=timedelta(hours=args.interval_hours),
+    )
+    x, v = Column("x"), Column("v")
+    for name, metric, columns in [
+        ("count", Count(), ["x"]),
+        ("mean", Mean(operand=x), ["x"]),
+        ("percentEmpty", PercentEmpty(operand=x), ["x"]),
+        ("p50", Quantile(operand=x), ["x"]),
+        (
+            "psi",
+            PSI(
+                operand=x,
+                reference_data=reference,
+                binning_method=QuantileBinning(reference_series=reference["x"]),
+            ),
+            ["x"],
+        ),
+        ("euclideanDistance", EuclideanDistance(operand=v, reference_data=reference), ["v"]),
+    ]:
+        df = primary[columns]
+        print(f"{name}:")
+        before = measure(
+            lambda: groupby_timeseries(df, metrics=(metric,), **parameters), args.iterations
+        )
+        print(f"  groupby:  {before * 1e3:10,.1f}ms per time series")
+        after = measure(
+            lambda: df.pipe(timeseries(**parameters), metrics=(metric,)), args.iterations
+        )
+        print(f"  segments: {after * 1e3:10,.1f}ms per time series  ({before / after:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""
+OTLP Decode Event Loop Stall Benchmark
+
+Decodes a single large ExportTraceServiceRequest (10k spans with sizable
+`llm.input_messages` attributes by default) while a ticker coroutine measures how late
+the event loop wakes it up. Prints the wall time of the decode along with the worst and
+99th-percentile event loop stall for each decoding strategy:
+
+- inline: decode every span on the event loop (the previous gRPC path)
+- per-span thread: `run_in_threadpool` per span (the previous HTTP path)
+- SpanDecoder on a thread pool
+- SpanDecoder on a process pool
+
+A process pool can only decode in parallel on a machine with several cores.
+
+Usage:
+    python scripts/perf/otlp_decode_event_loop_stall.py
+    python scripts/perf/otlp_decode_event_loop_stall.py --num-spans 20000 --max-workers 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from secrets import token_hex
+from time import perf_counter
+from typing import Any
+
+import numpy as np
+from openinference.semconv.trace import SpanAttributes
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+from opentelemetry.proto.trace.v1.trace_pb2 import ResourceSpans, ScopeSpans
+from starlette.concurrency import run_in_threadpool
+
+from phoenix.server.span_decoder import SpanDecoder
+from phoenix.trace.attributes import unflatten
+from phoenix.trace.otel import decode_otlp_span, encode_span_to_otlp
+from phoenix.trace.schemas import Span, SpanContext, SpanKind, SpanStatusCode
+from phoenix.utilities.project import get_project_name
+
+Strategy = Callable[[ExportTraceServiceRequest], Awaitable[int]]
+
+DEFAULT_NUM_SPANS = 10_000
+DEFAULT_NUM_MESSAGES = 10
+DEFAULT_SPANS_PER_RESOURCE = 1000
+TICK_SECONDS = 0.001
+
+
+def generate_request(
+    num_spans: int,
+    num_messages: int,
+    spans_per_resource: int,
+) -> ExportTraceServiceRequest:
+    t0 = datetime.now(timezone.utc)
+    otlp_spans = []
+    for i in range(num_spans):
+        attributes: dict[str, Any] = {
+            SpanAttributes.OPENINFERENCE_SPAN_KIND: "LLM",
+            SpanAttributes.INPUT_VALUE: json.dumps({"messages": ["x" * 200] * num_messages}),
+            SpanAttributes.OUTPUT_VALUE: "y" * 500,
+            SpanAttributes.LLM_TOKEN_COUNT_PROMPT: 100,
+            SpanAttributes.LLM_TOKEN_COUNT_COMPLETION: 100,
+        }
+        for j in range(num_messages):
+            prefix = f"{SpanAttributes.LLM_INPUT_MESSAGES}.{j}.message"
+            attributes[f"{prefix}.role"] = "user" if j % 2 else "assistant"
+            attributes[f"{prefix}.content"] = "z" * 200
+        otlp_spans.append(
+            encode_span_to_otlp(
+                Span(
+                    name="llm",
+                    context=SpanContext(trace_id=token_hex(16), span_id=token_hex(8)),
+                    span_kind=SpanKind.LLM,
+                    parent_id=None,
+                    start_time=t0 + timedelta(milliseconds=i),
+                    end_time=t0 + timedelta(milliseconds=i + 1),
+                    status_code=SpanStatusCode.OK,
+                    status_message="",
+                    attributes=unflatten(attributes.items()),
+                    events=[],
+                    conversation=None,
+                )
+            )
+        )
+    return ExportTraceServiceRequest(
+        resource_spans=[
+            ResourceSpans(scope_spans=[ScopeSpans(spans=otlp_spans[i : i + spans_per_resource])])
+            for i in range(0, num_spans, spans_per_resource)
+        ]
+    )
+
+
+async def inline(request: ExportTraceServiceRequest) -> int:
+    n = 0
+    for resource_spans in request.resource_spans:
+        get_project_name(resource_spans.resource.attributes)
+        for scope_span in resource_spans.scope_spans:
+            for otlp_span in scope_span.spans:
+                decode_otlp_span(otlp_span)
+                n += 1
+    return n
+
+
+async def per_span_thread(request: ExportTraceServiceRequest) -> int:
+    n = 0
+    for resource_spans in request.resource_spans:
+        get_project_name(resource_spans.resource.attributes)
+        for scope_span in resource_spans.scope_spans:
+            for otlp_span in scope_span.spans:
+                await run_in_threadpool(decode_otlp_span, otlp_span)
+                n += 1
+    return n
+
+
+async def measure(
+    strategy: Strategy,
+    request: ExportTraceServiceRequest,
+) -> tuple[float, float, float]:
+    stalls: list[float] = []
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        while not done.is_set():
+            start = perf_counter()
+            await asyncio.sleep(TICK_SECONDS)
+            stalls.append(perf_counter() - start - TICK_SECONDS)
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    start = perf_counter()
+    num_spans = await strategy(request)
+    elapsed = perf_counter() - start
+    done.set()
+    await task
+    assert num_spans == sum(
+        len(scope_spans.spans)
+        for resource_spans in request.resource_spans
+        for scope_spans in resource_spans.scope_spans
+    )
+    return elapsed, max(stalls), float(np.percentile(stalls, 99))
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--num-spans", type=int, default=DEFAULT_NUM_SPANS)
+    parser.add_argument("--num-messages", type=int, default=DEFAULT_NUM_MESSAGES)
+    parser.add_argument("--spans-per-resource", type=int, default=DEFAULT_SPANS_PER_RESOURCE)
+    parser.add_argument("--max-workers", type=int, default=None)
+    args = parser.parse_args()
+
+    request = generate_request(args.num_spans, args.num_messages, args.spans_per_resource)
+    print(
+        f"spans={args.num_spans} resource_spans={len(request.resource_spans)} "
+        f"bytes={request.ByteSize():,}"
+    )
+    thread_decoder = SpanDecoder(args.max_workers)
+    process_decoder = SpanDecoder(args.max_workers, use_processes=True)
+    async with thread_decoder, process_decoder:
+
+        async def decode_on_threads(request: ExportTraceServiceRequest) -> int:
+            return len(await thread_decoder.decode(request))
+
+        async def decode_on_processes(request: ExportTraceServiceRequest) -> int:
+            return len(await process_decoder.decode(request))
+
+        await decode_on_processes(request)  # warm up the worker processes
+        strategies: list[tuple[str, Strategy]] = [
+            ("inline", inline),
+            ("per-span thread", per_span_thread),
+            ("SpanDecoder (threads)", decode_on_threads),
+            ("SpanDecoder (processes)", decode_on_processes),
+        ]
+        print(f"  {'strategy':<24} {'decode':>10} {'max stall':>10} {'p99 stall':>10}")
+        for name, strategy in strategies:
+            elapsed, max_stall, p99_stall = await measure(strategy, request)
+            print(
+                f"  {name:<24} {elapsed * 1000:8,.0f}ms {max_stall * 1000:8,.1f}ms "
+                f"{p99_stall * 1000:8,.1f}ms"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
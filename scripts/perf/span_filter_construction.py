@@ -0,0 +1,83 @@
+"""
+SpanFilter Construction Benchmark
+
+Constructs `SpanFilter`s and `Projector`s for a handful of conditions and expressions of
+the kind the UI sends repeatedly, and prints the average construction time of each with
+and without the process-wide cache of compiled filters and projections:
+
+- uncached: parse, validate, translate and compile on every construction (the previous
+  behavior)
+- cached: look up the compiled filter or projection by its condition or expression
+
+Usage:
+    python scripts/perf/span_filter_construction.py
+    python scripts/perf/span_filter_construction.py --iterations 10000
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+from contextlib import ExitStack
+from time import perf_counter
+from unittest.mock import patch
+
+import phoenix.trace.dsl.filter
+from phoenix.trace.dsl.filter import Projector, SpanFilter
+
+DEFAULT_ITERATIONS = 2000
+
+CONDITIONS = [
+    "span_kind == 'LLM'",
+    "status_code == 'ERROR' and latency_ms > 1000",
+    "'hallucination' in input.value or 'hallucination' in output.value",
+    "evals['Hallucination'].label == 'hallucinated' and evals['QA'].score < 0.5",
+    "llm.token_count.total > 1000 and llm.model_name == 'gpt-4o'",
+    "metadata['user_id'] == 'abc' and span_kind in ('LLM', 'RETRIEVER')",
+]
+
+EXPRESSIONS = [
+    "input.value",
+    "output.value",
+    "llm.token_count.total",
+    "attributes['retrieval.documents']",
+    "metadata['user_id']",
+]
+
+
+def measure(construct: Callable[[], object], iterations: int) -> float:
+    start = perf_counter()
+    for _ in range(iterations):
+        construct()
+    return (perf_counter() - start) / iterations
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    args = parser.parse_args()
+
+    cases: list[tuple[str, Callable[[], object]]] = [
+        *((condition, lambda c=condition: SpanFilter(c)) for condition in CONDITIONS),
+        *((expression, lambda e=expression: Projector(e)) for expression in EXPRESSIONS),
+    ]
+    print(f"  {'condition or expression':<72} {'uncached':>10} {'cached':>10} {'speedup':>8}")
+    for name, construct in cases:
+        with ExitStack() as stack:
+            for name_of_cached in ("_compile_filter", "_compile_projection"):
+                cached_function = getattr(phoenix.trace.dsl.filter, name_of_cached)
+                stack.enter_context(
+                    patch.object(
+                        phoenix.trace.dsl.filter, name_of_cached, cached_function.__wrapped__
+                    )
+                )
+            uncached = measure(construct, args.iterations)
+        cached = measure(construct, args.iterations)
+        print(
+            f"  {name[:72]:<72} {uncached * 1e6:8,.1f}µs {cached * 1e6:8,.1f}µs "
+            f"{uncached / cached:7,.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -94,6 +94,18 @@ ENV_PHOENIX_SQL_DATABASE_SCHEMA = "PHOENIX_SQL_DATABASE_SCHEMA"
 The schema to use for the PostgresSQL database. (This is ignored for SQLite.)
 See e.g. https://www.postgresql.org/docs/current/ddl-schemas.html
 """
+ENV_PHOENIX_SQL_DATABASE_READ_REPLICA_URL = "PHOENIX_SQL_DATABASE_READ_REPLICA_URL"
+"""
+The URL of a read-only replica of the PostgreSQL database, e.g. a hot standby. If set, GraphQL
+queries and the GET endpoints of the REST API read from the replica, so that they don't compete
+with the ingestion of traces on the primary database. This is ignored for SQLite.
+"""
+ENV_PHOENIX_SQL_DATABASE_READ_YOUR_WRITES_SECONDS = "PHOENIX_SQL_DATABASE_READ_YOUR_WRITES_SECONDS"
+"""
+The number of seconds, after a user changes something (e.g. by a GraphQL mutation), during which
+the reads of that user go to the primary database rather than to the read replica, so that the
+user sees their change even if the replica lags behind. Defaults to 5.
+"""
 ENV_PHOENIX_DATABASE_ALLOCATED_STORAGE_CAPACITY_GIBIBYTES = (
     "PHOENIX_DATABASE_ALLOCATED_STORAGE_CAPACITY_GIBIBYTES"
 )
@@ -105,6 +117,41 @@ ENV_PHOENIX_ENABLE_PROMETHEUS = "PHOENIX_ENABLE_PROMETHEUS"
 """
 Whether to enable Prometheus. Defaults to false.
 """
+ENV_PHOENIX_SPAN_DECODER_MAX_WORKERS = "PHOENIX_SPAN_DECODER_MAX_WORKERS"
+"""
+The number of workers used to decode incoming OTLP trace requests off the event loop. Defaults
+to 1 for a pool of threads, and to the lesser of 4 and the number of CPUs for a pool of
+processes. Set to 0 to decode on the event loop.
+"""
+ENV_PHOENIX_SPAN_DECODER_USE_PROCESSES = "PHOENIX_SPAN_DECODER_USE_PROCESSES"
+"""
+Whether to decode incoming OTLP trace requests on a pool of processes instead of a pool of
+threads. Defaults to false.
+"""
+ENV_PHOENIX_MAX_SPANS_BUFFERED = "PHOENIX_MAX_SPANS_BUFFERED"
+"""
+The maximum number of received spans waiting to be written to the database. When the limit is
+reached, OTLP export requests are rejected with gRPC status RESOURCE_EXHAUSTED or HTTP status
+503, so that exporters back off and retry. Defaults to 100,000.
+"""
+ENV_PHOENIX_MAX_SPAN_BYTES_BUFFERED = "PHOENIX_MAX_SPAN_BYTES_BUFFERED"
+"""
+The maximum approximate size in bytes (as encoded in OTLP) of received spans waiting to be
+written to the database. When the limit is reached, OTLP export requests are rejected as for
+PHOENIX_MAX_SPANS_BUFFERED. Defaults to 256 MiB.
+"""
+ENV_PHOENIX_SPAN_SPOOL_DIR = "PHOENIX_SPAN_SPOOL_DIR"
+"""
+The directory of the write-ahead spool for received spans. When set, OTLP export requests are
+written to the spool before they are acknowledged, and spans that have not been written to the
+database are replayed from the spool after a restart or a database outage. Disabled by default.
+"""
+ENV_PHOENIX_SPAN_SPOOL_MAX_BYTES = "PHOENIX_SPAN_SPOOL_MAX_BYTES"
+"""
+The maximum size in bytes of the span spool, not counting requests that have been written to the
+database. When the limit is reached, OTLP export requests are rejected as for
+PHOENIX_MAX_SPANS_BUFFERED. Defaults to 1 GiB.
+"""
 ENV_LOGGING_MODE = "PHOENIX_LOGGING_MODE"
 """
 The logging mode (either 'default' or 'structured').
@@ -1295,6 +1342,28 @@ def get_env_database_schema() -> Optional[str]:
     return getenv(ENV_PHOENIX_SQL_DATABASE_SCHEMA)
 
 
+def get_env_database_read_replica_connection_str() -> Optional[str]:
+    """
+    Gets the value of the PHOENIX_SQL_DATABASE_READ_REPLICA_URL environment variable.
+    """
+    if get_env_database_connection_str().startswith("sqlite"):
+        return None
+    return getenv(ENV_PHOENIX_SQL_DATABASE_READ_REPLICA_URL) or None
+
+
+def get_env_database_read_your_writes_seconds() -> float:
+    """
+    Gets the value of the PHOENIX_SQL_DATABASE_READ_YOUR_WRITES_SECONDS environment variable.
+    """
+    from phoenix.server.types import DEFAULT_READ_YOUR_WRITES_SECONDS
+
+    seconds = _float_val(
+        ENV_PHOENIX_SQL_DATABASE_READ_YOUR_WRITES_SECONDS, DEFAULT_READ_YOUR_WRITES_SECONDS
+    )
+    assert seconds >= 0
+    return seconds
+
+
 def get_env_database_allocated_storage_capacity_gibibytes() -> Optional[float]:
     return _float_val(ENV_PHOENIX_DATABASE_ALLOCATED_STORAGE_CAPACITY_GIBIBYTES)
 
@@ -1501,6 +1570,68 @@ def _get_default_idp_display_name(idp_name: str) -> str:
     return idp_name.replace("_", " ").title()
 
 
+def get_env_span_decoder_max_workers() -> Optional[int]:
+    """
+    Gets the value of the PHOENIX_SPAN_DECODER_MAX_WORKERS environment variable.
+    """
+    max_workers = _int_val(ENV_PHOENIX_SPAN_DECODER_MAX_WORKERS)
+    if max_workers is not None and max_workers < 0:
+        raise ValueError(
+            f"Invalid value for environment variable {ENV_PHOENIX_SPAN_DECODER_MAX_WORKERS}: "
+            f"{max_workers}. Value must be a non-negative integer."
+        )
+    return max_workers
+
+
+def get_env_span_decoder_use_processes() -> bool:
+    """
+    Gets the value of the PHOENIX_SPAN_DECODER_USE_PROCESSES environment variable.
+    """
+    return _bool_val(ENV_PHOENIX_SPAN_DECODER_USE_PROCESSES, False)
+
+
+def get_env_max_spans_buffered() -> int:
+    """
+    Gets the value of the PHOENIX_MAX_SPANS_BUFFERED environment variable.
+    """
+    from phoenix.db.insertion.constants import DEFAULT_MAX_SPANS_BUFFERED
+
+    max_spans = _int_val(ENV_PHOENIX_MAX_SPANS_BUFFERED, DEFAULT_MAX_SPANS_BUFFERED)
+    assert max_spans > 0
+    return max_spans
+
+
+def get_env_max_span_bytes_buffered() -> int:
+    """
+    Gets the value of the PHOENIX_MAX_SPAN_BYTES_BUFFERED environment variable.
+    """
+    from phoenix.db.insertion.constants import DEFAULT_MAX_SPAN_BYTES_BUFFERED
+
+    max_bytes = _int_val(ENV_PHOENIX_MAX_SPAN_BYTES_BUFFERED, DEFAULT_MAX_SPAN_BYTES_BUFFERED)
+    assert max_bytes > 0
+    return max_bytes
+
+
+def get_env_span_spool_dir() -> Optional[Path]:
+    """
+    Gets the value of the PHOENIX_SPAN_SPOOL_DIR environment variable.
+    """
+    if not (span_spool_dir := getenv(ENV_PHOENIX_SPAN_SPOOL_DIR)):
+        return None
+    return Path(span_spool_dir)
+
+
+def get_env_span_spool_max_bytes() -> int:
+    """
+    Gets the value of the PHOENIX_SPAN_SPOOL_MAX_BYTES environment variable.
+    """
+    from phoenix.db.insertion.constants import DEFAULT_MAX_SPAN_SPOOL_BYTES
+
+    max_bytes = _int_val(ENV_PHOENIX_SPAN_SPOOL_MAX_BYTES, DEFAULT_MAX_SPAN_SPOOL_BYTES)
+    assert max_bytes > 0
+    return max_bytes
+
+
 def get_env_disable_migrations() -> bool:
     return _bool_val(ENV_PHOENIX_DANGEROUSLY_DISABLE_MIGRATIONS, False)
 
@@ -41,6 +41,7 @@ from wrapt import ObjectProxy
 
 from phoenix.config import GENERATED_INFERENCES_NAME_PREFIX
 from phoenix.datetime_utils import floor_to_minute
+from phoenix.inferences.vectors import VectorArray, VectorDtype
 
 
 class DimensionRole(IntEnum): ...
@@ -887,6 +888,16 @@ class Model:
             # Set time column as index for use by pd.Grouper.
             df = df.set_index(dim_time.name, drop=False)
 
+            # Store the embedding vectors of each dimension as one matrix.
+            for embedding_dim in self[EmbeddingDimension]:
+                name = embedding_dim.name
+                if name not in df.columns or isinstance(df.dtypes[name], VectorDtype):
+                    continue
+                try:
+                    df[name] = VectorArray.from_vectors(df[name])
+                except (TypeError, ValueError):
+                    pass
+
             # Update dataset since its dataframe may have changed.
             self._inference_sets[inferences_role] = self._new_inferences(
                 df, name=dataset.name, role=inferences_role
@@ -934,6 +945,13 @@ class Model:
             ]
             rows = pd.Series(sorted(set(numbers)))
             filtered_df = df.iloc[rows, columns].reset_index(drop=True)
+            filtered_df = filtered_df.astype(
+                {
+                    name: object
+                    for name, dtype in filtered_df.dtypes.items()
+                    if isinstance(dtype, VectorDtype)
+                }
+            )
             if model_has_multiple_inference_sets:
                 filtered_df["__phoenix_dataset_name__"] = df.display_name
             if cluster_ids and (ids := cluster_ids.get(inferences_role)):
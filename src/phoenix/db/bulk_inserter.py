@@ -1,28 +1,37 @@
 import asyncio
 import logging
-from asyncio import Queue, as_completed
+from asyncio import Queue, QueueFull, as_completed
 from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
 from dataclasses import dataclass, field
+from datetime import datetime
 from functools import singledispatchmethod
 from itertools import islice
 from time import perf_counter
-from typing import Any, Optional, cast
+from typing import Any, Optional, Protocol, cast
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing_extensions import TypeAlias
 
 import phoenix.trace.v1 as pb
-from phoenix.db.insertion.constants import DEFAULT_RETRY_ALLOWANCE, DEFAULT_RETRY_DELAY_SEC
+from phoenix.db.insertion.cache import InsertionCache
+from phoenix.db.insertion.constants import (
+    DEFAULT_MAX_SPAN_BYTES_BUFFERED,
+    DEFAULT_MAX_SPANS_BUFFERED,
+    DEFAULT_RETRY_ALLOWANCE,
+    DEFAULT_RETRY_DELAY_SEC,
+)
 from phoenix.db.insertion.document_annotation import DocumentAnnotationQueueInserter
 from phoenix.db.insertion.evaluation import (
     InsertEvaluationError,
     insert_evaluation,
 )
 from phoenix.db.insertion.helpers import DataManipulation, DataManipulationEvent
-from phoenix.db.insertion.span import SpanInsertionEvent, insert_span
+from phoenix.db.insertion.span import SpanInsertionEvent, insert_span, insert_spans
 from phoenix.db.insertion.span_annotation import SpanAnnotationQueueInserter
 from phoenix.db.insertion.trace_annotation import TraceAnnotationQueueInserter
 from phoenix.db.insertion.types import Insertables, Precursors
 from phoenix.server.dml_event import DmlEvent, SpanInsertEvent
+from phoenix.server.span_spool import SpanSpool
 from phoenix.server.types import CanPutItem, DbSessionFactory
 from phoenix.trace.schemas import Span
 
@@ -31,6 +40,15 @@ logger = logging.getLogger(__name__)
 ProjectRowId: TypeAlias = int
 
 
+class QueueSpans(Protocol):
+    def __call__(
+        self,
+        spans: Iterable[tuple[Span, str]],
+        num_bytes: int = 0,
+        spool_position: Optional[int] = None,
+    ) -> Awaitable[None]: ...
+
+
 @dataclass(frozen=True)
 class TransactionResult:
     updated_project_rowids: set[ProjectRowId] = field(default_factory=set)
@@ -50,6 +68,10 @@ class BulkInserter:
         enable_prometheus: bool = False,
         retry_delay_sec: float = DEFAULT_RETRY_DELAY_SEC,
         retry_allowance: int = DEFAULT_RETRY_ALLOWANCE,
+        insertion_cache: Optional[InsertionCache] = None,
+        max_spans_buffered: int = DEFAULT_MAX_SPANS_BUFFERED,
+        max_span_bytes_buffered: int = DEFAULT_MAX_SPAN_BYTES_BUFFERED,
+        span_spool: Optional[SpanSpool] = None,
     ) -> None:
         """
         :param db: A function to initiate a new database session.
@@ -59,6 +81,16 @@ class BulkInserter:
         the operations queue for each transaction.
         :param max_queue_size: The maximum length of the operations queue.
         :param enable_prometheus: Whether Prometheus is enabled.
+        :param insertion_cache: Cache of project, trace and project session rowids used
+        when inserting spans. It must be invalidated when traces or projects are deleted.
+        :param max_spans_buffered: The maximum number of spans waiting to be inserted before
+        new spans are rejected by `check_span_capacity`.
+        :param max_span_bytes_buffered: The maximum approximate size in bytes (as encoded
+        in OTLP) of the spans waiting to be inserted before new spans are rejected by
+        `check_span_capacity`.
+        :param span_spool: The spool the spans are read from, if any. It is committed as
+        spans are inserted, and spans that fail to be inserted are retried instead of
+        dropped.
         """
         self._db = db
         self._running = False
@@ -72,18 +104,35 @@ class BulkInserter:
         self._evaluations: list[pb.Evaluation] = (
             [] if initial_batch_of_evaluations is None else list(initial_batch_of_evaluations)
         )
+        self._max_spans_buffered = max_spans_buffered
+        self._max_span_bytes_buffered = max_span_bytes_buffered
+        self._num_spans_buffered = len(self._spans)
+        self._num_span_bytes_buffered = 0
+        self._span_enqueue_times: list[float] = []
+        self._span_spool = span_spool
+        self._span_spool_position: Optional[int] = None
         self._task: Optional[asyncio.Task[None]] = None
         self._event_queue = event_queue
         self._enable_prometheus = enable_prometheus
         self._retry_delay_sec = retry_delay_sec
         self._retry_allowance = retry_allowance
         self._queue_inserters = _QueueInserters(db, self._retry_delay_sec, self._retry_allowance)
+        self._insertion_cache = (
+            InsertionCache(enable_prometheus=enable_prometheus)
+            if insertion_cache is None
+            else insertion_cache
+        )
+
+    @property
+    def insertion_cache(self) -> InsertionCache:
+        return self._insertion_cache
 
     async def __aenter__(
         self,
     ) -> tuple[
         Callable[[Any], Awaitable[None]],
         Callable[[Span, str], Awaitable[None]],
+        QueueSpans,
         Callable[[pb.Evaluation], Awaitable[None]],
         Callable[[DataManipulation], None],
     ]:
@@ -93,6 +142,7 @@ class BulkInserter:
         return (
             self._enqueue,
             self._queue_span,
+            self._queue_spans,
             self._queue_evaluation,
             self._enqueue_operation,
         )
@@ -109,8 +159,64 @@ class BulkInserter:
     def _enqueue_operation(self, operation: DataManipulation) -> None:
         cast("Queue[DataManipulation]", self._operations).put_nowait(operation)
 
+    def check_span_capacity(self, num_spans: int, num_bytes: int) -> None:
+        """
+        Raises `QueueFull` if the span buffer has no room for the given number of spans
+        and bytes, so that the caller can shed the load and have the exporter retry
+        later. The limits are soft: spans that are admitted but not yet queued (e.g.
+        because they are still being decoded) are not counted, and the buffer always
+        admits spans when it is empty, no matter how many.
+        """
+        if not self.has_span_capacity(num_spans, num_bytes):
+            if self._enable_prometheus:
+                from phoenix.server.prometheus import (
+                    BULK_LOADER_SHED_REQUESTS,
+                    BULK_LOADER_SHED_SPANS,
+                )
+
+                BULK_LOADER_SHED_REQUESTS.inc()
+                BULK_LOADER_SHED_SPANS.inc(num_spans)
+            raise QueueFull
+
+    def has_span_capacity(self, num_spans: int, num_bytes: int) -> bool:
+        return not self._num_spans_buffered or (
+            self._num_spans_buffered + num_spans <= self._max_spans_buffered
+            and self._num_span_bytes_buffered + num_bytes <= self._max_span_bytes_buffered
+        )
+
     async def _queue_span(self, span: Span, project_name: str) -> None:
         self._spans.append((span, project_name))
+        self._update_span_buffer(1, 0)
+
+    async def _queue_spans(
+        self,
+        spans: Iterable[tuple[Span, str]],
+        num_bytes: int = 0,
+        spool_position: Optional[int] = None,
+    ) -> None:
+        """
+        :param spool_position: The position in the span spool following the request the
+        spans were read from, if any.
+        """
+        if spool_position is not None:
+            self._span_spool_position = spool_position
+        num_spans = len(self._spans)
+        self._spans.extend(spans)
+        self._update_span_buffer(len(self._spans) - num_spans, num_bytes)
+
+    def _update_span_buffer(self, num_spans: int, num_bytes: int) -> None:
+        if num_spans > 0:
+            self._span_enqueue_times.append(perf_counter())
+        self._num_spans_buffered += num_spans
+        self._num_span_bytes_buffered += num_bytes
+        if self._enable_prometheus:
+            from phoenix.server.prometheus import (
+                BULK_LOADER_SPAN_QUEUE_BYTES,
+                BULK_LOADER_SPAN_QUEUE_LENGTH,
+            )
+
+            BULK_LOADER_SPAN_QUEUE_LENGTH.set(self._num_spans_buffered)
+            BULK_LOADER_SPAN_QUEUE_BYTES.set(self._num_span_bytes_buffered)
 
     async def _queue_evaluation(self, evaluation: pb.Evaluation) -> None:
         self._evaluations.append(evaluation)
@@ -120,6 +226,8 @@ class BulkInserter:
     async def _bulk_insert(self) -> None:
         assert isinstance(self._operations, Queue)
         spans_buffer, evaluations_buffer = None, None
+        num_span_bytes_buffered, span_enqueue_times = 0, []
+        span_spool_position: Optional[int] = None
         # start first insert immediately if the inserter has not run recently
         while (
             self._running
@@ -158,14 +266,41 @@ class BulkInserter:
             if self._spans:
                 spans_buffer = self._spans
                 self._spans = []
+                num_span_bytes_buffered = self._num_span_bytes_buffered
+                span_enqueue_times = self._span_enqueue_times
+                self._span_enqueue_times = []
+                span_spool_position = self._span_spool_position
             if self._evaluations:
                 evaluations_buffer = self._evaluations
                 self._evaluations = []
             # Spans should be inserted before the evaluations, since an evaluation
             # insertion will fail if the span it references doesn't exist.
             if spans_buffer:
-                await self._insert_spans(spans_buffer)
+                if self._enable_prometheus:
+                    from phoenix.server.prometheus import BULK_LOADER_SPAN_QUEUE_TIME
+
+                    now = perf_counter()
+                    for enqueued_at in span_enqueue_times:
+                        BULK_LOADER_SPAN_QUEUE_TIME.observe(now - enqueued_at)
+                inserted = False
+                try:
+                    inserted = await self._insert_spans(spans_buffer)
+                finally:
+                    if not inserted and self._span_spool is not None:
+                        # The spool has acknowledged these spans, so put them back at the
+                        # front of the buffer to be retried. Spans that did get inserted
+                        # are skipped on the next attempt. Nothing is counted twice, since
+                        # the buffer still holds the counts of these spans.
+                        self._spans[:0] = spans_buffer
+                        self._span_enqueue_times[:0] = span_enqueue_times
+                    else:
+                        # The spans stay in memory until the insertion has finished.
+                        self._update_span_buffer(-len(spans_buffer), -num_span_bytes_buffered)
+                if inserted and self._span_spool is not None and span_spool_position is not None:
+                    await self._span_spool.commit(span_spool_position)
                 spans_buffer = None
+                if not inserted and self._span_spool is not None:
+                    await asyncio.sleep(self._retry_delay_sec)
             if evaluations_buffer:
                 await self._insert_evaluations(evaluations_buffer)
                 evaluations_buffer = None
@@ -173,42 +308,76 @@ class BulkInserter:
                 self._event_queue.put(event)
             await asyncio.sleep(self._sleep)
 
-    async def _insert_spans(self, spans: list[tuple[Span, str]]) -> None:
-        project_ids = set()
+    async def _insert_spans(self, spans: list[tuple[Span, str]]) -> bool:
+        """
+        Returns whether every batch of spans was committed. Spans that fail to be
+        inserted individually, e.g. because they are invalid, don't count as a failure.
+        """
+        inserted = True
+        time_bounds: dict[int, tuple[datetime, datetime]] = {}
         for i in range(0, len(spans), self._max_ops_per_transaction):
+            batch = spans[i : i + self._max_ops_per_transaction]
             try:
                 start = perf_counter()
                 async with self._db() as session:
-                    for span, project_name in islice(spans, i, i + self._max_ops_per_transaction):
-                        if self._enable_prometheus:
-                            from phoenix.server.prometheus import BULK_LOADER_SPAN_INSERTIONS
+                    if self._enable_prometheus:
+                        from phoenix.server.prometheus import BULK_LOADER_SPAN_INSERTIONS
 
-                            BULK_LOADER_SPAN_INSERTIONS.inc()
-                        result: Optional[SpanInsertionEvent] = None
-                        try:
-                            async with session.begin_nested():
-                                result = await insert_span(session, span, project_name)
-                        except Exception:
-                            if self._enable_prometheus:
-                                from phoenix.server.prometheus import BULK_LOADER_EXCEPTIONS
-
-                                BULK_LOADER_EXCEPTIONS.inc()
-                            logger.exception(
-                                f"Failed to insert span with span_id={span.context.span_id}"
-                            )
-                        if result is not None:
-                            project_ids.add(result.project_rowid)
+                        BULK_LOADER_SPAN_INSERTIONS.inc(len(batch))
+                    try:
+                        async with session.begin_nested():
+                            results = await insert_spans(session, batch, self._insertion_cache)
+                    except Exception:
+                        # Drop the rowids that were staged by the rolled-back batch, along
+                        # with the rest, in case a stale entry caused the failure.
+                        self._insertion_cache.clear()
+                        # Fall back to inserting one span at a time, so that a single
+                        # bad span can't cause the rest of the batch to be dropped.
+                        logger.exception(
+                            "Failed to insert batch of spans, retrying spans individually"
+                        )
+                        results = await self._insert_spans_individually(session, batch)
+                    for result in results:
+                        bounds = (result.start_time, result.end_time)
+                        if previous := time_bounds.get(result.project_rowid):
+                            bounds = (min(previous[0], bounds[0]), max(previous[1], bounds[1]))
+                        time_bounds[result.project_rowid] = bounds
+                self._insertion_cache.commit()
                 if self._enable_prometheus:
                     from phoenix.server.prometheus import BULK_LOADER_INSERTION_TIME
 
                     BULK_LOADER_INSERTION_TIME.observe(perf_counter() - start)
             except Exception:
+                self._insertion_cache.clear()
                 if self._enable_prometheus:
                     from phoenix.server.prometheus import BULK_LOADER_EXCEPTIONS
 
                     BULK_LOADER_EXCEPTIONS.inc()
                 logger.exception("Failed to insert spans")
-        self._event_queue.put(SpanInsertEvent(tuple(project_ids)))
+                inserted = False
+        self._event_queue.put(SpanInsertEvent(tuple(time_bounds), time_bounds))
+        return inserted
+
+    async def _insert_spans_individually(
+        self,
+        session: AsyncSession,
+        spans: Iterable[tuple[Span, str]],
+    ) -> list[SpanInsertionEvent]:
+        results = []
+        for span, project_name in spans:
+            result: Optional[SpanInsertionEvent] = None
+            try:
+                async with session.begin_nested():
+                    result = await insert_span(session, span, project_name)
+            except Exception:
+                if self._enable_prometheus:
+                    from phoenix.server.prometheus import BULK_LOADER_EXCEPTIONS
+
+                    BULK_LOADER_EXCEPTIONS.inc()
+                logger.exception(f"Failed to insert span with span_id={span.context.span_id}")
+            if result is not None:
+                results.append(result)
+        return results
 
     async def _insert_evaluations(self, evaluations: list[pb.Evaluation]) -> None:
         for i in range(0, len(evaluations), self._max_ops_per_transaction):
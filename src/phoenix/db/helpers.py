@@ -8,6 +8,7 @@ from openinference.semconv.trace import (
     SpanAttributes,
 )
 from sqlalchemy import (
+    ColumnElement,
     Integer,
     Select,
     SQLColumnExpression,
@@ -15,6 +16,7 @@ from sqlalchemy import (
     case,
     distinct,
     func,
+    or_,
     select,
 )
 from typing_extensions import assert_never
@@ -115,48 +117,57 @@ def dedup(
     return ans
 
 
-def get_dataset_example_revisions(
-    dataset_version_id: int,
-) -> Select[tuple[models.DatasetExampleRevision]]:
-    version = (
-        select(
-            models.DatasetVersion.id,
-            models.DatasetVersion.dataset_id,
-        )
-        .filter_by(id=dataset_version_id)
-        .subquery()
+def in_dataset_snapshot(
+    dataset_version_id: Optional[int] = None,
+    *,
+    dataset_id: Optional[int] = None,
+) -> ColumnElement[bool]:
+    """
+    Whether a snapshot range (see `models.DatasetSnapshotRange`) is in the snapshot of a
+    version of a dataset, i.e. whether its revision is the current revision of an example
+    that is not deleted as of the version. Without a version, the snapshot is that of the
+    latest version of the dataset. With both, the version must belong to the dataset, or
+    the snapshot is empty.
+    """
+    snapshot = models.DatasetSnapshotRange
+    if dataset_version_id is None:
+        if dataset_id is None:
+            raise ValueError("Either a dataset or a dataset version is required")
+        return and_(snapshot.dataset_id == dataset_id, snapshot.to_version_id.is_(None))
+    version_dataset_id = select(models.DatasetVersion.dataset_id).where(
+        models.DatasetVersion.id == dataset_version_id
     )
-    table = models.DatasetExampleRevision
-    revision = (
-        select(
-            table.dataset_example_id,
-            func.max(table.dataset_version_id).label("dataset_version_id"),
-        )
-        .join_from(
-            table,
-            models.DatasetExample,
-            table.dataset_example_id == models.DatasetExample.id,
+    if dataset_id is not None:
+        version_dataset_id = version_dataset_id.where(
+            models.DatasetVersion.dataset_id == dataset_id
         )
-        .join_from(
-            models.DatasetExample,
-            version,
-            models.DatasetExample.dataset_id == version.c.dataset_id,
-        )
-        .where(models.DatasetExample.dataset_id == version.c.dataset_id)
-        .where(table.dataset_version_id <= version.c.id)
-        .group_by(table.dataset_example_id)
-        .subquery()
+    return and_(
+        snapshot.dataset_id == version_dataset_id.scalar_subquery(),
+        snapshot.from_version_id <= dataset_version_id,
+        or_(
+            snapshot.to_version_id.is_(None),
+            snapshot.to_version_id > dataset_version_id,
+        ),
     )
+
+
+def get_dataset_example_revisions(
+    dataset_version_id: Optional[int] = None,
+    *,
+    dataset_id: Optional[int] = None,
+) -> Select[tuple[models.DatasetExampleRevision]]:
+    """
+    The revisions of the examples in the snapshot of a version of a dataset, as defined by
+    `in_dataset_snapshot`. The snapshot ranges are joined, so that the revisions can be
+    ordered, or paginated, by `models.DatasetSnapshotRange.dataset_example_id`, which is
+    indexed along with the dataset.
+    """
+    table = models.DatasetExampleRevision
+    snapshot = models.DatasetSnapshotRange
     return (
         select(table)
-        .where(table.revision_kind != "DELETE")
-        .join(
-            revision,
-            onclause=and_(
-                revision.c.dataset_example_id == table.dataset_example_id,
-                revision.c.dataset_version_id == table.dataset_version_id,
-            ),
-        )
+        .join(snapshot, snapshot.dataset_example_revision_id == table.id)
+        .where(in_dataset_snapshot(dataset_version_id, dataset_id=dataset_id))
     )
 
 
@@ -0,0 +1,167 @@
+"""
+Rowid cache for the span ingestion path.
+
+A batch of spans typically references a handful of projects and a few hundred traces, most
+of which have been seen in recent batches. Caching the rowids (and the time bounds needed
+for bookkeeping) of those records lets `insert_spans` skip most of its read queries.
+
+Entries written by `insert_spans` are staged, and only added to the cache by `commit`, once
+the transaction that produced them has committed, or dropped by `clear`, e.g. when it is rolled
+back. The cache must be invalidated whenever traces or projects are deleted. Bounds that go
+stale in the other direction (i.e. widened by another writer) are harmless, since the
+updates issued by `insert_spans` can only widen the bounds stored in the database.
+"""
+
+from collections.abc import Callable, Iterable
+from contextlib import suppress
+from datetime import datetime
+from typing import Generic, NamedTuple, Optional, TypeVar
+
+from cachetools import TTLCache
+from typing_extensions import TypeAlias
+
+_ProjectName: TypeAlias = str
+_ProjectRowId: TypeAlias = int
+_TraceId: TypeAlias = str
+_SessionId: TypeAlias = str
+
+_KeyT = TypeVar("_KeyT")
+_ValueT = TypeVar("_ValueT")
+
+
+class CachedTrace(NamedTuple):
+    rowid: int
+    project_rowid: int
+    start_time: datetime
+    end_time: datetime
+    project_session_rowid: Optional[int]
+    session_id: Optional[str]
+
+
+class CachedProjectSession(NamedTuple):
+    rowid: int
+    project_id: int
+    start_time: datetime
+    end_time: datetime
+
+
+class _Section(Generic[_KeyT, _ValueT]):
+    def __init__(self, name: str, maxsize: int, ttl: float, enable_prometheus: bool) -> None:
+        self.name = name
+        self._cache: TTLCache[_KeyT, _ValueT] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._staged: dict[_KeyT, _ValueT] = {}
+        self._enable_prometheus = enable_prometheus
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: _KeyT) -> Optional[_ValueT]:
+        value = self._staged.get(key)
+        if value is None:
+            value = self._cache.get(key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        if self._enable_prometheus:
+            from phoenix.server.prometheus import INSERTION_CACHE_HITS, INSERTION_CACHE_MISSES
+
+            (INSERTION_CACHE_MISSES if value is None else INSERTION_CACHE_HITS).labels(
+                cache=self.name
+            ).inc()
+        return value
+
+    def set(self, key: _KeyT, value: _ValueT) -> None:
+        self._staged[key] = value
+
+    def commit(self) -> None:
+        self._cache.update(self._staged)
+        self._staged.clear()
+
+    def discard(self, predicate: Callable[[_ValueT], bool]) -> None:
+        for key in [k for k, v in self._staged.items() if predicate(v)]:
+            del self._staged[key]
+        for key in [k for k, v in list(self._cache.items()) if predicate(v)]:
+            with suppress(KeyError):  # the entry may have expired in the meantime
+                del self._cache[key]
+
+    def clear(self) -> None:
+        self._staged.clear()
+        self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+class InsertionCache:
+    """
+    Bounded LRU caches with TTL, mapping project names to project rowids, trace_ids to
+    trace records, and session_ids to project session records.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_projects: int = 1_000,
+        max_traces: int = 100_000,
+        max_project_sessions: int = 100_000,
+        ttl_seconds: float = 3600,
+        enable_prometheus: bool = False,
+    ) -> None:
+        self.projects: _Section[_ProjectName, _ProjectRowId] = _Section(
+            "project", max_projects, ttl_seconds, enable_prometheus
+        )
+        self.traces: _Section[_TraceId, CachedTrace] = _Section(
+            "trace", max_traces, ttl_seconds, enable_prometheus
+        )
+        self.project_sessions: _Section[_SessionId, CachedProjectSession] = _Section(
+            "project_session", max_project_sessions, ttl_seconds, enable_prometheus
+        )
+
+    def invalidate_projects(self, project_rowids: Iterable[int]) -> None:
+        """
+        Drops the traces and project sessions of the given projects, e.g. after some of
+        their traces have been deleted.
+        """
+        if not (ids := set(project_rowids)):
+            return
+        session_rowids: set[int] = set()
+
+        def predicate(trace: CachedTrace) -> bool:
+            if trace.project_rowid not in ids:
+                return False
+            if trace.project_session_rowid is not None:
+                session_rowids.add(trace.project_session_rowid)
+            return True
+
+        self.traces.discard(predicate)
+        self.project_sessions.discard(
+            lambda project_session: project_session.project_id in ids
+            or project_session.rowid in session_rowids
+        )
+
+    def delete_projects(self, project_rowids: Iterable[int]) -> None:
+        """
+        Drops the given projects along with their traces and project sessions.
+        """
+        if not (ids := set(project_rowids)):
+            return
+        self.projects.discard(lambda rowid: rowid in ids)
+        self.invalidate_projects(ids)
+
+    def commit(self) -> None:
+        """
+        Adds the staged entries to the cache, once the transaction that produced them has
+        committed.
+        """
+        self.projects.commit()
+        self.traces.commit()
+        self.project_sessions.commit()
+
+    def clear(self) -> None:
+        """
+        Drops all entries, staged or not, e.g. when a transaction that produced some of them
+        was rolled back.
+        """
+        self.projects.clear()
+        self.traces.clear()
+        self.project_sessions.clear()
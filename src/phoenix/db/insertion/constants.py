@@ -1,2 +1,6 @@
 DEFAULT_RETRY_DELAY_SEC: float = 10
 DEFAULT_RETRY_ALLOWANCE: int = 60
+DEFAULT_MAX_SPANS_BUFFERED: int = 100_000
+DEFAULT_MAX_SPAN_BYTES_BUFFERED: int = 256 * 2**20
+DEFAULT_SPAN_BUFFER_RETRY_AFTER_SEC: int = 5
+DEFAULT_MAX_SPAN_SPOOL_BYTES: int = 2**30
@@ -1,9 +1,10 @@
+import asyncio
 import logging
 from collections.abc import Awaitable, Iterable, Iterator, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from itertools import chain
+from itertools import chain, islice
 from typing import Any, Optional, Union, cast
 
 from sqlalchemy import insert, select
@@ -21,6 +22,8 @@ DatasetExampleId: TypeAlias = int
 DatasetExampleRevisionId: TypeAlias = int
 SpanRowId: TypeAlias = int
 
+DEFAULT_BATCH_SIZE = 1000
+
 
 @dataclass(frozen=True)
 class ExampleContent:
@@ -151,6 +154,7 @@ async def add_dataset_examples(
     description: Optional[str] = None,
     metadata: Optional[Mapping[str, Any]] = None,
     action: DatasetAction = DatasetAction.CREATE,
+    batch_size: int = DEFAULT_BATCH_SIZE,
 ) -> Optional[DatasetExampleAdditionEvent]:
     created_at = datetime.now(timezone.utc)
     dataset_id: Optional[DatasetId] = None
@@ -179,35 +183,54 @@ async def add_dataset_examples(
     except Exception:
         logger.exception(f"Failed to insert dataset version for {dataset_id=}")
         raise
-    for example in (await examples) if isinstance(examples, Awaitable) else examples:
+    if isinstance(examples, Awaitable):
+        examples = await examples
+    iterator = iter(examples)
+    loop = asyncio.get_running_loop()
+    num_examples = 0
+    # The examples may be parsed lazily from an upload, so they are taken in batches, off
+    # the event loop, and each batch is inserted with one statement per table.
+    while batch := await loop.run_in_executor(None, _take, iterator, batch_size):
         try:
-            dataset_example_id = await insert_dataset_example(
-                session=session,
-                dataset_id=dataset_id,
-                created_at=created_at,
+            dataset_example_ids = await session.scalars(
+                insert(models.DatasetExample).returning(
+                    models.DatasetExample.id, sort_by_parameter_order=True
+                ),
+                [{"dataset_id": dataset_id, "created_at": created_at} for _ in batch],
             )
         except Exception:
-            logger.exception(f"Failed to insert dataset example for {dataset_id=}")
+            logger.exception(f"Failed to insert dataset examples for {dataset_id=}")
             raise
         try:
-            await insert_dataset_example_revision(
-                session=session,
-                dataset_version_id=dataset_version_id,
-                dataset_example_id=dataset_example_id,
-                input=example.input,
-                output=example.output,
-                metadata=example.metadata,
-                created_at=created_at,
+            await session.execute(
+                insert(models.DatasetExampleRevision),
+                [
+                    {
+                        "dataset_version_id": dataset_version_id,
+                        "dataset_example_id": dataset_example_id,
+                        "input": example.input,
+                        "output": example.output,
+                        "metadata_": example.metadata,
+                        "revision_kind": RevisionKind.CREATE.value,
+                        "created_at": created_at,
+                    }
+                    for example, dataset_example_id in zip(batch, dataset_example_ids)
+                ],
             )
         except Exception:
             logger.exception(
-                f"Failed to insert dataset example revision for {dataset_version_id=}, "
-                f"{dataset_example_id=}"
+                f"Failed to insert dataset example revisions for {dataset_version_id=}"
             )
             raise
+        num_examples += len(batch)
+        logger.info(f"Inserted {num_examples} examples into {dataset_version_id=}")
     return DatasetExampleAdditionEvent(dataset_id=dataset_id)
 
 
+def _take(iterator: Iterator[ExampleContent], n: int) -> list[ExampleContent]:
+    return list(islice(iterator, n))
+
+
 @dataclass(frozen=True)
 class DatasetKeys:
     input: frozenset[str]
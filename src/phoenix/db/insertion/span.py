@@ -1,19 +1,28 @@
-from dataclasses import asdict
-from typing import NamedTuple, Optional, cast
+from collections import defaultdict
+from collections.abc import Iterable, Mapping, Sequence
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Any, NamedTuple, Optional, cast
 
 from openinference.semconv.trace import SpanAttributes
-from sqlalchemy import func, insert, select, update
+from sqlalchemy import ColumnElement, Table, bindparam, case, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from phoenix.db import models
+from phoenix.db import models, span_tree
 from phoenix.db.helpers import SupportedSQLDialect
+from phoenix.db.insertion.cache import CachedProjectSession, CachedTrace, InsertionCache
 from phoenix.db.insertion.helpers import OnConflict, insert_on_conflict
+from phoenix.db.rollups import RollupDeltas
 from phoenix.trace.attributes import get_attribute_value
 from phoenix.trace.schemas import Span, SpanStatusCode
 
 
 class SpanInsertionEvent(NamedTuple):
     project_rowid: int
+    # Time bounds of the trace, which contain the start times of every span and trace whose
+    # aggregates the insertion may have changed, e.g. ancestors with cumulative counts.
+    start_time: datetime
+    end_time: datetime
 
 
 class ClearProjectSpansEvent(NamedTuple):
@@ -41,19 +50,28 @@ async def insert_span(
         select(models.Trace).filter_by(trace_id=trace_id)
     ) or models.Trace(trace_id=trace_id)
 
+    rollups = RollupDeltas()
     if trace.id is not None:
         # Trace record may need to be updated.
+        previous = (trace.project_rowid, trace.start_time, trace.end_time)
         if trace.end_time < span.end_time:
+            if trace.project_rowid != project_rowid:
+                # The spans of the trace move along with it to the other project.
+                await rollups.add_spans_of_trace(session, trace.id, trace.project_rowid, -1)
+                await rollups.add_spans_of_trace(session, trace.id, project_rowid)
+                await span_tree.move_spans_of_trace(session, trace.id, project_rowid)
             trace.end_time = span.end_time
             trace.project_rowid = project_rowid
         if span.start_time < trace.start_time:
             trace.start_time = span.start_time
+        rollups.move_trace(previous, (trace.project_rowid, trace.start_time, trace.end_time))
     else:
         # Trace record needs to be persisted for the first time.
         trace.start_time = span.start_time
         trace.end_time = span.end_time
         trace.project_rowid = project_rowid
         session.add(trace)
+        rollups.add_trace(project_rowid, span.start_time, span.end_time)
 
     session_id = get_attribute_value(span.attributes, SpanAttributes.SESSION_ID)
     session_id = str(session_id).strip() if session_id is not None else ""
@@ -163,31 +181,596 @@ async def insert_span(
         ).returning(models.Span.id)
     )
     if span_rowid is None:
+        await rollups.apply(session)
         return None
+    rollups.add_span(
+        trace.project_rowid,
+        span.start_time,
+        span.end_time,
+        span.status_code.value,
+        llm_token_count_prompt,
+        llm_token_count_completion,
+    )
+    await rollups.apply(session)
+    await span_tree.add_spans(
+        session,
+        [(span_rowid, span.context.span_id, span.parent_id, trace.project_rowid, span.start_time)],
+    )
     # Propagate cumulative values to ancestors. This is usually a no-op, since
     # the parent usually arrives after the child. But in the event that a
     # child arrives after its parent, we need to make sure that all the
     # ancestors' cumulative values are updated.
-    ancestors = (
-        select(models.Span.id, models.Span.parent_id)
-        .where(models.Span.span_id == span.parent_id)
-        .cte(recursive=True)
+    path = await session.scalar(
+        select(models.SpanTreeNode.path).where(models.SpanTreeNode.span_rowid == span_rowid)
     )
-    child = ancestors.alias()
-    ancestors = ancestors.union_all(
-        select(models.Span.id, models.Span.parent_id).join(
-            child, models.Span.span_id == child.c.parent_id
+    if path is not None and (ancestor_rowids := span_tree.rowids_in_path(path)[:-1]):
+        await session.execute(
+            update(models.Span)
+            .where(models.Span.id.in_(ancestor_rowids))
+            .values(
+                cumulative_error_count=models.Span.cumulative_error_count + cumulative_error_count,
+                cumulative_llm_token_count_prompt=models.Span.cumulative_llm_token_count_prompt
+                + cumulative_llm_token_count_prompt,
+                cumulative_llm_token_count_completion=models.Span.cumulative_llm_token_count_completion
+                + cumulative_llm_token_count_completion,
+            )
         )
+    return SpanInsertionEvent(project_rowid, trace.start_time, trace.end_time)
+
+
+class _Counts(NamedTuple):
+    error_count: int = 0
+    llm_token_count_prompt: int = 0
+    llm_token_count_completion: int = 0
+
+    def __add__(self, other: Any) -> "_Counts":
+        if not isinstance(other, _Counts):
+            return NotImplemented
+        return _Counts(*(a + b for a, b in zip(self, other)))
+
+
+async def insert_spans(
+    session: AsyncSession,
+    spans: Sequence[tuple[Span, str]],
+    cache: Optional[InsertionCache] = None,
+) -> list[SpanInsertionEvent]:
+    """
+    Set-based counterpart of `insert_span` for a whole batch of spans.
+
+    Projects, traces and project sessions are resolved with one lookup each, spans are
+    inserted with multi-row INSERT statements, and the cumulative counts are computed in
+    memory for parents and children arriving in the same batch. Only ancestors that
+    already exist in the database are updated afterwards. The number of statements
+    executed is therefore independent of the number of spans in the batch.
+
+    Spans whose span_id already exists in the database, as well as repeated span_ids
+    within the batch, are skipped.
+
+    If a cache is provided, it is used in lieu of reading projects, traces and project
+    sessions from the database, and it is populated with the records of this batch. The
+    caller must clear the cache if the enclosing transaction is rolled back.
+    """
+    dialect = SupportedSQLDialect(session.bind.dialect.name)
+    batch: dict[str, tuple[Span, str]] = {}
+    for span, project_name in spans:
+        batch.setdefault(span.context.span_id, (span, project_name))
+    if not batch:
+        return []
+    for span_id in await session.scalars(
+        select(models.Span.span_id).where(models.Span.span_id.in_(batch))
+    ):
+        batch.pop(span_id, None)
+    if not batch:
+        return []
+
+    project_rowids = await _get_or_create_project_rowids(
+        session, {project_name for _, project_name in batch.values()}, cache
     )
+    rollups = RollupDeltas()
+    traces = await _upsert_traces_and_sessions(
+        session, batch.values(), project_rowids, rollups, cache
+    )
+
+    counts = {span_id: _get_counts(span) for span_id, (span, _) in batch.items()}
+    cumulative_counts = _accumulate(
+        batch,
+        counts,
+        {
+            parent_id: _Counts(*(int(v or 0) for v in values))
+            for parent_id, *values in await session.execute(
+                select(
+                    models.Span.parent_id,
+                    func.sum(models.Span.cumulative_error_count),
+                    func.sum(models.Span.cumulative_llm_token_count_prompt),
+                    func.sum(models.Span.cumulative_llm_token_count_completion),
+                )
+                .where(models.Span.parent_id.in_(batch))
+                .group_by(models.Span.parent_id)
+            )
+        },
+    )
+
+    records = [
+        dict(
+            span_id=span_id,
+            trace_rowid=traces[span.context.trace_id].rowid,
+            parent_id=span.parent_id,
+            span_kind=span.span_kind.value,
+            name=span.name,
+            start_time=span.start_time,
+            end_time=span.end_time,
+            attributes=span.attributes,
+            events=[asdict(event) for event in span.events],
+            status_code=span.status_code.value,
+            status_message=span.status_message,
+            cumulative_error_count=cumulative_counts[span_id].error_count,
+            cumulative_llm_token_count_prompt=cumulative_counts[span_id].llm_token_count_prompt,
+            cumulative_llm_token_count_completion=cumulative_counts[
+                span_id
+            ].llm_token_count_completion,
+            llm_token_count_prompt=counts[span_id].llm_token_count_prompt,
+            llm_token_count_completion=counts[span_id].llm_token_count_completion,
+        )
+        for span_id, (span, _) in batch.items()
+    ]
+    # Executing with a list of parameters lets SQLAlchemy render multi-row INSERT
+    # statements ("insertmanyvalues") sized to the parameter limits of the dialect,
+    # and the compiled statement stays cacheable regardless of the batch size.
+    inserted: dict[str, int] = {
+        span_id: rowid
+        for rowid, span_id in await session.execute(
+            insert_on_conflict(
+                dialect=dialect,
+                table=models.Span,
+                unique_by=("span_id",),
+                on_conflict=OnConflict.DO_NOTHING,
+            ).returning(models.Span.id, models.Span.span_id),
+            records,
+        )
+    }
+    tree_nodes = []
+    for span_id, rowid in inserted.items():
+        span, _ = batch[span_id]
+        project_rowid = traces[span.context.trace_id].project_rowid
+        tree_nodes.append((rowid, span_id, span.parent_id, project_rowid, span.start_time))
+    await span_tree.add_spans(session, tree_nodes)
+    # Propagate cumulative values to ancestors that were inserted prior to this batch.
+    # This is usually a no-op, since the parent usually arrives after the child.
+    deltas: defaultdict[str, _Counts] = defaultdict(_Counts)
+    for span_id in inserted:
+        span, _ = batch[span_id]
+        if span.parent_id is not None and span.parent_id not in inserted:
+            deltas[span.parent_id] += cumulative_counts[span_id]
+    await _propagate_to_ancestors(session, deltas)
+    for span_id in inserted:
+        span, _ = batch[span_id]
+        rollups.add_span(
+            traces[span.context.trace_id].project_rowid,
+            span.start_time,
+            span.end_time,
+            span.status_code.value,
+            counts[span_id].llm_token_count_prompt,
+            counts[span_id].llm_token_count_completion,
+        )
+    await rollups.apply(session)
+    events = []
+    for span_id in inserted:
+        trace = traces[batch[span_id][0].context.trace_id]
+        events.append(SpanInsertionEvent(trace.project_rowid, trace.start_time, trace.end_time))
+    return events
+
+
+async def _get_or_create_project_rowids(
+    session: AsyncSession,
+    project_names: set[str],
+    cache: Optional[InsertionCache] = None,
+) -> dict[str, int]:
+    project_rowids: dict[str, int] = {}
+    if cache is not None:
+        for name in project_names:
+            if (rowid := cache.projects.get(name)) is not None:
+                project_rowids[name] = rowid
+    if missing := project_names - project_rowids.keys():
+        project_rowids.update(
+            (name, id_)
+            for id_, name in await session.execute(
+                select(models.Project.id, models.Project.name).where(
+                    models.Project.name.in_(missing)
+                )
+            )
+        )
+    if new_names := sorted(project_names - project_rowids.keys()):
+        project_rowids.update(
+            (name, id_)
+            for id_, name in await session.execute(
+                insert(models.Project).returning(models.Project.id, models.Project.name),
+                [dict(name=name) for name in new_names],
+            )
+        )
+    if cache is not None:
+        for name, rowid in project_rowids.items():
+            cache.projects.set(name, rowid)
+    return project_rowids
+
+
+@dataclass
+class _TraceState:
+    trace_id: str
+    project_rowid: int
+    start_time: datetime
+    end_time: datetime
+    project_session: Optional["_ProjectSessionState"] = None
+    project_session_rowid: Optional[int] = None
+    rowid: Optional[int] = None
+    dirty: bool = False
+    # project and time bounds of an existing trace before this batch
+    original: Optional[tuple[int, datetime, datetime]] = None
+
+
+@dataclass
+class _ProjectSessionState:
+    session_id: str
+    project_id: int
+    start_time: datetime
+    end_time: datetime
+    rowid: Optional[int] = None
+    dirty: bool = False
+
+
+async def _upsert_traces_and_sessions(
+    session: AsyncSession,
+    spans: Iterable[tuple[Span, str]],
+    project_rowids: Mapping[str, int],
+    rollups: RollupDeltas,
+    cache: Optional[InsertionCache] = None,
+) -> dict[str, "_TraceState"]:
+    """
+    Applies the same trace and project session bookkeeping as `insert_span`, span by span
+    in memory, and then persists the results with a fixed number of statements. Returns
+    the traces keyed by trace_id, and records the changes to them in the rollups.
+
+    Updates to existing records only ever widen the time bounds in the database, so that
+    bounds obtained from a stale cache can't shrink them.
+    """
+    spans = list(spans)
+    traces: dict[str, _TraceState] = {}
+    sessions: dict[str, _ProjectSessionState] = {}
+    trace_session_ids: dict[str, str] = {}  # project session of each existing trace
+
+    trace_ids = {span.context.trace_id for span, _ in spans}
+    if cache is not None:
+        for trace_id in trace_ids:
+            if (cached_trace := cache.traces.get(trace_id)) is not None:
+                traces[trace_id] = _TraceState(
+                    trace_id=trace_id,
+                    project_rowid=cached_trace.project_rowid,
+                    start_time=cached_trace.start_time,
+                    end_time=cached_trace.end_time,
+                    project_session_rowid=cached_trace.project_session_rowid,
+                    rowid=cached_trace.rowid,
+                    original=(
+                        cached_trace.project_rowid,
+                        cached_trace.start_time,
+                        cached_trace.end_time,
+                    ),
+                )
+                if cached_trace.session_id is not None:
+                    trace_session_ids[trace_id] = cached_trace.session_id
+    if missing_trace_ids := trace_ids - traces.keys():
+        for trace, session_id in await session.execute(
+            select(models.Trace, models.ProjectSession.session_id)
+            .outerjoin(
+                models.ProjectSession,
+                models.Trace.project_session_rowid == models.ProjectSession.id,
+            )
+            .where(models.Trace.trace_id.in_(missing_trace_ids))
+        ):
+            traces[trace.trace_id] = _TraceState(
+                trace_id=trace.trace_id,
+                project_rowid=trace.project_rowid,
+                start_time=trace.start_time,
+                end_time=trace.end_time,
+                project_session_rowid=trace.project_session_rowid,
+                rowid=trace.id,
+                original=(trace.project_rowid, trace.start_time, trace.end_time),
+            )
+            if session_id is not None:
+                trace_session_ids[trace.trace_id] = session_id
+
+    session_ids = set(trace_session_ids.values())
+    session_ids.update(filter(None, (_get_session_id(span) for span, _ in spans)))
+    if cache is not None:
+        for session_id in session_ids:
+            if (cached_session := cache.project_sessions.get(session_id)) is not None:
+                sessions[session_id] = _ProjectSessionState(
+                    session_id=session_id,
+                    project_id=cached_session.project_id,
+                    start_time=cached_session.start_time,
+                    end_time=cached_session.end_time,
+                    rowid=cached_session.rowid,
+                )
+    if missing_session_ids := session_ids - sessions.keys():
+        for row in await session.scalars(
+            select(models.ProjectSession).where(
+                models.ProjectSession.session_id.in_(missing_session_ids)
+            )
+        ):
+            sessions[row.session_id] = _ProjectSessionState(
+                session_id=row.session_id,
+                project_id=row.project_id,
+                start_time=row.start_time,
+                end_time=row.end_time,
+                rowid=row.id,
+            )
+    for trace_id, session_id in trace_session_ids.items():
+        traces[trace_id].project_session = sessions.get(session_id)
+
+    for span, project_name in spans:
+        project_rowid = project_rowids[project_name]
+        trace_id = span.context.trace_id
+        if (trace := traces.get(trace_id)) is None:
+            trace = traces[trace_id] = _TraceState(
+                trace_id=trace_id,
+                project_rowid=project_rowid,
+                start_time=span.start_time,
+                end_time=span.end_time,
+            )
+        else:
+            if trace.end_time < span.end_time:
+                trace.end_time = span.end_time
+                trace.project_rowid = project_rowid
+                trace.dirty = True
+            if span.start_time < trace.start_time:
+                trace.start_time = span.start_time
+                trace.dirty = True
+        if (project_session := trace.project_session) is None:
+            # As in `insert_span`, the session_id on the span is ignored if the trace
+            # is already associated with a project session.
+            if trace.project_session_rowid is not None:
+                continue
+            if not (session_id := _get_session_id(span)):
+                continue
+            if (project_session := sessions.get(session_id)) is None:
+                project_session = sessions[session_id] = _ProjectSessionState(
+                    session_id=session_id,
+                    project_id=project_rowid,
+                    start_time=trace.start_time,
+                    end_time=trace.end_time,
+                )
+            trace.project_session = project_session
+            trace.dirty = True
+        if trace.start_time < project_session.start_time:
+            project_session.start_time = trace.start_time
+            project_session.dirty = True
+        if project_session.end_time < trace.end_time:
+            project_session.end_time = trace.end_time
+            project_session.dirty = True
+
+    if new_sessions := [s for s in sessions.values() if s.rowid is None]:
+        rowids = {
+            session_id: id_
+            for id_, session_id in await session.execute(
+                insert(models.ProjectSession).returning(
+                    models.ProjectSession.id, models.ProjectSession.session_id
+                ),
+                [
+                    dict(
+                        session_id=s.session_id,
+                        project_id=s.project_id,
+                        start_time=s.start_time,
+                        end_time=s.end_time,
+                    )
+                    for s in new_sessions
+                ],
+            )
+        }
+        for s in new_sessions:
+            s.rowid = rowids[s.session_id]
+    if updated_sessions := [s for s in sessions.values() if s.dirty and s.rowid is not None]:
+        table = cast(Table, models.ProjectSession.__table__)
+        await session.execute(
+            update(table)
+            .where(table.c.id == bindparam("_id"))
+            .values(
+                start_time=_least(table.c.start_time, "_start_time"),
+                end_time=_greatest(table.c.end_time, "_end_time"),
+            ),
+            [
+                dict(_id=s.rowid, _start_time=s.start_time, _end_time=s.end_time)
+                for s in updated_sessions
+            ],
+        )
+    for trace in traces.values():
+        if trace.project_session is not None:
+            trace.project_session_rowid = trace.project_session.rowid
+    if new_traces := [t for t in traces.values() if t.rowid is None]:
+        rowids = {
+            trace_id: id_
+            for id_, trace_id in await session.execute(
+                insert(models.Trace).returning(models.Trace.id, models.Trace.trace_id),
+                [
+                    dict(
+                        trace_id=t.trace_id,
+                        project_rowid=t.project_rowid,
+                        start_time=t.start_time,
+                        end_time=t.end_time,
+                        project_session_rowid=t.project_session_rowid,
+                    )
+                    for t in new_traces
+                ],
+            )
+        }
+        for t in new_traces:
+            t.rowid = rowids[t.trace_id]
+    if updated_traces := [t for t in traces.values() if t.dirty and t.rowid is not None]:
+        table = cast(Table, models.Trace.__table__)
+        await session.execute(
+            update(table)
+            .where(table.c.id == bindparam("_id"))
+            .values(
+                start_time=_least(table.c.start_time, "_start_time"),
+                end_time=_greatest(table.c.end_time, "_end_time"),
+                project_rowid=case(
+                    (
+                        table.c.end_time < bindparam("_end_time", type_=table.c.end_time.type),
+                        bindparam("_project_rowid", type_=table.c.project_rowid.type),
+                    ),
+                    else_=table.c.project_rowid,
+                ),
+                project_session_rowid=func.coalesce(
+                    table.c.project_session_rowid,
+                    bindparam("_project_session_rowid", type_=table.c.project_session_rowid.type),
+                ),
+            ),
+            [
+                dict(
+                    _id=t.rowid,
+                    _start_time=t.start_time,
+                    _end_time=t.end_time,
+                    _project_rowid=t.project_rowid,
+                    _project_session_rowid=t.project_session_rowid,
+                )
+                for t in updated_traces
+            ],
+        )
+    for t in traces.values():
+        if t.original is None:
+            rollups.add_trace(t.project_rowid, t.start_time, t.end_time)
+            continue
+        if (original_project_rowid := t.original[0]) != t.project_rowid:
+            # The spans of the trace move along with it to the other project.
+            assert t.rowid is not None
+            await rollups.add_spans_of_trace(session, t.rowid, original_project_rowid, -1)
+            await rollups.add_spans_of_trace(session, t.rowid, t.project_rowid)
+            await span_tree.move_spans_of_trace(session, t.rowid, t.project_rowid)
+        rollups.move_trace(t.original, (t.project_rowid, t.start_time, t.end_time))
+
+    if cache is not None:
+        for s in sessions.values():
+            assert s.rowid is not None
+            cache.project_sessions.set(
+                s.session_id,
+                CachedProjectSession(
+                    rowid=s.rowid,
+                    project_id=s.project_id,
+                    start_time=s.start_time,
+                    end_time=s.end_time,
+                ),
+            )
+        for t in traces.values():
+            assert t.rowid is not None
+            cache.traces.set(
+                t.trace_id,
+                CachedTrace(
+                    rowid=t.rowid,
+                    project_rowid=t.project_rowid,
+                    start_time=t.start_time,
+                    end_time=t.end_time,
+                    project_session_rowid=t.project_session_rowid,
+                    session_id=None if t.project_session is None else t.project_session.session_id,
+                ),
+            )
+    return traces
+
+
+def _least(column: ColumnElement[datetime], key: str) -> ColumnElement[datetime]:
+    value = bindparam(key, type_=column.type)
+    return case((value < column, value), else_=column)
+
+
+def _greatest(column: ColumnElement[datetime], key: str) -> ColumnElement[datetime]:
+    value = bindparam(key, type_=column.type)
+    return case((column < value, value), else_=column)
+
+
+def _accumulate(
+    batch: Mapping[str, tuple[Span, str]],
+    counts: Mapping[str, _Counts],
+    existing_children: Mapping[str, _Counts],
+) -> dict[str, _Counts]:
+    """
+    Computes cumulative counts for every span in the batch, given the counts contributed
+    by children that already exist in the database.
+    """
+    children: defaultdict[str, list[str]] = defaultdict(list)
+    for span_id, (span, _) in batch.items():
+        if span.parent_id is not None and span.parent_id in batch:
+            children[span.parent_id].append(span_id)
+    ans: dict[str, _Counts] = {}
+    for root in batch:
+        if root in ans:
+            continue
+        # iterative post-order traversal, so deep traces can't exhaust the call stack
+        stack: list[tuple[str, bool]] = [(root, False)]
+        visiting: set[str] = set()
+        while stack:
+            span_id, expanded = stack.pop()
+            if expanded:
+                total = counts[span_id] + existing_children.get(span_id, _Counts())
+                for child_id in children.get(span_id, ()):
+                    total += ans.get(child_id, _Counts())
+                ans[span_id] = total
+            elif span_id not in ans and span_id not in visiting:
+                visiting.add(span_id)
+                stack.append((span_id, True))
+                stack.extend((child_id, False) for child_id in children.get(span_id, ()))
+    return ans
+
+
+async def _propagate_to_ancestors(
+    session: AsyncSession,
+    deltas: Mapping[str, _Counts],
+) -> None:
+    if not deltas:
+        return
+    updates: defaultdict[int, _Counts] = defaultdict(_Counts)
+    for span_id, path in await session.execute(
+        select(models.Span.span_id, models.SpanTreeNode.path)
+        .join_from(models.Span, models.SpanTreeNode)
+        .where(models.Span.span_id.in_(deltas))
+    ):
+        for rowid in span_tree.rowids_in_path(path):
+            updates[rowid] += deltas[span_id]
+    if not updates:
+        return
+    table = cast(Table, models.Span.__table__)
     await session.execute(
-        update(models.Span)
-        .where(models.Span.id.in_(select(ancestors.c.id)))
+        update(table)
+        .where(table.c.id == bindparam("_id"))
         .values(
-            cumulative_error_count=models.Span.cumulative_error_count + cumulative_error_count,
-            cumulative_llm_token_count_prompt=models.Span.cumulative_llm_token_count_prompt
-            + cumulative_llm_token_count_prompt,
-            cumulative_llm_token_count_completion=models.Span.cumulative_llm_token_count_completion
-            + cumulative_llm_token_count_completion,
-        )
+            cumulative_error_count=table.c.cumulative_error_count + bindparam("_error_count"),
+            cumulative_llm_token_count_prompt=table.c.cumulative_llm_token_count_prompt
+            + bindparam("_llm_token_count_prompt"),
+            cumulative_llm_token_count_completion=table.c.cumulative_llm_token_count_completion
+            + bindparam("_llm_token_count_completion"),
+        ),
+        [
+            dict(
+                _id=id_,
+                _error_count=delta.error_count,
+                _llm_token_count_prompt=delta.llm_token_count_prompt,
+                _llm_token_count_completion=delta.llm_token_count_completion,
+            )
+            for id_, delta in updates.items()
+        ],
+    )
+
+
+def _get_session_id(span: Span) -> str:
+    session_id = get_attribute_value(span.attributes, SpanAttributes.SESSION_ID)
+    return str(session_id).strip() if session_id is not None else ""
+
+
+def _get_counts(span: Span) -> _Counts:
+    return _Counts(
+        error_count=int(span.status_code is SpanStatusCode.ERROR),
+        llm_token_count_prompt=_get_int(span, SpanAttributes.LLM_TOKEN_COUNT_PROMPT),
+        llm_token_count_completion=_get_int(span, SpanAttributes.LLM_TOKEN_COUNT_COMPLETION),
     )
-    return SpanInsertionEvent(project_rowid)
+
+
+def _get_int(span: Span, key: str) -> int:
+    try:
+        return int(get_attribute_value(span.attributes, key) or 0)
+    except BaseException:
+        return 0
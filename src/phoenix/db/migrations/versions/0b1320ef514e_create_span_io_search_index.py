@@ -0,0 +1,98 @@
+"""create span io search index
+
+Revision ID: 0b1320ef514e
+Revises: e6a3a31c6bb5
+Create Date: 2025-05-19 11:27:04.862113
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0b1320ef514e"
+down_revision: Union[str, None] = "e6a3a31c6bb5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_KEYS = ("input", "output")
+
+# Same as phoenix.db.models.SPAN_IO_SEARCH_DDL at the time of this migration.
+_SQLITE_DDL = (
+    """
+    CREATE VIRTUAL TABLE span_io_search USING fts5(
+        input_value,
+        output_value,
+        content='',
+        contentless_delete=1,
+        tokenize='trigram case_sensitive 1'
+    )
+    """,
+    """
+    CREATE TRIGGER span_io_search_after_insert AFTER INSERT ON spans BEGIN
+        INSERT INTO span_io_search(rowid, input_value, output_value) VALUES (
+            new.id,
+            json_extract(new.attributes, '$.input.value'),
+            json_extract(new.attributes, '$.output.value')
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER span_io_search_after_update AFTER UPDATE OF attributes ON spans BEGIN
+        DELETE FROM span_io_search WHERE rowid = old.id;
+        INSERT INTO span_io_search(rowid, input_value, output_value) VALUES (
+            new.id,
+            json_extract(new.attributes, '$.input.value'),
+            json_extract(new.attributes, '$.output.value')
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER span_io_search_after_delete AFTER DELETE ON spans BEGIN
+        DELETE FROM span_io_search WHERE rowid = old.id;
+    END
+    """,
+)
+
+
+def upgrade() -> None:
+    connection = op.get_bind()
+    if connection.dialect.name == "postgresql":
+        # The extension may not be available, or the user may not be allowed to create
+        # it, in which case substring filters keep scanning the spans.
+        try:
+            with connection.begin_nested():
+                op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        except sa.exc.DBAPIError:
+            return
+        for key in _KEYS:
+            op.execute(
+                f"CREATE INDEX IF NOT EXISTS ix_spans_{key}_value_trgm ON spans "
+                f"USING gin ((attributes #>> '{{{key},value}}') gin_trgm_ops)"
+            )
+        return
+    for ddl in _SQLITE_DDL:
+        op.execute(ddl)
+    op.execute(
+        """
+        INSERT INTO span_io_search(rowid, input_value, output_value)
+        SELECT
+            id,
+            json_extract(attributes, '$.input.value'),
+            json_extract(attributes, '$.output.value')
+        FROM spans
+        """
+    )
+
+
+def downgrade() -> None:
+    connection = op.get_bind()
+    if connection.dialect.name == "postgresql":
+        for key in _KEYS:
+            op.execute(f"DROP INDEX IF EXISTS ix_spans_{key}_value_trgm")
+        return
+    for event in ("insert", "update", "delete"):
+        op.execute(f"DROP TRIGGER IF EXISTS span_io_search_after_{event}")
+    op.execute("DROP TABLE IF EXISTS span_io_search")
@@ -0,0 +1,30 @@
+"""add last applied at to project trace retention policies
+
+Revision ID: 1c4e8c1fd2b5
+Revises: 604296618771
+Create Date: 2025-05-29 09:12:44.681305
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "1c4e8c1fd2b5"
+down_revision: Union[str, None] = "604296618771"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("project_trace_retention_policies") as batch_op:
+        batch_op.add_column(
+            sa.Column("last_applied_at", sa.TIMESTAMP(timezone=True), nullable=True)
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("project_trace_retention_policies") as batch_op:
+        batch_op.drop_column("last_applied_at")
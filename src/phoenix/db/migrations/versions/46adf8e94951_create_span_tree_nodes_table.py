@@ -0,0 +1,70 @@
+"""create span tree nodes table
+
+Revision ID: 46adf8e94951
+Revises: 0b1320ef514e
+Create Date: 2025-05-21 09:42:17.510239
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "46adf8e94951"
+down_revision: Union[str, None] = "0b1320ef514e"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "span_tree_nodes",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column(
+            "span_rowid",
+            sa.Integer,
+            sa.ForeignKey("spans.id", ondelete="CASCADE"),
+            nullable=False,
+            unique=True,
+        ),
+        sa.Column("root_span_rowid", sa.Integer, nullable=False),
+        sa.Column("depth", sa.Integer, nullable=False),
+        sa.Column(
+            "path",
+            sa.String().with_variant(sa.String(collation="C"), "postgresql"),
+            nullable=False,
+            unique=True,
+        ),
+    )
+    # Spans whose parents don't exist are roots. Spans in cycles of parent_ids aren't
+    # reachable from any root, and are made roots afterwards.
+    op.execute(
+        """
+        WITH RECURSIVE tree(span_rowid, span_id, root_span_rowid, depth, path) AS (
+            SELECT id, span_id, id, 0, '/' || CAST(id AS TEXT) || '/'
+            FROM spans
+            WHERE parent_id IS NULL
+            OR NOT EXISTS (SELECT 1 FROM spans AS parent WHERE parent.span_id = spans.parent_id)
+            UNION ALL
+            SELECT spans.id, spans.span_id, tree.root_span_rowid, tree.depth + 1,
+                tree.path || CAST(spans.id AS TEXT) || '/'
+            FROM tree JOIN spans ON spans.parent_id = tree.span_id
+        )
+        INSERT INTO span_tree_nodes (span_rowid, root_span_rowid, depth, path)
+        SELECT span_rowid, root_span_rowid, depth, path FROM tree
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO span_tree_nodes (span_rowid, root_span_rowid, depth, path)
+        SELECT id, id, 0, '/' || CAST(id AS TEXT) || '/'
+        FROM spans
+        WHERE NOT EXISTS (SELECT 1 FROM span_tree_nodes WHERE span_rowid = spans.id)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("span_tree_nodes")
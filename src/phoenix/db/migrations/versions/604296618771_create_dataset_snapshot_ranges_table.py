@@ -0,0 +1,169 @@
+"""create dataset snapshot ranges table
+
+Revision ID: 604296618771
+Revises: ad288ae2bf44
+Create Date: 2025-05-27 10:41:18.530271
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "604296618771"
+down_revision: Union[str, None] = "ad288ae2bf44"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Same as phoenix.db.models.DATASET_SNAPSHOT_RANGES_DDL at the time of this migration.
+_TRIGGER_BODY = """
+    UPDATE dataset_snapshot_ranges
+    SET to_version_id = {new}.dataset_version_id
+    WHERE dataset_example_id = {new}.dataset_example_id
+    AND from_version_id < {new}.dataset_version_id
+    AND (to_version_id IS NULL OR to_version_id > {new}.dataset_version_id);
+    INSERT INTO dataset_snapshot_ranges (
+        dataset_id,
+        dataset_example_id,
+        dataset_example_revision_id,
+        from_version_id,
+        to_version_id
+    )
+    SELECT
+        dataset_examples.dataset_id,
+        {new}.dataset_example_id,
+        {new}.id,
+        {new}.dataset_version_id,
+        (
+            SELECT min(dataset_example_revisions.dataset_version_id)
+            FROM dataset_example_revisions
+            WHERE dataset_example_revisions.dataset_example_id = {new}.dataset_example_id
+            AND dataset_example_revisions.dataset_version_id > {new}.dataset_version_id
+        )
+    FROM dataset_examples
+    WHERE dataset_examples.id = {new}.dataset_example_id
+    AND {new}.revision_kind != 'DELETE';
+"""
+_DDL = {
+    "sqlite": (
+        f"""
+    CREATE TRIGGER dataset_snapshot_ranges_after_insert
+    AFTER INSERT ON dataset_example_revisions BEGIN
+    {_TRIGGER_BODY.format(new="new")}
+    END
+    """,
+    ),
+    "postgresql": (
+        f"""
+    CREATE OR REPLACE FUNCTION dataset_snapshot_ranges_after_insert() RETURNS trigger AS $$
+    BEGIN
+    {_TRIGGER_BODY.format(new="NEW")}
+    RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+        """
+    CREATE TRIGGER dataset_snapshot_ranges_after_insert
+    AFTER INSERT ON dataset_example_revisions
+    FOR EACH ROW EXECUTE FUNCTION dataset_snapshot_ranges_after_insert()
+    """,
+    ),
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "dataset_snapshot_ranges",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column(
+            "dataset_id",
+            sa.Integer,
+            sa.ForeignKey("datasets.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "dataset_example_id",
+            sa.Integer,
+            sa.ForeignKey("dataset_examples.id", ondelete="CASCADE"),
+            nullable=False,
+            index=True,
+        ),
+        sa.Column(
+            "dataset_example_revision_id",
+            sa.Integer,
+            sa.ForeignKey("dataset_example_revisions.id", ondelete="CASCADE"),
+            nullable=False,
+            unique=True,
+        ),
+        sa.Column(
+            "from_version_id",
+            sa.Integer,
+            sa.ForeignKey("dataset_versions.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("to_version_id", sa.Integer, nullable=True),
+    )
+    op.create_index(
+        "ix_dataset_snapshot_ranges_dataset_example",
+        "dataset_snapshot_ranges",
+        [
+            "dataset_id",
+            "dataset_example_id",
+            "from_version_id",
+            "to_version_id",
+            "dataset_example_revision_id",
+        ],
+    )
+    op.create_index(
+        "ix_dataset_snapshot_ranges_dataset_to_version_example",
+        "dataset_snapshot_ranges",
+        ["dataset_id", "to_version_id", "dataset_example_id", "dataset_example_revision_id"],
+    )
+    # Each revision, unless it is a deletion, is current until the next revision of its
+    # example, if any.
+    op.execute(
+        """
+        INSERT INTO dataset_snapshot_ranges (
+            dataset_id,
+            dataset_example_id,
+            dataset_example_revision_id,
+            from_version_id,
+            to_version_id
+        )
+        SELECT
+            dataset_examples.dataset_id,
+            revisions.dataset_example_id,
+            revisions.id,
+            revisions.dataset_version_id,
+            revisions.next_version_id
+        FROM (
+            SELECT
+                id,
+                dataset_example_id,
+                dataset_version_id,
+                revision_kind,
+                LEAD(dataset_version_id) OVER (
+                    PARTITION BY dataset_example_id ORDER BY dataset_version_id
+                ) AS next_version_id
+            FROM dataset_example_revisions
+        ) AS revisions
+        JOIN dataset_examples ON dataset_examples.id = revisions.dataset_example_id
+        WHERE revisions.revision_kind != 'DELETE'
+        """
+    )
+    for ddl in _DDL[op.get_bind().dialect.name]:
+        op.execute(ddl)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute(
+            "DROP TRIGGER IF EXISTS dataset_snapshot_ranges_after_insert "
+            "ON dataset_example_revisions"
+        )
+        op.execute("DROP FUNCTION IF EXISTS dataset_snapshot_ranges_after_insert")
+    else:
+        op.execute("DROP TRIGGER IF EXISTS dataset_snapshot_ranges_after_insert")
+    op.drop_table("dataset_snapshot_ranges")
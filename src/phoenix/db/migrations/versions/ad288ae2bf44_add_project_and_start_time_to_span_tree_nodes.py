@@ -0,0 +1,56 @@
+"""add project and start time to span tree nodes
+
+Revision ID: ad288ae2bf44
+Revises: 46adf8e94951
+Create Date: 2025-05-23 14:08:36.115402
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "ad288ae2bf44"
+down_revision: Union[str, None] = "46adf8e94951"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("span_tree_nodes") as batch_op:
+        batch_op.add_column(sa.Column("project_rowid", sa.Integer, nullable=True))
+        batch_op.add_column(sa.Column("start_time", sa.TIMESTAMP(timezone=True), nullable=True))
+    op.execute(
+        """
+        UPDATE span_tree_nodes
+        SET project_rowid = (
+            SELECT traces.project_rowid
+            FROM spans JOIN traces ON spans.trace_rowid = traces.id
+            WHERE spans.id = span_tree_nodes.span_rowid
+        ),
+        start_time = (
+            SELECT spans.start_time FROM spans WHERE spans.id = span_tree_nodes.span_rowid
+        )
+        """
+    )
+    with op.batch_alter_table("span_tree_nodes") as batch_op:
+        batch_op.alter_column("project_rowid", nullable=False, existing_nullable=True)
+        batch_op.alter_column("start_time", nullable=False, existing_nullable=True)
+        batch_op.create_index(
+            "ix_span_tree_nodes_project_start_time",
+            ["project_rowid", "start_time", "span_rowid"],
+        )
+        batch_op.create_index(
+            "ix_span_tree_nodes_project_depth_start_time",
+            ["project_rowid", "depth", "start_time", "span_rowid"],
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("span_tree_nodes") as batch_op:
+        batch_op.drop_index("ix_span_tree_nodes_project_depth_start_time")
+        batch_op.drop_index("ix_span_tree_nodes_project_start_time")
+        batch_op.drop_column("start_time")
+        batch_op.drop_column("project_rowid")
@@ -0,0 +1,116 @@
+"""create project hourly rollups table
+
+Revision ID: c0b5f5b1b5a7
+Revises: 6a88424799fe
+Create Date: 2025-05-12 10:41:37.519204
+
+"""
+
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c0b5f5b1b5a7"
+down_revision: Union[str, None] = "6a88424799fe"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COUNTS = (
+    "span_count",
+    "trace_count",
+    "error_count",
+    "llm_token_count_prompt",
+    "llm_token_count_completion",
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        "project_hourly_rollups",
+        sa.Column("id", sa.Integer, primary_key=True),
+        sa.Column(
+            "project_rowid",
+            sa.Integer,
+            sa.ForeignKey("projects.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("hour", sa.TIMESTAMP(timezone=True), nullable=False),
+        *(sa.Column(name, sa.Integer, nullable=False) for name in _COUNTS),
+        sa.UniqueConstraint("project_rowid", "hour"),
+    )
+    _backfill()
+
+
+def downgrade() -> None:
+    op.drop_table("project_hourly_rollups")
+
+
+def _backfill() -> None:
+    connection = op.get_bind()
+    if connection.dialect.name == "postgresql":
+        span_hour = "date_trunc('hour', timezone('UTC', spans.start_time))"
+        trace_hour = "date_trunc('hour', timezone('UTC', traces.start_time))"
+    else:
+        span_hour = "strftime('%Y-%m-%d %H:00:00', spans.start_time)"
+        trace_hour = "strftime('%Y-%m-%d %H:00:00', traces.start_time)"
+    rollups: defaultdict[tuple[int, datetime], dict[str, int]] = defaultdict(
+        lambda: dict.fromkeys(_COUNTS, 0)
+    )
+    spans = connection.execute(
+        sa.text(
+            f"""
+            SELECT
+                traces.project_rowid,
+                {span_hour},
+                COUNT(*),
+                SUM(CASE WHEN spans.status_code = 'ERROR' THEN 1 ELSE 0 END),
+                COALESCE(SUM(spans.llm_token_count_prompt), 0),
+                COALESCE(SUM(spans.llm_token_count_completion), 0)
+            FROM spans JOIN traces ON spans.trace_rowid = traces.id
+            GROUP BY 1, 2
+            """
+        )
+    )
+    for project_rowid, hour, span_count, error_count, prompt, completion in spans:
+        rollup = rollups[project_rowid, _as_hour(hour)]
+        rollup["span_count"] = span_count
+        rollup["error_count"] = error_count
+        rollup["llm_token_count_prompt"] = prompt
+        rollup["llm_token_count_completion"] = completion
+    traces = connection.execute(
+        sa.text(
+            f"""
+            SELECT traces.project_rowid, {trace_hour}, COUNT(*)
+            FROM traces
+            GROUP BY 1, 2
+            """
+        )
+    )
+    for project_rowid, hour, trace_count in traces:
+        rollups[project_rowid, _as_hour(hour)]["trace_count"] = trace_count
+    if not rollups:
+        return
+    table = sa.table(
+        "project_hourly_rollups",
+        sa.column("project_rowid", sa.Integer),
+        sa.column("hour", sa.TIMESTAMP(timezone=True)),
+        *(sa.column(name, sa.Integer) for name in _COUNTS),
+    )
+    op.bulk_insert(
+        table,
+        [
+            dict(project_rowid=project_rowid, hour=hour, **counts)
+            for (project_rowid, hour), counts in rollups.items()
+        ],
+    )
+
+
+def _as_hour(value: Any) -> datetime:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    assert isinstance(value, datetime)
+    return value.replace(tzinfo=timezone.utc)
@@ -4,9 +4,11 @@ from typing import Any, Iterable, Literal, Optional, Sequence, TypedDict, cast
 import sqlalchemy.sql as sql
 from openinference.semconv.trace import RerankerAttributes, SpanAttributes
 from sqlalchemy import (
+    DDL,
     JSON,
     NUMERIC,
     TIMESTAMP,
+    Boolean,
     CheckConstraint,
     ColumnElement,
     Dialect,
@@ -19,7 +21,9 @@ from sqlalchemy import (
     String,
     TypeDecorator,
     UniqueConstraint,
+    and_,
     case,
+    event,
     func,
     insert,
     select,
@@ -37,7 +41,16 @@ from sqlalchemy.orm import (
     mapped_column,
     relationship,
 )
-from sqlalchemy.sql import Values, column, compiler, expression, literal, roles, union_all
+from sqlalchemy.sql import (
+    Values,
+    column,
+    compiler,
+    expression,
+    literal,
+    roles,
+    table,
+    union_all,
+)
 from sqlalchemy.sql.compiler import SQLCompiler
 from sqlalchemy.sql.functions import coalesce
 from typing_extensions import TypeAlias
@@ -70,8 +83,12 @@ from phoenix.trace.attributes import get_attribute_value
 
 INPUT_MIME_TYPE = SpanAttributes.INPUT_MIME_TYPE.split(".")
 INPUT_VALUE = SpanAttributes.INPUT_VALUE.split(".")
+LLM_INVOCATION_PARAMETERS = SpanAttributes.LLM_INVOCATION_PARAMETERS.split(".")
+LLM_MODEL_NAME = SpanAttributes.LLM_MODEL_NAME.split(".")
+LLM_PROVIDER = SpanAttributes.LLM_PROVIDER.split(".")
 LLM_TOKEN_COUNT_TOTAL = SpanAttributes.LLM_TOKEN_COUNT_TOTAL.split(".")
 LLM_TOKEN_COUNT_PROMPT = SpanAttributes.LLM_TOKEN_COUNT_PROMPT.split(".")
+LLM_TOKEN_COUNT_PROMPT_DETAILS = SpanAttributes.LLM_TOKEN_COUNT_PROMPT_DETAILS.split(".")
 LLM_TOKEN_COUNT_COMPLETION = SpanAttributes.LLM_TOKEN_COUNT_COMPLETION.split(".")
 METADATA = SpanAttributes.METADATA.split(".")
 OUTPUT_MIME_TYPE = SpanAttributes.OUTPUT_MIME_TYPE.split(".")
@@ -423,6 +440,7 @@ class ProjectTraceRetentionPolicy(Base):
         _TraceRetentionCronExpression, nullable=False
     )
     rule: Mapped[TraceRetentionRule] = mapped_column(_TraceRetentionRule, nullable=False)
+    last_applied_at: Mapped[Optional[datetime]] = mapped_column(UtcTimeStamp, nullable=True)
     projects: Mapped[list["Project"]] = relationship(
         "Project", back_populates="trace_retention_policy", uselist=True
     )
@@ -646,6 +664,42 @@ class Span(Base):
     def _metadata_expression(cls) -> ColumnElement[Any]:
         return cls.attributes[METADATA]
 
+    @hybrid_property
+    def llm_provider(self) -> Any:
+        return get_attribute_value(self.attributes, LLM_PROVIDER)
+
+    @llm_provider.inplace.expression
+    @classmethod
+    def _llm_provider_expression(cls) -> ColumnElement[Any]:
+        return cls.attributes[LLM_PROVIDER]
+
+    @hybrid_property
+    def llm_model_name(self) -> Any:
+        return get_attribute_value(self.attributes, LLM_MODEL_NAME)
+
+    @llm_model_name.inplace.expression
+    @classmethod
+    def _llm_model_name_expression(cls) -> ColumnElement[Any]:
+        return cls.attributes[LLM_MODEL_NAME]
+
+    @hybrid_property
+    def llm_invocation_parameters(self) -> Any:
+        return get_attribute_value(self.attributes, LLM_INVOCATION_PARAMETERS)
+
+    @llm_invocation_parameters.inplace.expression
+    @classmethod
+    def _llm_invocation_parameters_expression(cls) -> ColumnElement[Any]:
+        return cls.attributes[LLM_INVOCATION_PARAMETERS]
+
+    @hybrid_property
+    def llm_token_count_prompt_details(self) -> Any:
+        return get_attribute_value(self.attributes, LLM_TOKEN_COUNT_PROMPT_DETAILS)
+
+    @llm_token_count_prompt_details.inplace.expression
+    @classmethod
+    def _llm_token_count_prompt_details_expression(cls) -> ColumnElement[Any]:
+        return cls.attributes[LLM_TOKEN_COUNT_PROMPT_DETAILS]
+
     @hybrid_property
     def num_documents(self) -> int:
         if self.span_kind.upper() == "RERANKER":
@@ -698,6 +752,86 @@ class Span(Base):
     )
 
 
+# Paths are compared bytewise, so that the descendants of a span are a contiguous range.
+SPAN_TREE_PATH = String().with_variant(String(collation="C"), "postgresql")
+
+
+class SpanTreeNode(Base):
+    """
+    The position of a span in the tree of its trace, kept up to date as spans are inserted,
+    including when children arrive before their parents. See `phoenix.db.span_tree`.
+
+    The project and start time of the span are copied here so that the spans, or the root
+    spans, of a project can be paginated by start time from an index alone.
+    """
+
+    __tablename__ = "span_tree_nodes"
+    span_rowid: Mapped[int] = mapped_column(
+        ForeignKey("spans.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+    )
+    root_span_rowid: Mapped[int] = mapped_column(nullable=False)
+    depth: Mapped[int] = mapped_column(nullable=False)
+    path: Mapped[str] = mapped_column(SPAN_TREE_PATH, nullable=False, unique=True)
+    project_rowid: Mapped[int] = mapped_column(nullable=False)
+    start_time: Mapped[datetime] = mapped_column(UtcTimeStamp, nullable=False)
+
+    __table_args__ = (
+        Index("ix_span_tree_nodes_project_start_time", "project_rowid", "start_time", "span_rowid"),
+        Index(
+            "ix_span_tree_nodes_project_depth_start_time",
+            "project_rowid",
+            "depth",
+            "start_time",
+            "span_rowid",
+        ),
+    )
+
+
+class ProjectHourlyRollup(Base):
+    """
+    Aggregates of the spans and traces of a project that started in a given hour, kept up
+    to date as spans are inserted and traces are deleted. See `phoenix.db.rollups`.
+    """
+
+    __tablename__ = "project_hourly_rollups"
+    project_rowid: Mapped[int] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    hour: Mapped[datetime] = mapped_column(UtcTimeStamp, nullable=False)
+    span_count: Mapped[int] = mapped_column(nullable=False)
+    trace_count: Mapped[int] = mapped_column(nullable=False)
+    error_count: Mapped[int] = mapped_column(nullable=False)
+    llm_token_count_prompt: Mapped[int] = mapped_column(nullable=False)
+    llm_token_count_completion: Mapped[int] = mapped_column(nullable=False)
+
+    __table_args__ = (UniqueConstraint("project_rowid", "hour"),)
+
+
+class ProjectHourlyLatencyBucket(Base):
+    """
+    A bucket of the latency sketch of the spans, or of the traces, of a project that
+    started in a given hour. See `phoenix.db.sketches`.
+    """
+
+    __tablename__ = "project_hourly_latency_buckets"
+    project_rowid: Mapped[int] = mapped_column(
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    hour: Mapped[datetime] = mapped_column(UtcTimeStamp, nullable=False)
+    kind: Mapped[str] = mapped_column(
+        CheckConstraint("kind IN ('span', 'trace')", name="valid_kind"),
+        nullable=False,
+    )
+    bucket: Mapped[int] = mapped_column(nullable=False)
+    count: Mapped[int] = mapped_column(nullable=False)
+
+    __table_args__ = (UniqueConstraint("project_rowid", "kind", "hour", "bucket"),)
+
+
 class LatencyMs(expression.FunctionElement[float]):
     # See https://docs.sqlalchemy.org/en/20/core/compiler.html
     inherit_cache = True
@@ -790,6 +924,147 @@ def _(element: Any, compiler: Any, **kw: Any) -> Any:
     return compiler.process(func.text_contains(string, substring) > 0, **kw)
 
 
+# On SQLite, the input and output values of spans are indexed for substring search by an
+# FTS5 table with the trigram tokenizer, which triggers keep in sync with the spans. The
+# table is contentless, i.e. it only holds the index and the values are read from the
+# spans. On PostgreSQL, the migrations create trigram indexes of the values instead, if
+# the `pg_trgm` extension is available. See `span_io_value_contains`.
+SPAN_IO_SEARCH_DDL: tuple[str, ...] = (
+    """
+    CREATE VIRTUAL TABLE span_io_search USING fts5(
+        input_value,
+        output_value,
+        content='',
+        contentless_delete=1,
+        tokenize='trigram case_sensitive 1'
+    )
+    """,
+    """
+    CREATE TRIGGER span_io_search_after_insert AFTER INSERT ON spans BEGIN
+        INSERT INTO span_io_search(rowid, input_value, output_value) VALUES (
+            new.id,
+            json_extract(new.attributes, '$.input.value'),
+            json_extract(new.attributes, '$.output.value')
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER span_io_search_after_update AFTER UPDATE OF attributes ON spans BEGIN
+        DELETE FROM span_io_search WHERE rowid = old.id;
+        INSERT INTO span_io_search(rowid, input_value, output_value) VALUES (
+            new.id,
+            json_extract(new.attributes, '$.input.value'),
+            json_extract(new.attributes, '$.output.value')
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER span_io_search_after_delete AFTER DELETE ON spans BEGIN
+        DELETE FROM span_io_search WHERE rowid = old.id;
+    END
+    """,
+)
+
+for _ddl in SPAN_IO_SEARCH_DDL:
+    event.listen(
+        Span.__table__,
+        "after_create",
+        DDL(_ddl).execute_if(dialect="sqlite"),  # type: ignore[no-untyped-call]
+    )
+event.listen(
+    Span.__table__,
+    "before_drop",
+    DDL("DROP TABLE IF EXISTS span_io_search").execute_if(  # type: ignore[no-untyped-call]
+        dialect="sqlite"
+    ),
+)
+
+_SPAN_IO_SEARCH = table(
+    "span_io_search",
+    column("rowid", Integer),
+    column("input_value", String),
+    column("output_value", String),
+)
+
+
+def span_io_value_contains(
+    key: Literal["input", "output"],
+    substring: str,
+) -> ColumnElement[bool]:
+    """
+    Whether the input or output value of a span contains the substring, as with
+    `TextContains`, except that the search index of the values is used if the substring
+    is long enough to be looked up in it, i.e. if it has at least three characters.
+    """
+    if len(substring) < 3:
+        return cast(
+            ColumnElement[bool],
+            TextContains(Span.attributes[[key, "value"]].as_string(), substring),
+        )
+    if key == "input":
+        return _SpanInputValueContains(Span.attributes, substring)
+    return _SpanOutputValueContains(Span.attributes, substring)
+
+
+class _SpanIOValueContains(expression.FunctionElement[bool]):
+    # See https://docs.sqlalchemy.org/en/20/core/compiler.html
+    inherit_cache = True
+    type = Boolean()
+    name = "span_io_value_contains"
+    key: Literal["input", "output"]
+
+
+class _SpanInputValueContains(_SpanIOValueContains):
+    inherit_cache = True
+    key = "input"
+
+
+class _SpanOutputValueContains(_SpanIOValueContains):
+    inherit_cache = True
+    key = "output"
+
+
+@compiles(_SpanIOValueContains)
+def _(element: Any, compiler: Any, **kw: Any) -> Any:
+    # See https://docs.sqlalchemy.org/en/20/core/compiler.html
+    attributes, substring = list(element.clauses)
+    value = attributes[[element.key, "value"]].as_string()
+    return compiler.process(TextContains(value, substring), **kw)
+
+
+@compiles(_SpanIOValueContains, "postgresql")
+def _(element: Any, compiler: Any, **kw: Any) -> Any:
+    # See https://docs.sqlalchemy.org/en/20/core/compiler.html
+    # The value is extracted with a literal path so that the expression matches that of the
+    # trigram index, which can answer LIKE but not `strpos`.
+    attributes, substring = list(element.clauses)
+    value = f"({compiler.process(attributes, **kw)} #>> '{{{element.key},value}}')"
+    escaped = func.replace(
+        func.replace(func.replace(substring, "\\", "\\\\"), "%", "\\%"), "_", "\\_"
+    )
+    pattern = literal("%").concat(escaped).concat("%")
+    return f"({value} LIKE {compiler.process(pattern, **kw)})"
+
+
+@compiles(_SpanIOValueContains, "sqlite")
+def _(element: Any, compiler: Any, **kw: Any) -> Any:
+    # See https://docs.sqlalchemy.org/en/20/core/compiler.html
+    # The substring is looked up as a phrase, i.e. as a sequence of trigrams, and the
+    # candidate spans are then checked exactly. The NULL among the matches makes the
+    # condition NULL rather than false when the value is NULL, as with `TextContains`,
+    # which matters when it is negated.
+    attributes, substring = list(element.clauses)
+    phrase = literal('"').concat(func.replace(substring, '"', '""')).concat('"')
+    matches = (
+        select(_SPAN_IO_SEARCH.c.rowid)
+        .where(_SPAN_IO_SEARCH.c[f"{element.key}_value"].match(phrase))
+        .union_all(select(sql.null()))
+    )
+    value = attributes[[element.key, "value"]].as_string()
+    condition = and_(attributes.table.c.id.in_(matches), TextContains(value, substring))
+    return f"({compiler.process(condition, **kw)})"
+
+
 async def init_models(engine: AsyncEngine) -> None:
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
@@ -939,42 +1214,18 @@ class Dataset(Base):
     @example_count.inplace.expression
     def _example_count(cls) -> ColumnElement[int]:
         return (
-            select(
-                func.sum(
-                    case(
-                        (DatasetExampleRevision.revision_kind == "CREATE", 1),
-                        (DatasetExampleRevision.revision_kind == "DELETE", -1),
-                        else_=0,
-                    )
-                )
-            )
-            .select_from(DatasetExampleRevision)
-            .join(
-                DatasetExample,
-                onclause=DatasetExample.id == DatasetExampleRevision.dataset_example_id,
-            )
-            .filter(DatasetExample.dataset_id == cls.id)
+            select(func.count(DatasetSnapshotRange.id))
+            .where(DatasetSnapshotRange.dataset_id == cls.id)
+            .where(DatasetSnapshotRange.to_version_id.is_(None))
             .label("example_count")
         )
 
     async def load_example_count(self, session: AsyncSession) -> None:
         if not hasattr(self, "_example_count_value"):
             self._example_count_value = await session.scalar(
-                select(
-                    func.sum(
-                        case(
-                            (DatasetExampleRevision.revision_kind == "CREATE", 1),
-                            (DatasetExampleRevision.revision_kind == "DELETE", -1),
-                            else_=0,
-                        )
-                    )
-                )
-                .select_from(DatasetExampleRevision)
-                .join(
-                    DatasetExample,
-                    onclause=DatasetExample.id == DatasetExampleRevision.dataset_example_id,
-                )
-                .filter(DatasetExample.dataset_id == self.id)
+                select(func.count(DatasetSnapshotRange.id))
+                .where(DatasetSnapshotRange.dataset_id == self.id)
+                .where(DatasetSnapshotRange.to_version_id.is_(None))
             )
 
 
@@ -1033,6 +1284,147 @@ class DatasetExampleRevision(Base):
     )
 
 
+class DatasetSnapshotRange(Base):
+    """
+    The range of versions of a dataset in which a revision of an example is the current
+    one, i.e. the versions from the version of the revision up to, but excluding, the
+    version of the next revision of the example. The snapshot of a version is thus the
+    ranges of the dataset that contain the version, and the snapshot of the latest version
+    is the ranges that are still open. Deleted examples have no range.
+
+    The ranges are kept up to date by a trigger on the revisions, so that every way of
+    inserting revisions is covered. See `DATASET_SNAPSHOT_RANGES_DDL`.
+    """
+
+    __tablename__ = "dataset_snapshot_ranges"
+    dataset_id: Mapped[int] = mapped_column(
+        ForeignKey("datasets.id", ondelete="CASCADE"),
+    )
+    dataset_example_id: Mapped[int] = mapped_column(
+        ForeignKey("dataset_examples.id", ondelete="CASCADE"),
+        index=True,
+    )
+    dataset_example_revision_id: Mapped[int] = mapped_column(
+        ForeignKey("dataset_example_revisions.id", ondelete="CASCADE"),
+        unique=True,
+    )
+    from_version_id: Mapped[int] = mapped_column(
+        ForeignKey("dataset_versions.id", ondelete="CASCADE"),
+    )
+    # Versions are only ever deleted along with their dataset, so this is not a foreign key.
+    to_version_id: Mapped[Optional[int]]
+
+    # The snapshot of a version is read from the first index, and that of the latest version
+    # from the second, in order of the examples and without reading the table.
+    __table_args__ = (
+        Index(
+            "ix_dataset_snapshot_ranges_dataset_example",
+            "dataset_id",
+            "dataset_example_id",
+            "from_version_id",
+            "to_version_id",
+            "dataset_example_revision_id",
+        ),
+        Index(
+            "ix_dataset_snapshot_ranges_dataset_to_version_example",
+            "dataset_id",
+            "to_version_id",
+            "dataset_example_id",
+            "dataset_example_revision_id",
+        ),
+    )
+
+
+# When a revision is inserted, the range of the revision that was current at its version,
+# if any, is closed at its version, and a range is opened for it unless it is a deletion.
+# Revisions are ordinarily inserted for the latest version, but the range of a revision
+# inserted for an earlier version is closed at the next revision of the example, if any.
+_DATASET_SNAPSHOT_RANGES_TRIGGER_BODY = """
+    UPDATE dataset_snapshot_ranges
+    SET to_version_id = {new}.dataset_version_id
+    WHERE dataset_example_id = {new}.dataset_example_id
+    AND from_version_id < {new}.dataset_version_id
+    AND (to_version_id IS NULL OR to_version_id > {new}.dataset_version_id);
+    INSERT INTO dataset_snapshot_ranges (
+        dataset_id,
+        dataset_example_id,
+        dataset_example_revision_id,
+        from_version_id,
+        to_version_id
+    )
+    SELECT
+        dataset_examples.dataset_id,
+        {new}.dataset_example_id,
+        {new}.id,
+        {new}.dataset_version_id,
+        (
+            SELECT min(dataset_example_revisions.dataset_version_id)
+            FROM dataset_example_revisions
+            WHERE dataset_example_revisions.dataset_example_id = {new}.dataset_example_id
+            AND dataset_example_revisions.dataset_version_id > {new}.dataset_version_id
+        )
+    FROM dataset_examples
+    WHERE dataset_examples.id = {new}.dataset_example_id
+    AND {new}.revision_kind != 'DELETE';
+"""
+
+DATASET_SNAPSHOT_RANGES_DDL: dict[str, tuple[str, ...]] = {
+    "sqlite": (
+        f"""
+    CREATE TRIGGER dataset_snapshot_ranges_after_insert
+    AFTER INSERT ON dataset_example_revisions BEGIN
+    {_DATASET_SNAPSHOT_RANGES_TRIGGER_BODY.format(new="new")}
+    END
+    """,
+    ),
+    "postgresql": (
+        f"""
+    CREATE OR REPLACE FUNCTION dataset_snapshot_ranges_after_insert() RETURNS trigger AS $$
+    BEGIN
+    {_DATASET_SNAPSHOT_RANGES_TRIGGER_BODY.format(new="NEW")}
+    RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+    """,
+        """
+    CREATE TRIGGER dataset_snapshot_ranges_after_insert
+    AFTER INSERT ON dataset_example_revisions
+    FOR EACH ROW EXECUTE FUNCTION dataset_snapshot_ranges_after_insert()
+    """,
+    ),
+}
+
+for _dialect, _ddls in DATASET_SNAPSHOT_RANGES_DDL.items():
+    for _ddl in _ddls:
+        event.listen(
+            DatasetSnapshotRange.__table__,
+            "after_create",
+            DDL(_ddl).execute_if(dialect=_dialect),  # type: ignore[no-untyped-call]
+        )
+event.listen(
+    DatasetSnapshotRange.__table__,
+    "before_drop",
+    DDL(  # type: ignore[no-untyped-call]
+        "DROP TRIGGER IF EXISTS dataset_snapshot_ranges_after_insert"
+    ).execute_if(dialect="sqlite"),
+)
+event.listen(
+    DatasetSnapshotRange.__table__,
+    "before_drop",
+    DDL(  # type: ignore[no-untyped-call]
+        "DROP TRIGGER IF EXISTS dataset_snapshot_ranges_after_insert "
+        "ON dataset_example_revisions"
+    ).execute_if(dialect="postgresql"),
+)
+event.listen(
+    DatasetSnapshotRange.__table__,
+    "after_drop",
+    DDL(  # type: ignore[no-untyped-call]
+        "DROP FUNCTION IF EXISTS dataset_snapshot_ranges_after_insert"
+    ).execute_if(dialect="postgresql"),
+)
+
+
 class Experiment(Base):
     __tablename__ = "experiments"
     dataset_id: Mapped[int] = mapped_column(
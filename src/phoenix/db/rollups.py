@@ -0,0 +1,332 @@
+"""
+Hourly rollups of the spans and traces of each project.
+
+A `ProjectHourlyRollup` holds the number of spans, traces and spans with errors of a
+project that started in a given hour, along with the token counts of those spans, and the
+`ProjectHourlyLatencyBucket`s of that hour hold the sketches of the latencies of those
+spans and traces (see `phoenix.db.sketches`). Code that inserts spans or deletes traces
+records the changes it makes in `RollupDeltas`, and applies them in the same transaction,
+so that the rollups stay consistent with the spans without ever being recomputed.
+Aggregates over a time range are then read from the rollups of the whole hours in the
+range, and only the partial hours at its edges, if any, are computed from the spans (see
+`split_time_range`).
+"""
+
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from typing import Any, Literal, NamedTuple, Optional
+
+from sqlalchemy import ColumnElement, delete, select
+from sqlalchemy.dialects.postgresql import insert as insert_postgresql
+from sqlalchemy.dialects.sqlite import insert as insert_sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing_extensions import TypeAlias, assert_never
+
+from phoenix.datetime_utils import normalize_datetime
+from phoenix.db import models
+from phoenix.db.helpers import SupportedSQLDialect
+from phoenix.db.sketches import bucket_of, latency_ms
+
+ProjectRowId: TypeAlias = int
+Hour: TypeAlias = datetime
+LatencyKind: TypeAlias = Literal["span", "trace"]
+Bucket: TypeAlias = int
+TimeInterval: TypeAlias = tuple[Optional[datetime], Optional[datetime]]
+
+
+class RollupCounts(NamedTuple):
+    span_count: int = 0
+    trace_count: int = 0
+    error_count: int = 0
+    llm_token_count_prompt: int = 0
+    llm_token_count_completion: int = 0
+
+    def __add__(self, other: Any) -> "RollupCounts":
+        if not isinstance(other, RollupCounts):
+            return NotImplemented
+        return RollupCounts(*(a + b for a, b in zip(self, other)))
+
+    def __neg__(self) -> "RollupCounts":
+        return RollupCounts(*(-a for a in self))
+
+
+class RollupDeltas:
+    """
+    Changes to the rollups, accumulated in memory by (project, hour) and applied at once.
+    """
+
+    def __init__(self) -> None:
+        self._deltas: defaultdict[tuple[ProjectRowId, Hour], RollupCounts] = defaultdict(
+            RollupCounts
+        )
+        self._buckets: defaultdict[tuple[ProjectRowId, LatencyKind, Hour, Bucket], int] = (
+            defaultdict(int)
+        )
+
+    def add(self, project_rowid: ProjectRowId, hour: Hour, counts: RollupCounts) -> None:
+        self._deltas[project_rowid, hour] += counts
+
+    def add_span(
+        self,
+        project_rowid: ProjectRowId,
+        start_time: datetime,
+        end_time: datetime,
+        status_code: str,
+        llm_token_count_prompt: Optional[int],
+        llm_token_count_completion: Optional[int],
+        sign: int = 1,
+    ) -> None:
+        hour = hour_of(start_time)
+        counts = RollupCounts(
+            span_count=1,
+            error_count=int(status_code == "ERROR"),
+            llm_token_count_prompt=llm_token_count_prompt or 0,
+            llm_token_count_completion=llm_token_count_completion or 0,
+        )
+        self.add(project_rowid, hour, counts if sign > 0 else -counts)
+        bucket = bucket_of(latency_ms(start_time, end_time))
+        self._buckets[project_rowid, "span", hour, bucket] += sign
+
+    def add_trace(
+        self,
+        project_rowid: ProjectRowId,
+        start_time: datetime,
+        end_time: datetime,
+        sign: int = 1,
+    ) -> None:
+        hour = hour_of(start_time)
+        self.add(project_rowid, hour, RollupCounts(trace_count=sign))
+        bucket = bucket_of(latency_ms(start_time, end_time))
+        self._buckets[project_rowid, "trace", hour, bucket] += sign
+
+    def move_trace(
+        self,
+        old: tuple[ProjectRowId, datetime, datetime],
+        new: tuple[ProjectRowId, datetime, datetime],
+    ) -> None:
+        """
+        Records a change of the project or of the time bounds, given as (project, start
+        time, end time), of an existing trace. Its existing spans have to be moved
+        separately if the project changed (see `add_spans_of_trace`).
+        """
+        if old == new:
+            return
+        self.add_trace(*old, sign=-1)
+        self.add_trace(*new)
+
+    async def add_spans_of_trace(
+        self,
+        session: AsyncSession,
+        trace_rowid: int,
+        project_rowid: ProjectRowId,
+        sign: int = 1,
+    ) -> None:
+        """
+        Records the spans of a trace that exist in the database as belonging to the given
+        project, or as no longer belonging to it if the sign is negative.
+        """
+        stmt = select(*_SPAN_COLUMNS).where(models.Span.trace_rowid == trace_rowid)
+        for start_time, end_time, status_code, prompt, completion in await session.execute(stmt):
+            self.add_span(
+                project_rowid, start_time, end_time, status_code, prompt, completion, sign
+            )
+
+    async def apply(self, session: AsyncSession) -> None:
+        deltas = sorted((key, counts) for key, counts in self._deltas.items() if any(counts))
+        buckets = sorted((key, count) for key, count in self._buckets.items() if count)
+        self._deltas.clear()
+        self._buckets.clear()
+        dialect = SupportedSQLDialect(session.bind.dialect.name)
+        if deltas:
+            rollup = models.ProjectHourlyRollup
+            await session.execute(
+                _upsert(dialect, rollup, "project_rowid", "hour"),
+                [
+                    dict(project_rowid=pid, hour=hour, **counts._asdict())
+                    for (pid, hour), counts in deltas
+                ],
+            )
+            if any(min(counts) < 0 for _, counts in deltas):
+                await session.execute(
+                    delete(rollup)
+                    .where(rollup.project_rowid.in_({pid for (pid, _), _ in deltas}))
+                    .where(rollup.span_count <= 0)
+                    .where(rollup.trace_count <= 0)
+                )
+        if buckets:
+            bucket = models.ProjectHourlyLatencyBucket
+            await session.execute(
+                _upsert(dialect, bucket, "project_rowid", "kind", "hour", "bucket"),
+                [
+                    dict(project_rowid=pid, kind=kind, hour=hour, bucket=b, count=count)
+                    for (pid, kind, hour, b), count in buckets
+                ],
+            )
+            if any(count < 0 for _, count in buckets):
+                await session.execute(
+                    delete(bucket)
+                    .where(bucket.project_rowid.in_({pid for (pid, *_), _ in buckets}))
+                    .where(bucket.count <= 0)
+                )
+
+
+async def add_single_span_traces(session: AsyncSession, spans: Iterable[models.Span]) -> None:
+    """
+    Adds new traces consisting of a single span each, such as those of the playground,
+    to the rollups. The spans must have their trace attached.
+    """
+    deltas = RollupDeltas()
+    for span in spans:
+        deltas.add_trace(span.trace.project_rowid, span.trace.start_time, span.trace.end_time)
+        deltas.add_span(
+            span.trace.project_rowid,
+            span.start_time,
+            span.end_time,
+            span.status_code,
+            span.llm_token_count_prompt,
+            span.llm_token_count_completion,
+        )
+    await deltas.apply(session)
+
+
+async def subtract_traces(session: AsyncSession, condition: ColumnElement[bool]) -> None:
+    """
+    Removes the traces matching the condition on `Trace`, along with their spans, from the
+    rollups. This must be called in the same transaction as, and before, their deletion.
+    """
+    deltas = await _aggregate(session, condition, sign=-1)
+    await deltas.apply(session)
+
+
+async def clear_rollups(
+    session: AsyncSession,
+    project_rowids: Optional[Iterable[ProjectRowId]] = None,
+) -> None:
+    """
+    Deletes the rollups of the given projects, or of all projects. When all the traces of a
+    project are deleted, this takes the place of `subtract_traces`, which would have to read
+    every one of their spans.
+    """
+    if project_rowids is not None:
+        project_rowids = set(project_rowids)
+    for table in (models.ProjectHourlyRollup, models.ProjectHourlyLatencyBucket):
+        stmt = delete(table)
+        if project_rowids is not None:
+            stmt = stmt.where(table.project_rowid.in_(project_rowids))
+        await session.execute(stmt)
+
+
+async def rebuild_rollups(
+    session: AsyncSession,
+    project_rowids: Optional[Iterable[ProjectRowId]] = None,
+) -> None:
+    """
+    Recomputes the rollups of the given projects, or of all projects, from scratch. This is
+    only needed for spans and traces that were written without going through
+    `RollupDeltas`.
+    """
+    condition: Optional[ColumnElement[bool]] = None
+    if project_rowids is not None:
+        project_rowids = set(project_rowids)
+        condition = models.Trace.project_rowid.in_(project_rowids)
+    await clear_rollups(session, project_rowids)
+    deltas = await _aggregate(session, condition, sign=1)
+    await deltas.apply(session)
+
+
+def split_time_range(
+    start_time: Optional[datetime],
+    end_time: Optional[datetime],
+) -> tuple[Optional[TimeInterval], list[TimeInterval]]:
+    """
+    Splits the interval [start_time, end_time) into whole hours, whose aggregates can be
+    read from the rollups, and the partial hours at either end, whose aggregates have to
+    be computed from the spans. The interval of whole hours is None if there are none.
+    """
+    start_time, end_time = normalize_datetime(start_time), normalize_datetime(end_time)
+    lower = ceil_hour(start_time) if start_time else None
+    upper = hour_of(end_time) if end_time else None
+    if lower is not None and upper is not None and upper <= lower:
+        return None, [(start_time, end_time)]
+    edges: list[TimeInterval] = []
+    if start_time and lower != start_time:
+        edges.append((start_time, lower))
+    if end_time and upper != end_time:
+        edges.append((upper, end_time))
+    return (lower, upper), edges
+
+
+def hour_of(t: datetime) -> Hour:
+    """
+    The start of the hour containing the given time, in UTC. As when binding timestamps,
+    naive times are taken to be local.
+    """
+    normalized = normalize_datetime(t)
+    assert normalized is not None
+    return normalized.replace(minute=0, second=0, microsecond=0)
+
+
+def ceil_hour(t: datetime) -> Hour:
+    """
+    The start of the hour following the given time, or the given time if it is already
+    the start of an hour, in UTC.
+    """
+    hour = hour_of(t)
+    return hour if hour == normalize_datetime(t) else hour + timedelta(hours=1)
+
+
+async def _aggregate(
+    session: AsyncSession,
+    condition: Optional[ColumnElement[bool]],
+    sign: int,
+) -> RollupDeltas:
+    # The latency of each span and trace is needed for its bucket, so the rows are
+    # aggregated here rather than in SQL.
+    deltas = RollupDeltas()
+    pid = models.Trace.project_rowid
+    spans = select(pid, *_SPAN_COLUMNS).join_from(models.Trace, models.Span)
+    traces = select(pid, models.Trace.start_time, models.Trace.end_time)
+    if condition is not None:
+        spans = spans.where(condition)
+        traces = traces.where(condition)
+    async for (
+        project_rowid,
+        start_time,
+        end_time,
+        status_code,
+        prompt,
+        completion,
+    ) in await session.stream(spans):
+        deltas.add_span(project_rowid, start_time, end_time, status_code, prompt, completion, sign)
+    async for project_rowid, start_time, end_time in await session.stream(traces):
+        deltas.add_trace(project_rowid, start_time, end_time, sign=sign)
+    return deltas
+
+
+_SPAN_COLUMNS = (
+    models.Span.start_time,
+    models.Span.end_time,
+    models.Span.status_code,
+    models.Span.llm_token_count_prompt,
+    models.Span.llm_token_count_completion,
+)
+
+
+def _upsert(dialect: SupportedSQLDialect, table: Any, *index_elements: str) -> Any:
+    stmt: Any
+    if dialect is SupportedSQLDialect.POSTGRESQL:
+        stmt = insert_postgresql(table)
+    elif dialect is SupportedSQLDialect.SQLITE:
+        stmt = insert_sqlite(table)
+    else:
+        assert_never(dialect)
+    increments = [
+        column.name
+        for column in table.__table__.columns
+        if not column.primary_key and column.name not in index_elements
+    ]
+    return stmt.on_conflict_do_update(
+        index_elements=list(index_elements),
+        set_={name: getattr(table, name) + stmt.excluded[name] for name in increments},
+    )
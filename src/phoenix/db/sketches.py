@@ -0,0 +1,96 @@
+"""
+Mergeable sketches of latency distributions.
+
+`LatencySketch` is a DDSketch (https://arxiv.org/abs/1908.10693): latencies are counted in
+buckets whose boundaries grow geometrically, so that any quantile it returns is within
+`RELATIVE_ACCURACY` of the exact value, and sketches are merged by adding the counts of
+their buckets. Since a bucket is identified by an integer, the sketches of the hourly
+rollups are stored as one row per non-empty bucket and merged with `SUM` in SQL.
+"""
+
+import math
+from collections import defaultdict
+from datetime import datetime
+from typing import Final, Optional
+
+RELATIVE_ACCURACY: Final[float] = 0.01
+"""
+The relative accuracy of quantiles. Changing it invalidates the stored sketches.
+"""
+
+_GAMMA: Final[float] = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+_LN_GAMMA: Final[float] = math.log(_GAMMA)
+
+# The buckets of negative latencies, e.g. due to clock skew, mirror those of positive
+# latencies and are offset by this much. The index of a bucket of a finite positive float
+# is well within (-2**16, 2**16), so the offset buckets never collide with the others.
+_NEGATIVE_OFFSET: Final[int] = 2**30
+_ZERO_BUCKET: Final[int] = -(2**30)
+
+
+def latency_ms(start_time: datetime, end_time: datetime) -> float:
+    return (end_time - start_time).total_seconds() * 1000
+
+
+def bucket_of(value: float) -> int:
+    if value == 0:
+        return _ZERO_BUCKET
+    if value < 0:
+        return _NEGATIVE_OFFSET + bucket_of(-value)
+    return math.ceil(math.log(value) / _LN_GAMMA)
+
+
+def value_of(bucket: int) -> float:
+    """
+    The value representing the bucket, which is within the relative accuracy of any value
+    in the bucket.
+    """
+    if bucket == _ZERO_BUCKET:
+        return 0.0
+    if bucket > _NEGATIVE_OFFSET // 2:
+        return -value_of(bucket - _NEGATIVE_OFFSET)
+    return 2 * _GAMMA**bucket / (_GAMMA + 1)
+
+
+class LatencySketch:
+    def __init__(self) -> None:
+        self._counts: defaultdict[int, int] = defaultdict(int)
+        self._count = 0
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def add(self, value: float) -> None:
+        self.add_bucket(bucket_of(value), 1)
+
+    def add_bucket(self, bucket: int, count: int) -> None:
+        self._counts[bucket] += count
+        self._count += count
+
+    def merge(self, other: "LatencySketch") -> None:
+        for bucket, count in other._counts.items():
+            self.add_bucket(bucket, count)
+
+    def quantile(self, probability: float) -> Optional[float]:
+        """
+        Returns the estimated quantile, or None if the sketch is empty. As with
+        `percentile_cont`, the quantile is interpolated between the values of rank
+        floor(p * (n - 1)) and ceil(p * (n - 1)) among the n values, counting from zero.
+        """
+        if self._count <= 0:
+            return None
+        rank = probability * (self._count - 1)
+        lower = math.floor(rank)
+        upper = min(lower + 1, self._count - 1)
+        values: list[float] = []
+        cumulative_count = 0
+        buckets = (bucket for bucket, count in self._counts.items() if count > 0)
+        for bucket in sorted(buckets, key=value_of):
+            cumulative_count += self._counts[bucket]
+            while len(values) < 2 and cumulative_count > (lower, upper)[len(values)]:
+                values.append(value_of(bucket))
+            if len(values) == 2:
+                break
+        lower_value, upper_value = values
+        return lower_value + (upper_value - lower_value) * (rank - lower)
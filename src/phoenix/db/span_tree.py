@@ -0,0 +1,236 @@
+"""
+Materialized trees of the spans of each trace.
+
+A `SpanTreeNode` records the depth of a span, the row id of the root of its tree, and its
+path, i.e. the row ids of its ancestors and of itself, e.g. "/12/45/78/". Since a path is a
+prefix of the paths of all the descendants of the span, the descendants are the range of
+paths between "/12/45/" and "/12/450" (see `descendant_path_range`), and the ancestors are
+read from the path itself (see `rowids_in_path`), so that neither requires walking the
+`parent_id` of the spans one level at a time.
+
+Code that inserts spans adds their nodes in the same transaction (see `add_spans`). A span
+whose parent hasn't arrived yet is the root of its own tree until its parent is inserted,
+at which point its subtree is moved under the parent. The roots of a project, i.e. the
+nodes of depth 0, are thereby indexed along with the start times of their spans, so that
+they can be paginated without checking whether their parents exist.
+"""
+
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any, NamedTuple, Optional, Union, cast
+
+from sqlalchemy import (
+    ColumnElement,
+    Table,
+    Update,
+    bindparam,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import QueryableAttribute
+from typing_extensions import TypeAlias
+
+from phoenix.db import models
+
+SpanRowId: TypeAlias = int
+SpanId: TypeAlias = str
+ParentId: TypeAlias = Optional[str]
+ProjectRowId: TypeAlias = int
+_Path: TypeAlias = Union[ColumnElement[str], QueryableAttribute[str]]
+
+
+class _Node(NamedTuple):
+    span_rowid: SpanRowId
+    root_span_rowid: SpanRowId
+    depth: int
+    path: str
+    project_rowid: ProjectRowId
+    start_time: datetime
+
+
+async def add_spans(
+    session: AsyncSession,
+    spans: Iterable[tuple[SpanRowId, SpanId, ParentId, ProjectRowId, datetime]],
+) -> None:
+    """
+    Adds the nodes of newly inserted spans, given as (row id, span_id, parent_id, project
+    row id, start time), and moves the subtrees of existing spans whose parents are among
+    them.
+    """
+    batch = {
+        span_id: (rowid, parent_id, project_rowid, start_time)
+        for rowid, span_id, parent_id, project_rowid, start_time in spans
+    }
+    if not batch:
+        return
+    nodes: dict[SpanId, _Node] = {}
+    if parent_ids := {p for _, p, *_ in batch.values() if p is not None and p not in batch}:
+        for span_id, *columns in await session.execute(
+            select(models.Span.span_id, *_NODE_COLUMNS)
+            .join_from(models.SpanTreeNode, models.Span)
+            .where(models.Span.span_id.in_(parent_ids))
+        ):
+            nodes[span_id] = _Node(*columns)
+    new_nodes: dict[SpanId, _Node] = {}
+    for span_id in batch:
+        # Walk up to the nearest ancestor with a node, then add the nodes on the way down.
+        chain: list[SpanId] = []
+        parent_id: ParentId = span_id
+        while parent_id in batch and parent_id not in new_nodes and parent_id not in chain:
+            chain.append(parent_id)
+            parent_id = batch[parent_id][1]
+        parent = None
+        if parent_id is not None and parent_id not in chain:
+            parent = new_nodes.get(parent_id) or nodes.get(parent_id)
+        for child_id in reversed(chain):
+            rowid, _, project_rowid, start_time = batch[child_id]
+            if parent is None:
+                node = _Node(rowid, rowid, 0, f"/{rowid}/", project_rowid, start_time)
+            else:
+                node = _Node(
+                    rowid,
+                    parent.root_span_rowid,
+                    parent.depth + 1,
+                    f"{parent.path}{rowid}/",
+                    project_rowid,
+                    start_time,
+                )
+            new_nodes[child_id] = parent = node
+    await session.execute(
+        insert(models.SpanTreeNode),
+        [node._asdict() for node in new_nodes.values()],
+    )
+    # Spans that arrived before their parents are the roots of their own trees so far.
+    new_rowids = {rowid for rowid, *_ in batch.values()}
+    orphans = [
+        dict(_rowid=rowid, _parent=new_nodes[parent_id].span_rowid)
+        for rowid, parent_id in await session.execute(
+            select(models.SpanTreeNode.span_rowid, models.Span.parent_id)
+            .join_from(models.SpanTreeNode, models.Span)
+            .where(models.Span.parent_id.in_(new_nodes))
+            .where(models.SpanTreeNode.depth == 0)
+        )
+        if rowid not in new_rowids
+    ]
+    if orphans:
+        await session.execute(_MOVE_SUBTREE, orphans)
+
+
+async def rebuild_span_tree(
+    session: AsyncSession,
+    trace_rowids: Optional[Iterable[int]] = None,
+) -> None:
+    """
+    Recomputes the nodes of the spans of the given traces, or of all traces, from scratch.
+    This is only needed for spans that were written without going through `add_spans`.
+    """
+    spans = select(
+        models.Span.id,
+        models.Span.span_id,
+        models.Span.parent_id,
+        models.Trace.project_rowid,
+        models.Span.start_time,
+    ).join_from(models.Span, models.Trace)
+    stmt = delete(models.SpanTreeNode)
+    if trace_rowids is not None:
+        condition = models.Span.trace_rowid.in_(set(trace_rowids))
+        spans = spans.where(condition)
+        stmt = stmt.where(
+            models.SpanTreeNode.span_rowid.in_(select(models.Span.id).where(condition))
+        )
+    await session.execute(stmt)
+    await add_spans(
+        session,
+        [
+            (rowid, span_id, parent_id, pid, t)
+            for rowid, span_id, parent_id, pid, t in await session.execute(spans)
+        ],
+    )
+
+
+async def move_spans_of_trace(
+    session: AsyncSession,
+    trace_rowid: int,
+    project_rowid: ProjectRowId,
+) -> None:
+    """
+    Records that the spans of an existing trace now belong to the given project.
+    """
+    await session.execute(
+        update(models.SpanTreeNode)
+        .where(
+            models.SpanTreeNode.span_rowid.in_(
+                select(models.Span.id).where(models.Span.trace_rowid == trace_rowid)
+            )
+        )
+        .values(project_rowid=project_rowid)
+    )
+
+
+def rowids_in_path(path: str) -> list[SpanRowId]:
+    """
+    The row ids of the ancestors of a span, from the root down, followed by its own.
+    """
+    return [int(rowid) for rowid in path.strip("/").split("/")]
+
+
+def descendant_path_range(
+    path: _Path,
+) -> tuple[_Path, ColumnElement[str]]:
+    """
+    The bounds, exclusive of both, of the paths of the descendants of the span with the
+    given path. "0" is the character following "/".
+    """
+    return path, func.substr(path, 1, func.length(path) - 1).concat(literal("0"))
+
+
+_NODE_COLUMNS = (
+    models.SpanTreeNode.span_rowid,
+    models.SpanTreeNode.root_span_rowid,
+    models.SpanTreeNode.depth,
+    models.SpanTreeNode.path,
+    models.SpanTreeNode.project_rowid,
+    models.SpanTreeNode.start_time,
+)
+
+
+def _move_subtree() -> Update:
+    # Moves the subtree of the root `_rowid` under `_parent`. The parent is read from the
+    # database rather than from memory, since it may itself have been moved by a preceding
+    # execution, and nothing is moved if the parent is in the subtree, i.e. if there's a
+    # cycle.
+    table = cast(Table, models.SpanTreeNode.__table__)
+    parent = table.alias("parent")
+    subtree = table.alias("subtree")
+
+    def of_parent(column: str) -> Any:
+        return (
+            select(parent.c[column])
+            .where(parent.c.span_rowid == bindparam("_parent"))
+            .scalar_subquery()
+        )
+
+    root_path = (
+        select(subtree.c.path).where(subtree.c.span_rowid == bindparam("_rowid")).scalar_subquery()
+    )
+    lower, upper = descendant_path_range(root_path)
+    parent_path = of_parent("path")
+    return (
+        update(table)
+        .where(table.c.path >= lower)  # the root itself is moved too
+        .where(table.c.path < upper)
+        .where(~((parent_path >= lower) & (parent_path < upper)))
+        .values(
+            root_span_rowid=of_parent("root_span_rowid"),
+            depth=table.c.depth + of_parent("depth") + 1,
+            path=parent_path.concat(func.substr(table.c.path, 2)),
+        )
+    )
+
+
+_MOVE_SUBTREE = _move_subtree()
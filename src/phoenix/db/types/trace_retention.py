@@ -7,8 +7,6 @@ import sqlalchemy as sa
 from pydantic import AfterValidator, BaseModel, Field, RootModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from phoenix.utilities import hour_of_week
-
 
 class _MaxDays(BaseModel):
     max_days: Annotated[float, Field(ge=0)]
@@ -46,6 +44,10 @@ class MaxDaysRule(_MaxDays, BaseModel):
     def __bool__(self) -> bool:
         return self.max_days > 0
 
+    @property
+    def trace_filter(self) -> sa.ColumnElement[bool]:
+        return self.max_days_filter
+
     async def delete_traces(
         self,
         session: AsyncSession,
@@ -53,15 +55,7 @@ class MaxDaysRule(_MaxDays, BaseModel):
     ) -> set[int]:
         if self.max_days <= 0:
             return set()
-        from phoenix.db.models import Trace
-
-        stmt = (
-            sa.delete(Trace)
-            .where(Trace.project_rowid.in_(project_rowids))
-            .where(self.max_days_filter)
-            .returning(Trace.project_rowid)
-        )
-        return set(await session.scalars(stmt))
+        return await _delete_traces(session, project_rowids, self.trace_filter)
 
 
 class MaxCountRule(_MaxCount, BaseModel):
@@ -70,6 +64,10 @@ class MaxCountRule(_MaxCount, BaseModel):
     def __bool__(self) -> bool:
         return self.max_count > 0
 
+    @property
+    def trace_filter(self) -> sa.ColumnElement[bool]:
+        return self.max_count_filter
+
     async def delete_traces(
         self,
         session: AsyncSession,
@@ -77,15 +75,7 @@ class MaxCountRule(_MaxCount, BaseModel):
     ) -> set[int]:
         if self.max_count <= 0:
             return set()
-        from phoenix.db.models import Trace
-
-        stmt = (
-            sa.delete(Trace)
-            .where(Trace.project_rowid.in_(project_rowids))
-            .where(self.max_count_filter)
-            .returning(Trace.project_rowid)
-        )
-        return set(await session.scalars(stmt))
+        return await _delete_traces(session, project_rowids, self.trace_filter)
 
 
 class MaxDaysOrCountRule(_MaxDays, _MaxCount, BaseModel):
@@ -94,6 +84,10 @@ class MaxDaysOrCountRule(_MaxDays, _MaxCount, BaseModel):
     def __bool__(self) -> bool:
         return self.max_days > 0 or self.max_count > 0
 
+    @property
+    def trace_filter(self) -> sa.ColumnElement[bool]:
+        return sa.or_(self.max_days_filter, self.max_count_filter)
+
     async def delete_traces(
         self,
         session: AsyncSession,
@@ -101,15 +95,7 @@ class MaxDaysOrCountRule(_MaxDays, _MaxCount, BaseModel):
     ) -> set[int]:
         if self.max_days <= 0 and self.max_count <= 0:
             return set()
-        from phoenix.db.models import Trace
-
-        stmt = (
-            sa.delete(Trace)
-            .where(Trace.project_rowid.in_(project_rowids))
-            .where(sa.or_(self.max_days_filter, self.max_count_filter))
-            .returning(Trace.project_rowid)
-        )
-        return set(await session.scalars(stmt))
+        return await _delete_traces(session, project_rowids, self.trace_filter)
 
 
 class TraceRetentionRule(RootModel[Union[MaxDaysRule, MaxCountRule, MaxDaysOrCountRule]]):
@@ -120,6 +106,13 @@ class TraceRetentionRule(RootModel[Union[MaxDaysRule, MaxCountRule, MaxDaysOrCou
     def __bool__(self) -> bool:
         return bool(self.root)
 
+    @property
+    def trace_filter(self) -> sa.ColumnElement[bool]:
+        """
+        The condition on `Trace` for traces to be deleted.
+        """
+        return self.root.trace_filter
+
     async def delete_traces(
         self,
         session: AsyncSession,
@@ -128,6 +121,20 @@ class TraceRetentionRule(RootModel[Union[MaxDaysRule, MaxCountRule, MaxDaysOrCou
         return await self.root.delete_traces(session, project_rowids)
 
 
+async def _delete_traces(
+    session: AsyncSession,
+    project_rowids: Union[Iterable[int], sa.ScalarSelect[int]],
+    trace_filter: sa.ColumnElement[bool],
+) -> set[int]:
+    from phoenix.db.models import Trace
+    from phoenix.db.rollups import subtract_traces
+
+    condition = sa.and_(Trace.project_rowid.in_(project_rowids), trace_filter)
+    await subtract_traces(session, condition)
+    stmt = sa.delete(Trace).where(condition).returning(Trace.project_rowid)
+    return set(await session.scalars(stmt))
+
+
 def _time_of_next_run(
     cron_expression: str,
     after: Optional[datetime] = None,
@@ -151,6 +158,50 @@ def _time_of_next_run(
         ValueError: If the expression has non-wildcard values for day-of-month or month, if the
             minute field is not '0', or if no match is found within the next 7 days (168 hours).
     """
+    hours, python_days_of_week = _parse_cron_expression(cron_expression)
+    t = after.replace(tzinfo=timezone.utc) if after else datetime.now(timezone.utc)
+    t = t.replace(minute=0, second=0, microsecond=0)
+    for _ in range(168):  # Check up to 7 days (168 hours)
+        t += timedelta(hours=1)
+        if t.hour in hours and t.weekday() in python_days_of_week:
+            return t
+    raise ValueError("No matching execution time found within the next 7 days.")
+
+
+def _time_of_prev_run(
+    cron_expression: str,
+    at: datetime,
+) -> datetime:
+    """
+    Parse a cron expression and calculate the UTC datetime of the latest run at or before
+    the given time. The same restrictions as for `_time_of_next_run` apply.
+
+    Args:
+        cron_expression (str): Standard cron expression with 5 fields:
+            minute hour day-of-month month day-of-week
+        at: datetime: The datetime to search back from. Must be timezone-aware.
+
+    Returns:
+        datetime: The datetime of the previous run. Timezone is UTC.
+
+    Raises:
+        ValueError: If the expression is invalid, or if no match is found within the
+            previous 7 days (168 hours).
+    """
+    hours, python_days_of_week = _parse_cron_expression(cron_expression)
+    t = at.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    for _ in range(168):  # Check up to 7 days (168 hours)
+        if t.hour in hours and t.weekday() in python_days_of_week:
+            return t
+        t -= timedelta(hours=1)
+    raise ValueError("No matching execution time found within the previous 7 days.")
+
+
+def _parse_cron_expression(cron_expression: str) -> tuple[set[int], set[int]]:
+    """
+    Parse a cron expression into its hours (0-23) and its days of week in Python's weekday
+    format (0-6, where 0 is Monday).
+    """
     fields: list[str] = cron_expression.strip().split()
     if len(fields) != 5:
         raise ValueError(
@@ -167,27 +218,20 @@ def _time_of_next_run(
     # Convert to Python's weekday format (0-6, where 0 is Monday)
     # Sunday (0 in cron) becomes 6 in Python's weekday()
     python_days_of_week = {(day_of_week + 6) % 7 for day_of_week in days_of_week}
-    t = after.replace(tzinfo=timezone.utc) if after else datetime.now(timezone.utc)
-    t = t.replace(minute=0, second=0, microsecond=0)
-    for _ in range(168):  # Check up to 7 days (168 hours)
-        t += timedelta(hours=1)
-        if t.hour in hours and t.weekday() in python_days_of_week:
-            return t
-    raise ValueError("No matching execution time found within the next 7 days.")
+    return hours, python_days_of_week
 
 
 class TraceRetentionCronExpression(RootModel[str]):
     root: Annotated[str, AfterValidator(lambda x: (_time_of_next_run(x), x)[1])]
 
-    def get_hour_of_prev_run(self) -> int:
+    def get_time_of_prev_run(self, at: datetime) -> datetime:
         """
-        Calculate the hour of the previous run before now.
+        Calculate the time of the latest run at or before the given time.
 
         Returns:
-            int: The hour of the previous run (0-167), where 0 is midnight Sunday UTC.
+            datetime: The start of the hour of the previous run, in UTC.
         """
-        after = datetime.now(timezone.utc) - timedelta(hours=1)
-        return hour_of_week(_time_of_next_run(self.root, after))
+        return _time_of_prev_run(self.root, at)
 
 
 def _parse_field(field: str, min_val: int, max_val: int) -> set[int]:
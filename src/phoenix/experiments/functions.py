@@ -1,22 +1,22 @@
-import asyncio
 import functools
 import inspect
 import json
 import traceback
 from binascii import hexlify
+from collections import defaultdict
 from collections.abc import Awaitable, Mapping, Sequence
+from concurrent.futures import Future
 from contextlib import ExitStack
 from copy import deepcopy
 from dataclasses import replace
 from datetime import datetime, timezone
 from itertools import product
-from typing import Any, Literal, Optional, Union, cast
+from typing import Any, Literal, Optional, TypeVar, Union, cast
 from urllib.parse import urljoin
 
 import httpx
 import opentelemetry.sdk.trace as trace_sdk
 import pandas as pd
-from httpx import HTTPStatusError
 from openinference.semconv.resource import ResourceAttributes
 from openinference.semconv.trace import (
     OpenInferenceMimeTypeValues,
@@ -27,7 +27,7 @@ from opentelemetry.context import Context
 from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
 from opentelemetry.sdk.resources import Resource
 from opentelemetry.sdk.trace import Span
-from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export import BatchSpanProcessor
 from opentelemetry.trace import Status, StatusCode, Tracer
 from typing_extensions import TypeAlias
 
@@ -60,6 +60,7 @@ from phoenix.experiments.types import (
     _asdict,
     _replace,
 )
+from phoenix.experiments.uploads import BatchUploader
 from phoenix.experiments.utils import get_dataset_experiments_url, get_experiment_url, get_func_name
 from phoenix.trace.attributes import flatten
 from phoenix.utilities.client import VersionedAsyncClient, VersionedClient
@@ -81,6 +82,8 @@ Evaluators: TypeAlias = Union[
 ]
 
 
+_Key = TypeVar("_Key")
+
 RateLimitErrors: TypeAlias = Union[type[BaseException], Sequence[type[BaseException]]]
 
 
@@ -97,6 +100,7 @@ def run_experiment(
     print_summary: bool = True,
     concurrency: int = 3,
     timeout: Optional[int] = None,
+    fetch_runs: bool = False,
 ) -> RanExperiment:
     """
     Runs an experiment using a given set of dataset of examples.
@@ -161,6 +165,9 @@ def run_experiment(
             Defaults to 3.
         timeout (Optional[int]): The timeout for the task execution in seconds. Use this to run
             longer tasks to avoid re-queuing the same task multiple times. Defaults to None.
+        fetch_runs (bool): Whether to fetch the runs of the experiment from Phoenix once the tasks
+            have completed, rather than to return the runs as they were uploaded, e.g. to also
+            return runs uploaded by other processes. Defaults to False.
 
     Returns:
         RanExperiment: The results of the experiment and evaluation. Additional evaluations can be
@@ -209,7 +216,6 @@ def run_experiment(
             project_name="",
         )
 
-    tracer, resource = _get_tracer(experiment.project_name)
     root_span_name = f"Task: {get_func_name(task)}"
     root_span_kind = CHAIN
 
@@ -236,6 +242,17 @@ def run_experiment(
     # Create a cache for task results
     task_result_cache: dict[tuple[str, int], Any] = {}
 
+    # Runs are uploaded in batches in the background, and get their IDs once the tasks complete.
+    # A run can be uploaded more than once when its task is retried after a timeout, in which
+    # case the server only creates the first one.
+    run_uploads: defaultdict[tuple[str, int], list["Future[Optional[str]]"]] = defaultdict(list)
+
+    def upload_run(exp_run: ExperimentRun) -> None:
+        assert run_uploader is not None
+        run_uploads[exp_run.dataset_example_id, exp_run.repetition_number].append(
+            run_uploader.submit(jsonify(exp_run))
+        )
+
     def sync_run_experiment(test_case: TestCase) -> Optional[ExperimentRun]:
         example, repetition_number = test_case.example, test_case.repetition_number
         cache_key = (example.id, repetition_number)
@@ -256,18 +273,7 @@ def run_experiment(
                 trace_id=None,  # No trace ID since we don't have the original span
             )
             if not dry_run:
-                try:
-                    # Try to create the run directly
-                    resp = sync_client.post(
-                        f"/v1/experiments/{experiment.id}/runs", json=jsonify(exp_run)
-                    )
-                    resp.raise_for_status()
-                    exp_run = replace(exp_run, id=resp.json()["data"]["id"])
-                except HTTPStatusError as e:
-                    if e.response.status_code == 409:
-                        # Ignore duplicate runs - we'll get the final state from the database
-                        return None
-                    raise
+                upload_run(exp_run)
             return exp_run
 
         output = None
@@ -331,20 +337,9 @@ def run_experiment(
             trace_id=_str_trace_id(span.get_span_context().trace_id),  # type: ignore[no-untyped-call]
         )
         if not dry_run:
-            try:
-                # Try to create the run directly
-                resp = sync_client.post(
-                    f"/v1/experiments/{experiment.id}/runs", json=jsonify(exp_run)
-                )
-                resp.raise_for_status()
-                exp_run = replace(exp_run, id=resp.json()["data"]["id"])
-                if error is None:
-                    task_result_cache[cache_key] = output
-            except HTTPStatusError as e:
-                if e.response.status_code == 409:
-                    # 409 conflict errors are caused by submitting duplicate runs
-                    return None
-                raise
+            upload_run(exp_run)
+            if error is None:
+                task_result_cache[cache_key] = output
         return exp_run
 
     async def async_run_experiment(test_case: TestCase) -> Optional[ExperimentRun]:
@@ -367,24 +362,7 @@ def run_experiment(
                 trace_id=None,  # No trace ID since we don't have the original span
             )
             if not dry_run:
-                try:
-                    # Try to create the run directly
-                    future = asyncio.get_running_loop().run_in_executor(
-                        None,
-                        functools.partial(
-                            sync_client.post,
-                            url=f"/v1/experiments/{experiment.id}/runs",
-                            json=jsonify(exp_run),
-                        ),
-                    )
-                    resp = await future
-                    resp.raise_for_status()
-                    exp_run = replace(exp_run, id=resp.json()["data"]["id"])
-                except HTTPStatusError as e:
-                    if e.response.status_code == 409:
-                        # 409 conflict errors are caused by submitting duplicate runs
-                        return None
-                    raise
+                upload_run(exp_run)
             return exp_run
 
         output = None
@@ -442,26 +420,9 @@ def run_experiment(
             trace_id=_str_trace_id(span.get_span_context().trace_id),  # type: ignore[no-untyped-call]
         )
         if not dry_run:
-            try:
-                # Try to create the run directly
-                future = asyncio.get_running_loop().run_in_executor(
-                    None,
-                    functools.partial(
-                        sync_client.post,
-                        url=f"/v1/experiments/{experiment.id}/runs",
-                        json=jsonify(exp_run),
-                    ),
-                )
-                resp = await future
-                resp.raise_for_status()
-                exp_run = replace(exp_run, id=resp.json()["data"]["id"])
-                if error is None:
-                    task_result_cache[cache_key] = output
-            except HTTPStatusError as e:
-                if e.response.status_code == 409:
-                    # Ignore duplicate runs - we'll get the final state from the database
-                    return None
-                raise
+            upload_run(exp_run)
+            if error is None:
+                task_result_cache[cache_key] = output
         return exp_run
 
     _errors: tuple[type[BaseException], ...]
@@ -493,18 +454,38 @@ def run_experiment(
         TestCase(example=deepcopy(ex), repetition_number=rep)
         for ex, rep in product(dataset.examples.values(), range(1, repetitions + 1))
     ]
-    task_runs, _execution_details = executor.run(test_cases)
+    tracer, resource, tracer_provider = _get_tracer(experiment.project_name)
+    run_uploader = (
+        None
+        if dry_run
+        else BatchUploader(f"/v1/experiments/{experiment.id}/runs/batch", async_client)
+    )
+    try:
+        task_runs, _execution_details = executor.run(test_cases)
+    finally:
+        tracer_provider.shutdown()  # flushes the spans of the tasks
+        if run_uploader is not None:
+            run_uploader.close()
     print("✅ Task runs completed.")
 
-    # Get the final state of runs from the database
-    if not dry_run:
-        all_runs = sync_client.get(f"/v1/experiments/{experiment.id}/runs").json()["data"]
-        task_runs = []
-        for run in all_runs:
-            # Parse datetime strings
-            run["start_time"] = datetime.fromisoformat(run["start_time"])
-            run["end_time"] = datetime.fromisoformat(run["end_time"])
-            task_runs.append(ExperimentRun.from_dict(run))
+    if run_uploader is not None:
+        run_ids = _uploaded_ids(run_uploads, "runs")
+        if fetch_runs:
+            # Get the final state of runs from the database
+            all_runs = sync_client.get(f"/v1/experiments/{experiment.id}/runs").json()["data"]
+            task_runs = []
+            for run in all_runs:
+                # Parse datetime strings
+                run["start_time"] = datetime.fromisoformat(run["start_time"])
+                run["end_time"] = datetime.fromisoformat(run["end_time"])
+                task_runs.append(ExperimentRun.from_dict(run))
+        else:
+            task_runs = [
+                replace(run, id=run_ids[key])
+                for run in task_runs
+                if run is not None
+                and (key := (run.dataset_example_id, run.repetition_number)) in run_ids
+            ]
 
         # Check if we got all expected runs
         expected_runs = len(dataset.examples) * repetitions
@@ -610,9 +591,18 @@ def evaluate_experiment(
         for (example, run), evaluator in product(example_run_pairs, evaluators_by_name.values())
     ]
 
-    tracer, resource = _get_tracer(None if dry_run else "evaluators")
     root_span_kind = EVALUATOR
 
+    # Evaluations are uploaded in batches in the background, and get their IDs once the
+    # evaluators complete.
+    eval_uploads: defaultdict[tuple[str, str], list["Future[Optional[str]]"]] = defaultdict(list)
+
+    def upload_eval_run(eval_run: ExperimentEvaluationRun) -> None:
+        assert eval_uploader is not None
+        eval_uploads[eval_run.experiment_run_id, eval_run.name].append(
+            eval_uploader.submit(jsonify(eval_run))
+        )
+
     def sync_evaluate_run(
         obj: tuple[Example, ExperimentRun, Evaluator],
     ) -> ExperimentEvaluationRun:
@@ -660,9 +650,7 @@ def evaluate_experiment(
             trace_id=_str_trace_id(span.get_span_context().trace_id),  # type: ignore[no-untyped-call]
         )
         if not dry_run:
-            resp = sync_client.post("/v1/experiment_evaluations", json=jsonify(eval_run))
-            resp.raise_for_status()
-            eval_run = replace(eval_run, id=resp.json()["data"]["id"])
+            upload_eval_run(eval_run)
         return eval_run
 
     async def async_evaluate_run(
@@ -712,19 +700,7 @@ def evaluate_experiment(
             trace_id=_str_trace_id(span.get_span_context().trace_id),  # type: ignore[no-untyped-call]
         )
         if not dry_run:
-            # Below is a workaround to avoid timeout errors sometimes
-            # encountered when the evaluator is a synchronous function
-            # that blocks for too long.
-            resp = await asyncio.get_running_loop().run_in_executor(
-                None,
-                functools.partial(
-                    sync_client.post,
-                    url="/v1/experiment_evaluations",
-                    json=jsonify(eval_run),
-                ),
-            )
-            resp.raise_for_status()
-            eval_run = replace(eval_run, id=resp.json()["data"]["id"])
+            upload_eval_run(eval_run)
         return eval_run
 
     _errors: tuple[type[BaseException], ...]
@@ -750,7 +726,25 @@ def evaluate_experiment(
         tqdm_bar_format=get_tqdm_progress_bar_formatter("running experiment evaluations"),
         concurrency=concurrency,
     )
-    eval_runs, _execution_details = executor.run(evaluation_input)
+    tracer, resource, tracer_provider = _get_tracer(None if dry_run else "evaluators")
+    eval_uploader = (
+        None if dry_run else BatchUploader("/v1/experiment_evaluations/batch", async_client)
+    )
+    try:
+        eval_runs, _execution_details = executor.run(evaluation_input)
+    finally:
+        tracer_provider.shutdown()  # flushes the spans of the evaluators
+        if eval_uploader is not None:
+            eval_uploader.close()
+    if eval_uploader is not None:
+        eval_run_ids = _uploaded_ids(eval_uploads, "evaluations")
+        eval_runs = [
+            replace(eval_run, id=eval_run_ids[key])
+            if eval_run is not None
+            and (key := (eval_run.experiment_run_id, eval_run.name)) in eval_run_ids
+            else None
+            for eval_run in eval_runs
+        ]
     eval_summary = EvaluationSummary.from_eval_runs(
         EvaluationParameters(
             eval_names=frozenset(evaluators_by_name),
@@ -764,6 +758,28 @@ def evaluate_experiment(
     return ran_experiment
 
 
+def _uploaded_ids(
+    uploads: Mapping[_Key, Sequence["Future[Optional[str]]"]],
+    kind: str,
+) -> dict[_Key, str]:
+    """
+    Gets the IDs of the uploaded records by their keys, warning about the
+    uploads that failed. The keys of records that the server skipped, e.g.
+    because they were duplicates, are left out.
+    """
+    ids: dict[_Key, str] = {}
+    errors: list[BaseException] = []
+    for key, futures in uploads.items():
+        for future in futures:
+            if (error := future.exception()) is not None:
+                errors.append(error)
+            elif (id_ := future.result()) is not None:
+                ids.setdefault(key, id_)
+    if errors:
+        print(f"⚠️  Warning: Failed to upload {len(errors)} {kind}: {errors[-1]!r}")
+    return ids
+
+
 def _evaluators_by_name(obj: Optional[Evaluators]) -> Mapping[EvaluatorName, Evaluator]:
     evaluators_by_name: dict[EvaluatorName, Evaluator] = {}
     if obj is None:
@@ -794,11 +810,19 @@ def _evaluators_by_name(obj: Optional[Evaluators]) -> Mapping[EvaluatorName, Eva
     return evaluators_by_name
 
 
-def _get_tracer(project_name: Optional[str] = None) -> tuple[Tracer, Resource]:
+def _get_tracer(
+    project_name: Optional[str] = None,
+) -> tuple[Tracer, Resource, trace_sdk.TracerProvider]:
+    """
+    Spans are exported in batches in the background, so that tasks and evaluators don't wait
+    on exports. The queue and batch sizes and the export interval can be configured with the
+    `OTEL_BSP_*` environment variables of OpenTelemetry, e.g. `OTEL_BSP_MAX_QUEUE_SIZE`, past
+    which spans are dropped. The tracer provider must be shut down to flush the spans.
+    """
     resource = Resource({ResourceAttributes.PROJECT_NAME: project_name} if project_name else {})
     tracer_provider = trace_sdk.TracerProvider(resource=resource)
     span_processor = (
-        SimpleSpanProcessor(
+        BatchSpanProcessor(
             OTLPSpanExporter(
                 endpoint=urljoin(f"{get_base_url()}", "v1/traces"),
                 headers=get_env_client_headers(),
@@ -808,7 +832,7 @@ def _get_tracer(project_name: Optional[str] = None) -> tuple[Tracer, Resource]:
         else _NoOpProcessor()
     )
     tracer_provider.add_span_processor(span_processor)
-    return tracer_provider.get_tracer(__name__), resource
+    return tracer_provider.get_tracer(__name__), resource, tracer_provider
 
 
 def _str_trace_id(id_: int) -> str:
@@ -0,0 +1,162 @@
+"""
+Uploads of experiment runs and evaluations in batches.
+
+Posting every run and evaluation of an experiment on its own costs one round trip to the
+server, and one transaction on the server, per record. `BatchUploader` instead buffers
+records and posts them to a bulk endpoint from a background thread, which runs its own event
+loop with one pooled async client, so that tasks and evaluators never wait on the server.
+A batch is posted as soon as it is full, and the records that are still buffered are posted
+at regular intervals, so that records are never held back for long.
+"""
+
+import asyncio
+import threading
+from collections.abc import Mapping
+from concurrent.futures import Future
+from typing import Any, Optional
+
+import httpx
+
+DEFAULT_MAX_BATCH_SIZE = 100
+DEFAULT_MAX_DELAY_SECONDS = 1.0
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+
+_Item = tuple[Mapping[str, Any], "Future[Optional[str]]"]
+
+
+class BatchUploader:
+    def __init__(
+        self,
+        url: str,
+        client: httpx.AsyncClient,
+        *,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_delay_seconds: float = DEFAULT_MAX_DELAY_SECONDS,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+    ) -> None:
+        """
+        Starts the background thread of the uploader.
+
+        Parameters
+        ----------
+        url : str
+            The bulk endpoint, which takes the records as the `data` of its request
+            body and returns their IDs as the `data` of its response, in order.
+
+        client : httpx.AsyncClient
+            The client with which batches are posted, from the event loop of the
+            background thread, so it must not be used by another event loop. The
+            uploader closes it when the uploader is closed.
+
+        max_batch_size : int, default=100
+            The number of records at which a batch is posted right away.
+
+        max_delay_seconds : float, default=1.0
+            The interval at which buffered records are posted, whether or not
+            they make up a full batch.
+
+        max_concurrent_requests : int, default=4
+            The number of batches that can be posted at the same time.
+        """
+        self._url = url
+        self._client = client
+        self._max_batch_size = max_batch_size
+        self._max_delay_seconds = max_delay_seconds
+        self._max_concurrent_requests = max_concurrent_requests
+        self._buffer: list[_Item] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self._started = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._main, daemon=True)
+        self._thread.start()
+        self._started.wait()
+        if self._error is not None:
+            raise RuntimeError("Failed to start the uploader") from self._error
+
+    def submit(self, record: Mapping[str, Any]) -> "Future[Optional[str]]":
+        """
+        Buffers a record for upload, returning a future of its ID, which is None
+        if the server skipped the record, e.g. because it is a duplicate. The
+        future fails with the error of the request if its batch failed to post.
+        """
+        future: "Future[Optional[str]]" = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Cannot submit records to a closed uploader")
+            self._buffer.append((record, future))
+            is_full = len(self._buffer) >= self._max_batch_size
+        if is_full:
+            self._loop.call_soon_threadsafe(self._flush)
+        return future
+
+    def close(self) -> None:
+        """
+        Posts the records that are still buffered and waits for every batch to
+        be posted, then stops the background thread.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._loop.call_soon_threadsafe(self._stopping.set)
+        self._thread.join()
+
+    def __enter__(self) -> "BatchUploader":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _main(self) -> None:
+        try:
+            asyncio.run(self._run())
+        except BaseException as exc:
+            if self._started.is_set():
+                raise
+            self._error = exc  # raised by the constructor instead
+        finally:
+            self._started.set()
+
+    async def _run(self) -> None:
+        try:
+            self._loop = asyncio.get_running_loop()
+            self._stopping = asyncio.Event()
+            self._semaphore = asyncio.Semaphore(self._max_concurrent_requests)
+            self._tasks: set["asyncio.Task[None]"] = set()
+            self._started.set()
+            while not self._stopping.is_set():
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), self._max_delay_seconds)
+                except asyncio.TimeoutError:
+                    pass
+                self._flush()
+            self._flush()
+            while self._tasks:
+                await asyncio.wait(self._tasks)
+        finally:
+            await self._client.aclose()
+
+    def _flush(self) -> None:
+        with self._lock:
+            buffer, self._buffer = self._buffer, []
+        for i in range(0, len(buffer), self._max_batch_size):
+            task = asyncio.create_task(self._post(buffer[i : i + self._max_batch_size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _post(self, batch: list[_Item]) -> None:
+        async with self._semaphore:
+            try:
+                response = await self._client.post(
+                    self._url,
+                    json={"data": [record for record, _ in batch]},
+                )
+                response.raise_for_status()
+                ids = [item["id"] for item in response.json()["data"]]
+            except Exception as exc:
+                for _, future in batch:
+                    future.set_exception(exc)
+                return
+        for (_, future), id_ in zip(batch, ids):
+            future.set_result(id_)
@@ -1,11 +1,13 @@
 import logging
 import re
+import shutil
 import uuid
 from copy import deepcopy
 from dataclasses import dataclass, fields, replace
 from enum import Enum
 from itertools import groupby
 from typing import Any, Optional, Union
+from urllib.parse import quote, unquote
 
 import numpy as np
 import pandas as pd
@@ -32,6 +34,7 @@ from .schema import (
     SchemaFieldValue,
 )
 from .validation import validate_inferences_inputs
+from .vectors import VectorArray, VectorDtype
 
 logger = logging.getLogger(__name__)
 
@@ -81,6 +84,7 @@ class Inferences:
 
     _data_file_name: str = "data.parquet"
     _schema_file_name: str = "schema.json"
+    _vectors_dir_name: str = "vectors"
     _is_persisted: bool = False
     _is_empty: bool = False
 
@@ -129,23 +133,35 @@ class Inferences:
 
     @classmethod
     def from_name(cls, name: str) -> "Inferences":
-        """Retrieves a dataset by name from the file system"""
+        """Retrieves a dataset by name from the file system. Embedding vectors
+        saved apart from the rest of the data are mapped into memory instead of
+        being read."""
         directory = INFERENCES_DIR / name
         df = read_parquet(directory / cls._data_file_name)
+        vectors_directory = directory / cls._vectors_dir_name
+        if vectors_directory.is_dir():
+            for path in sorted(vectors_directory.iterdir()):
+                df[unquote(path.name)] = VectorArray.load(path)
         with open(directory / cls._schema_file_name) as schema_file:
             schema_json = schema_file.read()
         schema = Schema.from_json(schema_json)
         return cls(df, schema, name)
 
     def to_disc(self) -> None:
-        """writes the data and schema to disc"""
+        """writes the data and schema to disc, with each column of embedding
+        vectors as a matrix of its own that can be mapped into memory"""
         directory = INFERENCES_DIR / self.name
         directory.mkdir(parents=True, exist_ok=True)
-        self.dataframe.to_parquet(
+        vectors = _get_vector_arrays(self.dataframe, self.schema)
+        self.dataframe.drop(columns=list(vectors)).to_parquet(
             directory / self._data_file_name,
             allow_truncated_timestamps=True,
             coerce_timestamps="ms",
         )
+        vectors_directory = directory / self._vectors_dir_name
+        shutil.rmtree(vectors_directory, ignore_errors=True)
+        for column_name, array in vectors.items():
+            array.save(vectors_directory / quote(column_name, safe=""))
         schema_json_data = self.schema.to_json()
         with open(directory / self._schema_file_name, "w+") as schema_file:
             schema_file.write(schema_json_data)
@@ -605,7 +621,9 @@ def _create_and_normalize_dataframe_and_schema(
         if not isinstance(embedding, EmbeddingColumnNames):
             continue
         vector_column_name = embedding.vector_column_name
-        if vector_column_name not in parsed_dataframe.columns:
+        if vector_column_name not in parsed_dataframe.columns or isinstance(
+            parsed_dataframe.dtypes[vector_column_name], VectorDtype
+        ):
             continue
         parsed_dataframe.loc[:, vector_column_name] = _coerce_vectors_as_arrays_if_necessary(
             parsed_dataframe.loc[:, vector_column_name],
@@ -632,6 +650,33 @@ def _coerce_vectors_as_arrays_if_necessary(
     return series
 
 
+def _get_vector_arrays(dataframe: DataFrame, schema: Schema) -> dict[str, VectorArray]:
+    """
+    Returns the embedding vector columns of the dataframe as `VectorArray`s,
+    leaving out those whose vectors are not all numeric and of the same length.
+    """
+    vector_arrays: dict[str, VectorArray] = {}
+    for embedding in (
+        schema.prompt_column_names,
+        schema.response_column_names,
+        *(schema.embedding_feature_column_names or {}).values(),
+    ):
+        if not isinstance(embedding, EmbeddingColumnNames):
+            continue
+        vector_column_name = embedding.vector_column_name
+        if vector_column_name not in dataframe.columns:
+            continue
+        column = dataframe[vector_column_name]
+        if isinstance(array := column.array, VectorArray):
+            vector_arrays[vector_column_name] = array
+            continue
+        try:
+            vector_arrays[vector_column_name] = VectorArray.from_vectors(column)
+        except (TypeError, ValueError):
+            logger.warning(f"vectors in column `{vector_column_name}` can't be stacked")
+    return vector_arrays
+
+
 def _sort_dataframe_rows_by_timestamp(dataframe: DataFrame, schema: Schema) -> DataFrame:
     """
     Sorts dataframe rows by timestamp.
@@ -6,6 +6,7 @@ from pandas.api.types import is_numeric_dtype, is_string_dtype
 
 from . import errors as err
 from .schema import EmbeddingColumnNames, Schema
+from .vectors import VectorArray
 
 RESERVED_EMBEDDING_NAMES = ("prompt", "response")
 
@@ -103,6 +104,12 @@ def _validate_embedding_vector(
     errors: list[err.ValidationError] = []
     vector_length = None
 
+    if isinstance(array := vector_column.array, VectorArray):
+        # The vectors of a matrix are numeric and of the same length.
+        if array.mask.any() and (width := array.matrix.shape[1]) <= 1:
+            errors.append(err.InvalidEmbeddingVectorSize(name, vector_column_name, width))
+        return errors
+
     for vector in vector_column:
         vector_is_missing = vector is None or (isinstance(vector, float) and math.isnan(vector))
         if vector_is_missing:
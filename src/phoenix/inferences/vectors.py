@@ -0,0 +1,198 @@
+"""
+Embedding vectors stored as one contiguous matrix per column.
+
+A column of embeddings is ordinarily a column of objects, i.e. one `numpy.ndarray` per
+row. `VectorArray` instead keeps the vectors of a column as the rows of one float32
+matrix, which can be an `np.memmap` of a file on disk, along with a mask of the rows that
+have a vector. Slicing the column slices the matrix without copying it, and the vectors
+of any range of rows can be summed in one vectorized pass. Rows without a vector are
+zeros in the matrix, so that sums don't need the mask.
+
+The array is immutable, so its copies share the matrix.
+"""
+
+import builtins
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Optional, Union, cast
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+from pandas.api.extensions import ExtensionArray, ExtensionDtype, take
+from pandas.api.indexers import check_array_indexer
+from pandas.api.types import is_integer
+
+VECTOR_DTYPE = np.float32
+"""The precision in which vectors are stored. Sums are computed in float64."""
+
+_CHUNK_SIZE = 10_000
+_MATRIX_FILE_NAME = "matrix.npy"
+_MASK_FILE_NAME = "mask.npy"
+
+
+class VectorDtype(ExtensionDtype):
+    name = "vector"
+    type = np.ndarray
+    kind = "O"
+    na_value = np.nan
+
+    @classmethod
+    def construct_array_type(cls) -> builtins.type["VectorArray"]:
+        return VectorArray
+
+
+class VectorArray(ExtensionArray):
+    def __init__(
+        self,
+        matrix: npt.NDArray[np.floating[Any]],
+        mask: Optional[npt.NDArray[np.bool_]] = None,
+    ) -> None:
+        if matrix.ndim != 2:
+            raise ValueError(f"matrix must be two-dimensional, not {matrix.ndim}-dimensional")
+        if mask is None:
+            mask = np.ones(len(matrix), dtype=bool)
+        if mask.shape != (len(matrix),):
+            raise ValueError("mask must have one entry per row of the matrix")
+        self._matrix = matrix
+        self._mask = mask
+
+    @classmethod
+    def from_vectors(
+        cls,
+        vectors: Union["pd.Series[Any]", Sequence[Any]],
+    ) -> "VectorArray":
+        """
+        Copies vectors, with None or NaN in place of missing ones, into one
+        matrix, a chunk at a time so that they are never all copied at once
+        into an intermediate array. Raises ValueError if the vectors are not
+        all numeric and of the same length.
+        """
+        if not isinstance(vectors, pd.Series):
+            vectors = pd.Series(list(vectors), dtype=object)
+        values = vectors.to_numpy(dtype=object)
+        mask = pd.notna(values)
+        positions = np.flatnonzero(mask)
+        width = len(values[positions[0]]) if len(positions) else 0
+        matrix = np.zeros((len(values), width), dtype=VECTOR_DTYPE)
+        for start in range(0, len(positions), _CHUNK_SIZE):
+            rows = positions[start : start + _CHUNK_SIZE]
+            matrix[rows] = np.stack(values[rows])
+        return cls(matrix, mask)
+
+    @classmethod
+    def load(cls, directory: Path, mmap: bool = True) -> "VectorArray":
+        """
+        Loads the vectors saved in a directory. With `mmap`, the matrix is
+        mapped into memory read-only, so that loading is instant and only the
+        pages that are read are ever paged in.
+        """
+        return cls(
+            np.load(directory / _MATRIX_FILE_NAME, mmap_mode="r" if mmap else None),
+            np.load(directory / _MASK_FILE_NAME),
+        )
+
+    def save(self, directory: Path) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        np.save(directory / _MATRIX_FILE_NAME, self._matrix)
+        np.save(directory / _MASK_FILE_NAME, self._mask)
+
+    @property
+    def matrix(self) -> npt.NDArray[np.floating[Any]]:
+        """The vectors, one per row, with rows of zeros for the missing ones."""
+        return self._matrix
+
+    @property
+    def mask(self) -> npt.NDArray[np.bool_]:
+        """Whether each row has a vector."""
+        return self._mask
+
+    def sum(self) -> npt.NDArray[np.float64]:
+        return cast(npt.NDArray[np.float64], self._matrix.sum(axis=0, dtype=np.float64))
+
+    def mean(self) -> Union[npt.NDArray[np.float64], float]:
+        if not (count := int(self._mask.sum())):
+            return np.nan
+        return self.sum() / count
+
+    @classmethod
+    def _from_sequence(
+        cls,
+        scalars: Any,
+        *,
+        dtype: Any = None,
+        copy: bool = False,
+    ) -> "VectorArray":
+        if isinstance(scalars, cls):
+            return scalars
+        return cls.from_vectors(scalars)
+
+    @classmethod
+    def _concat_same_type(cls, to_concat: Sequence["VectorArray"]) -> "VectorArray":
+        # Empty arrays are left out because their widths may be zero.
+        arrays = [array for array in to_concat if len(array)] or list(to_concat[:1])
+        return cls(
+            np.concatenate([array._matrix for array in arrays]),
+            np.concatenate([array._mask for array in arrays]),
+        )
+
+    @property
+    def dtype(self) -> VectorDtype:
+        return VectorDtype()
+
+    @property
+    def nbytes(self) -> int:
+        return int(self._matrix.nbytes + self._mask.nbytes)
+
+    def __len__(self) -> int:
+        return len(self._mask)
+
+    def __getitem__(self, item: Any) -> Any:
+        if is_integer(item):
+            return self._matrix[item] if self._mask[item] else np.nan
+        if not isinstance(item, slice):
+            item = check_array_indexer(self, item)
+        return type(self)(self._matrix[item], self._mask[item])
+
+    def __eq__(self, other: Any) -> npt.NDArray[np.bool_]:  # type: ignore[override]
+        if not isinstance(other, VectorArray) or other._matrix.shape != self._matrix.shape:
+            return np.zeros(len(self), dtype=bool)
+        equal = cast(npt.NDArray[np.bool_], (self._matrix == other._matrix).all(axis=1))
+        return self._mask & other._mask & equal
+
+    def __array__(self, dtype: Any = None, copy: Optional[bool] = None) -> npt.NDArray[Any]:
+        values = np.full(len(self), np.nan, dtype=object)
+        for i in np.flatnonzero(self._mask).tolist():
+            values[i] = self._matrix[i]
+        return values
+
+    def isna(self) -> npt.NDArray[np.bool_]:
+        return ~self._mask
+
+    def take(
+        self,
+        indices: Any,
+        *,
+        allow_fill: bool = False,
+        fill_value: Any = None,
+    ) -> "VectorArray":
+        # Missing rows are the only fill supported, whatever the `fill_value`.
+        positions = take(np.arange(len(self)), indices, allow_fill=allow_fill, fill_value=-1)
+        if not allow_fill:
+            return type(self)(self._matrix[positions], self._mask[positions])
+        filled = positions < 0
+        matrix = np.zeros((len(positions), self._matrix.shape[1]), dtype=self._matrix.dtype)
+        matrix[~filled] = self._matrix[positions[~filled]]
+        mask = np.zeros(len(positions), dtype=bool)
+        mask[~filled] = self._mask[positions[~filled]]
+        return type(self)(matrix, mask)
+
+    def copy(self) -> "VectorArray":
+        return type(self)(self._matrix, self._mask)
+
+    def _reduce(self, name: str, *, skipna: bool = True, **kwargs: Any) -> Any:
+        if name in ("sum", "mean"):
+            if not skipna and not self._mask.all():
+                return np.nan
+            return self.sum() if name == "sum" else self.mean()
+        return super()._reduce(name, skipna=skipna, **kwargs)
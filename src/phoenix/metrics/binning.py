@@ -6,6 +6,7 @@ from functools import partial
 from typing import Any, Optional, cast
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 from typing_extensions import TypeAlias
 
@@ -28,6 +29,14 @@ class BinningMethod(ABC):
     @abstractmethod
     def histogram(self, data: "pd.Series[Any]") -> Histogram: ...
 
+    def bin_codes(self, data: "pd.Series[Any]") -> tuple[npt.NDArray[np.intp], "pd.Index[Any]"]:
+        """Assigns each value to a bin, returning the position of its bin, or
+        -1 if the value isn't counted, along with the bins, so that the
+        histogram is the count of each position. Binning methods whose bins
+        depend on the data being binned raise NotImplementedError, since
+        histograms of parts of the data can't then be added up."""
+        raise NotImplementedError
+
     @abstractmethod
     def segmented_summary(
         self,
@@ -93,6 +102,23 @@ class IntervalBinning(BinningMethod):
         cut = pd.cut(numeric_data, bins)
         return cut.value_counts(dropna=self.dropna)
 
+    def bin_codes(self, data: "pd.Series[Any]") -> tuple[npt.NDArray[np.intp], "pd.Index[Any]"]:
+        numeric_data = pd.to_numeric(data, errors="coerce")
+        cut = pd.cut(numeric_data, self.numeric_bins(numeric_data))
+        codes = cut.cat.codes.to_numpy(dtype=np.intp)
+        bins = np.arange(len(cut.cat.categories))
+        if not self.dropna:
+            # Missing values are counted in a bin of their own, i.e. code -1 in
+            # `pd.Categorical`, which is placed ahead of the other bins.
+            codes, bins = codes + 1, np.insert(bins, 0, -1)
+        return codes, pd.CategoricalIndex(
+            pd.Categorical.from_codes(
+                bins,
+                cut.cat.categories,
+                ordered=cut.cat.ordered,
+            )
+        )
+
     def segmented_summary(
         self,
         segment_column: Column,
@@ -197,6 +223,11 @@ class QuantileBinning(IntervalBinning):
     +inf as the left- and right-most bin boundaries. Default values are the
     decile probabilities."""
 
+    def bin_codes(self, data: "pd.Series[Any]") -> tuple[npt.NDArray[np.intp], "pd.Index[Any]"]:
+        if self.bins is None:
+            raise NotImplementedError("quantiles of the data being binned")
+        return super().bin_codes(data)
+
     def numeric_bins(self, data: "pd.Series[Any]") -> NumericBins:
         if self.bins is not None:
             return self.bins
@@ -268,6 +299,10 @@ class CategoricalBinning(BinningMethod):
             dropna=self.dropna,
         )
 
+    def bin_codes(self, data: "pd.Series[Any]") -> tuple[npt.NDArray[np.intp], "pd.Index[Any]"]:
+        codes, uniques = pd.factorize(data, use_na_sentinel=self.dropna)
+        return codes.astype(np.intp, copy=False), pd.Index(uniques)
+
     def segmented_summary(
         self,
         segment_column: Column,
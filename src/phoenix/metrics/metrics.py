@@ -3,7 +3,7 @@ import warnings
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from functools import cached_property
-from typing import Union, cast
+from typing import Any, Union, cast
 
 import numpy as np
 import numpy.typing as npt
@@ -12,43 +12,127 @@ from scipy.spatial.distance import euclidean, jensenshannon
 from scipy.stats import entropy
 from typing_extensions import TypeAlias
 
+from phoenix.inferences.vectors import VectorArray
 from phoenix.metrics import Metric
 
 from .mixins import (
+    Boundaries,
+    Decomposable,
     DiscreteDivergence,
     DriftOperator,
     NullaryOperator,
     UnaryOperator,
     VectorOperator,
     ZeroInitialValue,
+    segment_sums,
 )
 
 
 @dataclass(frozen=True)
-class Count(NullaryOperator, ZeroInitialValue, Metric):
+class Count(NullaryOperator, ZeroInitialValue, Decomposable, Metric):
     def calc(self, dataframe: pd.DataFrame) -> int:
         return len(dataframe)
 
+    def partials(self, dataframe: pd.DataFrame, boundaries: Boundaries) -> pd.DataFrame:
+        return pd.DataFrame({"count": np.diff(boundaries)})
+
+    def combine(self, sums: "pd.Series[Any]") -> int:
+        return int(sums["count"])
+
 
 @dataclass(frozen=True)
-class CountNotNull(UnaryOperator, ZeroInitialValue, Metric):
+class CountNotNull(UnaryOperator, ZeroInitialValue, Decomposable, Metric):
     def calc(self, dataframe: pd.DataFrame) -> int:
         return self.operand(dataframe).count()
 
+    def partials(self, dataframe: pd.DataFrame, boundaries: Boundaries) -> pd.DataFrame:
+        not_null = self.operand(dataframe).notna().to_numpy()
+        return pd.DataFrame({"count": segment_sums(not_null, boundaries)})
+
+    def combine(self, sums: "pd.Series[Any]") -> int:
+        return int(sums["count"])
+
+
+def _numeric_partials(data: "pd.Series[Any]", boundaries: Boundaries) -> pd.DataFrame:
+    numeric_data = pd.to_numeric(data, errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+    not_null = ~np.isnan(numeric_data)
+    return pd.DataFrame(
+        {
+            "sum": segment_sums(np.where(not_null, numeric_data, 0), boundaries),
+            "count": segment_sums(not_null, boundaries),
+        }
+    )
+
 
 @dataclass(frozen=True)
-class Sum(UnaryOperator, Metric):
+class Sum(UnaryOperator, Decomposable, Metric):
     def calc(self, dataframe: pd.DataFrame) -> float:
         data = self.operand(dataframe)
         numeric_data = pd.to_numeric(data, errors="coerce")
         return cast(float, numeric_data.sum())
 
+    def partials(self, dataframe: pd.DataFrame, boundaries: Boundaries) -> pd.DataFrame:
+        return _numeric_partials(self.operand(dataframe), boundaries)
+
+    def combine(self, sums: "pd.Series[Any]") -> float:
+        return float(sums["sum"])
+
 
 Vector: TypeAlias = Union[float, npt.NDArray[np.float64]]
 
 
+_VECTOR_CHUNK_SIZE = 10_000
+
+
+def _vector_partials(
+    data: "pd.Series[Any]",
+    shape: int,
+    boundaries: Boundaries,
+) -> pd.DataFrame:
+    """
+    The sums of the vectors of each segment, one column per dimension, and
+    their counts in the last column. The vectors of a `VectorArray` are summed in place, one slice
+    of its matrix per segment. Others are stacked a chunk at a time, so that a
+    large embedding dimension isn't copied in full into one array.
+    """
+    segments = list(enumerate(zip(boundaries[:-1].tolist(), boundaries[1:].tolist())))
+    if isinstance(array := data.array, VectorArray):
+        sums = np.zeros((len(segments), array.matrix.shape[1]))
+        for i, (start, stop) in segments:
+            # Summing each slice is faster than `np.add.reduceat` over the rows.
+            sums[i] = array.matrix[start:stop].sum(axis=0, dtype=np.float64)
+        return pd.DataFrame(sums).assign(count=segment_sums(array.mask, boundaries))
+    not_null = data.notna().to_numpy()
+    vectors = data.to_numpy()
+    width = len(vectors[not_null.argmax()]) if not_null.any() else shape
+    sums = np.zeros((len(segments), width))
+    for i, (start, stop) in segments:
+        for chunk_start in range(start, stop, _VECTOR_CHUNK_SIZE):
+            chunk = slice(chunk_start, min(chunk_start + _VECTOR_CHUNK_SIZE, stop))
+            if len(chunk_vectors := vectors[chunk][not_null[chunk]]):
+                sums[i] += np.sum(np.stack(chunk_vectors), axis=0)
+    return pd.DataFrame(sums).assign(count=segment_sums(not_null, boundaries))
+
+
+def _vector_sum(sums: "pd.Series[Any]") -> npt.NDArray[np.float64]:
+    # Slicing off the count is much faster than dropping it by its label.
+    return sums.to_numpy(dtype=float)[:-1]
+
+
+def _mean_of_vectors(data: "pd.Series[Any]") -> Vector:
+    if isinstance(array := data.array, VectorArray):
+        return cast(Vector, array.mean())
+    return cast(Vector, np.mean(data.dropna()))
+
+
+def _vector_mean(sums: "pd.Series[Any]") -> Vector:
+    if not (count := sums["count"]):
+        return np.nan
+    return cast(Vector, _vector_sum(sums) / count)
+
+
 @dataclass(frozen=True)
-class VectorSum(UnaryOperator, VectorOperator, ZeroInitialValue, Metric):
+class VectorSum(UnaryOperator, VectorOperator, ZeroInitialValue, Decomposable, Metric):
     def calc(self, dataframe: pd.DataFrame) -> Vector:
         data = self.operand(dataframe)
         return cast(
@@ -59,22 +143,42 @@ class VectorSum(UnaryOperator, VectorOperator, ZeroInitialValue, Metric):
             ),
         )
 
+    def partials(self, dataframe: pd.DataFrame, boundaries: Boundaries) -> pd.DataFrame:
+        return _vector_partials(self.operand(dataframe), self.shape, boundaries)
+
+    def combine(self, sums: "pd.Series[Any]") -> Vector:
+        return _vector_sum(sums)
+
 
 @dataclass(frozen=True)
-class Mean(UnaryOperator, Metric):
+class Mean(UnaryOperator, Decomposable, Metric):
     def calc(self, dataframe: pd.DataFrame) -> float:
         data = self.operand(dataframe)
         numeric_data = pd.to_numeric(data, errors="coerce")
         return numeric_data.mean()
 
+    def partials(self, dataframe: pd.DataFrame, boundaries: Boundaries) -> pd.DataFrame:
+        return _numeric_partials(self.operand(dataframe), boundaries)
+
+    def combine(self, sums: "pd.Series[Any]") -> float:
+        if not sums["count"]:
+            return np.nan
+        return float(sums["sum"] / sums["count"])
+
 
 @dataclass(frozen=True)
-class VectorMean(UnaryOperator, VectorOperator, Metric):
+class VectorMean(UnaryOperator, VectorOperator, Decomposable, Metric):
     def calc(self, dataframe: pd.DataFrame) -> Vector:
         data = self.operand(dataframe)
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=RuntimeWarning)
-            return cast(Vector, np.mean(data.dropna()))
+            return _mean_of_vectors(data)
+
+    def partials(self, dataframe: pd.DataFrame, boundaries: Boundaries) -> pd.DataFrame:
+        return _vector_partials(self.operand(dataframe), self.shape, boundaries)
+
+    def combine(self, sums: "pd.Series[Any]") -> Vector:
+        return _vector_mean(sums)
 
 
 @dataclass(frozen=True)
@@ -103,11 +207,24 @@ class Cardinality(UnaryOperator, Metric):
 
 
 @dataclass(frozen=True)
-class PercentEmpty(UnaryOperator, Metric):
+class PercentEmpty(UnaryOperator, Decomposable, Metric):
     def calc(self, dataframe: pd.DataFrame) -> float:
         data = self.operand(dataframe)
         return data.isna().mean() * 100
 
+    def partials(self, dataframe: pd.DataFrame, boundaries: Boundaries) -> pd.DataFrame:
+        return pd.DataFrame(
+            {
+                "empty": segment_sums(self.operand(dataframe).isna().to_numpy(), boundaries),
+                "count": np.diff(boundaries),
+            }
+        )
+
+    def combine(self, sums: "pd.Series[Any]") -> float:
+        if not sums["count"]:
+            return np.nan
+        return float(sums["empty"] / sums["count"] * 100)
+
 
 @dataclass(frozen=True)
 class Quantile(UnaryOperator, Metric):
@@ -142,11 +259,10 @@ class Quantile(UnaryOperator, Metric):
 
 
 @dataclass(frozen=True)
-class EuclideanDistance(DriftOperator, VectorOperator):
+class EuclideanDistance(DriftOperator, VectorOperator, Decomposable):
     @cached_property
     def reference_value(self) -> Vector:
-        data = self.operand(self.reference_data)
-        return cast(Vector, np.mean(data.dropna()))
+        return _mean_of_vectors(self.operand(self.reference_data))
 
     def calc(self, dataframe: pd.DataFrame) -> float:
         if dataframe.empty or (
@@ -157,11 +273,21 @@ class EuclideanDistance(DriftOperator, VectorOperator):
         return cast(
             float,
             euclidean(
-                np.mean(data.dropna()),
+                _mean_of_vectors(data),
                 self.reference_value,
             ),
         )
 
+    def partials(self, dataframe: pd.DataFrame, boundaries: Boundaries) -> pd.DataFrame:
+        return _vector_partials(self.operand(dataframe), self.shape, boundaries)
+
+    def combine(self, sums: "pd.Series[Any]") -> float:
+        if not sums["count"] or (
+            isinstance(self.reference_value, float) and not math.isfinite(self.reference_value)
+        ):
+            return np.nan
+        return cast(float, euclidean(_vector_mean(sums), self.reference_value))
+
 
 Distribution: TypeAlias = "pd.Series[float]"
 Divergence: TypeAlias = Callable[[Distribution, Distribution], float]
@@ -14,6 +14,7 @@ from itertools import repeat
 from typing import TYPE_CHECKING, Any, Iterator, Mapping, Optional
 
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
 from typing_extensions import TypeAlias
 
@@ -154,6 +155,70 @@ class EvaluationMetric(Metric, ABC):
         )
 
 
+Boundaries: TypeAlias = npt.NDArray[np.intp]
+
+
+@dataclass(frozen=True)
+class Decomposable(Metric, ABC):
+    """
+    A metric whose value over a set of rows is a function of sums over those
+    rows, e.g. counts, totals and histograms. Since sums over the parts of a
+    set of rows add up to the sums over the whole set, the metric can be
+    computed over many overlapping windows of sorted rows from the partial
+    sums of the segments between the edges of the windows, without going
+    through the rows of each window. See `phoenix.metrics.timeseries`.
+    """
+
+    @abstractmethod
+    def partials(self, dataframe: pd.DataFrame, boundaries: Boundaries) -> pd.DataFrame:
+        """
+        Parameters
+        ----------
+        dataframe: pandas DataFrame
+            The rows of all the segments.
+        boundaries: array of int, shape = (n_segments + 1,)
+            The position of the first row of each segment, followed by the
+            number of rows, i.e. segment i is the rows from boundaries[i] to
+            boundaries[i + 1], exclusive.
+
+        Returns
+        -------
+        partials: pandas DataFrame, shape = (n_segments, n_sums)
+            The sums over the rows of each segment, one column per sum.
+        """
+
+    @abstractmethod
+    def combine(self, sums: "pd.Series[Any]") -> Any:
+        """
+        Parameters
+        ----------
+        sums: series, shape = (n_sums,)
+            The sums over a set of rows, indexed by the columns of the partials.
+
+        Returns
+        -------
+        value: Any
+            The value of the metric over the set of rows.
+        """
+
+
+def segment_sums(values: npt.NDArray[Any], boundaries: Boundaries) -> npt.NDArray[Any]:
+    """
+    Sums the rows of an array between consecutive boundaries. See
+    `Decomposable.partials`.
+    """
+    if values.dtype == bool:
+        values = values.astype(np.int64)
+    starts = boundaries[:-1]
+    non_empty = starts < boundaries[1:]
+    sums = np.zeros((len(starts), *values.shape[1:]), dtype=values.dtype)
+    if non_empty.any():
+        # Empty segments are left out because `reduceat` would return the row at
+        # their position instead of zero.
+        sums[non_empty] = np.add.reduceat(values, starts[non_empty], axis=0)
+    return sums
+
+
 @dataclass(frozen=True)
 class DriftOperator(UnaryOperator, ABC):
     reference_data: pd.DataFrame = field(
@@ -180,7 +245,7 @@ class Discretizer(ABC):
 
 
 @dataclass(frozen=True)
-class DiscreteDivergence(Discretizer, DriftOperator, ABC):
+class DiscreteDivergence(Discretizer, DriftOperator, Decomposable, ABC):
     """See https://en.wikipedia.org/wiki/Divergence_(statistics%29"""
 
     normalize: Normalizer = AdditiveSmoothing(pseudocount=1)
@@ -210,9 +275,28 @@ class DiscreteDivergence(Discretizer, DriftOperator, ABC):
 
     def calc(self, dataframe: pd.DataFrame) -> float:
         data = self.operand(dataframe)
+        return self._compare(self.histogram(data))
+
+    def partials(self, dataframe: pd.DataFrame, boundaries: Boundaries) -> pd.DataFrame:
+        codes, bins = self.binning_method.bin_codes(self.operand(dataframe))
+        segments = np.repeat(np.arange(len(boundaries) - 1), np.diff(boundaries))
+        counted = codes >= 0
+        counts = np.bincount(
+            segments[counted] * len(bins) + codes[counted],
+            minlength=(len(boundaries) - 1) * len(bins),
+        )
+        return pd.DataFrame(
+            counts.reshape((len(boundaries) - 1, len(bins))),
+            columns=bins,
+        )
+
+    def combine(self, sums: "pd.Series[Any]") -> float:
+        return self._compare(sums)
+
+    def _compare(self, histogram: Histogram) -> float:
         # outer-join histograms and fill in zeros for missing categories
         merged_counts = pd.merge(
-            self.histogram(data).rename("primary_histogram"),
+            histogram.rename("primary_histogram"),
             self.reference_histogram,
             left_index=True,
             right_index=True,
@@ -1,13 +1,20 @@
+import logging
+import warnings
 from collections.abc import Callable, Iterable, Iterator
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
 from functools import partial
 from itertools import accumulate, repeat
-from typing import cast
+from typing import Any, cast
 
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 from typing_extensions import TypeAlias
 
-from phoenix.metrics import Metric, multi_calculate
+from phoenix.metrics import Metric
+from phoenix.metrics.mixins import Decomposable
+
+logger = logging.getLogger(__name__)
 
 
 def timeseries(
@@ -62,34 +69,91 @@ def _aggregator(
     sampling_interval: timedelta,
 ) -> pd.DataFrame:
     """
-    Calls groupby on the dataframe and apply metric calculations on each group.
+    Computes the metrics over the evaluation window of each point in the time
+    series, in one pass over the rows.
+
+    The rows are split into segments at the edges of the evaluation windows,
+    which are multiples of the sampling interval apart when the evaluation
+    window is divisible by it, so that each window is a contiguous run of
+    segments. A `Decomposable` metric computes its partial sums for every
+    segment at once, and the sums over each window are the differences of
+    their prefix sums. Other metrics are computed on the rows of each window.
     """
     calcs = tuple(metrics)
-    return pd.concat(
-        _results(
-            calcs=calcs,
-            dataframe=dataframe,
+    time_index = cast(pd.DatetimeIndex, dataframe.index)
+    window_ends = sorted(
+        _window_ends(
+            time_index=time_index,
             start_time=start_time,
             end_time=end_time,
             evaluation_window=evaluation_window,
             sampling_interval=sampling_interval,
-        ),
-        verify_integrity=True,
+        )
     )
+    if not window_ends:
+        return pd.DataFrame()
+    edges = sorted({end - evaluation_window for end in window_ends}.union(window_ends))
+    positions = {edge: i for i, edge in enumerate(edges)}
+    starts = np.array([positions[end - evaluation_window] for end in window_ends])
+    stops = np.array([positions[end] for end in window_ends])
+    boundaries = np.asarray(time_index.searchsorted(edges), dtype=np.intp)
+    rows = dataframe.iloc[boundaries[0] : boundaries[-1]]
+    results: dict[int, list[Any]] = {}
+    for calc in calcs:
+        if isinstance(calc, Decomposable):
+            try:
+                partials = calc.partials(rows, boundaries - boundaries[0])
+            except (TypeError, ValueError, NotImplementedError):
+                pass
+            else:
+                results[calc.id()] = _combine(calc, partials, starts, stops)
+                continue
+        results[calc.id()] = [
+            calc(dataframe, slice(boundaries[start], boundaries[stop]))
+            for start, stop in zip(starts, stops)
+        ]
+    return pd.DataFrame(results, index=pd.DatetimeIndex(window_ends))
+
+
+def _combine(
+    calc: Decomposable,
+    partials: pd.DataFrame,
+    starts: npt.NDArray[np.intp],
+    stops: npt.NDArray[np.intp],
+) -> list[Any]:
+    """
+    Computes a metric over each run of segments from the prefix sums of their
+    partial sums.
+    """
+    values = partials.to_numpy()
+    prefix_sums = np.zeros((len(values) + 1, values.shape[1]), dtype=values.dtype)
+    np.cumsum(values, axis=0, out=prefix_sums[1:])
+    results = []
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", category=RuntimeWarning)
+        for sums in prefix_sums[stops] - prefix_sums[starts]:
+            try:
+                results.append(calc.combine(pd.Series(sums, index=partials.columns)))
+            except (TypeError, ValueError, NotImplementedError) as exc:
+                logger.warning(exc, exc_info=True)
+                results.append(calc.initial_value)
+    return results
 
 
 StartTime: TypeAlias = datetime
 EndTime: TypeAlias = datetime
+Origin: TypeAlias = datetime
 
 
-def _groupers(
+def _offsets(
     start_time: datetime,
     end_time: datetime,
     evaluation_window: timedelta,
     sampling_interval: timedelta,
-) -> Iterator[tuple[StartTime, EndTime, pd.Grouper]]:
+) -> Iterator[tuple[StartTime, EndTime, Origin]]:
     """
-    Yields pandas.Groupers from time series parameters.
+    Yields the rows of evaluation windows from time series parameters, along
+    with the time range of the data summarized by each row.
     """
     if not sampling_interval:
         return
@@ -106,30 +170,21 @@ def _groupers(
     for offset in offsets:
         if offset >= max_offset:
             return
-        # Each Grouper is like a row in a brick wall, where each brick is an
-        # evaluation window. By shifting each row of bricks by the sampling
-        # interval, we can get all the brick's right edges to line up with the
-        # points of the time series, and together they will summarize data for
-        # the whole time series.
+        # Each row of windows is like a row in a brick wall, where each brick
+        # is an evaluation window. By shifting each row of bricks by the
+        # sampling interval, we can get all the brick's right edges to line up
+        # with the points of the time series, and together they will summarize
+        # data for the whole time series.
         #
         #                   evaluation window
         #                   ┌──┴──┐
-        #       ┌─────┬─────┬─────┬─────┐    offset groupers
+        #       ┌─────┬─────┬─────┬─────┐    offset rows
         #     ┌─┴───┬─┴───┬─┴───┬─┴───┬─┘0 │ by sampling interval
         #   ┌─┴───┬─┴───┬─┴───┬─┴───┬─┘1   │
         #   └─────┴─────┴─────┴─────┘2     ▼
         #         ┌─┬─┬─┬─┬─┬─┬─┬─┬─┬─┬─┐    combine into
         #         └─┴─┴─┴─┴─┴─┴─┴─┴─┴2┴1┘0   final time series
         #
-        grouper = pd.Grouper(  # type: ignore  # mypy finds the wrong Grouper
-            freq=evaluation_window,
-            origin=end_time,
-            offset=-offset,
-            # Each point in timeseries will be labeled by the end instant of
-            # its evaluation window.
-            label="right",
-            sort=False,
-        )
         time_stop = end_time - offset
         if divisible:
             time_start = start_time - evaluation_window
@@ -138,60 +193,46 @@ def _groupers(
         yield (
             time_start,
             time_stop,
-            grouper,
+            # Each point in timeseries will be labeled by the end instant of
+            # its evaluation window.
+            time_stop,
         )
 
 
-def _results(
-    calcs: Iterable[Metric],
-    dataframe: pd.DataFrame,
+def _window_ends(
+    time_index: pd.DatetimeIndex,
     start_time: datetime,
     end_time: datetime,
     evaluation_window: timedelta,
     sampling_interval: timedelta,
-) -> Iterator[pd.DataFrame]:
+) -> Iterator[datetime]:
     """
-    Yields metric results for each data point in time series.
+    Yields the end instant of each evaluation window in the time series. As
+    with `pandas.Grouper`, a row of windows spans from the window of its
+    first data point to that of its last, including empty windows in between.
     """
-    yield pd.DataFrame()
-    calculate_metrics = partial(
-        multi_calculate,
-        calcs=calcs,
-    )
-    # pandas time indexing is end-inclusive
-    result_slice = slice(start_time, end_time)
     for (
         time_start,  # inclusive
         time_stop,  # exclusive
-        group,
-    ) in _groupers(
+        origin,
+    ) in _offsets(
         start_time=start_time,
         end_time=end_time,
         evaluation_window=evaluation_window,
         sampling_interval=sampling_interval,
     ):
         row_start, row_stop = row_interval_from_sorted_time_index(
-            time_index=cast(pd.DatetimeIndex, dataframe.index),
+            time_index=time_index,
             time_start=time_start,  # inclusive
             time_stop=time_stop,  # exclusive
         )
-        # pandas row indexing is stop-exclusive
-        row_slice = slice(row_start, row_stop)
-        filtered = dataframe.iloc[row_slice, :]
-        res = filtered.groupby(
-            group,
-            group_keys=True,
-        ).apply(
-            calculate_metrics,
+        if row_start >= row_stop:
+            continue
+        first, last = (
+            origin + ((time_index[row] - origin) // evaluation_window + 1) * evaluation_window
+            for row in (row_start, row_stop - 1)
         )
-
-        # NB: on ubuntu, we lose the timezone information when there is no data
-        if res.index.tzinfo is None:  # type: ignore
-            res = res.set_axis(
-                res.index.tz_localize(  # type: ignore
-                    timezone.utc,
-                ),
-                axis=0,
-            )
-
-        yield res.loc[result_slice, :]
+        while first <= last:
+            if start_time <= first <= end_time:
+                yield first
+            first += evaluation_window
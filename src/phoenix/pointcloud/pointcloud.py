@@ -23,6 +23,17 @@ class ClustersFinder(Protocol):
     def find_clusters(self, mat: Matrix) -> list[RawCluster]: ...
 
 
+class FittedProjector(Protocol):
+    @property
+    def embedding(self) -> Matrix: ...
+
+    def transform(self, mat: Matrix) -> Matrix: ...
+
+
+class FittingDimensionalityReducer(Protocol):
+    def fit(self, mat: Matrix, n_components: int) -> FittedProjector: ...
+
+
 @dataclass(frozen=True)
 class PointCloud:
     dimensionalityReducer: DimensionalityReducer
@@ -1,6 +1,6 @@
 import warnings
 from dataclasses import asdict, dataclass
-from typing import cast
+from typing import Any, cast
 
 import numpy as np
 import numpy.typing as npt
@@ -9,8 +9,23 @@ from typing_extensions import TypeAlias
 Matrix: TypeAlias = npt.NDArray[np.float64]
 
 
-def _center(arr: Matrix) -> Matrix:
-    return cast(Matrix, arr - np.mean(arr, axis=0))
+@dataclass(frozen=True)
+class FittedUmap:
+    model: Any
+    center: Matrix
+    embedding: Matrix
+    """The centered projections of the vectors the model was fitted on."""
+
+    def transform(self, mat: Matrix) -> Matrix:
+        """
+        Projects new vectors onto the embedding space of the fitted model,
+        using the nearest neighbor index built while fitting.
+        """
+        with warnings.catch_warnings():
+            from numba.core.errors import NumbaWarning
+
+            warnings.simplefilter("ignore", category=NumbaWarning)
+            return cast(Matrix, self.model.transform(mat) - self.center)
 
 
 @dataclass(frozen=True)
@@ -19,6 +34,9 @@ class Umap:
     min_dist: float = 0.1
 
     def project(self, mat: Matrix, n_components: int) -> Matrix:
+        return self.fit(mat, n_components).embedding
+
+    def fit(self, mat: Matrix, n_components: int) -> FittedUmap:
         with warnings.catch_warnings():
             from numba.core.errors import NumbaWarning
 
@@ -31,4 +49,7 @@ class Umap:
             # is greater or equal to the number of samples.
             # see https://github.com/lmcinnes/umap/issues/201#issuecomment-462097103
             config["init"] = "random"
-        return _center(UMAP(**config).fit_transform(mat))
+        model = UMAP(**config)
+        embedding = model.fit_transform(mat)
+        center = np.mean(embedding, axis=0)
+        return FittedUmap(model=model, center=center, embedding=cast(Matrix, embedding - center))
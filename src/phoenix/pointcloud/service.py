@@ -0,0 +1,180 @@
+"""
+Point clouds of embeddings that are cached across requests.
+
+Projecting the same sample of vectors again, e.g. to find clusters with different HDBSCAN
+parameters, reuses the cached projections. When the sample changes, e.g. when the time range
+is moved, the model last fitted for the same embedding and UMAP parameters projects the new
+vectors onto its space with `transform`, as long as the vectors it was fitted on make up at
+least half of the sample, so that the points already on screen stay where they were.
+Otherwise, a new model is fitted on the sample.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping
+from typing import Any, Generic, NamedTuple, Optional, TypeVar
+
+import numpy as np
+
+from phoenix.pointcloud.pointcloud import (
+    ClustersFinder,
+    FittedProjector,
+    FittingDimensionalityReducer,
+    Vector,
+)
+
+logger = logging.getLogger(__name__)
+
+_IdType = TypeVar("_IdType", bound=Hashable)
+_K = TypeVar("_K", bound=Hashable)
+_V = TypeVar("_V")
+
+DEFAULT_MAX_CACHED_PROJECTIONS = 32
+DEFAULT_MAX_CACHED_MODELS = 8
+
+
+class _ModelKey(NamedTuple):
+    dimension: Hashable
+    reducer: FittingDimensionalityReducer
+    n_components: int
+
+
+class _ProjectionKey(NamedTuple):
+    model_key: _ModelKey
+    ids: frozenset[Any]
+
+
+class _Model(NamedTuple):
+    projector: FittedProjector
+    projections: Mapping[Any, Vector]
+
+
+class _LRUCache(Generic[_K, _V]):
+    def __init__(self, max_size: int) -> None:
+        self._max_size = max_size
+        self._items: OrderedDict[_K, _V] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: _K) -> Optional[_V]:
+        with self._lock:
+            if (value := self._items.get(key)) is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def set(self, key: _K, value: _V) -> None:
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self._max_size:
+                self._items.popitem(last=False)
+
+
+class PointCloudService:
+    def __init__(
+        self,
+        max_cached_projections: int = DEFAULT_MAX_CACHED_PROJECTIONS,
+        max_cached_models: int = DEFAULT_MAX_CACHED_MODELS,
+    ) -> None:
+        self._projections: _LRUCache[_ProjectionKey, Mapping[Any, Vector]] = _LRUCache(
+            max_cached_projections
+        )
+        self._models: _LRUCache[_ModelKey, _Model] = _LRUCache(max_cached_models)
+
+    def generate(
+        self,
+        dimension: Hashable,
+        data: Mapping[_IdType, Vector],
+        dimensionality_reducer: FittingDimensionalityReducer,
+        clusters_finder: ClustersFinder,
+        n_components: int = 3,
+    ) -> tuple[dict[_IdType, Vector], dict[str, set[_IdType]]]:
+        """
+        Projects the vectors of an embedding dimension onto lower dimensions
+        and finds clusters among the projections, like `PointCloud.generate`.
+
+        Parameters
+        ----------
+        dimension : hashable
+            Identifies the embedding dimension of the vectors, so that models
+            are only reused for the same embedding.
+
+        data : mapping
+            Mapping of input vectors by their EventIds.
+
+        dimensionality_reducer : FittingDimensionalityReducer
+            The reducer, e.g. `Umap`, whose parameters are part of the key of
+            the cached projections.
+
+        clusters_finder : ClustersFinder
+            The clustering algorithm, which is run on every call.
+
+        n_components : int, default=3
+            Number of dimensions in the projected space.
+        """
+        if not data:
+            return {}, {}
+        projections = self._project(
+            _ModelKey(dimension, dimensionality_reducer, n_components),
+            data,
+        )
+        event_ids = list(projections)
+        clusters = clusters_finder.find_clusters(np.stack(list(projections.values())))
+        return projections, {
+            str(i): {event_ids[row_index] for row_index in cluster}
+            for i, cluster in enumerate(clusters)
+        }
+
+    def _project(
+        self,
+        model_key: _ModelKey,
+        data: Mapping[_IdType, Vector],
+    ) -> dict[_IdType, Vector]:
+        projection_key = _ProjectionKey(model_key, frozenset(data))
+        if (cached := self._projections.get(projection_key)) is not None:
+            return dict(cached)
+        model = self._models.get(model_key)
+        if model is not None and 2 * sum(id_ in model.projections for id_ in data) >= len(data):
+            new_ids = [id_ for id_ in data if id_ not in model.projections]
+            new_projections: Mapping[_IdType, Vector] = {}
+            if new_ids:
+                new_projections = dict(
+                    zip(
+                        new_ids,
+                        model.projector.transform(np.stack([data[id_] for id_ in new_ids])),
+                    )
+                )
+            projections = {
+                id_: new_projections[id_] if id_ in new_projections else model.projections[id_]
+                for id_ in data
+            }
+        else:
+            event_ids = list(data)
+            projector = model_key.reducer.fit(
+                np.stack([data[id_] for id_ in event_ids]),
+                model_key.n_components,
+            )
+            projections = dict(zip(event_ids, projector.embedding))
+            self._models.set(model_key, _Model(projector, projections))
+        self._projections.set(projection_key, projections)
+        return dict(projections)
+
+    def warm_up(self) -> None:
+        """
+        Compiles the numba functions of UMAP and HDBSCAN in a background thread,
+        so that the first request for a point cloud doesn't have to wait for it.
+        """
+        threading.Thread(target=_warm_up, name="point-cloud-warm-up", daemon=True).start()
+
+
+def _warm_up() -> None:
+    from phoenix.pointcloud.clustering import Hdbscan
+    from phoenix.pointcloud.projectors import Umap
+
+    try:
+        mat = np.random.default_rng(0).normal(size=(64, 8))
+        fitted = Umap().fit(mat, 3)
+        fitted.transform(mat[:8])
+        Hdbscan().find_clusters(fitted.embedding)
+    except Exception:
+        logger.exception("Failed to warm up point cloud generation")
@@ -1,5 +1,5 @@
 from asyncio import get_running_loop
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import cached_property, partial
 from pathlib import Path
 from typing import Any, Optional, cast
@@ -14,6 +14,7 @@ from phoenix.auth import (
 )
 from phoenix.core.model_schema import Model
 from phoenix.db import models
+from phoenix.pointcloud.service import PointCloudService
 from phoenix.server.api.dataloaders import (
     AnnotationSummaryDataLoader,
     AverageExperimentRunLatencyDataLoader,
@@ -132,6 +133,7 @@ class Context(BaseContext):
     secret: Optional[Secret] = None
     token_store: Optional[TokenStore] = None
     email_sender: Optional[EmailSender] = None
+    point_clouds: PointCloudService = field(default_factory=PointCloudService)
 
     def get_secret(self) -> Secret:
         """A type-safe way to get the application secret. Throws an error if the secret is not set.
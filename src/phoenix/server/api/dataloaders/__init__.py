@@ -1,4 +1,4 @@
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field, fields
 
 from .annotation_summaries import AnnotationSummaryCache, AnnotationSummaryDataLoader
 from .average_experiment_run_latency import AverageExperimentRunLatencyDataLoader
@@ -103,3 +103,10 @@ class CacheForDataLoaders:
     token_count: TokenCountCache = field(
         default_factory=TokenCountCache,
     )
+    enable_prometheus: InitVar[bool] = False
+
+    def __post_init__(self, enable_prometheus: bool) -> None:
+        for cache_field in fields(self):
+            cache = getattr(self, cache_field.name)
+            cache.name = cache_field.name
+            cache.enable_prometheus = enable_prometheus
@@ -10,7 +10,7 @@ from strawberry.dataloader import AbstractCache, DataLoader
 from typing_extensions import TypeAlias, assert_never
 
 from phoenix.db import models
-from phoenix.server.api.dataloaders.cache import TwoTierCache
+from phoenix.server.api.dataloaders.cache import TimeBounds, TwoTierCache, overlaps
 from phoenix.server.api.input_types.TimeRange import TimeRange
 from phoenix.server.api.types.AnnotationSummary import AnnotationSummary
 from phoenix.server.types import DbSessionFactory
@@ -60,6 +60,9 @@ class AnnotationSummaryCache(
             if section[0] == project_rowid:
                 del self._cache[section]
 
+    def invalidate_time_bounds(self, section: _Section, time_bounds: TimeBounds) -> None:
+        self.invalidate_sub_keys(section, lambda sub_key: overlaps(sub_key[0], time_bounds))
+
     def _cache_key(self, key: Key) -> tuple[_Section, _SubKey]:
         (kind, project_rowid, interval, filter_condition), annotation_name = _cache_key_fn(key)
         return (project_rowid, annotation_name, kind), (interval, filter_condition)
@@ -1,3 +1,3 @@
-from phoenix.server.api.dataloaders.cache.two_tier_cache import TwoTierCache
+from phoenix.server.api.dataloaders.cache.two_tier_cache import TimeBounds, TwoTierCache, overlaps
 
-__all__ = ("TwoTierCache",)
+__all__ = ("TimeBounds", "TwoTierCache", "overlaps")
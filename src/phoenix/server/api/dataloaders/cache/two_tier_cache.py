@@ -5,15 +5,21 @@ but we need to invalidate subsets of keys, e.g. all those associated with a
 specific project, very frequently (i.e. essentially at each span insertion). In a
 single-tier system we would need to check all the keys to see if they are in the
 subset that we want to invalidate.
+
+Within a section, entries can also be invalidated selectively, e.g. only those whose time
+intervals overlap the time bounds of newly inserted data (see `overlaps`), so that the
+aggregates of closed historical intervals stay cached while data keeps arriving.
 """
 
 from abc import ABC, abstractmethod
 from asyncio import Future
 from collections.abc import Callable
+from datetime import datetime
 from typing import Any, Generic, Optional, TypeVar
 
 from cachetools import Cache
 from strawberry.dataloader import AbstractCache
+from typing_extensions import TypeAlias
 
 _Key = TypeVar("_Key")
 _Result = TypeVar("_Result")
@@ -21,6 +27,19 @@ _Result = TypeVar("_Result")
 _Section = TypeVar("_Section")
 _SubKey = TypeVar("_SubKey")
 
+TimeInterval: TypeAlias = tuple[Optional[datetime], Optional[datetime]]
+TimeBounds: TypeAlias = tuple[datetime, datetime]
+
+
+def overlaps(interval: TimeInterval, time_bounds: TimeBounds) -> bool:
+    """
+    Whether a right-open time interval, either end of which may be unbounded, contains any
+    time within the given bounds, which are inclusive.
+    """
+    start, end = interval
+    earliest, latest = time_bounds
+    return (start is None or start <= latest) and (end is None or earliest < end)
+
 
 class TwoTierCache(
     AbstractCache[_Key, _Result],
@@ -37,6 +56,10 @@ class TwoTierCache(
         super().__init__(*args, **kwargs)
         self._cache = main_cache
         self._sub_cache_factory = sub_cache_factory
+        self.name = type(self).__name__
+        self.enable_prometheus = False
+        self.hits = 0
+        self.misses = 0
 
     @abstractmethod
     def _cache_key(self, key: _Key) -> tuple[_Section, _SubKey]: ...
@@ -45,11 +68,26 @@ class TwoTierCache(
         if sub_cache := self._cache.get(section):
             sub_cache.clear()
 
+    def invalidate_sub_keys(self, section: _Section, predicate: Callable[[_SubKey], bool]) -> None:
+        if sub_cache := self._cache.get(section):
+            for sub_key in [sub_key for sub_key in sub_cache.keys() if predicate(sub_key)]:
+                del sub_cache[sub_key]
+
     def get(self, key: _Key) -> Optional["Future[_Result]"]:
         section, sub_key = self._cache_key(key)
-        if not (sub_cache := self._cache.get(section)):
-            return None
-        return sub_cache.get(sub_key)
+        sub_cache = self._cache.get(section)
+        value = sub_cache.get(sub_key) if sub_cache else None
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        if self.enable_prometheus:
+            from phoenix.server.prometheus import DATALOADER_CACHE_HITS, DATALOADER_CACHE_MISSES
+
+            (DATALOADER_CACHE_MISSES if value is None else DATALOADER_CACHE_HITS).labels(
+                cache=self.name
+            ).inc()
+        return value
 
     def set(self, key: _Key, value: "Future[_Result]") -> None:
         section, sub_key = self._cache_key(key)
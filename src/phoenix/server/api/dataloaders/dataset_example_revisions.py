@@ -1,6 +1,6 @@
 from typing import Optional, Union
 
-from sqlalchemy import Integer, case, func, or_, select, union
+from sqlalchemy import Integer, and_, case, or_, select, union
 from sqlalchemy.sql.expression import literal
 from strawberry.dataloader import DataLoader
 from typing_extensions import TypeAlias
@@ -41,38 +41,15 @@ class DatasetExampleRevisionsDataLoader(DataLoader[Key, Result]):
                 for example_id, version_id in keys
             )
         ).subquery()
-        revision_ids = (
+        snapshot = models.DatasetSnapshotRange
+        query = (
             select(
                 keys_subquery.c.example_id,
                 keys_subquery.c.version_id,
-                func.max(models.DatasetExampleRevision.id).label("revision_id"),
-            )
-            .select_from(keys_subquery)
-            .join(
-                models.DatasetExampleRevision,
-                onclause=keys_subquery.c.example_id
-                == models.DatasetExampleRevision.dataset_example_id,
-            )
-            .where(
-                or_(
-                    # This query gets the latest `revision_id` for each example:
-                    # - If `version_id` is NOT given, it finds the maximum `revision_id`.
-                    # - If `version_id` is given, it finds the highest `revision_id` whose
-                    #   `version_id` is less than or equal to the one specified.
-                    keys_subquery.c.version_id.is_(None),
-                    models.DatasetExampleRevision.dataset_version_id <= keys_subquery.c.version_id,
-                )
-            )
-            .group_by(keys_subquery.c.example_id, keys_subquery.c.version_id)
-        ).subquery()
-        query = (
-            select(
-                revision_ids.c.example_id,
-                revision_ids.c.version_id,
                 case(
                     (
                         or_(
-                            revision_ids.c.version_id.is_(None),
+                            keys_subquery.c.version_id.is_(None),
                             models.DatasetVersion.id.is_not(None),
                         ),
                         True,
@@ -81,17 +58,37 @@ class DatasetExampleRevisionsDataLoader(DataLoader[Key, Result]):
                 ).label("is_valid_version"),  # check that non-null versions exist
                 models.DatasetExampleRevision,
             )
-            .select_from(revision_ids)
+            .select_from(keys_subquery)
+            .join(
+                snapshot,
+                onclause=and_(
+                    keys_subquery.c.example_id == snapshot.dataset_example_id,
+                    # The snapshot range of each example that contains the version, i.e. the
+                    # open range if the version is not given. Deleted examples have none.
+                    or_(
+                        and_(
+                            keys_subquery.c.version_id.is_(None),
+                            snapshot.to_version_id.is_(None),
+                        ),
+                        and_(
+                            snapshot.from_version_id <= keys_subquery.c.version_id,
+                            or_(
+                                snapshot.to_version_id.is_(None),
+                                snapshot.to_version_id > keys_subquery.c.version_id,
+                            ),
+                        ),
+                    ),
+                ),
+            )
             .join(
                 models.DatasetExampleRevision,
-                onclause=revision_ids.c.revision_id == models.DatasetExampleRevision.id,
+                onclause=snapshot.dataset_example_revision_id == models.DatasetExampleRevision.id,
             )
             .join(
                 models.DatasetVersion,
-                onclause=revision_ids.c.version_id == models.DatasetVersion.id,
+                onclause=keys_subquery.c.version_id == models.DatasetVersion.id,
                 isouter=True,  # keep rows where the version id is null
             )
-            .where(models.DatasetExampleRevision.revision_kind != "DELETE")
         )
         async with self._db() as session:
             results = {
@@ -12,7 +12,7 @@ from typing_extensions import TypeAlias
 from phoenix.db import models
 from phoenix.db.helpers import SupportedSQLDialect, num_docs_col
 from phoenix.metrics.retrieval_metrics import RetrievalMetrics
-from phoenix.server.api.dataloaders.cache import TwoTierCache
+from phoenix.server.api.dataloaders.cache import TimeBounds, TwoTierCache, overlaps
 from phoenix.server.api.input_types.TimeRange import TimeRange
 from phoenix.server.api.types.DocumentEvaluationSummary import DocumentEvaluationSummary
 from phoenix.server.types import DbSessionFactory
@@ -61,6 +61,9 @@ class DocumentEvaluationSummaryCache(
             if section[0] == project_rowid:
                 del self._cache[section]
 
+    def invalidate_time_bounds(self, section: _Section, time_bounds: TimeBounds) -> None:
+        self.invalidate_sub_keys(section, lambda sub_key: overlaps(sub_key[0], time_bounds))
+
     def _cache_key(self, key: Key) -> tuple[_Section, _SubKey]:
         (project_rowid, interval, filter_condition), eval_name = _cache_key_fn(key)
         return (project_rowid, eval_name), (interval, filter_condition)
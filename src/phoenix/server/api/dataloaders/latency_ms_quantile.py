@@ -23,7 +23,9 @@ from typing_extensions import TypeAlias, assert_never
 
 from phoenix.db import models
 from phoenix.db.helpers import SupportedSQLDialect
-from phoenix.server.api.dataloaders.cache import TwoTierCache
+from phoenix.db.rollups import split_time_range
+from phoenix.db.sketches import LatencySketch, latency_ms
+from phoenix.server.api.dataloaders.cache import TimeBounds, TwoTierCache, overlaps
 from phoenix.server.api.input_types.TimeRange import TimeRange
 from phoenix.server.types import DbSessionFactory
 from phoenix.trace.dsl import SpanFilter
@@ -70,6 +72,9 @@ class LatencyMsQuantileCache(
             sub_cache_factory=lambda: LFUCache(maxsize=2 * 2 * 2 * 16),
         )
 
+    def invalidate_time_bounds(self, project_rowid: ProjectRowId, time_bounds: TimeBounds) -> None:
+        self.invalidate_sub_keys(project_rowid, lambda sub_key: overlaps(sub_key[0], time_bounds))
+
     def _cache_key(self, key: Key) -> tuple[_Section, _SubKey]:
         (kind, interval, filter_condition), (project_rowid, probability) = _cache_key_fn(key)
         return project_rowid, (interval, filter_condition, kind, probability)
@@ -114,6 +119,11 @@ async def _get_results(
     params: Mapping[Param, list[ResultPosition]],
 ) -> AsyncIterator[tuple[ResultPosition, QuantileValue]]:
     kind, (start_time, end_time), filter_condition = segment
+    if not filter_condition:
+        results = _get_results_from_sketches(session, kind, (start_time, end_time), params)
+        async for position, quantile_value in results:
+            yield position, quantile_value
+        return
     stmt = select(models.Trace.project_rowid)
     if kind == "trace":
         latency_column = cast(FloatCol, models.Trace.latency_ms)
@@ -141,6 +151,63 @@ async def _get_results(
         yield position, quantile_value
 
 
+async def _get_results_from_sketches(
+    session: AsyncSession,
+    kind: Kind,
+    interval: TimeInterval,
+    params: Mapping[Param, list[ResultPosition]],
+) -> AsyncIterator[tuple[ResultPosition, QuantileValue]]:
+    """
+    Estimates the quantiles by merging the hourly latency sketches of the whole hours in
+    the time interval with the latencies in the partial hours at its edges.
+    """
+    project_rowids = {project_rowid for project_rowid, _ in params}
+    sketches: defaultdict[ProjectRowId, LatencySketch] = defaultdict(LatencySketch)
+    hours, edges = split_time_range(*interval)
+    if hours is not None:
+        table = models.ProjectHourlyLatencyBucket
+        stmt = (
+            select(table.project_rowid, table.bucket, func.sum(table.count))
+            .where(table.kind == kind)
+            .where(table.project_rowid.in_(project_rowids))
+            .group_by(table.project_rowid, table.bucket)
+        )
+        start_time, end_time = hours
+        if start_time:
+            stmt = stmt.where(start_time <= table.hour)
+        if end_time:
+            stmt = stmt.where(table.hour < end_time)
+        async for project_rowid, bucket, count in await session.stream(stmt):
+            sketches[project_rowid].add_bucket(bucket, count)
+    for start_time, end_time in edges:
+        if kind == "trace":
+            time_columns = (models.Trace.start_time, models.Trace.end_time)
+        elif kind == "span":
+            time_columns = (models.Span.start_time, models.Span.end_time)
+        else:
+            assert_never(kind)
+        edge_stmt = select(models.Trace.project_rowid, *time_columns).where(
+            models.Trace.project_rowid.in_(project_rowids)
+        )
+        if kind == "span":
+            edge_stmt = edge_stmt.join(models.Span)
+        if start_time:
+            edge_stmt = edge_stmt.where(start_time <= time_columns[0])
+        if end_time:
+            edge_stmt = edge_stmt.where(time_columns[0] < end_time)
+        async for project_rowid, record_start_time, record_end_time in await session.stream(
+            edge_stmt
+        ):
+            sketches[project_rowid].add(latency_ms(record_start_time, record_end_time))
+    for (project_rowid, probability), positions in params.items():
+        if (sketch := sketches.get(project_rowid)) is None:
+            continue
+        if (quantile_value := sketch.quantile(probability)) is None:
+            continue
+        for position in positions:
+            yield position, quantile_value
+
+
 async def _get_results_sqlite(
     session: AsyncSession,
     base_stmt: Select[Any],
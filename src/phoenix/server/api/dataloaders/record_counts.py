@@ -1,4 +1,5 @@
 from collections import defaultdict
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any, Literal, Optional
 
@@ -8,7 +9,8 @@ from strawberry.dataloader import AbstractCache, DataLoader
 from typing_extensions import TypeAlias, assert_never
 
 from phoenix.db import models
-from phoenix.server.api.dataloaders.cache import TwoTierCache
+from phoenix.db.rollups import split_time_range
+from phoenix.server.api.dataloaders.cache import TimeBounds, TwoTierCache, overlaps
 from phoenix.server.api.input_types.TimeRange import TimeRange
 from phoenix.server.types import DbSessionFactory
 from phoenix.trace.dsl import SpanFilter
@@ -52,6 +54,9 @@ class RecordCountCache(
             sub_cache_factory=lambda: LFUCache(maxsize=2 * 2 * 2),
         )
 
+    def invalidate_time_bounds(self, project_rowid: ProjectRowId, time_bounds: TimeBounds) -> None:
+        self.invalidate_sub_keys(project_rowid, lambda sub_key: overlaps(sub_key[0], time_bounds))
+
     def _cache_key(self, key: Key) -> tuple[_Section, _SubKey]:
         (kind, interval, filter_condition), project_rowid = _cache_key_fn(key)
         return project_rowid, (interval, filter_condition, kind)
@@ -81,19 +86,62 @@ class RecordCountDataLoader(DataLoader[Key, Result]):
             arguments[segment][param].append(position)
         async with self._db() as session:
             for segment, params in arguments.items():
-                stmt = _get_stmt(segment, *params.keys())
-                data = await session.stream(stmt)
-                async for project_rowid, count in data:
-                    for position in params[project_rowid]:
-                        results[position] = count
+                for stmt in _get_stmts(segment, *params.keys()):
+                    data = await session.stream(stmt)
+                    async for project_rowid, count in data:
+                        for position in params[project_rowid]:
+                            results[position] += count
         return results
 
 
-def _get_stmt(
+def _get_stmts(
     segment: Segment,
     *project_rowids: Param,
-) -> Select[Any]:
+) -> Iterator[Select[Any]]:
+    """
+    Without a filter condition, whole hours are counted from the hourly rollups, and only
+    the partial hours at the edges of the time interval are counted from the spans.
+    """
     kind, (start_time, end_time), filter_condition = segment
+    if filter_condition:
+        yield _get_stmt(kind, (start_time, end_time), filter_condition, *project_rowids)
+        return
+    hours, edges = split_time_range(start_time, end_time)
+    if hours is not None:
+        yield _get_rollup_stmt(kind, hours, *project_rowids)
+    for interval in edges:
+        yield _get_stmt(kind, interval, None, *project_rowids)
+
+
+def _get_rollup_stmt(
+    kind: Kind,
+    hours: TimeInterval,
+    *project_rowids: Param,
+) -> Select[Any]:
+    rollup = models.ProjectHourlyRollup
+    if kind == "span":
+        count = rollup.span_count
+    elif kind == "trace":
+        count = rollup.trace_count
+    else:
+        assert_never(kind)
+    pid = rollup.project_rowid
+    stmt = select(pid, func.sum(count)).where(pid.in_(project_rowids)).group_by(pid)
+    start_time, end_time = hours
+    if start_time:
+        stmt = stmt.where(start_time <= rollup.hour)
+    if end_time:
+        stmt = stmt.where(rollup.hour < end_time)
+    return stmt
+
+
+def _get_stmt(
+    kind: Kind,
+    interval: TimeInterval,
+    filter_condition: FilterCondition,
+    *project_rowids: Param,
+) -> Select[Any]:
+    start_time, end_time = interval
     pid = models.Trace.project_rowid
     stmt = select(pid)
     if kind == "span":
@@ -1,4 +1,5 @@
 from collections import defaultdict
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any, Literal, Optional
 
@@ -9,7 +10,8 @@ from strawberry.dataloader import AbstractCache, DataLoader
 from typing_extensions import TypeAlias
 
 from phoenix.db import models
-from phoenix.server.api.dataloaders.cache import TwoTierCache
+from phoenix.db.rollups import split_time_range
+from phoenix.server.api.dataloaders.cache import TimeBounds, TwoTierCache, overlaps
 from phoenix.server.api.input_types.TimeRange import TimeRange
 from phoenix.server.types import DbSessionFactory
 from phoenix.trace.dsl import SpanFilter
@@ -53,6 +55,9 @@ class TokenCountCache(
             sub_cache_factory=lambda: LFUCache(maxsize=2 * 2 * 3),
         )
 
+    def invalidate_time_bounds(self, project_rowid: ProjectRowId, time_bounds: TimeBounds) -> None:
+        self.invalidate_sub_keys(project_rowid, lambda sub_key: overlaps(sub_key[0], time_bounds))
+
     def _cache_key(self, key: Key) -> tuple[_Section, _SubKey]:
         (interval, filter_condition), (project_rowid, kind) = _cache_key_fn(key)
         return project_rowid, (interval, filter_condition, kind)
@@ -82,23 +87,69 @@ class TokenCountDataLoader(DataLoader[Key, Result]):
             arguments[segment][param].append(position)
         async with self._db() as session:
             for segment, params in arguments.items():
-                stmt = _get_stmt(segment, *params.keys())
-                data = await session.stream(stmt)
-                async for project_rowid, prompt, completion, total in data:
-                    for position in params[(project_rowid, "prompt")]:
-                        results[position] = prompt
-                    for position in params[(project_rowid, "completion")]:
-                        results[position] = completion
-                    for position in params[(project_rowid, "total")]:
-                        results[position] = total
+                for stmt in _get_stmts(segment, *params.keys()):
+                    data = await session.stream(stmt)
+                    async for project_rowid, prompt, completion, total in data:
+                        for position in params[(project_rowid, "prompt")]:
+                            results[position] += prompt
+                        for position in params[(project_rowid, "completion")]:
+                            results[position] += completion
+                        for position in params[(project_rowid, "total")]:
+                            results[position] += total
         return results
 
 
-def _get_stmt(
+def _get_stmts(
     segment: Segment,
     *params: Param,
+) -> Iterator[Select[Any]]:
+    """
+    Without a filter condition, whole hours are summed from the hourly rollups, and only
+    the partial hours at the edges of the time interval are summed from the spans.
+    """
+    interval, filter_condition = segment
+    if filter_condition:
+        yield _get_stmt(interval, filter_condition, *params)
+        return
+    hours, edges = split_time_range(*interval)
+    if hours is not None:
+        yield _get_rollup_stmt(hours, *params)
+    for edge in edges:
+        yield _get_stmt(edge, None, *params)
+
+
+def _get_rollup_stmt(
+    hours: TimeInterval,
+    *params: Param,
+) -> Select[Any]:
+    rollup = models.ProjectHourlyRollup
+    prompt = coalesce(func.sum(rollup.llm_token_count_prompt), 0)
+    completion = coalesce(func.sum(rollup.llm_token_count_completion), 0)
+    pid = rollup.project_rowid
+    stmt = (
+        select(
+            pid,
+            prompt.label("prompt"),
+            completion.label("completion"),
+            (prompt + completion).label("total"),
+        )
+        .where(pid.in_([rowid for rowid, _ in params]))
+        .group_by(pid)
+    )
+    start_time, end_time = hours
+    if start_time:
+        stmt = stmt.where(start_time <= rollup.hour)
+    if end_time:
+        stmt = stmt.where(rollup.hour < end_time)
+    return stmt
+
+
+def _get_stmt(
+    interval: TimeInterval,
+    filter_condition: FilterCondition,
+    *params: Param,
 ) -> Select[Any]:
-    (start_time, end_time), filter_condition = segment
+    start_time, end_time = interval
     prompt = coalesce(func.sum(models.Span.llm_token_count_prompt), 0)
     completion = coalesce(func.sum(models.Span.llm_token_count_completion), 0)
     total = prompt + completion
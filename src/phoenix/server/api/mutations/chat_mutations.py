@@ -23,8 +23,9 @@ from strawberry.types import Info
 from typing_extensions import assert_never
 
 from phoenix.datetime_utils import local_now, normalize_datetime
-from phoenix.db import models
+from phoenix.db import models, span_tree
 from phoenix.db.helpers import get_dataset_example_revisions
+from phoenix.db.rollups import add_single_span_traces
 from phoenix.server.api.auth import IsLocked, IsNotReadOnly
 from phoenix.server.api.context import Context
 from phoenix.server.api.exceptions import BadRequest, CustomGraphQLError, NotFound
@@ -169,9 +170,9 @@ class ChatCompletionMutationMixin:
             revisions = [
                 revision
                 async for revision in await session.stream_scalars(
-                    get_dataset_example_revisions(resolved_version_id).order_by(
-                        models.DatasetExampleRevision.id
-                    )
+                    get_dataset_example_revisions(
+                        resolved_version_id, dataset_id=dataset_id
+                    ).order_by(models.DatasetExampleRevision.id)
                 )
             ]
             if not revisions:
@@ -433,6 +434,11 @@ class ChatCompletionMutationMixin:
             session.add(trace)
             session.add(span)
             await session.flush()
+            await add_single_span_traces(session, [span])
+            await span_tree.add_spans(
+                session,
+                [(span.id, span.span_id, span.parent_id, trace.project_rowid, span.start_time)],
+            )
 
         gql_span = Span(span_rowid=span.id, db_span=span)
 
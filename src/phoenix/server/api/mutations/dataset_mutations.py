@@ -10,14 +10,18 @@ from openinference.semconv.trace import (
     ToolAttributes,
     ToolCallAttributes,
 )
-from sqlalchemy import and_, delete, distinct, func, insert, select, update
+from sqlalchemy import delete, distinct, insert, select, update
 from sqlalchemy.orm import contains_eager
 from strawberry import UNSET
 from strawberry.relay.types import GlobalID
 from strawberry.types import Info
 
 from phoenix.db import models
-from phoenix.db.helpers import get_eval_trace_ids_for_datasets, get_project_names_for_datasets
+from phoenix.db.helpers import (
+    get_dataset_example_revisions,
+    get_eval_trace_ids_for_datasets,
+    get_project_names_for_datasets,
+)
 from phoenix.server.api.auth import IsLocked, IsNotReadOnly
 from phoenix.server.api.context import Context
 from phoenix.server.api.exceptions import BadRequest, NotFound
@@ -371,7 +375,7 @@ class DatasetMutationMixin:
             if not (dataset := await session.scalar(stmt)):
                 raise NotFound(f"Unknown dataset: {input.dataset_id}")
         await asyncio.gather(
-            delete_projects(info.context.db, *project_names),
+            delete_projects(info.context.db, *project_names, event_queue=info.context.event_queue),
             delete_traces(info.context.db, *eval_trace_ids),
             return_exceptions=True,
         )
@@ -421,23 +425,12 @@ class DatasetMutationMixin:
                 raise BadRequest("Examples must come from the same dataset.")
             dataset = datasets[0]
 
-            revision_ids = (
-                select(func.max(models.DatasetExampleRevision.id))
-                .where(models.DatasetExampleRevision.dataset_example_id.in_(example_ids))
-                .group_by(models.DatasetExampleRevision.dataset_example_id)
-                .scalar_subquery()
-            )
             revisions = (
                 await session.scalars(
-                    select(models.DatasetExampleRevision)
-                    .where(
-                        and_(
-                            models.DatasetExampleRevision.id.in_(revision_ids),
-                            models.DatasetExampleRevision.revision_kind != "DELETE",
-                        )
-                    )
+                    get_dataset_example_revisions(dataset_id=dataset.id)
+                    .where(models.DatasetSnapshotRange.dataset_example_id.in_(example_ids))
                     .order_by(
-                        models.DatasetExampleRevision.dataset_example_id
+                        models.DatasetSnapshotRange.dataset_example_id
                     )  # ensure the order of the revisions matches the order of the input patches
                 )
             ).all()
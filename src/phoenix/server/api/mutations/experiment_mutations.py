@@ -63,7 +63,7 @@ class ExperimentMutationMixin:
                     )
                 )
         await asyncio.gather(
-            delete_projects(info.context.db, *project_names),
+            delete_projects(info.context.db, *project_names, event_queue=info.context.event_queue),
             delete_traces(info.context.db, *eval_trace_ids),
             return_exceptions=True,
         )
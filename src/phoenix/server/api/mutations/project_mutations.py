@@ -1,11 +1,12 @@
 import strawberry
-from sqlalchemy import delete, select
+from sqlalchemy import ColumnElement, and_, delete, select
 from sqlalchemy.orm import load_only
 from strawberry.relay import GlobalID
 from strawberry.types import Info
 
 from phoenix.config import DEFAULT_PROJECT_NAME
 from phoenix.db import models
+from phoenix.db.rollups import clear_rollups, subtract_traces
 from phoenix.server.api.auth import IsNotReadOnly
 from phoenix.server.api.context import Context
 from phoenix.server.api.input_types.ClearProjectInput import ClearProjectInput
@@ -38,14 +39,17 @@ class ProjectMutationMixin:
         project_id = from_global_id_with_expected_type(
             global_id=input.id, expected_type_name="Project"
         )
+        condition: ColumnElement[bool] = models.Trace.project_rowid == project_id
+        if input.end_time:
+            condition = and_(condition, models.Trace.start_time < input.end_time)
         delete_statement = (
-            delete(models.Trace)
-            .where(models.Trace.project_rowid == project_id)
-            .returning(models.Trace.project_session_rowid)
+            delete(models.Trace).where(condition).returning(models.Trace.project_session_rowid)
         )
-        if input.end_time:
-            delete_statement = delete_statement.where(models.Trace.start_time < input.end_time)
         async with info.context.db() as session:
+            if input.end_time:
+                await subtract_traces(session, condition)
+            else:
+                await clear_rollups(session, (project_id,))
             deleted_trace_project_session_ids = await session.scalars(delete_statement)
             if deleted_trace_project_session_ids:
                 await session.execute(
@@ -6,6 +6,7 @@ from strawberry.relay import GlobalID
 from strawberry.types import Info
 
 from phoenix.db import models
+from phoenix.db.rollups import subtract_traces
 from phoenix.server.api.auth import IsNotReadOnly
 from phoenix.server.api.context import Context
 from phoenix.server.api.exceptions import BadRequest
@@ -33,6 +34,7 @@ class TraceMutationMixin:
         except ValueError as error:
             raise BadRequest(str(error))
         async with info.context.db() as session:
+            await subtract_traces(session, models.Trace.id.in_(trace_rowids))
             traces = (
                 await session.scalars(
                     delete(models.Trace)
@@ -20,7 +20,11 @@ from phoenix.config import (
 )
 from phoenix.db import enums, models
 from phoenix.db.constants import DEFAULT_PROJECT_TRACE_RETENTION_POLICY_ID
-from phoenix.db.helpers import SupportedSQLDialect, exclude_experiment_projects
+from phoenix.db.helpers import (
+    SupportedSQLDialect,
+    exclude_experiment_projects,
+    in_dataset_snapshot,
+)
 from phoenix.db.models import DatasetExample as OrmExample
 from phoenix.db.models import DatasetExampleRevision as OrmRevision
 from phoenix.db.models import DatasetVersion as OrmVersion
@@ -348,29 +352,21 @@ class Query:
             if num_resolved_experiment_ids != len(experiment_ids_):
                 raise ValueError("Unable to resolve one or more experiment IDs.")
 
-            revision_ids = (
-                select(func.max(OrmRevision.id))
-                .join(OrmExample, OrmExample.id == OrmRevision.dataset_example_id)
-                .where(
-                    and_(
-                        OrmRevision.dataset_version_id <= version_id,
-                        OrmExample.dataset_id == dataset_id,
-                    )
-                )
-                .group_by(OrmRevision.dataset_example_id)
-                .scalar_subquery()
-            )
             examples_query = (
                 select(OrmExample)
                 .distinct(OrmExample.id)
                 .join(
-                    OrmRevision,
+                    models.DatasetSnapshotRange,
                     onclause=and_(
-                        OrmExample.id == OrmRevision.dataset_example_id,
-                        OrmRevision.id.in_(revision_ids),
-                        OrmRevision.revision_kind != "DELETE",
+                        OrmExample.id == models.DatasetSnapshotRange.dataset_example_id,
+                        in_dataset_snapshot(version_id, dataset_id=dataset_id),
                     ),
                 )
+                .join(
+                    OrmRevision,
+                    onclause=OrmRevision.id
+                    == models.DatasetSnapshotRange.dataset_example_revision_id,
+                )
                 .order_by(OrmExample.id.desc())
             )
 
@@ -489,18 +485,14 @@ class Query:
                 raise NotFound(f"Unknown trace: {id}")
             return Trace(trace_rowid=trace.id, db_trace=trace)
         elif type_name == Span.__name__:
-            span_stmt = (
-                select(models.Span)
-                .options(
-                    joinedload(models.Span.trace, innerjoin=True).load_only(models.Trace.trace_id)
-                )
-                .where(models.Span.id == node_id)
-            )
+            # Only the existence of the span is checked here. Its fields are then loaded by
+            # `span_fields`, so that only the columns and attributes selected are fetched.
+            span_stmt = select(models.Span.id).where(models.Span.id == node_id)
             async with info.context.db() as session:
-                span = await session.scalar(span_stmt)
-            if span is None:
+                span_rowid = await session.scalar(span_stmt)
+            if span_rowid is None:
                 raise NotFound(f"Unknown span: {id}")
-            return Span(span_rowid=span.id, db_span=span)
+            return Span(span_rowid=span_rowid)
         elif type_name == Dataset.__name__:
             dataset_stmt = select(models.Dataset).where(models.Dataset.id == node_id)
             async with info.context.db() as session:
@@ -509,24 +501,19 @@ class Query:
             return to_gql_dataset(dataset)
         elif type_name == DatasetExample.__name__:
             example_id = node_id
-            latest_revision_id = (
-                select(func.max(models.DatasetExampleRevision.id))
-                .where(models.DatasetExampleRevision.dataset_example_id == example_id)
-                .scalar_subquery()
-            )
             async with info.context.db() as session:
+                # Examples that are deleted as of the latest version have no open range.
                 example = await session.scalar(
                     select(models.DatasetExample)
                     .join(
-                        models.DatasetExampleRevision,
-                        onclause=models.DatasetExampleRevision.dataset_example_id
+                        models.DatasetSnapshotRange,
+                        onclause=models.DatasetSnapshotRange.dataset_example_id
                         == models.DatasetExample.id,
                     )
                     .where(
                         and_(
                             models.DatasetExample.id == example_id,
-                            models.DatasetExampleRevision.id == latest_revision_id,
-                            models.DatasetExampleRevision.revision_kind != "DELETE",
+                            models.DatasetSnapshotRange.to_version_id.is_(None),
                         )
                     )
                 )
@@ -1,3 +1,4 @@
+from collections.abc import Mapping
 from datetime import datetime
 from typing import Optional, cast
 
@@ -16,6 +17,8 @@ def from_iso_format(value: Optional[str]) -> Optional[datetime]:
     return datetime.fromisoformat(value) if value else None
 
 
-def df_to_bytes(df: pd.DataFrame) -> bytes:
+def df_to_bytes(df: pd.DataFrame, metadata: Optional[Mapping[bytes, bytes]] = None) -> bytes:
     pa_table = pa.Table.from_pandas(df)
+    if metadata:
+        pa_table = pa_table.replace_schema_metadata({**pa_table.schema.metadata, **metadata})
     return table_to_bytes(pa_table)
@@ -44,6 +44,7 @@ from phoenix.server.api.types.AnnotationConfig import (
 from phoenix.server.api.types.AnnotationConfig import (
     FreeformAnnotationConfig as FreeformAnnotationConfigType,
 )
+from phoenix.server.bearer_auth import get_user_id
 
 logger = logging.getLogger(__name__)
 
@@ -218,7 +219,7 @@ async def list_annotation_configs(
             )
         cursor_id = int(cursor_gid.node_id)
 
-    async with request.app.state.db() as session:
+    async with request.app.state.db.read(get_user_id(request)) as session:
         query = (
             select(models.AnnotationConfig)
             .order_by(models.AnnotationConfig.id.desc())
@@ -250,7 +251,7 @@ async def get_annotation_config_by_name_or_id(
     request: Request,
     config_identifier: str = Path(..., description="ID or name of the annotation configuration"),
 ) -> GetAnnotationConfigResponseBody:
-    async with request.app.state.db() as session:
+    async with request.app.state.db.read(get_user_id(request)) as session:
         query = select(models.AnnotationConfig)
         # Try to interpret the identifier as an integer ID; if not, use it as a name.
         try:
@@ -13,6 +13,7 @@ from strawberry.relay import GlobalID
 from phoenix.db import models
 from phoenix.server.api.types.SpanAnnotation import SpanAnnotation as SpanAnnotationNodeType
 from phoenix.server.api.types.User import User as UserNodeType
+from phoenix.server.bearer_auth import get_user_id
 
 from .spans import SpanAnnotationData, SpanAnnotationResult
 from .utils import PaginatedResponseBody, _get_project_by_identifier, add_errors_to_responses
@@ -77,7 +78,7 @@ async def list_span_annotations(
             detail=f"Too many span_ids supplied: {len(span_ids)} (max {MAX_SPAN_IDS})",
         )
 
-    async with request.app.state.db() as session:
+    async with request.app.state.db.read(get_user_id(request)) as session:
         project = await _get_project_by_identifier(session, project_identifier)
         if not project:
             raise HTTPException(
@@ -1,5 +1,5 @@
+import codecs
 import csv
-import gzip
 import io
 import json
 import logging
@@ -7,17 +7,18 @@ import urllib
 import zlib
 from asyncio import QueueFull
 from collections import Counter
-from collections.abc import Awaitable, Callable, Coroutine, Iterator, Mapping, Sequence
+from collections.abc import AsyncIterator, Callable, Iterable, Iterator, Mapping, Sequence
+from contextlib import AsyncExitStack
 from datetime import datetime
 from enum import Enum
 from functools import partial
-from typing import Any, Optional, Union, cast
+from itertools import chain
+from typing import Any, BinaryIO, Optional, cast
 
-import pandas as pd
 import pyarrow as pa
 from fastapi import APIRouter, BackgroundTasks, HTTPException, Path, Query
 from fastapi.responses import PlainTextResponse, StreamingResponse
-from sqlalchemy import and_, delete, func, select
+from sqlalchemy import Select, and_, delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.concurrency import run_in_threadpool
 from starlette.datastructures import FormData, UploadFile
@@ -35,7 +36,11 @@ from strawberry.relay import GlobalID
 from typing_extensions import TypeAlias, assert_never
 
 from phoenix.db import models
-from phoenix.db.helpers import get_eval_trace_ids_for_datasets, get_project_names_for_datasets
+from phoenix.db.helpers import (
+    get_dataset_example_revisions,
+    get_eval_trace_ids_for_datasets,
+    get_project_names_for_datasets,
+)
 from phoenix.db.insertion.dataset import (
     DatasetAction,
     DatasetExampleAdditionEvent,
@@ -47,7 +52,9 @@ from phoenix.server.api.types.DatasetExample import DatasetExample as DatasetExa
 from phoenix.server.api.types.DatasetVersion import DatasetVersion as DatasetVersionNodeType
 from phoenix.server.api.types.node import from_global_id_with_expected_type
 from phoenix.server.api.utils import delete_projects, delete_traces
+from phoenix.server.bearer_auth import get_user_id
 from phoenix.server.dml_event import DatasetInsertEvent
+from phoenix.server.types import DbSessionFactory
 
 from .models import V1RoutesBaseModel
 from .utils import (
@@ -96,7 +103,7 @@ async def list_datasets(
         default=10, description="The max number of datasets to return at a time.", gt=0
     ),
 ) -> ListDatasetsResponseBody:
-    async with request.app.state.db() as session:
+    async with request.app.state.db.read(get_user_id(request)) as session:
         query = select(models.Dataset).order_by(models.Dataset.id.desc())
 
         if cursor:
@@ -177,7 +184,12 @@ async def delete_dataset(
         if (await session.scalar(stmt)) is None:
             raise HTTPException(detail="Dataset does not exist", status_code=HTTP_404_NOT_FOUND)
     tasks = BackgroundTasks()
-    tasks.add_task(delete_projects, request.app.state.db, *project_names)
+    tasks.add_task(
+        delete_projects,
+        request.app.state.db,
+        *project_names,
+        event_queue=request.state.event_queue,
+    )
     tasks.add_task(delete_traces, request.app.state.db, *eval_trace_ids)
 
 
@@ -204,7 +216,7 @@ async def get_dataset(
         raise HTTPException(
             detail=f"ID {dataset_id} refers to a f{type_name}", status_code=HTTP_404_NOT_FOUND
         )
-    async with request.app.state.db() as session:
+    async with request.app.state.db.read(get_user_id(request)) as session:
         result = await session.execute(
             select(models.Dataset, models.Dataset.example_count).filter(
                 models.Dataset.id == int(dataset_id.node_id)
@@ -296,7 +308,7 @@ async def list_dataset_versions(
             .where(models.DatasetVersion.dataset_id == dataset_id)
         ).scalar_subquery()
         stmt = stmt.filter(models.DatasetVersion.id <= max_dataset_version_id)
-    async with request.app.state.db() as session:
+    async with request.app.state.db.read(get_user_id(request)) as session:
         data = [
             DatasetVersion(
                 version_id=str(GlobalID(DATASET_VERSION_NODE_NAME, str(version.id))),
@@ -321,7 +333,7 @@ class UploadDatasetResponseBody(ResponseBody[UploadDatasetData]):
 @router.post(
     "/datasets/upload",
     operation_id="uploadDataset",
-    summary="Upload dataset from JSON, CSV, or PyArrow",
+    summary="Upload dataset from JSON, JSONL, CSV, or PyArrow",
     responses=add_errors_to_responses(
         [
             {
@@ -392,26 +404,30 @@ async def upload_dataset(
     ),
 ) -> Optional[UploadDatasetResponseBody]:
     request_content_type = request.headers["content-type"]
-    examples: Union[Examples, Awaitable[Examples]]
-    if request_content_type.startswith("application/json"):
-        try:
-            examples, action, name, description = await run_in_threadpool(
-                _process_json, await request.json()
-            )
-        except ValueError as e:
-            raise HTTPException(
-                detail=str(e),
-                status_code=HTTP_422_UNPROCESSABLE_ENTITY,
-            )
-        if action is DatasetAction.CREATE:
-            async with request.app.state.db() as session:
-                if await _check_table_exists(session, name):
-                    raise HTTPException(
-                        detail=f"Dataset with the same name already exists: {name=}",
-                        status_code=HTTP_409_CONFLICT,
-                    )
-    elif request_content_type.startswith("multipart/form-data"):
-        async with request.form() as form:
+    examples: Examples
+    # The file of a form is read as the examples are inserted, which for asynchronous
+    # requests is after the response is sent, so the form is closed by the operation.
+    exit_stack = AsyncExitStack()
+    try:
+        if request_content_type.startswith("application/json"):
+            try:
+                examples, action, name, description = await run_in_threadpool(
+                    _process_json, await request.json()
+                )
+            except ValueError as e:
+                raise HTTPException(
+                    detail=str(e),
+                    status_code=HTTP_422_UNPROCESSABLE_ENTITY,
+                )
+            if action is DatasetAction.CREATE:
+                async with request.app.state.db() as session:
+                    if await _check_table_exists(session, name):
+                        raise HTTPException(
+                            detail=f"Dataset with the same name already exists: {name=}",
+                            status_code=HTTP_409_CONFLICT,
+                        )
+        elif request_content_type.startswith("multipart/form-data"):
+            form = await exit_stack.enter_async_context(request.form())
             try:
                 (
                     action,
@@ -434,41 +450,59 @@ async def upload_dataset(
                             detail=f"Dataset with the same name already exists: {name=}",
                             status_code=HTTP_409_CONFLICT,
                         )
-            content = await file.read()
-        try:
-            file_content_type = FileContentType(file.content_type)
-            if file_content_type is FileContentType.CSV:
-                encoding = FileContentEncoding(file.headers.get("content-encoding"))
-                examples = await _process_csv(
-                    content, encoding, input_keys, output_keys, metadata_keys
+            try:
+                file_content_type = FileContentType(file.content_type)
+                if file_content_type is FileContentType.CSV:
+                    encoding = FileContentEncoding(file.headers.get("content-encoding"))
+                    examples = await run_in_threadpool(
+                        _process_csv, file.file, encoding, input_keys, output_keys, metadata_keys
+                    )
+                elif file_content_type is FileContentType.JSONL:
+                    encoding = FileContentEncoding(file.headers.get("content-encoding"))
+                    examples = await run_in_threadpool(
+                        _process_jsonl, file.file, encoding, input_keys, output_keys, metadata_keys
+                    )
+                elif file_content_type is FileContentType.PYARROW:
+                    examples = await run_in_threadpool(
+                        _process_pyarrow, file.file, input_keys, output_keys, metadata_keys
+                    )
+                else:
+                    assert_never(file_content_type)
+            except ValueError as e:
+                raise HTTPException(
+                    detail=str(e),
+                    status_code=HTTP_422_UNPROCESSABLE_ENTITY,
                 )
-            elif file_content_type is FileContentType.PYARROW:
-                examples = await _process_pyarrow(content, input_keys, output_keys, metadata_keys)
-            else:
-                assert_never(file_content_type)
+        else:
+            raise HTTPException(
+                detail="Invalid request Content-Type",
+                status_code=HTTP_422_UNPROCESSABLE_ENTITY,
+            )
+    except BaseException:
+        await exit_stack.aclose()
+        raise
+
+    async def operation(session: AsyncSession) -> DatasetExampleAdditionEvent:
+        async with exit_stack:
+            event = await add_dataset_examples(
+                session=session,
+                examples=examples,
+                action=action,
+                name=name,
+                description=description,
+            )
+        return cast(DatasetExampleAdditionEvent, event)
+
+    if sync:
+        try:
+            async with request.app.state.db() as session:
+                dataset_id = (await operation(session)).dataset_id
         except ValueError as e:
+            # e.g. a malformed row further down the file than what was checked upfront
             raise HTTPException(
                 detail=str(e),
                 status_code=HTTP_422_UNPROCESSABLE_ENTITY,
             )
-    else:
-        raise HTTPException(
-            detail="Invalid request Content-Type",
-            status_code=HTTP_422_UNPROCESSABLE_ENTITY,
-        )
-    operation = cast(
-        Callable[[AsyncSession], Awaitable[DatasetExampleAdditionEvent]],
-        partial(
-            add_dataset_examples,
-            examples=examples,
-            action=action,
-            name=name,
-            description=description,
-        ),
-    )
-    if sync:
-        async with request.app.state.db() as session:
-            dataset_id = (await operation(session)).dataset_id
         request.state.event_queue.put(DatasetInsertEvent((dataset_id,)))
         return UploadDatasetResponseBody(
             data=UploadDatasetData(dataset_id=str(GlobalID(Dataset.__name__, str(dataset_id))))
@@ -476,14 +510,14 @@ async def upload_dataset(
     try:
         request.state.enqueue_operation(operation)
     except QueueFull:
-        if isinstance(examples, Coroutine):
-            examples.close()
+        await exit_stack.aclose()
         raise HTTPException(detail="Too many requests.", status_code=HTTP_429_TOO_MANY_REQUESTS)
     return None
 
 
 class FileContentType(Enum):
     CSV = "text/csv"
+    JSONL = "application/jsonl"
     PYARROW = "application/x-pandas-pyarrow"
 
     @classmethod
@@ -534,32 +568,26 @@ def _process_json(
             raise ValueError(
                 f"{k} should be a list of same length as input containing only dictionary objects"
             )
-    examples: list[ExampleContent] = []
-    for i, obj in enumerate(inputs):
-        example = ExampleContent(
+    examples = (
+        ExampleContent(
             input=obj,
             output=outputs[i] if outputs else {},
             metadata=metadata[i] if metadata else {},
         )
-        examples.append(example)
+        for i, obj in enumerate(inputs)
+    )
     action = DatasetAction(cast(Optional[str], data.get("action")) or "create")
-    return iter(examples), action, name, description
+    return examples, action, name, description
 
 
-async def _process_csv(
-    content: bytes,
+def _process_csv(
+    file: BinaryIO,
     content_encoding: FileContentEncoding,
     input_keys: InputKeys,
     output_keys: OutputKeys,
     metadata_keys: MetadataKeys,
 ) -> Examples:
-    if content_encoding is FileContentEncoding.GZIP:
-        content = await run_in_threadpool(gzip.decompress, content)
-    elif content_encoding is FileContentEncoding.DEFLATE:
-        content = await run_in_threadpool(zlib.decompress, content)
-    elif content_encoding is not FileContentEncoding.NONE:
-        assert_never(content_encoding)
-    reader = await run_in_threadpool(lambda c: csv.DictReader(io.StringIO(c.decode())), content)
+    reader = csv.DictReader(_read_lines(file, content_encoding))
     if reader.fieldnames is None:
         raise ValueError("Missing CSV column header")
     (header, freq), *_ = Counter(reader.fieldnames).most_common(1)
@@ -573,32 +601,105 @@ async def _process_csv(
             output={k: row.get(k) for k in output_keys},
             metadata={k: row.get(k) for k in metadata_keys},
         )
-        for row in iter(reader)
+        for row in reader
     )
 
 
-async def _process_pyarrow(
-    content: bytes,
+def _process_jsonl(
+    file: BinaryIO,
+    content_encoding: FileContentEncoding,
     input_keys: InputKeys,
     output_keys: OutputKeys,
     metadata_keys: MetadataKeys,
-) -> Awaitable[Examples]:
+) -> Examples:
+    rows: Iterator[dict[str, Any]] = map(
+        _parse_json_line, filter(str.strip, _read_lines(file, content_encoding))
+    )
+    # Lines need not have the same keys, so only the first line is checked for them.
+    first_row = next(rows, None)
+    _check_keys_exist(frozenset(first_row or ()), input_keys, output_keys, metadata_keys)
+    if first_row is not None:
+        rows = chain((first_row,), rows)
+    return (
+        ExampleContent(
+            input={k: row.get(k) for k in input_keys},
+            output={k: row.get(k) for k in output_keys},
+            metadata={k: row.get(k) for k in metadata_keys},
+        )
+        for row in rows
+    )
+
+
+def _parse_json_line(line: str) -> dict[str, Any]:
+    obj = json.loads(line)
+    if not isinstance(obj, dict):
+        raise ValueError("Each line of a JSONL file should be a JSON object")
+    return obj
+
+
+def _process_pyarrow(
+    file: BinaryIO,
+    input_keys: InputKeys,
+    output_keys: OutputKeys,
+    metadata_keys: MetadataKeys,
+) -> Examples:
     try:
-        reader = pa.ipc.open_stream(content)
+        reader = pa.ipc.open_stream(file)
     except pa.ArrowInvalid as e:
         raise ValueError("File is not valid pyarrow") from e
     column_headers = frozenset(reader.schema.names)
     _check_keys_exist(column_headers, input_keys, output_keys, metadata_keys)
+    return (
+        ExampleContent(
+            input={k: row.get(k) for k in input_keys},
+            output={k: row.get(k) for k in output_keys},
+            metadata={k: row.get(k) for k in metadata_keys},
+        )
+        for batch in reader
+        for row in batch.to_pandas().to_dict(orient="records")
+    )
+
+
+_READ_CHUNK_SIZE = 1 << 20
+
+
+def _read_lines(file: BinaryIO, content_encoding: FileContentEncoding) -> Iterator[str]:
+    """
+    Decodes a file one chunk at a time, yielding its lines, with their line endings, so
+    that the file never has to be held in memory as a whole.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    remainder = ""
+    for chunk in chain(_read_chunks(file, content_encoding), (b"",)):
+        text = decoder.decode(chunk, final=not chunk)
+        *lines, remainder = (remainder + text).split("\n")
+        yield from (line + "\n" for line in lines)
+    if remainder:
+        yield remainder
 
-    def get_examples() -> Iterator[ExampleContent]:
-        for row in reader.read_pandas().to_dict(orient="records"):
-            yield ExampleContent(
-                input={k: row.get(k) for k in input_keys},
-                output={k: row.get(k) for k in output_keys},
-                metadata={k: row.get(k) for k in metadata_keys},
-            )
 
-    return run_in_threadpool(get_examples)
+def _read_chunks(file: BinaryIO, content_encoding: FileContentEncoding) -> Iterator[bytes]:
+    """
+    Reads and decompresses a file one chunk at a time. Decompressed chunks are no larger
+    than the chunks read, however well the file compresses.
+    """
+    chunks = iter(partial(file.read, _READ_CHUNK_SIZE), b"")
+    if content_encoding is FileContentEncoding.GZIP:
+        decompressor = zlib.decompressobj(wbits=16 + zlib.MAX_WBITS)
+    elif content_encoding is FileContentEncoding.DEFLATE:
+        decompressor = zlib.decompressobj()
+    elif content_encoding is FileContentEncoding.NONE:
+        yield from chunks
+        return
+    else:
+        assert_never(content_encoding)
+    for chunk in chunks:
+        while chunk:
+            if data := decompressor.decompress(chunk, _READ_CHUNK_SIZE):
+                yield data
+            chunk = decompressor.unconsumed_tail
+    if data := decompressor.flush():
+        yield data
 
 
 async def _check_table_exists(session: AsyncSession, name: str) -> bool:
@@ -672,7 +773,7 @@ class ListDatasetExamplesData(V1RoutesBaseModel):
 
 
 class ListDatasetExamplesResponseBody(ResponseBody[ListDatasetExamplesData]):
-    pass
+    next_cursor: Optional[str] = None
 
 
 @router.get(
@@ -690,6 +791,18 @@ async def get_dataset_examples(
             "The ID of the dataset version " "(if omitted, returns data from the latest version)"
         ),
     ),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="Cursor for pagination",
+    ),
+    limit: Optional[int] = Query(
+        default=None,
+        description=(
+            "The max number of examples to return at a time "
+            "(if omitted, returns all of the examples)"
+        ),
+        gt=0,
+    ),
 ) -> ListDatasetExamplesResponseBody:
     dataset_gid = GlobalID.from_id(id)
     version_gid = GlobalID.from_id(version_id) if version_id else None
@@ -704,7 +817,7 @@ async def get_dataset_examples(
             detail=f"ID {version_gid} refers to a {version_type}", status_code=HTTP_404_NOT_FOUND
         )
 
-    async with request.app.state.db() as session:
+    async with request.app.state.db.read(get_user_id(request)) as session:
         if (
             resolved_dataset_id := await session.scalar(
                 select(models.Dataset.id).where(models.Dataset.id == int(dataset_gid.node_id))
@@ -715,12 +828,6 @@ async def get_dataset_examples(
                 status_code=HTTP_404_NOT_FOUND,
             )
 
-        # Subquery to find the maximum created_at for each dataset_example_id
-        # timestamp tiebreaks are resolved by the largest id
-        partial_subquery = select(
-            func.max(models.DatasetExampleRevision.id).label("max_id"),
-        ).group_by(models.DatasetExampleRevision.dataset_example_id)
-
         if version_gid:
             if (
                 resolved_version_id := await session.scalar(
@@ -736,9 +843,8 @@ async def get_dataset_examples(
                     detail=f"No dataset version with id {version_id} can be found.",
                     status_code=HTTP_404_NOT_FOUND,
                 )
-            # if a version_id is provided, filter the subquery to only include revisions from that
-            partial_subquery = partial_subquery.filter(
-                models.DatasetExampleRevision.dataset_version_id <= resolved_version_id
+            query = get_dataset_example_revisions(
+                resolved_version_id, dataset_id=resolved_dataset_id
             )
         else:
             if (
@@ -752,39 +858,41 @@ async def get_dataset_examples(
                     detail="Dataset has no versions.",
                     status_code=HTTP_404_NOT_FOUND,
                 )
+            query = get_dataset_example_revisions(dataset_id=resolved_dataset_id)
 
-        subquery = partial_subquery.subquery()
-        # Query for the most recent example revisions that are not deleted
-        query = (
-            select(models.DatasetExample, models.DatasetExampleRevision)
-            .join(
-                models.DatasetExampleRevision,
-                models.DatasetExample.id == models.DatasetExampleRevision.dataset_example_id,
-            )
-            .join(
-                subquery,
-                (subquery.c.max_id == models.DatasetExampleRevision.id),
-            )
-            .filter(models.DatasetExample.dataset_id == resolved_dataset_id)
-            .filter(models.DatasetExampleRevision.revision_kind != "DELETE")
-            .order_by(models.DatasetExample.id.asc())
-        )
+        # The examples are paginated by their IDs, from the index of the snapshot ranges.
+        query = query.order_by(models.DatasetSnapshotRange.dataset_example_id.asc())
+        if cursor:
+            try:
+                cursor_example_id = from_global_id_with_expected_type(
+                    GlobalID.from_id(cursor), DatasetExampleNodeType.__name__
+                )
+            except ValueError:
+                raise HTTPException(
+                    detail=f"Invalid cursor: {cursor}",
+                    status_code=HTTP_422_UNPROCESSABLE_ENTITY,
+                )
+            query = query.where(models.DatasetSnapshotRange.dataset_example_id >= cursor_example_id)
+        if limit is not None:
+            query = query.limit(limit + 1)
         examples = [
             DatasetExample(
-                id=str(GlobalID("DatasetExample", str(example.id))),
+                id=str(GlobalID("DatasetExample", str(revision.dataset_example_id))),
                 input=revision.input,
                 output=revision.output,
                 metadata=revision.metadata_,
                 updated_at=revision.created_at,
             )
-            async for example, revision in await session.stream(query)
+            async for revision in await session.stream_scalars(query)
         ]
+    next_cursor = examples.pop().id if limit is not None and len(examples) > limit else None
     return ListDatasetExamplesResponseBody(
         data=ListDatasetExamplesData(
             dataset_id=str(GlobalID("Dataset", str(resolved_dataset_id))),
             version_id=str(GlobalID("DatasetVersion", str(resolved_version_id))),
             examples=examples,
-        )
+        ),
+        next_cursor=next_cursor,
     )
 
 
@@ -810,17 +918,17 @@ async def get_dataset_csv(
         ),
     ),
 ) -> Response:
+    db: DbSessionFactory = request.app.state.db.reader(get_user_id(request))
     try:
-        async with request.app.state.db() as session:
-            dataset_name, examples = await _get_db_examples(
+        async with db() as session:
+            dataset_name, stmt = await _get_db_examples(
                 session=session, id=id, version_id=version_id
             )
     except ValueError as e:
         raise HTTPException(detail=str(e), status_code=HTTP_422_UNPROCESSABLE_ENTITY)
-    content = await run_in_threadpool(_get_content_csv, examples)
     encoded_dataset_name = urllib.parse.quote(dataset_name)
-    return Response(
-        content=content,
+    return StreamingResponse(
+        content=_stream_content_csv(db, stmt),
         headers={
             "content-disposition": f"attachment; filename*=UTF-8''{encoded_dataset_name}.csv",
             "content-type": "text/csv",
@@ -852,20 +960,23 @@ async def get_dataset_jsonl_openai_ft(
             "The ID of the dataset version " "(if omitted, returns data from the latest version)"
         ),
     ),
-) -> bytes:
+) -> Response:
+    db: DbSessionFactory = request.app.state.db.reader(get_user_id(request))
     try:
-        async with request.app.state.db() as session:
-            dataset_name, examples = await _get_db_examples(
+        async with db() as session:
+            dataset_name, stmt = await _get_db_examples(
                 session=session, id=id, version_id=version_id
             )
     except ValueError as e:
         raise HTTPException(detail=str(e), status_code=HTTP_422_UNPROCESSABLE_ENTITY)
-    content = await run_in_threadpool(_get_content_jsonl_openai_ft, examples)
     encoded_dataset_name = urllib.parse.quote(dataset_name)
-    response.headers["content-disposition"] = (
-        f"attachment; filename*=UTF-8''{encoded_dataset_name}.jsonl"
+    return StreamingResponse(
+        content=_stream_content(db, stmt, _get_content_jsonl_openai_ft),
+        media_type="text/plain",
+        headers={
+            "content-disposition": f"attachment; filename*=UTF-8''{encoded_dataset_name}.jsonl"
+        },
     )
-    return content
 
 
 @router.get(
@@ -892,39 +1003,99 @@ async def get_dataset_jsonl_openai_evals(
             "The ID of the dataset version " "(if omitted, returns data from the latest version)"
         ),
     ),
-) -> bytes:
+) -> Response:
+    db: DbSessionFactory = request.app.state.db.reader(get_user_id(request))
     try:
-        async with request.app.state.db() as session:
-            dataset_name, examples = await _get_db_examples(
+        async with db() as session:
+            dataset_name, stmt = await _get_db_examples(
                 session=session, id=id, version_id=version_id
             )
     except ValueError as e:
         raise HTTPException(detail=str(e), status_code=HTTP_422_UNPROCESSABLE_ENTITY)
-    content = await run_in_threadpool(_get_content_jsonl_openai_evals, examples)
     encoded_dataset_name = urllib.parse.quote(dataset_name)
-    response.headers["content-disposition"] = (
-        f"attachment; filename*=UTF-8''{encoded_dataset_name}.jsonl"
+    return StreamingResponse(
+        content=_stream_content(db, stmt, _get_content_jsonl_openai_evals),
+        media_type="text/plain",
+        headers={
+            "content-disposition": f"attachment; filename*=UTF-8''{encoded_dataset_name}.jsonl"
+        },
     )
-    return content
-
-
-def _get_content_csv(examples: list[models.DatasetExampleRevision]) -> bytes:
-    records = [
-        {
-            "example_id": GlobalID(
-                type_name=DatasetExampleNodeType.__name__,
-                node_id=str(ex.dataset_example_id),
-            ),
-            **{f"input_{k}": v for k, v in ex.input.items()},
-            **{f"output_{k}": v for k, v in ex.output.items()},
-            **{f"metadata_{k}": v for k, v in ex.metadata_.items()},
-        }
-        for ex in examples
-    ]
-    return str(pd.DataFrame.from_records(records).to_csv(index=False)).encode()
 
 
-def _get_content_jsonl_openai_ft(examples: list[models.DatasetExampleRevision]) -> bytes:
+_EXPORT_BATCH_SIZE = 1000
+
+
+async def _stream_examples(
+    db: DbSessionFactory,
+    stmt: Select[tuple[models.DatasetExampleRevision]],
+) -> AsyncIterator[Sequence[models.DatasetExampleRevision]]:
+    """
+    Reads the examples from a server-side cursor in batches, so that only one batch is
+    held in memory at a time.
+    """
+    async with db() as session:
+        result = await session.stream_scalars(stmt.execution_options(yield_per=_EXPORT_BATCH_SIZE))
+        async for examples in result.partitions():
+            yield examples
+
+
+async def _stream_content(
+    db: DbSessionFactory,
+    stmt: Select[tuple[models.DatasetExampleRevision]],
+    get_content: Callable[[Iterable[models.DatasetExampleRevision]], bytes],
+) -> AsyncIterator[bytes]:
+    async for examples in _stream_examples(db, stmt):
+        yield await run_in_threadpool(get_content, examples)
+
+
+async def _stream_content_csv(
+    db: DbSessionFactory,
+    stmt: Select[tuple[models.DatasetExampleRevision]],
+) -> AsyncIterator[bytes]:
+    # The columns are the keys of all the examples in order of appearance, and they have to
+    # be written first, so the examples are read twice: once for the columns and once for
+    # the rows.
+    columns: dict[str, None] = {}
+    async for examples in _stream_examples(db, stmt):
+        columns.update(await run_in_threadpool(_get_columns_csv, examples))
+    yield await run_in_threadpool(_get_content_csv, (), columns)
+    async for examples in _stream_examples(db, stmt):
+        yield await run_in_threadpool(_get_content_csv, examples, columns, False)
+
+
+def _get_record_csv(ex: models.DatasetExampleRevision) -> dict[str, Any]:
+    return {
+        "example_id": GlobalID(
+            type_name=DatasetExampleNodeType.__name__,
+            node_id=str(ex.dataset_example_id),
+        ),
+        **{f"input_{k}": v for k, v in ex.input.items()},
+        **{f"output_{k}": v for k, v in ex.output.items()},
+        **{f"metadata_{k}": v for k, v in ex.metadata_.items()},
+    }
+
+
+def _get_columns_csv(examples: Iterable[models.DatasetExampleRevision]) -> dict[str, None]:
+    columns: dict[str, None] = {}
+    for ex in examples:
+        columns.update(dict.fromkeys(_get_record_csv(ex)))
+    return columns
+
+
+def _get_content_csv(
+    examples: Iterable[models.DatasetExampleRevision],
+    columns: Iterable[str],
+    header: bool = True,
+) -> bytes:
+    content = io.StringIO()
+    writer = csv.DictWriter(content, fieldnames=list(columns), lineterminator="\n")
+    if header:
+        writer.writeheader()
+    writer.writerows(map(_get_record_csv, examples))
+    return content.getvalue().encode()
+
+
+def _get_content_jsonl_openai_ft(examples: Iterable[models.DatasetExampleRevision]) -> bytes:
     records = io.BytesIO()
     for ex in examples:
         input_messages = ex.input.get("messages", [])
@@ -948,7 +1119,7 @@ def _get_content_jsonl_openai_ft(examples: list[models.DatasetExampleRevision])
     return records.read()
 
 
-def _get_content_jsonl_openai_evals(examples: list[models.DatasetExampleRevision]) -> bytes:
+def _get_content_jsonl_openai_evals(examples: Iterable[models.DatasetExampleRevision]) -> bytes:
     records = io.BytesIO()
     for ex in examples:
         records.write(
@@ -977,51 +1148,30 @@ def _get_content_jsonl_openai_evals(examples: list[models.DatasetExampleRevision
 
 async def _get_db_examples(
     *, session: Any, id: str, version_id: Optional[str]
-) -> tuple[str, list[models.DatasetExampleRevision]]:
+) -> tuple[str, Select[tuple[models.DatasetExampleRevision]]]:
     dataset_id = from_global_id_with_expected_type(GlobalID.from_id(id), DATASET_NODE_NAME)
     dataset_version_id: Optional[int] = None
     if version_id:
         dataset_version_id = from_global_id_with_expected_type(
             GlobalID.from_id(version_id), DATASET_VERSION_NODE_NAME
         )
-    latest_version = (
-        select(
-            models.DatasetExampleRevision.dataset_example_id,
-            func.max(models.DatasetExampleRevision.dataset_version_id).label("dataset_version_id"),
-        )
-        .group_by(models.DatasetExampleRevision.dataset_example_id)
-        .join(models.DatasetExample)
-        .where(models.DatasetExample.dataset_id == dataset_id)
-    )
-    if dataset_version_id is not None:
-        max_dataset_version_id = (
-            select(models.DatasetVersion.id)
-            .where(models.DatasetVersion.id == dataset_version_id)
-            .where(models.DatasetVersion.dataset_id == dataset_id)
-        ).scalar_subquery()
-        latest_version = latest_version.where(
-            models.DatasetExampleRevision.dataset_version_id <= max_dataset_version_id
-        )
-    subq = latest_version.subquery("latest_version")
-    stmt = (
-        select(models.DatasetExampleRevision)
-        .join(
-            subq,
-            onclause=and_(
-                models.DatasetExampleRevision.dataset_example_id == subq.c.dataset_example_id,
-                models.DatasetExampleRevision.dataset_version_id == subq.c.dataset_version_id,
-            ),
-        )
-        .where(models.DatasetExampleRevision.revision_kind != "DELETE")
-        .order_by(models.DatasetExampleRevision.dataset_example_id)
-    )
     dataset_name: Optional[str] = await session.scalar(
         select(models.Dataset.name).where(models.Dataset.id == dataset_id)
     )
     if not dataset_name:
         raise ValueError("Dataset does not exist.")
-    examples = [r async for r in await session.stream_scalars(stmt)]
-    return dataset_name, examples
+    if dataset_version_id is None:
+        # The examples are streamed after this session is closed, and may be read more than
+        # once, so they are pinned to the version that is the latest now.
+        dataset_version_id = await session.scalar(
+            select(func.max(models.DatasetVersion.id)).where(
+                models.DatasetVersion.dataset_id == dataset_id
+            )
+        )
+    stmt = get_dataset_example_revisions(dataset_version_id, dataset_id=dataset_id).order_by(
+        models.DatasetSnapshotRange.dataset_example_id
+    )
+    return dataset_name, stmt
 
 
 def _is_all_dict(seq: Sequence[Any]) -> bool:
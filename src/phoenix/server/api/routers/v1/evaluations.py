@@ -28,6 +28,7 @@ from phoenix.db import models
 from phoenix.db.insertion.types import Precursors
 from phoenix.exceptions import PhoenixEvaluationNameIsMissing
 from phoenix.server.api.routers.utils import table_to_bytes
+from phoenix.server.bearer_auth import get_user_id
 from phoenix.server.types import DbSessionFactory
 from phoenix.trace.span_evaluations import (
     DocumentEvaluations,
@@ -127,7 +128,7 @@ async def get_evaluations(
         or DEFAULT_PROJECT_NAME
     )
 
-    db: DbSessionFactory = request.app.state.db
+    db: DbSessionFactory = request.app.state.db.reader(get_user_id(request))
     async with db() as session:
         connection = await session.connection()
         trace_evals_dataframe = await connection.run_sync(
@@ -3,6 +3,7 @@ from typing import Any, Literal, Optional
 
 from fastapi import APIRouter, HTTPException
 from pydantic import Field
+from sqlalchemy import select
 from starlette.requests import Request
 from starlette.status import HTTP_404_NOT_FOUND
 from strawberry.relay import GlobalID
@@ -14,7 +15,7 @@ from phoenix.server.api.types.node import from_global_id_with_expected_type
 from phoenix.server.dml_event import ExperimentRunAnnotationInsertEvent
 
 from .models import V1RoutesBaseModel
-from .utils import ResponseBody, add_errors_to_responses
+from .utils import RequestBody, ResponseBody, add_errors_to_responses
 
 router = APIRouter(tags=["experiments"], include_in_schema=True)
 
@@ -113,3 +114,113 @@ async def upsert_experiment_evaluation(
     return UpsertExperimentEvaluationResponseBody(
         data=UpsertExperimentEvaluationResponseBodyData(id=str(evaluation_gid))
     )
+
+
+_MAX_EVALUATIONS_PER_STATEMENT = 1000
+
+
+class UpsertExperimentEvaluationsRequestBody(
+    RequestBody[list[UpsertExperimentEvaluationRequestBody]]
+):
+    data: list[UpsertExperimentEvaluationRequestBody] = Field(
+        description="The experiment evaluations to be upserted"
+    )
+
+
+class UpsertExperimentEvaluationsResponseBody(
+    ResponseBody[list[UpsertExperimentEvaluationResponseBodyData]]
+):
+    pass
+
+
+@router.post(
+    "/experiment_evaluations/batch",
+    operation_id="upsertExperimentEvaluations",
+    summary="Create or update evaluations for experiment runs in bulk",
+    description=(
+        "Creates or updates many evaluations of experiment runs at once. The IDs of the "
+        "evaluations are returned in the order of the evaluations in the request body."
+    ),
+    responses=add_errors_to_responses(
+        [{"status_code": HTTP_404_NOT_FOUND, "description": "Experiment run not found"}]
+    ),
+)
+async def upsert_experiment_evaluations(
+    request: Request, request_body: UpsertExperimentEvaluationsRequestBody
+) -> UpsertExperimentEvaluationsResponseBody:
+    records: list[dict[str, Any]] = []
+    for evaluation in request_body.data:
+        try:
+            experiment_run_id = from_global_id_with_expected_type(
+                GlobalID.from_id(evaluation.experiment_run_id), "ExperimentRun"
+            )
+        except ValueError:
+            raise HTTPException(
+                detail=f"ExperimentRun with ID {evaluation.experiment_run_id} does not exist",
+                status_code=HTTP_404_NOT_FOUND,
+            )
+        result = evaluation.result
+        records.append(
+            dict(
+                experiment_run_id=experiment_run_id,
+                name=evaluation.name,
+                annotator_kind=evaluation.annotator_kind,
+                label=result.label if result else None,
+                score=result.score if result else None,
+                explanation=result.explanation if result else None,
+                error=evaluation.error,
+                metadata_=evaluation.metadata or {},  # `metadata_` must match database
+                start_time=evaluation.start_time,
+                end_time=evaluation.end_time,
+                trace_id=evaluation.trace_id,
+            )
+        )
+    if not records:
+        return UpsertExperimentEvaluationsResponseBody(data=[])
+    experiment_run_ids = {record["experiment_run_id"] for record in records}
+    async with request.app.state.db() as session:
+        existing_experiment_run_ids = set(
+            await session.scalars(
+                select(models.ExperimentRun.id).where(
+                    models.ExperimentRun.id.in_(experiment_run_ids)
+                )
+            )
+        )
+        if missing_experiment_run_ids := experiment_run_ids - existing_experiment_run_ids:
+            experiment_run_gid = GlobalID("ExperimentRun", str(min(missing_experiment_run_ids)))
+            raise HTTPException(
+                detail=f"ExperimentRun with ID {experiment_run_gid} does not exist",
+                status_code=HTTP_404_NOT_FOUND,
+            )
+        dialect = SupportedSQLDialect(session.bind.dialect.name)
+        evaluation_ids: dict[tuple[int, str], int] = {}
+        for i in range(0, len(records), _MAX_EVALUATIONS_PER_STATEMENT):
+            for evaluation_id, experiment_run_id, name in await session.execute(
+                insert_on_conflict(
+                    *records[i : i + _MAX_EVALUATIONS_PER_STATEMENT],
+                    dialect=dialect,
+                    table=models.ExperimentRunAnnotation,
+                    unique_by=("experiment_run_id", "name"),
+                ).returning(
+                    models.ExperimentRunAnnotation.id,
+                    models.ExperimentRunAnnotation.experiment_run_id,
+                    models.ExperimentRunAnnotation.name,
+                )
+            ):
+                evaluation_ids[experiment_run_id, name] = evaluation_id
+    request.state.event_queue.put(
+        ExperimentRunAnnotationInsertEvent(tuple(evaluation_ids.values()))
+    )
+    return UpsertExperimentEvaluationsResponseBody(
+        data=[
+            UpsertExperimentEvaluationResponseBodyData(
+                id=str(
+                    GlobalID(
+                        "ExperimentEvaluation",
+                        str(evaluation_ids[record["experiment_run_id"], record["name"]]),
+                    )
+                )
+            )
+            for record in records
+        ]
+    )
@@ -11,12 +11,15 @@ from starlette.status import HTTP_404_NOT_FOUND, HTTP_409_CONFLICT
 from strawberry.relay import GlobalID
 
 from phoenix.db import models
+from phoenix.db.helpers import SupportedSQLDialect
+from phoenix.db.insertion.helpers import OnConflict, insert_on_conflict
 from phoenix.db.models import ExperimentRunOutput
 from phoenix.server.api.types.node import from_global_id_with_expected_type
+from phoenix.server.bearer_auth import get_user_id
 from phoenix.server.dml_event import ExperimentRunInsertEvent
 
 from .models import V1RoutesBaseModel
-from .utils import ResponseBody, add_errors_to_responses
+from .utils import RequestBody, ResponseBody, add_errors_to_responses
 
 router = APIRouter(tags=["experiments"], include_in_schema=True)
 
@@ -122,6 +125,132 @@ async def create_experiment_run(
     )
 
 
+_MAX_RUNS_PER_STATEMENT = 1000
+
+
+class CreateExperimentRunsRequestBody(RequestBody[list[ExperimentRun]]):
+    data: list[ExperimentRun] = Field(description="The experiment runs to create")
+
+
+class CreateExperimentRunsResponseBodyData(V1RoutesBaseModel):
+    id: Optional[str] = Field(
+        description=(
+            "The ID of the newly created experiment run, or null if the run for the same "
+            "dataset example and repetition has already been submitted"
+        )
+    )
+
+
+class CreateExperimentRunsResponseBody(ResponseBody[list[CreateExperimentRunsResponseBodyData]]):
+    pass
+
+
+@router.post(
+    "/experiments/{experiment_id}/runs/batch",
+    operation_id="createExperimentRuns",
+    summary="Create runs for an experiment in bulk",
+    description=(
+        "Creates many runs of an experiment at once. The IDs of the runs are returned in the "
+        "order of the runs in the request body. Runs that have already been submitted are "
+        "left as they are and have no ID in the response."
+    ),
+    response_description="Experiment runs created successfully",
+    responses=add_errors_to_responses(
+        [
+            {
+                "status_code": HTTP_404_NOT_FOUND,
+                "description": "Experiment or dataset example not found",
+            },
+        ]
+    ),
+)
+async def create_experiment_runs(
+    request: Request, experiment_id: str, request_body: CreateExperimentRunsRequestBody
+) -> CreateExperimentRunsResponseBody:
+    experiment_gid = GlobalID.from_id(experiment_id)
+    try:
+        experiment_rowid = from_global_id_with_expected_type(experiment_gid, "Experiment")
+    except ValueError:
+        raise HTTPException(
+            detail=f"Experiment with ID {experiment_gid} does not exist",
+            status_code=HTTP_404_NOT_FOUND,
+        )
+    records: list[dict[str, Any]] = []
+    for run in request_body.data:
+        try:
+            dataset_example_id = from_global_id_with_expected_type(
+                GlobalID.from_id(run.dataset_example_id), "DatasetExample"
+            )
+        except ValueError:
+            raise HTTPException(
+                detail=f"DatasetExample with ID {run.dataset_example_id} does not exist",
+                status_code=HTTP_404_NOT_FOUND,
+            )
+        records.append(
+            dict(
+                experiment_id=experiment_rowid,
+                dataset_example_id=dataset_example_id,
+                trace_id=run.trace_id,
+                output=ExperimentRunOutput(task_output=run.output),
+                repetition_number=run.repetition_number,
+                start_time=run.start_time,
+                end_time=run.end_time,
+                error=run.error,
+            )
+        )
+    if not records:
+        return CreateExperimentRunsResponseBody(data=[])
+    example_ids = {record["dataset_example_id"] for record in records}
+    async with request.app.state.db() as session:
+        if not await session.scalar(
+            select(models.Experiment.id).where(models.Experiment.id == experiment_rowid)
+        ):
+            raise HTTPException(
+                detail=f"Experiment with ID {experiment_gid} does not exist",
+                status_code=HTTP_404_NOT_FOUND,
+            )
+        existing_example_ids = set(
+            await session.scalars(
+                select(models.DatasetExample.id).where(models.DatasetExample.id.in_(example_ids))
+            )
+        )
+        if missing_example_ids := example_ids - existing_example_ids:
+            example_gid = GlobalID("DatasetExample", str(min(missing_example_ids)))
+            raise HTTPException(
+                detail=f"DatasetExample with ID {example_gid} does not exist",
+                status_code=HTTP_404_NOT_FOUND,
+            )
+        dialect = SupportedSQLDialect(session.bind.dialect.name)
+        run_ids: dict[tuple[int, int], int] = {}
+        for i in range(0, len(records), _MAX_RUNS_PER_STATEMENT):
+            for run_id, dataset_example_id, repetition_number in await session.execute(
+                insert_on_conflict(
+                    *records[i : i + _MAX_RUNS_PER_STATEMENT],
+                    dialect=dialect,
+                    table=models.ExperimentRun,
+                    unique_by=("experiment_id", "dataset_example_id", "repetition_number"),
+                    on_conflict=OnConflict.DO_NOTHING,
+                ).returning(
+                    models.ExperimentRun.id,
+                    models.ExperimentRun.dataset_example_id,
+                    models.ExperimentRun.repetition_number,
+                )
+            ):
+                run_ids[dataset_example_id, repetition_number] = run_id
+    if run_ids:
+        request.state.event_queue.put(ExperimentRunInsertEvent(tuple(run_ids.values())))
+    data = []
+    for record in records:
+        # a run repeated in the request body gets its ID only where it first appears
+        run_id = run_ids.pop((record["dataset_example_id"], record["repetition_number"]), None)
+        data.append(
+            CreateExperimentRunsResponseBodyData(
+                id=None if run_id is None else str(GlobalID("ExperimentRun", str(run_id)))
+            )
+        )
+    return CreateExperimentRunsResponseBody(data=data)
+
+
 class ExperimentRunResponse(ExperimentRun):
     id: str = Field(description="The ID of the experiment run")
     experiment_id: str = Field(description="The ID of the experiment")
@@ -152,7 +281,7 @@ async def list_experiment_runs(
             status_code=HTTP_404_NOT_FOUND,
         )
 
-    async with request.app.state.db() as session:
+    async with request.app.state.db.read(get_user_id(request)) as session:
         experiment_runs = await session.execute(
             select(models.ExperimentRun)
             .where(models.ExperimentRun.experiment_id == experiment_rowid)
@@ -6,7 +6,7 @@ from typing import Any, Optional
 import pandas as pd
 from fastapi import APIRouter, HTTPException, Path, Response
 from pydantic import Field
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 from starlette.requests import Request
@@ -15,9 +15,10 @@ from starlette.status import HTTP_200_OK, HTTP_404_NOT_FOUND, HTTP_422_UNPROCESS
 from strawberry.relay import GlobalID
 
 from phoenix.db import models
-from phoenix.db.helpers import SupportedSQLDialect
+from phoenix.db.helpers import SupportedSQLDialect, in_dataset_snapshot
 from phoenix.db.insertion.helpers import insert_on_conflict
 from phoenix.server.api.types.node import from_global_id_with_expected_type
+from phoenix.server.bearer_auth import get_user_id
 from phoenix.server.dml_event import ExperimentInsertEvent
 
 from .models import V1RoutesBaseModel
@@ -232,7 +233,7 @@ async def get_experiment(request: Request, experiment_id: str) -> GetExperimentR
             status_code=HTTP_404_NOT_FOUND,
         )
 
-    async with request.app.state.db() as session:
+    async with request.app.state.db.read(get_user_id(request)) as session:
         experiment = await session.execute(
             select(models.Experiment).where(models.Experiment.id == experiment_rowid)
         )
@@ -281,7 +282,7 @@ async def list_experiments(
             detail=f"Dataset with ID {dataset_gid} does not exist",
             status_code=HTTP_404_NOT_FOUND,
         )
-    async with request.app.state.db() as session:
+    async with request.app.state.db.read(get_user_id(request)) as session:
         query = (
             select(models.Experiment)
             .where(models.Experiment.dataset_id == dataset_rowid)
@@ -319,37 +320,25 @@ async def _get_experiment_runs_and_revisions(
     experiment = await session.get(models.Experiment, experiment_rowid)
     if not experiment:
         raise HTTPException(detail="Experiment not found", status_code=HTTP_404_NOT_FOUND)
-    revision_ids = (
-        select(func.max(models.DatasetExampleRevision.id))
-        .join(
-            models.DatasetExample,
-            models.DatasetExample.id == models.DatasetExampleRevision.dataset_example_id,
-        )
-        .where(
-            and_(
-                models.DatasetExampleRevision.dataset_version_id <= experiment.dataset_version_id,
-                models.DatasetExample.dataset_id == experiment.dataset_id,
-            )
-        )
-        .group_by(models.DatasetExampleRevision.dataset_example_id)
-        .scalar_subquery()
-    )
     runs_and_revisions = (
         (
             await session.execute(
                 select(models.ExperimentRun, models.DatasetExampleRevision)
+                .select_from(models.ExperimentRun)
                 .join(
-                    models.DatasetExample,
-                    models.DatasetExample.id == models.ExperimentRun.dataset_example_id,
+                    models.DatasetSnapshotRange,
+                    and_(
+                        models.DatasetSnapshotRange.dataset_example_id
+                        == models.ExperimentRun.dataset_example_id,
+                        in_dataset_snapshot(
+                            experiment.dataset_version_id, dataset_id=experiment.dataset_id
+                        ),
+                    ),
                 )
                 .join(
                     models.DatasetExampleRevision,
-                    and_(
-                        models.DatasetExample.id
-                        == models.DatasetExampleRevision.dataset_example_id,
-                        models.DatasetExampleRevision.id.in_(revision_ids),
-                        models.DatasetExampleRevision.revision_kind != "DELETE",
-                    ),
+                    models.DatasetExampleRevision.id
+                    == models.DatasetSnapshotRange.dataset_example_revision_id,
                 )
                 .options(
                     joinedload(models.ExperimentRun.annotations),
@@ -397,7 +386,7 @@ async def get_experiment_json(
             status_code=HTTP_422_UNPROCESSABLE_ENTITY,
         )
 
-    async with request.app.state.db() as session:
+    async with request.app.state.db.read(get_user_id(request)) as session:
         experiment, runs, revisions = await _get_experiment_runs_and_revisions(
             session, experiment_rowid
         )
@@ -464,7 +453,7 @@ async def get_experiment_csv(
             status_code=HTTP_422_UNPROCESSABLE_ENTITY,
         )
 
-    async with request.app.state.db() as session:
+    async with request.app.state.db.read(get_user_id(request)) as session:
         experiment, runs, revisions = await _get_experiment_runs_and_revisions(
             session, experiment_rowid
         )
@@ -24,6 +24,8 @@ from phoenix.server.api.routers.v1.utils import (
     add_errors_to_responses,
 )
 from phoenix.server.api.types.Project import Project as ProjectNodeType
+from phoenix.server.bearer_auth import get_user_id
+from phoenix.server.dml_event import ProjectDeleteEvent
 
 router = APIRouter(tags=["projects"])
 
@@ -106,7 +108,7 @@ async def get_projects(
     stmt = select(models.Project).order_by(models.Project.id.desc())
     if not include_experiment_projects:
         stmt = exclude_experiment_projects(stmt)
-    async with request.app.state.db() as session:
+    async with request.app.state.db.read(get_user_id(request)) as session:
         if cursor:
             try:
                 cursor_id = GlobalID.from_id(cursor).node_id
@@ -166,7 +168,7 @@ async def get_project(
     Raises:
         HTTPException: If the project identifier format is invalid or the project is not found.
     """  # noqa: E501
-    async with request.app.state.db() as session:
+    async with request.app.state.db.read(get_user_id(request)) as session:
         project = await _get_project_by_identifier(session, project_identifier)
     data = _to_project_response(project)
     return GetProjectResponseBody(data=data)
@@ -333,6 +335,7 @@ async def delete_project(
             )
 
         await session.delete(project)
+    request.state.event_queue.put(ProjectDeleteEvent((project.id,)))
     return None
 
 
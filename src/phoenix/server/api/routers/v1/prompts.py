@@ -33,7 +33,7 @@ from phoenix.server.api.types.node import from_global_id_with_expected_type
 from phoenix.server.api.types.Prompt import Prompt as PromptNodeType
 from phoenix.server.api.types.PromptVersion import PromptVersion as PromptVersionNodeType
 from phoenix.server.api.types.PromptVersionTag import PromptVersionTag as PromptVersionTagNodeType
-from phoenix.server.bearer_auth import PhoenixUser
+from phoenix.server.bearer_auth import PhoenixUser, get_user_id
 
 logger = logging.getLogger(__name__)
 
@@ -137,7 +137,7 @@ async def get_prompts(
     Raises:
         HTTPException: If the cursor format is invalid.
     """
-    async with request.app.state.db() as session:
+    async with request.app.state.db.read(get_user_id(request)) as session:
         # First check if any prompts exist
         if not cursor:
             prompt_exists = await session.scalar(select(models.Prompt.id).limit(1))
@@ -217,7 +217,7 @@ async def list_prompt_versions(
     query = _filter_by_prompt_identifier(query.join(models.Prompt), prompt_identifier)
     query = query.order_by(models.PromptVersion.id.desc())
 
-    async with request.app.state.db() as session:
+    async with request.app.state.db.read(get_user_id(request)) as session:
         if cursor:
             try:
                 cursor_id = GlobalID.from_id(cursor).node_id
@@ -286,7 +286,7 @@ async def get_prompt_version_by_prompt_version_id(
         )
     except ValueError:
         raise HTTPException(HTTP_422_UNPROCESSABLE_ENTITY, "Invalid prompt version ID")
-    async with request.app.state.db() as session:
+    async with request.app.state.db.read(get_user_id(request)) as session:
         prompt_version = await session.get(models.PromptVersion, id_)
         if prompt_version is None:
             raise HTTPException(HTTP_404_NOT_FOUND)
@@ -340,7 +340,7 @@ async def get_prompt_version_by_tag_name(
         .where(models.PromptVersionTag.name == name)
     )
     stmt = _filter_by_prompt_identifier(stmt.join(models.Prompt), prompt_identifier)
-    async with request.app.state.db() as session:
+    async with request.app.state.db.read(get_user_id(request)) as session:
         prompt_version: models.PromptVersion = await session.scalar(stmt)
         if prompt_version is None:
             raise HTTPException(HTTP_404_NOT_FOUND)
@@ -383,7 +383,7 @@ async def get_prompt_version_by_latest(
     """
     stmt = select(models.PromptVersion).order_by(models.PromptVersion.id.desc()).limit(1)
     stmt = _filter_by_prompt_identifier(stmt.join(models.Prompt), prompt_identifier)
-    async with request.app.state.db() as session:
+    async with request.app.state.db.read(get_user_id(request)) as session:
         prompt_version: models.PromptVersion = await session.scalar(stmt)
         if prompt_version is None:
             raise HTTPException(HTTP_404_NOT_FOUND)
@@ -564,7 +564,7 @@ async def list_prompt_version_tags(
     # Apply limit
     stmt = stmt.limit(limit + 1)
 
-    async with request.app.state.db() as session:
+    async with request.app.state.db.read(get_user_id(request)) as session:
         result = (await session.execute(stmt)).all()
 
     # Check if prompt version exists
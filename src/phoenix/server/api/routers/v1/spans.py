@@ -22,8 +22,9 @@ from phoenix.db.helpers import SupportedSQLDialect
 from phoenix.db.insertion.helpers import as_kv, insert_on_conflict
 from phoenix.db.insertion.types import Precursors
 from phoenix.server.api.routers.utils import df_to_bytes
-from phoenix.server.bearer_auth import PhoenixUser
+from phoenix.server.bearer_auth import PhoenixUser, get_user_id
 from phoenix.server.dml_event import SpanAnnotationInsertEvent
+from phoenix.server.types import DbSessionFactory
 from phoenix.trace.attributes import flatten
 from phoenix.trace.dsl import SpanQuery as SpanQuery_
 from phoenix.utilities.json import encode_df_as_json_string
@@ -38,6 +39,7 @@ from .utils import (
 )
 
 DEFAULT_SPAN_LIMIT = 1000
+QUERY_INDEX_METADATA_KEY = b"phoenix.query_index"
 
 router = APIRouter(tags=["spans"])
 
@@ -58,6 +60,16 @@ class QuerySpansRequestBody(V1RoutesBaseModel):
     limit: int = DEFAULT_SPAN_LIMIT
     root_spans_only: Optional[bool] = None
     orphan_span_as_root_span: bool = True
+    chunk_size: Optional[int] = Field(
+        default=None,
+        gt=0,
+        description=(
+            "If provided, the results of each query are read with a server-side cursor and "
+            "streamed as a sequence of Arrow IPC streams of up to this many rows each, whose "
+            f"schema metadata holds the index of the query under {QUERY_INDEX_METADATA_KEY!r}. "
+            "Does not apply to JSON responses."
+        ),
+    )
     project_name: Optional[str] = Field(
         default=None,
         description=(
@@ -410,7 +422,24 @@ async def query_spans_handler(
             detail=f"Invalid query: {e}",
             status_code=HTTP_422_UNPROCESSABLE_ENTITY,
         )
-    async with request.app.state.db() as session:
+    if request_body.chunk_size and accept != "application/json":
+        if not span_queries:
+            raise HTTPException(status_code=HTTP_404_NOT_FOUND)
+        return StreamingResponse(
+            content=_arrow_chunks(
+                request.app.state.db.reader(get_user_id(request)),
+                span_queries,
+                chunk_size=request_body.chunk_size,
+                project_name=project_name,
+                start_time=normalize_datetime(request_body.start_time, timezone.utc),
+                end_time=normalize_datetime(end_time, timezone.utc),
+                limit=request_body.limit,
+                root_spans_only=request_body.root_spans_only,
+                orphan_span_as_root_span=request_body.orphan_span_as_root_span,
+            ),
+            media_type="application/x-pandas-arrow",
+        )
+    async with request.app.state.db.read(get_user_id(request)) as session:
         results = []
         for query in span_queries:
             results.append(
@@ -450,6 +479,29 @@ async def query_spans_handler(
     )
 
 
+async def _arrow_chunks(
+    db: DbSessionFactory,
+    span_queries: list[SpanQuery_],
+    *,
+    chunk_size: int,
+    **kwargs: Any,
+) -> AsyncIterator[bytes]:
+    """
+    Yields the results of the queries as Arrow IPC streams of up to `chunk_size` rows each.
+    Each chunk is a stream of its own because the attribute columns, and hence the schema,
+    can differ from chunk to chunk.
+    """
+    loop = get_running_loop()
+    async with db() as session:
+        for i, query in enumerate(span_queries):
+            metadata = {QUERY_INDEX_METADATA_KEY: str(i).encode()}
+            chunks = query.iter_dataframes(session.sync_session, chunk_size=chunk_size, **kwargs)
+            # Each chunk is fetched in a `run_sync` call of its own, so that the cursor is
+            # only advanced as fast as the response is consumed.
+            while (df := await session.run_sync(lambda _: next(chunks, None))) is not None:
+                yield await loop.run_in_executor(None, df_to_bytes, df, metadata)
+
+
 async def _json_multipart(
     results: list[pd.DataFrame],
     boundary_token: str,
@@ -544,7 +596,7 @@ async def span_search(
 ) -> SpanSearchResponseBody:
     """Search spans with minimal filters instead of the old SpanQuery DSL."""
 
-    async with request.app.state.db() as session:
+    async with request.app.state.db.read(get_user_id(request)) as session:
         project = await _get_project_by_identifier(session, project_identifier)
 
     project_id: int = project.id
@@ -587,7 +639,7 @@ async def span_search(
 
     stmt = stmt.limit(limit + 1)
 
-    async with request.app.state.db() as session:
+    async with request.app.state.db.read(get_user_id(request)) as session:
         rows: list[tuple[models.Span, str]] = [r async for r in await session.stream(stmt)]
 
     if not rows:
@@ -1,5 +1,6 @@
 import gzip
 import zlib
+from asyncio import QueueFull
 from typing import Any, Literal, Optional
 
 from fastapi import APIRouter, BackgroundTasks, Header, HTTPException, Query
@@ -19,16 +20,17 @@ from starlette.status import (
     HTTP_404_NOT_FOUND,
     HTTP_415_UNSUPPORTED_MEDIA_TYPE,
     HTTP_422_UNPROCESSABLE_ENTITY,
+    HTTP_503_SERVICE_UNAVAILABLE,
 )
 from strawberry.relay import GlobalID
 
 from phoenix.db import models
+from phoenix.db.insertion.constants import DEFAULT_SPAN_BUFFER_RETRY_AFTER_SEC
 from phoenix.db.insertion.helpers import as_kv
 from phoenix.db.insertion.types import Precursors
 from phoenix.server.bearer_auth import PhoenixUser
 from phoenix.server.dml_event import TraceAnnotationInsertEvent
-from phoenix.trace.otel import decode_otlp_span
-from phoenix.utilities.project import get_project_name
+from phoenix.server.span_decoder import count_otlp_spans
 
 from .models import V1RoutesBaseModel
 from .utils import RequestBody, ResponseBody, add_errors_to_responses
@@ -49,6 +51,7 @@ router = APIRouter(tags=["traces"])
                 ),
             },
             {"status_code": HTTP_422_UNPROCESSABLE_ENTITY, "description": "Invalid request body"},
+            {"status_code": HTTP_503_SERVICE_UNAVAILABLE, "description": "Span buffer is full"},
         ]
     ),
     openapi_extra={
@@ -90,7 +93,20 @@ async def post_traces(
             detail="Request body is invalid ExportTraceServiceRequest",
             status_code=HTTP_422_UNPROCESSABLE_ENTITY,
         )
-    background_tasks.add_task(_add_spans, req, request.state)
+    span_spool = request.state.span_spool
+    try:
+        if span_spool is not None:
+            await span_spool.append(body)
+        else:
+            request.state.check_span_capacity(count_otlp_spans(req), len(body))
+    except QueueFull:
+        raise HTTPException(
+            detail="Span buffer is full" if span_spool is None else "Span spool is full",
+            status_code=HTTP_503_SERVICE_UNAVAILABLE,
+            headers={"Retry-After": str(DEFAULT_SPAN_BUFFER_RETRY_AFTER_SEC)},
+        )
+    if span_spool is None:
+        background_tasks.add_task(_add_spans, req, len(body), request.state)
     return JSONResponse(MessageToJson(ExportTraceServiceResponse()))
 
 
@@ -208,10 +224,5 @@ async def annotate_traces(
     )
 
 
-async def _add_spans(req: ExportTraceServiceRequest, state: State) -> None:
-    for resource_spans in req.resource_spans:
-        project_name = get_project_name(resource_spans.resource.attributes)
-        for scope_span in resource_spans.scope_spans:
-            for otlp_span in scope_span.spans:
-                span = await run_in_threadpool(decode_otlp_span, otlp_span)
-                await state.queue_span_for_bulk_insert(span, project_name)
+async def _add_spans(req: ExportTraceServiceRequest, num_bytes: int, state: State) -> None:
+    await state.queue_spans_for_bulk_insert(await state.span_decoder.decode(req), num_bytes)
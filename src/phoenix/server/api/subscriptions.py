@@ -17,7 +17,7 @@ from typing import (
 import strawberry
 from openinference.instrumentation import safe_json_dumps
 from openinference.semconv.trace import SpanAttributes
-from sqlalchemy import and_, func, insert, select
+from sqlalchemy import and_, insert, select
 from sqlalchemy.orm import load_only
 from strawberry.relay.types import GlobalID
 from strawberry.types import Info
@@ -25,7 +25,9 @@ from typing_extensions import TypeAlias, assert_never
 
 from phoenix.config import PLAYGROUND_PROJECT_NAME
 from phoenix.datetime_utils import local_now, normalize_datetime
-from phoenix.db import models
+from phoenix.db import models, span_tree
+from phoenix.db.helpers import get_dataset_example_revisions
+from phoenix.db.rollups import add_single_span_traces
 from phoenix.server.api.auth import IsLocked, IsNotReadOnly
 from phoenix.server.api.context import Context
 from phoenix.server.api.exceptions import BadRequest, CustomGraphQLError, NotFound
@@ -164,6 +166,19 @@ class Subscription:
             db_span = get_db_span(span, db_trace)
             session.add(db_span)
             await session.flush()
+            await add_single_span_traces(session, [db_span])
+            await span_tree.add_spans(
+                session,
+                [
+                    (
+                        db_span.id,
+                        db_span.span_id,
+                        db_span.parent_id,
+                        db_trace.project_rowid,
+                        db_span.start_time,
+                    )
+                ],
+            )
         info.context.event_queue.put(SpanInsertEvent(ids=(playground_project_id,)))
         yield ChatCompletionSubscriptionResult(span=Span(span_rowid=db_span.id, db_span=db_span))
 
@@ -223,29 +238,12 @@ class Subscription:
                     )
                 ) is None:
                     raise NotFound(f"Could not find dataset version with ID {version_id}")
-            revision_ids = (
-                select(func.max(models.DatasetExampleRevision.id))
-                .join(models.DatasetExample)
-                .where(
-                    and_(
-                        models.DatasetExample.dataset_id == dataset_id,
-                        models.DatasetExampleRevision.dataset_version_id <= resolved_version_id,
-                    )
-                )
-                .group_by(models.DatasetExampleRevision.dataset_example_id)
-            )
             if not (
                 revisions := [
                     rev
                     async for rev in await session.stream_scalars(
-                        select(models.DatasetExampleRevision)
-                        .where(
-                            and_(
-                                models.DatasetExampleRevision.id.in_(revision_ids),
-                                models.DatasetExampleRevision.revision_kind != "DELETE",
-                            )
-                        )
-                        .order_by(models.DatasetExampleRevision.dataset_example_id.asc())
+                        get_dataset_example_revisions(resolved_version_id, dataset_id=dataset_id)
+                        .order_by(models.DatasetSnapshotRange.dataset_example_id.asc())
                         .options(
                             load_only(
                                 models.DatasetExampleRevision.dataset_example_id,
@@ -455,6 +453,15 @@ async def _chat_completion_result_payloads(
                 session.add(span)
             session.add(run)
         await session.flush()
+        spans = [span for _, span, _ in results if span]
+        await add_single_span_traces(session, spans)
+        await span_tree.add_spans(
+            session,
+            [
+                (span.id, span.span_id, span.parent_id, span.trace.project_rowid, span.start_time)
+                for span in spans
+            ],
+        )
     for example_id, span, run in results:
         yield ChatCompletionSubscriptionResult(
             span=Span(span_rowid=span.id, db_span=span) if span else None,
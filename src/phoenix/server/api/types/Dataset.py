@@ -3,7 +3,8 @@ from datetime import datetime
 from typing import ClassVar, Optional, cast
 
 import strawberry
-from sqlalchemy import and_, func, select
+from aioitertools.itertools import islice
+from sqlalchemy import func, select
 from sqlalchemy.sql.functions import count
 from strawberry import UNSET
 from strawberry.relay import Connection, GlobalID, Node, NodeID
@@ -11,6 +12,7 @@ from strawberry.scalars import JSON
 from strawberry.types import Info
 
 from phoenix.db import models
+from phoenix.db.helpers import in_dataset_snapshot
 from phoenix.server.api.context import Context
 from phoenix.server.api.input_types.DatasetVersionSort import DatasetVersionSort
 from phoenix.server.api.types.DatasetExample import DatasetExample
@@ -20,7 +22,9 @@ from phoenix.server.api.types.ExperimentAnnotationSummary import ExperimentAnnot
 from phoenix.server.api.types.node import from_global_id_with_expected_type
 from phoenix.server.api.types.pagination import (
     ConnectionArgs,
+    Cursor,
     CursorString,
+    connection_from_cursors_and_nodes,
     connection_from_list,
 )
 from phoenix.server.api.types.SortDir import SortDir
@@ -93,26 +97,8 @@ class Dataset(Node):
             if dataset_version_id
             else None
         )
-        revision_ids = (
-            select(func.max(models.DatasetExampleRevision.id))
-            .join(models.DatasetExample)
-            .where(models.DatasetExample.dataset_id == dataset_id)
-            .group_by(models.DatasetExampleRevision.dataset_example_id)
-        )
-        if version_id:
-            version_id_subquery = (
-                select(models.DatasetVersion.id)
-                .where(models.DatasetVersion.dataset_id == dataset_id)
-                .where(models.DatasetVersion.id == version_id)
-                .scalar_subquery()
-            )
-            revision_ids = revision_ids.where(
-                models.DatasetExampleRevision.dataset_version_id <= version_id_subquery
-            )
-        stmt = (
-            select(count(models.DatasetExampleRevision.id))
-            .where(models.DatasetExampleRevision.id.in_(revision_ids))
-            .where(models.DatasetExampleRevision.revision_kind != "DELETE")
+        stmt = select(count(models.DatasetSnapshotRange.id)).where(
+            in_dataset_snapshot(version_id, dataset_id=dataset_id)
         )
         async with info.context.db() as session:
             return (await session.scalar(stmt)) or 0
@@ -127,12 +113,6 @@ class Dataset(Node):
         after: Optional[CursorString] = UNSET,
         before: Optional[CursorString] = UNSET,
     ) -> Connection[DatasetExample]:
-        args = ConnectionArgs(
-            first=first,
-            after=after if isinstance(after, CursorString) else None,
-            last=last,
-            before=before if isinstance(before, CursorString) else None,
-        )
         dataset_id = self.id_attr
         version_id = (
             from_global_id_with_expected_type(
@@ -141,47 +121,61 @@ class Dataset(Node):
             if dataset_version_id
             else None
         )
-        revision_ids = (
-            select(func.max(models.DatasetExampleRevision.id))
-            .join(models.DatasetExample)
-            .where(models.DatasetExample.dataset_id == dataset_id)
-            .group_by(models.DatasetExampleRevision.dataset_example_id)
-        )
-        if version_id:
-            version_id_subquery = (
-                select(models.DatasetVersion.id)
-                .where(models.DatasetVersion.dataset_id == dataset_id)
-                .where(models.DatasetVersion.id == version_id)
-                .scalar_subquery()
-            )
-            revision_ids = revision_ids.where(
-                models.DatasetExampleRevision.dataset_version_id <= version_id_subquery
-            )
-        query = (
+        # Examples are paginated by their IDs, from the index of the snapshot ranges, newest
+        # first. A backward page (`last`) is read in ascending order and then reversed.
+        snapshot = models.DatasetSnapshotRange
+        stmt = (
             select(models.DatasetExample)
-            .join(
-                models.DatasetExampleRevision,
-                onclause=models.DatasetExample.id
-                == models.DatasetExampleRevision.dataset_example_id,
+            .join(snapshot, snapshot.dataset_example_id == models.DatasetExample.id)
+            .where(in_dataset_snapshot(version_id, dataset_id=dataset_id))
+        )
+        if after:
+            stmt = stmt.where(snapshot.dataset_example_id < Cursor.from_string(after).rowid)
+        if before:
+            stmt = stmt.where(snapshot.dataset_example_id > Cursor.from_string(before).rowid)
+        backward = bool(last)
+        limit = last if backward else first
+        if backward:
+            stmt = stmt.order_by(snapshot.dataset_example_id.asc())
+        else:
+            stmt = stmt.order_by(snapshot.dataset_example_id.desc())
+        if limit:
+            stmt = stmt.limit(
+                limit + 1  # over-fetch by one to determine whether there's another page
             )
-            .where(
-                and_(
-                    models.DatasetExampleRevision.id.in_(revision_ids),
-                    models.DatasetExampleRevision.revision_kind != "DELETE",
+        cursors_and_nodes = []
+        async with info.context.db() as session:
+            records = await session.stream_scalars(stmt)
+            async for example in islice(records, limit):
+                cursors_and_nodes.append(
+                    (
+                        Cursor(rowid=example.id),
+                        DatasetExample(
+                            id_attr=example.id,
+                            version_id=version_id,
+                            created_at=example.created_at,
+                        ),
+                    )
                 )
+            has_more = True
+            try:
+                await records.__anext__()
+            except StopAsyncIteration:
+                has_more = False
+        if backward:
+            cursors_and_nodes.reverse()
+            # the `before` cursor itself is on the next page
+            return connection_from_cursors_and_nodes(
+                cursors_and_nodes,
+                has_previous_page=has_more,
+                has_next_page=bool(before),
             )
-            .order_by(models.DatasetExampleRevision.dataset_example_id.desc())
+        # the `after` cursor itself is on the previous page
+        return connection_from_cursors_and_nodes(
+            cursors_and_nodes,
+            has_previous_page=bool(after),
+            has_next_page=has_more,
         )
-        async with info.context.db() as session:
-            dataset_examples = [
-                DatasetExample(
-                    id_attr=example.id,
-                    version_id=version_id,
-                    created_at=example.created_at,
-                )
-                async for example in await session.stream_scalars(query)
-            ]
-        return connection_from_list(data=dataset_examples, args=args)
 
     @strawberry.field(
         description="Number of experiments for a specific version if version is specified, "
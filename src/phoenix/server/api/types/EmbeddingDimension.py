@@ -1,7 +1,7 @@
 from collections import defaultdict
 from collections.abc import Iterable, Iterator
 from datetime import timedelta
-from itertools import chain, repeat
+from itertools import chain, islice, repeat
 from typing import Any, Optional, Union, cast
 
 import numpy as np
@@ -27,9 +27,9 @@ from phoenix.core.model_schema import (
     REFERENCE,
     Inferences,
 )
+from phoenix.inferences.vectors import VectorArray
 from phoenix.metrics.timeseries import row_interval_from_sorted_time_index
 from phoenix.pointcloud.clustering import Hdbscan
-from phoenix.pointcloud.pointcloud import PointCloud
 from phoenix.pointcloud.projectors import Umap
 from phoenix.server.api.context import Context
 from phoenix.server.api.input_types.TimeRange import TimeRange
@@ -67,6 +67,8 @@ EVAL_INTERVAL_LENGTH = timedelta(hours=1)
 
 CORPUS = "CORPUS"
 
+_SAMPLING_SEED = 0
+
 
 @strawberry.type
 class EmbeddingDimension(Node):
@@ -330,23 +332,18 @@ class EmbeddingDimension(Node):
                     time_start=resolved_time_range.start,
                     time_stop=resolved_time_range.stop,
                 )
-            vector_column = self.dimension[inferences_id]
-            samples_collected = 0
-            for row_id in _row_indices(
-                row_id_start,
-                row_id_stop,
-                shuffle=0 < n_samples < (row_id_stop - row_id_start),
+            for row_id, embedding_vector in _sample_vectors(
+                self.dimension[inferences_id],
+                _row_indices(
+                    row_id_start,
+                    row_id_stop,
+                    num_rows=len(inferences),
+                    shuffle=0 < n_samples < (row_id_stop - row_id_start),
+                ),
+                n_samples,
             ):
-                if samples_collected >= n_samples:
-                    break
-                embedding_vector = vector_column.iloc[row_id]
-                # Exclude scalar values, e.g. None/NaN, by checking the presence
-                # of dunder method __len__.
-                if not hasattr(embedding_vector, "__len__"):
-                    continue
                 event_id = create_event_id(row_id, inferences_id)
                 data[event_id] = embedding_vector
-                samples_collected += 1
                 if isinstance(
                     self.dimension,
                     ms.RetrievalEmbeddingDimension,
@@ -411,14 +408,17 @@ class EmbeddingDimension(Node):
         if not 2 <= n_components <= 3:
             raise Exception(f"n_components must be 2 or 3, got {n_components}")
 
-        vectors, clustered_events = PointCloud(
-            dimensionalityReducer=Umap(n_neighbors=n_neighbors, min_dist=min_dist),
-            clustersFinder=Hdbscan(
+        vectors, clustered_events = info.context.point_clouds.generate(
+            self.dimension.name,
+            data,
+            Umap(n_neighbors=n_neighbors, min_dist=min_dist),
+            Hdbscan(
                 min_cluster_size=min_cluster_size,
                 min_samples=cluster_min_samples,
                 cluster_selection_epsilon=cluster_selection_epsilon,
             ),
-        ).generate(data, n_components=n_components)
+            n_components=n_components,
+        )
 
         points: dict[Union[InferencesRole, AncillaryInferencesRole], list[UMAPPoint]] = defaultdict(
             list
@@ -475,14 +475,44 @@ def _row_indices(
     start: int,
     stop: int,
     /,
+    num_rows: int,
     shuffle: bool = False,
 ) -> Iterator[int]:
     if not shuffle:
         yield from range(start, stop)
         return
-    shuffled_indices = np.arange(start, stop)
-    np.random.shuffle(shuffled_indices)
-    yield from shuffled_indices  # type: ignore[misc,unused-ignore]
+    # The rows are shuffled in the same order for any range, i.e. the order of a
+    # fixed permutation of all `num_rows` rows, so that a range is sampled the
+    # same way every time and overlapping ranges share most of their samples,
+    # which lets their UMAP projections be reused.
+    permutation = np.random.default_rng(_SAMPLING_SEED).permutation(num_rows)
+    yield from permutation[(start <= permutation) & (permutation < stop)].tolist()
+
+
+def _sample_vectors(
+    vector_column: "pd.Series[Any]",
+    row_ids: Iterator[int],
+    n_samples: int,
+) -> Iterator[tuple[int, npt.NDArray[Any]]]:
+    """
+    Takes the vectors of the first `n_samples` rows that have one. The
+    vectors of a `VectorArray` are gathered from its matrix all at once.
+    """
+    if isinstance(array := vector_column.array, VectorArray):
+        sampled_row_ids = list(islice(filter(array.mask.__getitem__, row_ids), max(n_samples, 0)))
+        yield from zip(sampled_row_ids, array.matrix[sampled_row_ids])
+        return
+    samples_collected = 0
+    for row_id in row_ids:
+        if samples_collected >= n_samples:
+            break
+        embedding_vector = vector_column.iloc[row_id]
+        # Exclude scalar values, e.g. None/NaN, by checking the presence
+        # of dunder method __len__.
+        if not hasattr(embedding_vector, "__len__"):
+            continue
+        yield row_id, embedding_vector
+        samples_collected += 1
 
 
 def to_gql_embedding_dimension(
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Any, ClassVar, Optional, Union
+from typing import Any, ClassVar, Union
 
 import strawberry
 from openinference.semconv.trace import OpenInferenceLLMProviderValues, SpanAttributes
@@ -89,13 +89,25 @@ class GenerativeProvider:
         cls,
         attributes: dict[str, Any],
     ) -> Union[GenerativeProviderKey, None]:
-        llm_provider: Optional[str] = get_attribute_value(attributes, SpanAttributes.LLM_PROVIDER)
+        return cls.get_model_provider(
+            llm_provider=get_attribute_value(attributes, SpanAttributes.LLM_PROVIDER),
+            llm_model=get_attribute_value(attributes, SpanAttributes.LLM_MODEL_NAME),
+        )
 
+    @classmethod
+    def get_model_provider(
+        cls,
+        llm_provider: Any,
+        llm_model: Any,
+    ) -> Union[GenerativeProviderKey, None]:
+        """
+        Same as `get_model_provider_from_attributes`, given the `llm.provider` and
+        `llm.model_name` attributes.
+        """
         if isinstance(llm_provider, str) and (
             provider := cls.attribute_provider_to_generative_provider_map.get(llm_provider)
         ):
             return provider
-        llm_model = get_attribute_value(attributes, SpanAttributes.LLM_MODEL_NAME)
         if isinstance(llm_model, str):
             return cls._infer_model_provider_from_model_name(llm_model)
         return None
@@ -1,13 +1,12 @@
 from __future__ import annotations
 
 import operator
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import TYPE_CHECKING, Annotated, Any, ClassVar, Optional
 
 import strawberry
 from aioitertools.itertools import islice
-from openinference.semconv.trace import SpanAttributes
-from sqlalchemy import desc, distinct, func, or_, select
+from sqlalchemy import Select, desc, distinct, func, or_, select
 from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.sql.elements import ColumnElement
 from sqlalchemy.sql.expression import tuple_
@@ -19,12 +18,13 @@ from typing_extensions import assert_never
 from phoenix.datetime_utils import right_open_time_range
 from phoenix.db import models
 from phoenix.db.helpers import SupportedSQLDialect
+from phoenix.db.rollups import ceil_hour, hour_of
 from phoenix.server.api.context import Context
 from phoenix.server.api.input_types.ProjectSessionSort import (
     ProjectSessionColumn,
     ProjectSessionSort,
 )
-from phoenix.server.api.input_types.SpanSort import SpanSort, SpanSortConfig
+from phoenix.server.api.input_types.SpanSort import SpanColumn, SpanSort, SpanSortConfig
 from phoenix.server.api.input_types.TimeRange import TimeRange
 from phoenix.server.api.types.AnnotationConfig import AnnotationConfig, to_gql_annotation_config
 from phoenix.server.api.types.AnnotationSummary import AnnotationSummary
@@ -60,6 +60,14 @@ class Project(Node):
         if self.db_project and self.project_rowid != self.db_project.id:
             raise ValueError("Project ID mismatch")
 
+    def _read_updates(self, info: Info[Context, None]) -> None:
+        # The UI refetches a project when `streaming_last_updated_at` changes, i.e. as soon
+        # as new spans are committed to the primary, so the reads of a project that was just
+        # updated go to the primary until the read replica can be expected to have them.
+        info.context.db.read_updates_since(
+            info.context.last_updated_at.get(self._table, self.project_rowid)
+        )
+
     @strawberry.field
     async def name(
         self,
@@ -104,6 +112,7 @@ class Project(Node):
         self,
         info: Info[Context, None],
     ) -> Optional[datetime]:
+        self._read_updates(info)
         start_time = await info.context.data_loaders.min_start_or_max_end_times.load(
             (self.project_rowid, "start"),
         )
@@ -115,6 +124,7 @@ class Project(Node):
         self,
         info: Info[Context, None],
     ) -> Optional[datetime]:
+        self._read_updates(info)
         end_time = await info.context.data_loaders.min_start_or_max_end_times.load(
             (self.project_rowid, "end"),
         )
@@ -128,6 +138,7 @@ class Project(Node):
         time_range: Optional[TimeRange] = UNSET,
         filter_condition: Optional[str] = UNSET,
     ) -> int:
+        self._read_updates(info)
         return await info.context.data_loaders.record_counts.load(
             ("span", self.project_rowid, time_range, filter_condition),
         )
@@ -138,6 +149,7 @@ class Project(Node):
         info: Info[Context, None],
         time_range: Optional[TimeRange] = UNSET,
     ) -> int:
+        self._read_updates(info)
         return await info.context.data_loaders.record_counts.load(
             ("trace", self.project_rowid, time_range, None),
         )
@@ -149,6 +161,7 @@ class Project(Node):
         time_range: Optional[TimeRange] = UNSET,
         filter_condition: Optional[str] = UNSET,
     ) -> float:
+        self._read_updates(info)
         return await info.context.data_loaders.token_counts.load(
             ("total", self.project_rowid, time_range, filter_condition),
         )
@@ -160,6 +173,7 @@ class Project(Node):
         time_range: Optional[TimeRange] = UNSET,
         filter_condition: Optional[str] = UNSET,
     ) -> float:
+        self._read_updates(info)
         return await info.context.data_loaders.token_counts.load(
             ("prompt", self.project_rowid, time_range, filter_condition),
         )
@@ -171,6 +185,7 @@ class Project(Node):
         time_range: Optional[TimeRange] = UNSET,
         filter_condition: Optional[str] = UNSET,
     ) -> float:
+        self._read_updates(info)
         return await info.context.data_loaders.token_counts.load(
             ("completion", self.project_rowid, time_range, filter_condition),
         )
@@ -182,6 +197,7 @@ class Project(Node):
         probability: float,
         time_range: Optional[TimeRange] = UNSET,
     ) -> Optional[float]:
+        self._read_updates(info)
         return await info.context.data_loaders.latency_ms_quantile.load(
             (
                 "trace",
@@ -200,6 +216,7 @@ class Project(Node):
         time_range: Optional[TimeRange] = UNSET,
         filter_condition: Optional[str] = UNSET,
     ) -> Optional[float]:
+        self._read_updates(info)
         return await info.context.data_loaders.latency_ms_quantile.load(
             (
                 "span",
@@ -212,6 +229,7 @@ class Project(Node):
 
     @strawberry.field
     async def trace(self, trace_id: ID, info: Info[Context, None]) -> Optional[Trace]:
+        self._read_updates(info)
         stmt = (
             select(models.Trace)
             .where(models.Trace.trace_id == str(trace_id))
@@ -236,23 +254,31 @@ class Project(Node):
         filter_condition: Optional[str] = UNSET,
         orphan_span_as_root_span: Optional[bool] = True,
     ) -> Connection[Span]:
+        self._read_updates(info)
+        # Spans are read by way of their span tree nodes, which carry the project and the
+        # start time of each span, so that pages of root spans in order of start time are
+        # read off of an index.
+        node = models.SpanTreeNode
         stmt = (
-            select(models.Span.id)
-            .join(models.Trace)
-            .where(models.Trace.project_rowid == self.project_rowid)
+            select(node.span_rowid)
+            .join(models.Span, models.Span.id == node.span_rowid)
+            .where(node.project_rowid == self.project_rowid)
         )
         if time_range:
             if time_range.start:
-                stmt = stmt.where(time_range.start <= models.Span.start_time)
+                stmt = stmt.where(time_range.start <= node.start_time)
             if time_range.end:
-                stmt = stmt.where(models.Span.start_time < time_range.end)
+                stmt = stmt.where(node.start_time < time_range.end)
         if filter_condition:
             span_filter = SpanFilter(condition=filter_condition)
-            stmt = span_filter(stmt)
+            stmt = span_filter(stmt.join(models.Trace, models.Trace.id == models.Span.trace_rowid))
         sort_config: Optional[SpanSortConfig] = None
-        cursor_rowid_column: Any = models.Span.id
+        cursor_rowid_column: Any = node.span_rowid
         if sort:
-            sort_config = sort.update_orm_expr(stmt)
+            if sort.col is SpanColumn.startTime and not sort.eval_result_key:
+                sort_config = _sort_by_node_start_time(stmt, sort.dir)
+            else:
+                sort_config = sort.update_orm_expr(stmt)
             stmt = sort_config.stmt
             if sort_config.dir is SortDir.desc:
                 cursor_rowid_column = desc(cursor_rowid_column)
@@ -263,28 +289,19 @@ class Project(Node):
                 compare = operator.lt if sort_config.dir is SortDir.desc else operator.gt
                 stmt = stmt.where(
                     compare(
-                        tuple_(sort_config.orm_expression, models.Span.id),
+                        tuple_(sort_config.orm_expression, node.span_rowid),
                         (sort_column.value, cursor.rowid),
                     )
                 )
             else:
-                stmt = stmt.where(models.Span.id > cursor.rowid)
+                stmt = stmt.where(node.span_rowid > cursor.rowid)
         stmt = stmt.order_by(cursor_rowid_column)
         if root_spans_only:
             # A root span is either a span with no parent_id or an orphan span
             # (a span whose parent_id references a span that doesn't exist in the database)
             if orphan_span_as_root_span:
-                # Include both types of root spans
-                parent_spans = select(models.Span.span_id).alias("parent_spans")
-                candidate_spans = stmt.add_columns(models.Span.parent_id).cte("candidate_spans")
-                stmt = select(candidate_spans).where(
-                    or_(
-                        candidate_spans.c.parent_id.is_(None),
-                        ~select(1)
-                        .where(candidate_spans.c.parent_id == parent_spans.c.span_id)
-                        .exists(),
-                    )
-                )
+                # Include both types of root spans, i.e. the roots of the span trees
+                stmt = stmt.where(node.depth == 0)
             else:
                 # Only include explicit root spans (spans with parent_id = NULL)
                 stmt = stmt.where(models.Span.parent_id.is_(None))
@@ -327,6 +344,7 @@ class Project(Node):
         sort: Optional[ProjectSessionSort] = UNSET,
         filter_io_substring: Optional[str] = UNSET,
     ) -> Connection[ProjectSession]:
+        self._read_updates(info)
         table = models.ProjectSession
         stmt = select(table).filter_by(project_id=self.project_rowid)
         if time_range:
@@ -342,14 +360,8 @@ class Project(Node):
                 .where(models.Span.parent_id.is_(None))
                 .where(
                     or_(
-                        models.TextContains(
-                            models.Span.attributes[INPUT_VALUE].as_string(),
-                            filter_io_substring,
-                        ),
-                        models.TextContains(
-                            models.Span.attributes[OUTPUT_VALUE].as_string(),
-                            filter_io_substring,
-                        ),
+                        models.span_io_value_contains("input", filter_io_substring),
+                        models.span_io_value_contains("output", filter_io_substring),
                     )
                 )
             ).subquery()
@@ -443,6 +455,7 @@ class Project(Node):
         self,
         info: Info[Context, None],
     ) -> list[str]:
+        self._read_updates(info)
         stmt = (
             select(distinct(models.TraceAnnotation.name))
             .join(models.Trace)
@@ -459,6 +472,7 @@ class Project(Node):
         self,
         info: Info[Context, None],
     ) -> list[str]:
+        self._read_updates(info)
         stmt = (
             select(distinct(models.SpanAnnotation.name))
             .join(models.Span)
@@ -476,6 +490,7 @@ class Project(Node):
         info: Info[Context, None],
         span_id: Optional[ID] = UNSET,
     ) -> list[str]:
+        self._read_updates(info)
         stmt = (
             select(distinct(models.DocumentAnnotation.name))
             .join(models.Span)
@@ -495,6 +510,7 @@ class Project(Node):
         annotation_name: str,
         time_range: Optional[TimeRange] = UNSET,
     ) -> Optional[AnnotationSummary]:
+        self._read_updates(info)
         return await info.context.data_loaders.annotation_summaries.load(
             ("trace", self.project_rowid, time_range, None, annotation_name),
         )
@@ -507,6 +523,7 @@ class Project(Node):
         time_range: Optional[TimeRange] = UNSET,
         filter_condition: Optional[str] = UNSET,
     ) -> Optional[AnnotationSummary]:
+        self._read_updates(info)
         return await info.context.data_loaders.annotation_summaries.load(
             ("span", self.project_rowid, time_range, filter_condition, annotation_name),
         )
@@ -519,6 +536,7 @@ class Project(Node):
         time_range: Optional[TimeRange] = UNSET,
         filter_condition: Optional[str] = UNSET,
     ) -> Optional[DocumentEvaluationSummary]:
+        self._read_updates(info)
         return await info.context.data_loaders.document_evaluation_summaries.load(
             (self.project_rowid, time_range, filter_condition, evaluation_name),
         )
@@ -667,43 +685,29 @@ class Project(Node):
             - The timestamps are rounded down to the nearest hour.
             - If a time range is provided, the start time is rounded down to the
               nearest hour, and the end time is rounded up to the nearest hour.
-            - The SQL query is optimized for both PostgreSQL and SQLite databases.
+            - The counts are read from the hourly rollups of the project rather than
+              computed from its spans.
         """
-        # Determine the appropriate SQL function to truncate timestamps to hours
-        # based on the database dialect
-        if info.context.db.dialect is SupportedSQLDialect.POSTGRESQL:
-            # PostgreSQL uses date_trunc for timestamp truncation
-            hour = func.date_trunc("hour", models.Span.start_time)
-        elif info.context.db.dialect is SupportedSQLDialect.SQLITE:
-            # SQLite uses strftime for timestamp formatting
-            hour = func.strftime("%Y-%m-%dT%H:00:00.000+00:00", models.Span.start_time)
-        else:
-            assert_never(info.context.db.dialect)
-
-        # Build the base query to count spans grouped by hour
+        self._read_updates(info)
+        # The counts are read from the hourly rollups of the project, which are
+        # maintained as spans are inserted and deleted
+        rollup = models.ProjectHourlyRollup
         stmt = (
-            select(hour, func.count())
-            .join(models.Trace)
-            .where(models.Trace.project_rowid == self.project_rowid)
-            .group_by(hour)
-            .order_by(hour)
+            select(rollup.hour, rollup.span_count)
+            .where(rollup.project_rowid == self.project_rowid)
+            .where(rollup.span_count > 0)
+            .order_by(rollup.hour)
         )
 
         # Apply time range filtering if provided
         if time_range:
             if t := time_range.start:
                 # Round down to nearest hour for the start time
-                start = t.replace(minute=0, second=0, microsecond=0)
-                stmt = stmt.where(start <= models.Span.start_time)
+                stmt = stmt.where(hour_of(t) <= rollup.hour)
             if t := time_range.end:
                 # Round up to nearest hour for the end time
                 # If the time is already at the start of an hour, use it as is
-                if t.minute == 0 and t.second == 0 and t.microsecond == 0:
-                    end = t
-                else:
-                    # Otherwise, round up to the next hour
-                    end = t.replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
-                stmt = stmt.where(models.Span.start_time < end)
+                stmt = stmt.where(rollup.hour < ceil_hour(t))
 
         # Execute the query and convert the results to a time series
         async with info.context.db() as session:
@@ -724,13 +728,27 @@ class SpanCountTimeSeries(TimeSeries):
     """A time series of span count"""
 
 
-INPUT_VALUE = SpanAttributes.INPUT_VALUE.split(".")
-OUTPUT_VALUE = SpanAttributes.OUTPUT_VALUE.split(".")
-
-
 def _as_datetime(value: Any) -> datetime:
     if isinstance(value, datetime):
         return value
     if isinstance(value, str):
         return datetime.fromisoformat(value)
     raise ValueError(f"Cannot convert {value} to datetime")
+
+
+def _sort_by_node_start_time(stmt: Select[Any], dir: SortDir) -> SpanSortConfig:
+    """
+    Sorts spans by the start times on their span tree nodes, which, unlike the start times
+    of the spans themselves, are indexed along with the project. Start times are never null.
+    """
+    col = SpanColumn.startTime
+    expr = models.SpanTreeNode.start_time
+    return SpanSortConfig(
+        stmt=stmt.add_columns(expr.label(col.column_name)).order_by(
+            desc(expr) if dir is SortDir.desc else expr
+        ),
+        orm_expression=expr,
+        dir=dir,
+        column_name=col.column_name,
+        column_data_type=col.data_type,
+    )
@@ -195,10 +195,20 @@ class Span(Node):
     ) -> Optional[float]:
         if self.db_span:
             return self.db_span.latency_ms
-        value = await info.context.data_loaders.span_fields.load(
-            (self.span_rowid, models.Span.latency_ms),
+        # The times are loaded rather than `models.Span.latency_ms`, whose SQL expression
+        # only has millisecond precision on SQLite, so that the value is the same as that
+        # of the hybrid property, whichever way the span is loaded.
+        start_time, end_time = await gather(
+            info.context.data_loaders.span_fields.load(
+                (self.span_rowid, models.Span.start_time),
+            ),
+            info.context.data_loaders.span_fields.load(
+                (self.span_rowid, models.Span.end_time),
+            ),
+        )
+        return round(
+            (cast(datetime, end_time) - cast(datetime, start_time)).total_seconds() * 1000, 1
         )
-        return cast(float, value)
 
     @strawberry.field(
         description="the parent span ID. If null, it is a root span",
@@ -359,15 +369,15 @@ class Span(Node):
         info: Info[Context, None],
     ) -> TokenCountPromptDetails:
         if self.db_span:
-            attributes = self.db_span.attributes
+            details = self.db_span.llm_token_count_prompt_details
         else:
-            attributes = await info.context.data_loaders.span_fields.load(
-                (self.span_rowid, models.Span.attributes),
+            details = await info.context.data_loaders.span_fields.load(
+                (self.span_rowid, models.Span.llm_token_count_prompt_details),
             )
 
         cache_read: Optional[int] = None
         raw_cache_read = get_attribute_value(
-            attributes=attributes,
+            attributes=details,
             key=LLM_TOKEN_COUNT_PROMPT_DETAILS_CACHE_READ,
         )
         if isinstance(raw_cache_read, int):
@@ -375,7 +385,7 @@ class Span(Node):
 
         cache_write: Optional[int] = None
         raw_cache_write = get_attribute_value(
-            attributes=attributes,
+            attributes=details,
             key=LLM_TOKEN_COUNT_PROMPT_DETAILS_CACHE_WRITE,
         )
         if isinstance(raw_cache_write, int):
@@ -383,7 +393,7 @@ class Span(Node):
 
         audio: Optional[int] = None
         raw_audio = get_attribute_value(
-            attributes=attributes,
+            attributes=details,
             key=LLM_TOKEN_COUNT_PROMPT_DETAILS_AUDIO,
         )
         if isinstance(raw_audio, int):
@@ -761,15 +771,25 @@ class Span(Node):
         from phoenix.server.api.helpers.playground_clients import OpenAIStreamingClient
         from phoenix.server.api.helpers.playground_registry import PLAYGROUND_CLIENT_REGISTRY
 
-        db_span: models.Span = await info.context.data_loaders.span_by_id.load(self.span_rowid)
-        attributes = db_span.attributes
-        llm_provider = GenerativeProvider.get_model_provider_from_attributes(attributes)
+        if self.db_span:
+            provider = self.db_span.llm_provider
+            llm_model = self.db_span.llm_model_name
+            invocation_parameters = self.db_span.llm_invocation_parameters
+        else:
+            provider, llm_model, invocation_parameters = await gather(
+                info.context.data_loaders.span_fields.load(
+                    (self.span_rowid, models.Span.llm_provider),
+                ),
+                info.context.data_loaders.span_fields.load(
+                    (self.span_rowid, models.Span.llm_model_name),
+                ),
+                info.context.data_loaders.span_fields.load(
+                    (self.span_rowid, models.Span.llm_invocation_parameters),
+                ),
+            )
+        llm_provider = GenerativeProvider.get_model_provider(provider, llm_model)
         if llm_provider is None:
             return []
-        llm_model = get_attribute_value(attributes, SpanAttributes.LLM_MODEL_NAME)
-        invocation_parameters = get_attribute_value(
-            attributes, SpanAttributes.LLM_INVOCATION_PARAMETERS
-        )
         if invocation_parameters is None:
             return []
         invocation_parameters = json.loads(invocation_parameters)
@@ -844,11 +864,10 @@ def _convert_metadata_to_string(metadata: Any) -> Optional[str]:
 
 INPUT_MIME_TYPE = SpanAttributes.INPUT_MIME_TYPE
 INPUT_VALUE = SpanAttributes.INPUT_VALUE
-LLM_TOKEN_COUNT_PROMPT_DETAILS_AUDIO = SpanAttributes.LLM_TOKEN_COUNT_PROMPT_DETAILS_AUDIO
-LLM_TOKEN_COUNT_PROMPT_DETAILS_CACHE_READ = SpanAttributes.LLM_TOKEN_COUNT_PROMPT_DETAILS_CACHE_READ
-LLM_TOKEN_COUNT_PROMPT_DETAILS_CACHE_WRITE = (
-    SpanAttributes.LLM_TOKEN_COUNT_PROMPT_DETAILS_CACHE_WRITE
-)
+# Relative to `llm.token_count.prompt_details`, which is loaded instead of all attributes.
+LLM_TOKEN_COUNT_PROMPT_DETAILS_AUDIO = "audio"
+LLM_TOKEN_COUNT_PROMPT_DETAILS_CACHE_READ = "cache_read"
+LLM_TOKEN_COUNT_PROMPT_DETAILS_CACHE_WRITE = "cache_write"
 METADATA = SpanAttributes.METADATA
 OUTPUT_MIME_TYPE = SpanAttributes.OUTPUT_MIME_TYPE
 OUTPUT_VALUE = SpanAttributes.OUTPUT_VALUE
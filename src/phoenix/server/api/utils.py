@@ -1,12 +1,17 @@
+from typing import Optional
+
 from sqlalchemy import delete
 
 from phoenix.db import models
-from phoenix.server.types import DbSessionFactory
+from phoenix.db.rollups import subtract_traces
+from phoenix.server.dml_event import DmlEvent, ProjectDeleteEvent
+from phoenix.server.types import CanPutItem, DbSessionFactory
 
 
 async def delete_projects(
     db: DbSessionFactory,
     *project_names: str,
+    event_queue: Optional[CanPutItem[DmlEvent]] = None,
 ) -> list[int]:
     if not project_names:
         return []
@@ -16,7 +21,10 @@ async def delete_projects(
         .returning(models.Project.id)
     )
     async with db() as session:
-        return list(await session.scalars(stmt))
+        project_ids = list(await session.scalars(stmt))
+    if event_queue is not None and project_ids:
+        event_queue.put(ProjectDeleteEvent(tuple(project_ids)))
+    return project_ids
 
 
 async def delete_traces(
@@ -25,10 +33,8 @@ async def delete_traces(
 ) -> list[int]:
     if not trace_ids:
         return []
-    stmt = (
-        delete(models.Trace)
-        .where(models.Trace.trace_id.in_(set(trace_ids)))
-        .returning(models.Trace.id)
-    )
+    condition = models.Trace.trace_id.in_(set(trace_ids))
+    stmt = delete(models.Trace).where(condition).returning(models.Trace.id)
     async with db() as session:
+        await subtract_traces(session, condition)
         return list(await session.scalars(stmt))
@@ -4,7 +4,7 @@ import importlib
 import json
 import logging
 import os
-from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Sequence
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator, Sequence
 from contextlib import AbstractAsyncContextManager, AsyncExitStack
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
@@ -35,7 +35,7 @@ from starlette.exceptions import HTTPException
 from starlette.middleware import Middleware
 from starlette.middleware.authentication import AuthenticationMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
+from starlette.requests import HTTPConnection, Request
 from starlette.responses import JSONResponse, PlainTextResponse, RedirectResponse, Response
 from starlette.staticfiles import StaticFiles
 from starlette.status import HTTP_401_UNAUTHORIZED
@@ -44,6 +44,7 @@ from starlette.types import Scope, StatefulLifespan
 from strawberry.extensions import SchemaExtension
 from strawberry.fastapi import GraphQLRouter
 from strawberry.subscriptions import GRAPHQL_TRANSPORT_WS_PROTOCOL
+from strawberry.types.graphql import OperationType
 from typing_extensions import TypeAlias
 
 import phoenix.trace.v1 as pb
@@ -58,7 +59,13 @@ from phoenix.config import (
     get_env_grpc_interceptor_paths,
     get_env_host,
     get_env_host_root_path,
+    get_env_max_span_bytes_buffered,
+    get_env_max_spans_buffered,
     get_env_port,
+    get_env_span_decoder_max_workers,
+    get_env_span_decoder_use_processes,
+    get_env_span_spool_dir,
+    get_env_span_spool_max_bytes,
     server_instrumentation_is_enabled,
     verify_server_environment_variables,
 )
@@ -68,7 +75,9 @@ from phoenix.db.bulk_inserter import BulkInserter
 from phoenix.db.engines import create_engine
 from phoenix.db.facilitator import Facilitator
 from phoenix.db.helpers import SupportedSQLDialect
+from phoenix.db.insertion.cache import InsertionCache
 from phoenix.exceptions import PhoenixMigrationError
+from phoenix.pointcloud.service import PointCloudService
 from phoenix.pointcloud.umap_parameters import UMAPParameters
 from phoenix.server.api.context import Context, DataLoaders
 from phoenix.server.api.dataloaders import (
@@ -119,7 +128,7 @@ from phoenix.server.api.routers import (
 )
 from phoenix.server.api.routers.v1 import REST_API_VERSION
 from phoenix.server.api.schema import build_graphql_schema
-from phoenix.server.bearer_auth import BearerTokenAuthBackend, is_authenticated
+from phoenix.server.bearer_auth import BearerTokenAuthBackend, get_user_id, is_authenticated
 from phoenix.server.dml_event import DmlEvent
 from phoenix.server.dml_event_handler import DmlEventHandler
 from phoenix.server.email.types import EmailSender
@@ -128,6 +137,8 @@ from phoenix.server.jwt_store import JwtStore
 from phoenix.server.middleware.gzip import GZipMiddleware
 from phoenix.server.oauth2 import OAuth2Clients
 from phoenix.server.retention import TraceDataSweeper
+from phoenix.server.span_decoder import SpanDecoder
+from phoenix.server.span_spool import SpanSpool, SpanSpoolReader
 from phoenix.server.telemetry import initialize_opentelemetry_tracer_provider
 from phoenix.server.types import (
     CanGetLastUpdatedAt,
@@ -319,6 +330,63 @@ class HeadersMiddleware(BaseHTTPMiddleware):
         return response
 
 
+class DbWriteRecorder(BaseHTTPMiddleware):
+    """
+    Records the requests that can write to the database, so that the same user's reads
+    are routed to the primary database until the read replica has caught up with them.
+    GraphQL requests are left to `DbSessionRouter`, which knows whether the operation is a
+    query, and ingestion requests are left out, because they are queued and, in any case,
+    only eventually visible. So are span queries, which are POST requests that only read.
+    """
+
+    _SAFE_METHODS = frozenset(["GET", "HEAD", "OPTIONS"])
+    _EXCLUDED_PATH_SUFFIXES = ("/graphql", "/v1/traces", "/v1/evaluations", "/v1/spans")
+
+    async def dispatch(
+        self,
+        request: Request,
+        call_next: RequestResponseEndpoint,
+    ) -> Response:
+        if request.method in self._SAFE_METHODS or request.url.path.rstrip("/").endswith(
+            self._EXCLUDED_PATH_SUFFIXES
+        ):
+            return await call_next(request)
+        db: DbSessionFactory = request.app.state.db
+        user_id = get_user_id(request)
+        db.record_write(user_id)
+        try:
+            return await call_next(request)
+        finally:
+            db.record_write(user_id)
+
+
+class DbSessionRouter(SchemaExtension):
+    """
+    Leaves the database sessions of GraphQL queries on the read replica, and moves those of
+    mutations and subscriptions to the primary database, recording them as writes, so that
+    the same user's queries are routed to the primary until the read replica has caught up.
+    """
+
+    def on_execute(self) -> Iterator[None]:
+        context = self.execution_context.context
+        if (
+            not isinstance(context, Context)
+            or self.execution_context.operation_type is OperationType.QUERY
+        ):
+            yield
+            return
+        context.db.read_from_primary()
+        if context.request is None:
+            yield
+            return
+        user_id = get_user_id(context.request)
+        context.db.record_write(user_id)
+        try:
+            yield
+        finally:
+            context.db.record_write(user_id)
+
+
 def user_fastapi_middlewares() -> list[Middleware]:
     paths = get_env_fastapi_middleware_paths()
     middlewares = []
@@ -497,6 +565,8 @@ def _lifespan(
     *,
     db: DbSessionFactory,
     bulk_inserter: BulkInserter,
+    span_decoder: SpanDecoder,
+    span_spool: Optional[SpanSpool],
     dml_event_handler: DmlEventHandler,
     trace_data_sweeper: Optional[TraceDataSweeper],
     token_store: Optional[TokenStore] = None,
@@ -515,14 +585,29 @@ def _lifespan(
         global DB_MUTEX
         DB_MUTEX = asyncio.Lock() if db.dialect is SupportedSQLDialect.SQLITE else None
         async with AsyncExitStack() as stack:
+            if span_spool is not None:
+                await stack.enter_async_context(span_spool)
             (
                 enqueue,
                 queue_span,
+                queue_spans,
                 queue_evaluation,
                 enqueue_operation,
             ) = await stack.enter_async_context(bulk_inserter)
+            await stack.enter_async_context(span_decoder)
+            if span_spool is not None:
+                span_spool_reader = SpanSpoolReader(
+                    span_spool,
+                    span_decoder,
+                    queue_spans,
+                    bulk_inserter.has_span_capacity,
+                )
+                await stack.enter_async_context(span_spool_reader)
             grpc_server = GrpcServer(
-                queue_span,
+                queue_spans,
+                span_decoder,
+                bulk_inserter.check_span_capacity,
+                span_spool=span_spool,
                 disabled=read_only,
                 tracer_provider=tracer_provider,
                 enable_prometheus=enable_prometheus,
@@ -546,6 +631,10 @@ def _lifespan(
                 "event_queue": dml_event_handler,
                 "enqueue": enqueue,
                 "queue_span_for_bulk_insert": queue_span,
+                "queue_spans_for_bulk_insert": queue_spans,
+                "span_decoder": span_decoder,
+                "check_span_capacity": bulk_inserter.check_span_capacity,
+                "span_spool": span_spool,
                 "queue_evaluation_for_bulk_insert": queue_evaluation,
                 "enqueue_operation": enqueue_operation,
             }
@@ -587,6 +676,7 @@ def create_graphql_router(
     secret: Optional[Secret] = None,
     token_store: Optional[TokenStore] = None,
     email_sender: Optional[EmailSender] = None,
+    point_clouds: Optional[PointCloudService] = None,
 ) -> GraphQLRouter[Context, None]:
     """Creates the GraphQL router.
 
@@ -604,97 +694,107 @@ def create_graphql_router(
         secret (Optional[Secret], optional): The application secret for auth. Defaults to None.
         token_store (Optional[TokenStore], optional): The token store for auth. Defaults to None.
         email_sender (Optional[EmailSender], optional): The email sender. Defaults to None.
+        point_clouds (Optional[PointCloudService], optional): The cache of UMAP projections of
+            embeddings. Defaults to a new one.
 
     Returns:
         GraphQLRouter: The router mounted at /graphql
     """
-
-    def get_context() -> Context:
+    point_clouds = point_clouds or PointCloudService()
+
+    def get_context(connection: HTTPConnection) -> Context:
+        # Requests read from the read replica, if any, unless `DbSessionRouter` moves them to
+        # the primary. Data loaders with shared caches always read from the primary, because
+        # the caches are invalidated by the events of writes to the primary, which the replica
+        # may not have caught up with yet.
+        read_db = db.reader(get_user_id(connection))
+        cached_db = db if cache_for_dataloaders else read_db
         return Context(
-            db=db,
+            db=read_db,
             model=model,
             corpus=corpus,
+            point_clouds=point_clouds,
             export_path=export_path,
             last_updated_at=last_updated_at,
             event_queue=event_queue,
             data_loaders=DataLoaders(
-                average_experiment_run_latency=AverageExperimentRunLatencyDataLoader(db),
-                dataset_example_revisions=DatasetExampleRevisionsDataLoader(db),
-                dataset_example_spans=DatasetExampleSpansDataLoader(db),
+                average_experiment_run_latency=AverageExperimentRunLatencyDataLoader(read_db),
+                dataset_example_revisions=DatasetExampleRevisionsDataLoader(read_db),
+                dataset_example_spans=DatasetExampleSpansDataLoader(read_db),
                 document_evaluation_summaries=DocumentEvaluationSummaryDataLoader(
-                    db,
+                    cached_db,
                     cache_map=(
                         cache_for_dataloaders.document_evaluation_summary
                         if cache_for_dataloaders
                         else None
                     ),
                 ),
-                document_evaluations=DocumentEvaluationsDataLoader(db),
-                document_retrieval_metrics=DocumentRetrievalMetricsDataLoader(db),
+                document_evaluations=DocumentEvaluationsDataLoader(read_db),
+                document_retrieval_metrics=DocumentRetrievalMetricsDataLoader(read_db),
                 annotation_summaries=AnnotationSummaryDataLoader(
-                    db,
+                    cached_db,
                     cache_map=(
                         cache_for_dataloaders.annotation_summary if cache_for_dataloaders else None
                     ),
                 ),
-                experiment_annotation_summaries=ExperimentAnnotationSummaryDataLoader(db),
-                experiment_error_rates=ExperimentErrorRatesDataLoader(db),
-                experiment_run_annotations=ExperimentRunAnnotations(db),
-                experiment_run_counts=ExperimentRunCountsDataLoader(db),
-                experiment_sequence_number=ExperimentSequenceNumberDataLoader(db),
+                experiment_annotation_summaries=ExperimentAnnotationSummaryDataLoader(read_db),
+                experiment_error_rates=ExperimentErrorRatesDataLoader(read_db),
+                experiment_run_annotations=ExperimentRunAnnotations(read_db),
+                experiment_run_counts=ExperimentRunCountsDataLoader(read_db),
+                experiment_sequence_number=ExperimentSequenceNumberDataLoader(read_db),
                 latency_ms_quantile=LatencyMsQuantileDataLoader(
-                    db,
+                    cached_db,
                     cache_map=(
                         cache_for_dataloaders.latency_ms_quantile if cache_for_dataloaders else None
                     ),
                 ),
                 min_start_or_max_end_times=MinStartOrMaxEndTimeDataLoader(
-                    db,
+                    cached_db,
                     cache_map=(
                         cache_for_dataloaders.min_start_or_max_end_time
                         if cache_for_dataloaders
                         else None
                     ),
                 ),
-                num_child_spans=NumChildSpansDataLoader(db),
-                num_spans_per_trace=NumSpansPerTraceDataLoader(db),
-                project_fields=TableFieldsDataLoader(db, models.Project),
+                num_child_spans=NumChildSpansDataLoader(read_db),
+                num_spans_per_trace=NumSpansPerTraceDataLoader(read_db),
+                project_fields=TableFieldsDataLoader(read_db, models.Project),
                 projects_by_trace_retention_policy_id=ProjectIdsByTraceRetentionPolicyIdDataLoader(
-                    db
+                    read_db
                 ),
-                prompt_version_sequence_number=PromptVersionSequenceNumberDataLoader(db),
+                prompt_version_sequence_number=PromptVersionSequenceNumberDataLoader(read_db),
                 record_counts=RecordCountDataLoader(
-                    db,
+                    cached_db,
                     cache_map=cache_for_dataloaders.record_count if cache_for_dataloaders else None,
                 ),
-                session_first_inputs=SessionIODataLoader(db, "first_input"),
-                session_last_outputs=SessionIODataLoader(db, "last_output"),
-                session_num_traces=SessionNumTracesDataLoader(db),
-                session_num_traces_with_error=SessionNumTracesWithErrorDataLoader(db),
-                session_token_usages=SessionTokenUsagesDataLoader(db),
-                session_trace_latency_ms_quantile=SessionTraceLatencyMsQuantileDataLoader(db),
-                span_annotations=SpanAnnotationsDataLoader(db),
-                span_fields=TableFieldsDataLoader(db, models.Span),
-                span_by_id=SpanByIdDataLoader(db),
-                span_dataset_examples=SpanDatasetExamplesDataLoader(db),
-                span_descendants=SpanDescendantsDataLoader(db),
-                span_projects=SpanProjectsDataLoader(db),
+                session_first_inputs=SessionIODataLoader(read_db, "first_input"),
+                session_last_outputs=SessionIODataLoader(read_db, "last_output"),
+                session_num_traces=SessionNumTracesDataLoader(read_db),
+                session_num_traces_with_error=SessionNumTracesWithErrorDataLoader(read_db),
+                session_token_usages=SessionTokenUsagesDataLoader(read_db),
+                session_trace_latency_ms_quantile=SessionTraceLatencyMsQuantileDataLoader(read_db),
+                span_annotations=SpanAnnotationsDataLoader(read_db),
+                span_fields=TableFieldsDataLoader(read_db, models.Span),
+                span_by_id=SpanByIdDataLoader(read_db),
+                span_dataset_examples=SpanDatasetExamplesDataLoader(read_db),
+                span_descendants=SpanDescendantsDataLoader(read_db),
+                span_projects=SpanProjectsDataLoader(read_db),
                 token_counts=TokenCountDataLoader(
-                    db,
+                    cached_db,
                     cache_map=cache_for_dataloaders.token_count if cache_for_dataloaders else None,
                 ),
-                trace_by_trace_ids=TraceByTraceIdsDataLoader(db),
-                trace_fields=TableFieldsDataLoader(db, models.Trace),
+                trace_by_trace_ids=TraceByTraceIdsDataLoader(read_db),
+                trace_fields=TableFieldsDataLoader(read_db, models.Trace),
                 trace_retention_policy_id_by_project_id=TraceRetentionPolicyIdByProjectIdDataLoader(
-                    db
+                    read_db
                 ),
                 project_trace_retention_policy_fields=TableFieldsDataLoader(
-                    db, models.ProjectTraceRetentionPolicy
+                    read_db, models.ProjectTraceRetentionPolicy
                 ),
-                trace_root_spans=TraceRootSpansDataLoader(db),
-                project_by_name=ProjectByNameDataLoader(db),
-                users=UsersDataLoader(db),
-                user_roles=UserRolesDataLoader(db),
+                trace_root_spans=TraceRootSpansDataLoader(read_db),
+                project_by_name=ProjectByNameDataLoader(read_db),
+                users=UsersDataLoader(read_db),
+                user_roles=UserRolesDataLoader(read_db),
             ),
             cache_for_dataloaders=cache_for_dataloaders,
             read_only=read_only,
@@ -808,6 +908,9 @@ def create_app(
     startup_callbacks_list: list[_Callback] = list(startup_callbacks)
     shutdown_callbacks_list: list[_Callback] = list(shutdown_callbacks)
     startup_callbacks_list.append(Facilitator(db=db))
+    point_clouds = PointCloudService()
+    if model.embedding_dimensions:
+        startup_callbacks_list.append(point_clouds.warm_up)
     initial_batch_of_spans: Iterable[tuple[Span, str]] = (
         ()
         if initial_spans is None
@@ -818,9 +921,12 @@ def create_app(
     )
     initial_batch_of_evaluations = () if initial_evaluations is None else initial_evaluations
     cache_for_dataloaders = (
-        CacheForDataLoaders() if db.dialect is SupportedSQLDialect.SQLITE else None
+        CacheForDataLoaders(enable_prometheus=enable_prometheus)
+        if db.dialect is SupportedSQLDialect.SQLITE
+        else None
     )
     last_updated_at = LastUpdatedAt()
+    insertion_cache = InsertionCache(enable_prometheus=enable_prometheus)
     middlewares: list[Middleware] = [Middleware(HeadersMiddleware)]
     middlewares.extend(user_fastapi_middlewares())
     if origins := get_env_csrf_trusted_origins():
@@ -851,11 +957,22 @@ def create_app(
     dml_event_handler = DmlEventHandler(
         db=db,
         cache_for_dataloaders=cache_for_dataloaders,
+        insertion_cache=insertion_cache,
         last_updated_at=last_updated_at,
     )
     trace_data_sweeper = TraceDataSweeper(
         db=db,
         dml_event_handler=dml_event_handler,
+        enable_prometheus=enable_prometheus,
+    )
+    span_spool = (
+        SpanSpool(
+            span_spool_dir,
+            max_bytes=get_env_span_spool_max_bytes(),
+            enable_prometheus=enable_prometheus,
+        )
+        if (span_spool_dir := get_env_span_spool_dir())
+        else None
     )
     bulk_inserter = bulk_inserter_factory(
         db,
@@ -863,6 +980,14 @@ def create_app(
         event_queue=dml_event_handler,
         initial_batch_of_spans=initial_batch_of_spans,
         initial_batch_of_evaluations=initial_batch_of_evaluations,
+        insertion_cache=insertion_cache,
+        max_spans_buffered=get_env_max_spans_buffered(),
+        max_span_bytes_buffered=get_env_max_span_bytes_buffered(),
+        span_spool=span_spool,
+    )
+    span_decoder = SpanDecoder(
+        get_env_span_decoder_max_workers(),
+        use_processes=get_env_span_decoder_use_processes(),
     )
     tracer_provider = None
     graphql_schema_extensions: list[Union[type[SchemaExtension], SchemaExtension]] = []
@@ -887,6 +1012,10 @@ def create_app(
 
         graphql_schema_extensions.append(_OpenTelemetryExtension)
 
+    if db.has_read_replica:
+        graphql_schema_extensions.append(DbSessionRouter)
+        middlewares.append(Middleware(DbWriteRecorder))
+
     graphql_router = create_graphql_router(
         db=db,
         graphql_schema=build_graphql_schema(graphql_schema_extensions),
@@ -901,6 +1030,7 @@ def create_app(
         secret=secret,
         token_store=token_store,
         email_sender=email_sender,
+        point_clouds=point_clouds,
     )
     if enable_prometheus:
         from phoenix.server.prometheus import PrometheusMiddleware
@@ -913,6 +1043,8 @@ def create_app(
             db=db,
             read_only=read_only,
             bulk_inserter=bulk_inserter,
+            span_decoder=span_decoder,
+            span_spool=span_spool,
             dml_event_handler=dml_event_handler,
             trace_data_sweeper=trace_data_sweeper,
             token_store=token_store,
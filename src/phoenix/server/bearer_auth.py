@@ -154,6 +154,16 @@ async def is_authenticated(
         raise HTTPException(status_code=HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
 
+def get_user_id(connection: HTTPConnection) -> Optional[UserId]:
+    """
+    Returns the ID of the user of a request or websocket connection, or None if the user is
+    anonymous, e.g. because authentication is disabled.
+    """
+    if isinstance(user := connection.scope.get("user"), PhoenixUser):
+        return user.identity
+    return None
+
+
 async def create_access_and_refresh_tokens(
     *,
     token_store: TokenStore,
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from abc import ABC
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from datetime import datetime
 from typing import ClassVar
 
 from phoenix.db import models
@@ -38,7 +40,14 @@ class SpanDmlEvent(ProjectDmlEvent): ...
 
 
 @dataclass(frozen=True)
-class SpanInsertEvent(SpanDmlEvent): ...
+class SpanInsertEvent(SpanDmlEvent):
+    """
+    The time bounds are the earliest and latest start times, by project, of the spans and
+    traces that the insertion may have changed. Projects without time bounds are treated
+    as changed in their entirety.
+    """
+
+    time_bounds: Mapping[int, tuple[datetime, datetime]] = field(default_factory=dict, hash=False)
 
 
 @dataclass(frozen=True)
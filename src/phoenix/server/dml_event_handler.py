@@ -3,13 +3,15 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from asyncio import gather
 from collections.abc import Callable, Iterable, Iterator, Mapping
+from datetime import datetime
 from inspect import getmro
 from itertools import chain
 from typing import Any, Generic, Optional, TypedDict, TypeVar, Union, cast
 
-from sqlalchemy import Select, select
+from sqlalchemy import Select, func, select
 from typing_extensions import TypeAlias, Unpack
 
+from phoenix.db.insertion.cache import InsertionCache
 from phoenix.db.models import (
     Base,
     DocumentAnnotation,
@@ -20,12 +22,15 @@ from phoenix.db.models import (
     TraceAnnotation,
 )
 from phoenix.server.api.dataloaders import CacheForDataLoaders
+from phoenix.server.api.dataloaders.cache import TimeBounds
 from phoenix.server.dml_event import (
     DmlEvent,
     DocumentAnnotationDmlEvent,
+    ProjectDeleteEvent,
     SpanAnnotationDmlEvent,
     SpanDeleteEvent,
     SpanDmlEvent,
+    SpanInsertEvent,
     TraceAnnotationDmlEvent,
 )
 from phoenix.server.types import (
@@ -60,6 +65,7 @@ class _HandlerParams(TypedDict):
     db: DbSessionFactory
     last_updated_at: CanSetLastUpdatedAt
     cache_for_dataloaders: Optional[CacheForDataLoaders]
+    insertion_cache: Optional[InsertionCache]
     sleep_seconds: float
 
 
@@ -83,9 +89,20 @@ class _HasCacheForDataLoaders(ABC):
         self._cache_for_dataloaders = cache_for_dataloaders
 
 
+class _HasInsertionCache(ABC):
+    def __init__(
+        self,
+        insertion_cache: Optional[InsertionCache] = None,
+        **kwargs: Any,
+    ) -> None:
+        super().__init__(**kwargs)
+        self._insertion_cache = insertion_cache
+
+
 class _DmlEventHandler(
     _HasLastUpdatedAt,
     _HasCacheForDataLoaders,
+    _HasInsertionCache,
     BatchedCaller[_DmlEventT],
     Generic[_DmlEventT],
     ABC,
@@ -113,24 +130,68 @@ class _GenericDmlEventHandler(_DmlEventHandler[DmlEvent]):
 class _SpanDmlEventHandler(_DmlEventHandler[SpanDmlEvent]):
     async def __call__(self) -> None:
         if cache := self._cache_for_dataloaders:
-            for id_ in set(chain.from_iterable(e.ids for e in self._batch)):
-                self._clear(cache, id_)
+            for id_, time_bounds in _merge_time_bounds(self._batch).items():
+                self._clear(cache, id_, time_bounds)
 
     @staticmethod
-    def _clear(cache: CacheForDataLoaders, project_id: int) -> None:
-        cache.latency_ms_quantile.invalidate(project_id)
-        cache.token_count.invalidate(project_id)
-        cache.record_count.invalidate(project_id)
+    def _clear(
+        cache: CacheForDataLoaders,
+        project_id: int,
+        time_bounds: Optional[TimeBounds],
+    ) -> None:
+        if time_bounds is None:
+            cache.latency_ms_quantile.invalidate(project_id)
+            cache.token_count.invalidate(project_id)
+            cache.record_count.invalidate(project_id)
+        else:
+            # Aggregates over time intervals that end before the new data stay cached.
+            cache.latency_ms_quantile.invalidate_time_bounds(project_id, time_bounds)
+            cache.token_count.invalidate_time_bounds(project_id, time_bounds)
+            cache.record_count.invalidate_time_bounds(project_id, time_bounds)
         cache.min_start_or_max_end_time.invalidate(project_id)
 
 
+def _merge_time_bounds(events: Iterable[SpanDmlEvent]) -> dict[int, Optional[TimeBounds]]:
+    """
+    The union of the time bounds of the events by project, which is None, i.e. unbounded,
+    if any of the events doesn't have time bounds for the project.
+    """
+    merged: dict[int, Optional[TimeBounds]] = {}
+    for e in events:
+        time_bounds = e.time_bounds if isinstance(e, SpanInsertEvent) else {}
+        for id_ in e.ids:
+            bounds = time_bounds.get(id_)
+            if id_ not in merged:
+                merged[id_] = bounds
+            elif bounds is None or (previous := merged[id_]) is None:
+                merged[id_] = None
+            else:
+                merged[id_] = (min(previous[0], bounds[0]), max(previous[1], bounds[1]))
+    return merged
+
+
 class _SpanDeleteEventHandler(_SpanDmlEventHandler):
+    async def __call__(self) -> None:
+        await super().__call__()
+        if (cache := self._insertion_cache) is not None:
+            cache.invalidate_projects(chain.from_iterable(e.ids for e in self._batch))
+
     @staticmethod
-    def _clear(cache: CacheForDataLoaders, project_id: int) -> None:
+    def _clear(
+        cache: CacheForDataLoaders,
+        project_id: int,
+        time_bounds: Optional[TimeBounds],
+    ) -> None:
         cache.annotation_summary.invalidate_project(project_id)
         cache.document_evaluation_summary.invalidate_project(project_id)
 
 
+class _ProjectDeleteEventHandler(_DmlEventHandler[ProjectDeleteEvent]):
+    async def __call__(self) -> None:
+        if (cache := self._insertion_cache) is not None:
+            cache.delete_projects(chain.from_iterable(e.ids for e in self._batch))
+
+
 _AnnotationTable: TypeAlias = Union[
     type[SpanAnnotation],
     type[TraceAnnotation],
@@ -151,7 +212,9 @@ class _AnnotationDmlEventHandler(
     ABC,
 ):
     _table: _AnnotationTable
-    _base_stmt: Union[Select[tuple[int, str]], Select[tuple[int]]] = (
+    # the spans or traces whose start times the summaries are filtered by
+    _annotated_table: Union[type[Span], type[Trace]]
+    _base_stmt: Union[Select[tuple[int, str, datetime, datetime]], Select[tuple[int]]] = (
         select(Project.id).join_from(Project, Trace).distinct()
     )
 
@@ -159,58 +222,85 @@ class _AnnotationDmlEventHandler(
         super().__init__(**kwargs)
         self._stmt = self._base_stmt
         if self._cache_for_dataloaders:
-            self._stmt = self._stmt.add_columns(self._table.name)
+            self._stmt = self._stmt.add_columns(
+                self._table.name,
+                func.min(self._annotated_table.start_time).label("start_time"),
+                func.max(self._annotated_table.start_time).label("end_time"),
+            ).group_by(Project.id, self._table.name)
 
-    def _get_stmt(self) -> Union[Select[tuple[int, str]], Select[tuple[int]]]:
+    def _get_stmt(self) -> Union[Select[tuple[int, str, datetime, datetime]], Select[tuple[int]]]:
         ids = set(chain.from_iterable(e.ids for e in self._batch))
         return self._stmt.where(self._table.id.in_(ids))
 
     @staticmethod
     @abstractmethod
-    def _clear(cache: CacheForDataLoaders, project_id: int, name: str) -> None: ...
+    def _clear(
+        cache: CacheForDataLoaders,
+        project_id: int,
+        name: str,
+        time_bounds: TimeBounds,
+    ) -> None: ...
 
     async def __call__(self) -> None:
         async with self._db() as session:
             async for row in await session.stream(self._get_stmt()):
                 self._last_updated_at.set(Project, row.id)
                 if cache := self._cache_for_dataloaders:
-                    self._clear(cache, row.id, row.name)
+                    self._clear(cache, row.id, row.name, (row.start_time, row.end_time))
 
 
 class _SpanAnnotationDmlEventHandler(_AnnotationDmlEventHandler[SpanAnnotationDmlEvent]):
     _table = SpanAnnotation
+    _annotated_table = Span
 
     def __init__(self, **kwargs: Unpack[_HandlerParams]) -> None:
         super().__init__(**kwargs)
         self._stmt = self._stmt.join_from(Trace, Span).join_from(Span, self._table)
 
     @staticmethod
-    def _clear(cache: CacheForDataLoaders, project_id: int, name: str) -> None:
-        cache.annotation_summary.invalidate((project_id, name, "span"))
+    def _clear(
+        cache: CacheForDataLoaders,
+        project_id: int,
+        name: str,
+        time_bounds: TimeBounds,
+    ) -> None:
+        cache.annotation_summary.invalidate_time_bounds((project_id, name, "span"), time_bounds)
 
 
 class _TraceAnnotationDmlEventHandler(_AnnotationDmlEventHandler[TraceAnnotationDmlEvent]):
     _table = TraceAnnotation
+    _annotated_table = Trace
 
     def __init__(self, **kwargs: Unpack[_HandlerParams]) -> None:
         super().__init__(**kwargs)
         self._stmt = self._stmt.join_from(Trace, self._table)
 
     @staticmethod
-    def _clear(cache: CacheForDataLoaders, project_id: int, name: str) -> None:
-        cache.annotation_summary.invalidate((project_id, name, "trace"))
+    def _clear(
+        cache: CacheForDataLoaders,
+        project_id: int,
+        name: str,
+        time_bounds: TimeBounds,
+    ) -> None:
+        cache.annotation_summary.invalidate_time_bounds((project_id, name, "trace"), time_bounds)
 
 
 class _DocumentAnnotationDmlEventHandler(_AnnotationDmlEventHandler[DocumentAnnotationDmlEvent]):
     _table = DocumentAnnotation
+    _annotated_table = Span
 
     def __init__(self, **kwargs: Unpack[_HandlerParams]) -> None:
         super().__init__(**kwargs)
         self._stmt = self._stmt.join_from(Trace, Span).join_from(Span, self._table)
 
     @staticmethod
-    def _clear(cache: CacheForDataLoaders, project_id: int, name: str) -> None:
-        cache.document_evaluation_summary.invalidate((project_id, name))
+    def _clear(
+        cache: CacheForDataLoaders,
+        project_id: int,
+        name: str,
+        time_bounds: TimeBounds,
+    ) -> None:
+        cache.document_evaluation_summary.invalidate_time_bounds((project_id, name), time_bounds)
 
 
 class DmlEventHandler:
@@ -220,18 +310,21 @@ class DmlEventHandler:
         db: DbSessionFactory,
         last_updated_at: CanSetLastUpdatedAt,
         cache_for_dataloaders: Optional[CacheForDataLoaders] = None,
+        insertion_cache: Optional[InsertionCache] = None,
         sleep_seconds: float = 0.1,
     ) -> None:
         kwargs = _HandlerParams(
             db=db,
             last_updated_at=last_updated_at,
             cache_for_dataloaders=cache_for_dataloaders,
+            insertion_cache=insertion_cache,
             sleep_seconds=sleep_seconds,
         )
         self._handlers: Mapping[type[DmlEvent], Iterable[_DmlEventHandler[Any]]] = {
             DmlEvent: [_GenericDmlEventHandler(**kwargs)],
             SpanDmlEvent: [_SpanDmlEventHandler(**kwargs)],
             SpanDeleteEvent: [_SpanDeleteEventHandler(**kwargs)],
+            ProjectDeleteEvent: [_ProjectDeleteEventHandler(**kwargs)],
             SpanAnnotationDmlEvent: [_SpanAnnotationDmlEventHandler(**kwargs)],
             TraceAnnotationDmlEvent: [_TraceAnnotationDmlEventHandler(**kwargs)],
             DocumentAnnotationDmlEvent: [_DocumentAnnotationDmlEventHandler(**kwargs)],
@@ -1,8 +1,11 @@
-from collections.abc import Awaitable, Callable
+from asyncio import QueueFull
+from collections.abc import Awaitable, Callable, Iterable
 from typing import TYPE_CHECKING, Any, Optional
 
 import grpc
-from grpc.aio import RpcContext, Server, ServerInterceptor
+from google.protobuf.duration_pb2 import Duration
+from google.rpc.error_details_pb2 import RetryInfo
+from grpc.aio import Server, ServerInterceptor, ServicerContext
 from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import (
     ExportTraceServiceRequest,
     ExportTraceServiceResponse,
@@ -20,10 +23,11 @@ from phoenix.config import (
     get_env_tls_config,
     get_env_tls_enabled_for_grpc,
 )
+from phoenix.db.insertion.constants import DEFAULT_SPAN_BUFFER_RETRY_AFTER_SEC
 from phoenix.server.bearer_auth import ApiKeyInterceptor
-from phoenix.trace.otel import decode_otlp_span
+from phoenix.server.span_decoder import SpanDecoder, count_otlp_spans
+from phoenix.server.span_spool import SpanSpool
 from phoenix.trace.schemas import Span
-from phoenix.utilities.project import get_project_name
 
 if TYPE_CHECKING:
     from opentelemetry.trace import TracerProvider
@@ -34,29 +38,49 @@ ProjectName: TypeAlias = str
 class Servicer(TraceServiceServicer):  # type: ignore[misc,unused-ignore]
     def __init__(
         self,
-        callback: Callable[[Span, ProjectName], Awaitable[None]],
+        callback: Callable[[Iterable[tuple[Span, ProjectName]], int], Awaitable[None]],
+        span_decoder: SpanDecoder,
+        check_span_capacity: Callable[[int, int], None],
+        span_spool: Optional[SpanSpool] = None,
     ) -> None:
         super().__init__()
         self._callback = callback
+        self._span_decoder = span_decoder
+        self._check_span_capacity = check_span_capacity
+        self._span_spool = span_spool
 
     async def Export(
         self,
         request: ExportTraceServiceRequest,
-        context: RpcContext,
+        context: ServicerContext,
     ) -> ExportTraceServiceResponse:
-        for resource_spans in request.resource_spans:
-            project_name = get_project_name(resource_spans.resource.attributes)
-            for scope_span in resource_spans.scope_spans:
-                for otlp_span in scope_span.spans:
-                    span = decode_otlp_span(otlp_span)
-                    await self._callback(span, project_name)
+        num_bytes = request.ByteSize()
+        try:
+            if self._span_spool is not None:
+                await self._span_spool.append(request.SerializeToString())
+                return ExportTraceServiceResponse()
+            self._check_span_capacity(count_otlp_spans(request), num_bytes)
+        except QueueFull:
+            # OTLP exporters retry RESOURCE_EXHAUSTED only when the server sends RetryInfo.
+            retry_info = RetryInfo(
+                retry_delay=Duration(seconds=DEFAULT_SPAN_BUFFER_RETRY_AFTER_SEC)
+            )
+            await context.abort(
+                grpc.StatusCode.RESOURCE_EXHAUSTED,
+                "Span buffer is full" if self._span_spool is None else "Span spool is full",
+                trailing_metadata=(("google.rpc.retryinfo-bin", retry_info.SerializeToString()),),
+            )
+        await self._callback(await self._span_decoder.decode(request), num_bytes)
         return ExportTraceServiceResponse()
 
 
 class GrpcServer:
     def __init__(
         self,
-        callback: Callable[[Span, ProjectName], Awaitable[None]],
+        callback: Callable[[Iterable[tuple[Span, ProjectName]], int], Awaitable[None]],
+        span_decoder: SpanDecoder,
+        check_span_capacity: Callable[[int, int], None],
+        span_spool: Optional[SpanSpool] = None,
         tracer_provider: Optional["TracerProvider"] = None,
         enable_prometheus: bool = False,
         disabled: bool = False,
@@ -64,6 +88,9 @@ class GrpcServer:
         interceptors: list[ServerInterceptor] = [],
     ) -> None:
         self._callback = callback
+        self._span_decoder = span_decoder
+        self._check_span_capacity = check_span_capacity
+        self._span_spool = span_spool
         self._server: Optional[Server] = None
         self._tracer_provider = tracer_provider
         self._enable_prometheus = enable_prometheus
@@ -106,7 +133,13 @@ class GrpcServer:
             server.add_secure_port(f"[::]:{get_env_grpc_port()}", server_credentials)
         else:
             server.add_insecure_port(f"[::]:{get_env_grpc_port()}")
-        add_TraceServiceServicer_to_server(Servicer(self._callback), server)  # type: ignore[no-untyped-call,unused-ignore]
+        servicer = Servicer(
+            self._callback,
+            self._span_decoder,
+            self._check_span_capacity,
+            self._span_spool,
+        )
+        add_TraceServiceServicer_to_server(servicer, server)  # type: ignore[no-untyped-call,unused-ignore]
         await server.start()
         self._server = server
 
@@ -21,6 +21,8 @@ from phoenix.config import (
     get_env_allowed_origins,
     get_env_auth_settings,
     get_env_database_connection_str,
+    get_env_database_read_replica_connection_str,
+    get_env_database_read_your_writes_seconds,
     get_env_database_schema,
     get_env_db_logging_level,
     get_env_disable_migrations,
@@ -48,6 +50,7 @@ from phoenix.config import (
 )
 from phoenix.core.model_schema_adapter import create_model_from_inferences
 from phoenix.db import get_printable_db_url
+from phoenix.db.engines import create_engine
 from phoenix.inferences.fixtures import FIXTURES, get_inferences
 from phoenix.inferences.inferences import EMPTY_INFERENCES, Inferences
 from phoenix.logging import setup_logging
@@ -370,7 +373,24 @@ def main() -> None:
 
     engine = create_engine_and_run_migrations(db_connection_str)
     instrumentation_cleanups = instrument_engine_if_enabled(engine)
-    factory = DbSessionFactory(db=_db(engine), dialect=engine.dialect.name)
+    replica_engine = None
+    if replica_connection_str := get_env_database_read_replica_connection_str():
+        # The replica follows the primary, so it is never migrated itself.
+        replica_engine = create_engine(connection_str=replica_connection_str, migrate=False)
+        instrumentation_cleanups.extend(instrument_engine_if_enabled(replica_engine))
+    if enable_prometheus:
+        from phoenix.server.prometheus import instrument_db_engine
+
+        instrument_db_engine(engine, "primary")
+        if replica_engine is not None:
+            instrument_db_engine(replica_engine, "replica")
+    factory = DbSessionFactory(
+        db=_db(engine),
+        dialect=engine.dialect.name,
+        read_replica=None if replica_engine is None else _db(replica_engine),
+        read_your_writes_seconds=get_env_database_read_your_writes_seconds(),
+        enable_prometheus=enable_prometheus,
+    )
     corpus_model = (
         None if corpus_inferences is None else create_model_from_inferences(corpus_inferences)
     )
@@ -3,7 +3,7 @@ import sys
 import time
 from functools import lru_cache
 from threading import Thread
-from typing import Optional
+from typing import Any, Optional
 
 import psutil
 from prometheus_client import (
@@ -12,6 +12,8 @@ from prometheus_client import (
     Summary,
     start_http_server,
 )
+from sqlalchemy import QueuePool, event
+from sqlalchemy.ext.asyncio import AsyncEngine
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.requests import Request
 from starlette.responses import Response
@@ -52,6 +54,54 @@ BULK_LOADER_EXCEPTIONS = Counter(
     name="bulk_loader_exceptions_total",
     documentation="Total count of bulk loader exceptions",
 )
+BULK_LOADER_SPAN_QUEUE_LENGTH = Gauge(
+    name="bulk_loader_span_queue_length",
+    documentation="Current number of spans waiting to be inserted by the bulk loader",
+)
+BULK_LOADER_SPAN_QUEUE_BYTES = Gauge(
+    name="bulk_loader_span_queue_bytes",
+    documentation="Current approximate size in bytes of spans waiting to be inserted",
+)
+BULK_LOADER_SPAN_QUEUE_TIME = Summary(
+    name="bulk_loader_span_queue_time_seconds_summary",
+    documentation="Summary of time spans spend waiting to be inserted (seconds)",
+)
+BULK_LOADER_SHED_REQUESTS = Counter(
+    name="bulk_loader_shed_requests_total",
+    documentation="Total count of span export requests rejected because the queue is full",
+)
+BULK_LOADER_SHED_SPANS = Counter(
+    name="bulk_loader_shed_spans_total",
+    documentation="Total count of spans rejected because the queue is full",
+)
+SPAN_SPOOL_BYTES = Gauge(
+    name="span_spool_bytes",
+    documentation="Current size in bytes of span export requests spooled but not yet inserted",
+)
+RETENTION_POLICY_DELETED_TRACES = Counter(
+    name="retention_policy_deleted_traces_total",
+    documentation="Total count of traces deleted by trace retention policies",
+)
+INSERTION_CACHE_HITS = Counter(
+    name="insertion_cache_hits_total",
+    documentation="Total count of span insertion cache hits by cache",
+    labelnames=["cache"],
+)
+INSERTION_CACHE_MISSES = Counter(
+    name="insertion_cache_misses_total",
+    documentation="Total count of span insertion cache misses by cache",
+    labelnames=["cache"],
+)
+DATALOADER_CACHE_HITS = Counter(
+    name="dataloader_cache_hits_total",
+    documentation="Total count of GraphQL data loader cache hits by cache",
+    labelnames=["cache"],
+)
+DATALOADER_CACHE_MISSES = Counter(
+    name="dataloader_cache_misses_total",
+    documentation="Total count of GraphQL data loader cache misses by cache",
+    labelnames=["cache"],
+)
 
 RATE_LIMITER_CACHE_SIZE = Gauge(
     name="rate_limiter_cache_size",
@@ -73,6 +123,46 @@ JWT_STORE_API_KEYS_ACTIVE = Gauge(
     documentation="Current number of API keys in the JWT store",
 )
 
+DB_POOL_CONNECTIONS = Gauge(
+    name="db_pool_connections",
+    documentation="Current number of connections of each database pool by state",
+    labelnames=["pool", "state"],
+)
+DB_QUERY_TIME = Summary(
+    name="db_query_time_seconds_summary",
+    documentation="Summary of database query execution time by pool (in seconds)",
+    labelnames=["pool"],
+)
+DB_READ_SESSIONS = Counter(
+    name="db_read_sessions_total",
+    documentation="Total count of read sessions by the pool they were opened on",
+    labelnames=["pool"],
+)
+
+
+def instrument_db_engine(engine: AsyncEngine, pool: str) -> None:
+    """
+    Exports the connections and the query times of the connection pool of an engine under
+    the given name, e.g. "primary" or "replica".
+    """
+    if isinstance(engine_pool := engine.sync_engine.pool, QueuePool):
+        DB_POOL_CONNECTIONS.labels(pool=pool, state="checked_out").set_function(
+            engine_pool.checkedout
+        )
+        DB_POOL_CONNECTIONS.labels(pool=pool, state="idle").set_function(engine_pool.checkedin)
+    query_time = DB_QUERY_TIME.labels(pool=pool)
+
+    def before_cursor_execute(*args: Any) -> None:
+        if (context := args[4]) is not None:
+            context._phoenix_query_start_time = time.perf_counter()
+
+    def after_cursor_execute(*args: Any) -> None:
+        if (start_time := getattr(args[4], "_phoenix_query_start_time", None)) is not None:
+            query_time.observe(time.perf_counter() - start_time)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", after_cursor_execute)
+
 
 class PrometheusMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
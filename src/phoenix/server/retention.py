@@ -1,36 +1,64 @@
 from __future__ import annotations
 
+import logging
 from asyncio import create_task, gather, sleep
+from collections.abc import Sequence
 from datetime import datetime, timedelta, timezone
 
 import sqlalchemy as sa
 from sqlalchemy.orm import selectinload
 
 from phoenix.db.constants import DEFAULT_PROJECT_TRACE_RETENTION_POLICY_ID
-from phoenix.db.models import Project, ProjectTraceRetentionPolicy
+from phoenix.db.models import Project, ProjectTraceRetentionPolicy, Trace
+from phoenix.db.rollups import subtract_traces
 from phoenix.server.dml_event import SpanDeleteEvent
 from phoenix.server.dml_event_handler import DmlEventHandler
 from phoenix.server.types import DaemonTask, DbSessionFactory
-from phoenix.utilities import hour_of_week
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TRACES_PER_CHUNK = 1000
+DEFAULT_SECONDS_BETWEEN_CHUNKS = 0.1
 
 
 class TraceDataSweeper(DaemonTask):
-    def __init__(self, db: DbSessionFactory, dml_event_handler: DmlEventHandler):
+    def __init__(
+        self,
+        db: DbSessionFactory,
+        dml_event_handler: DmlEventHandler,
+        *,
+        traces_per_chunk: int = DEFAULT_TRACES_PER_CHUNK,
+        seconds_between_chunks: float = DEFAULT_SECONDS_BETWEEN_CHUNKS,
+        enable_prometheus: bool = False,
+    ):
+        """
+        :param traces_per_chunk: The maximum number of traces deleted per transaction.
+        :param seconds_between_chunks: The time to sleep between transactions, so that
+        ingestion and queries aren't starved while a policy is applied.
+        :param enable_prometheus: Whether Prometheus is enabled.
+        """
         super().__init__()
         self._db = db
         self._dml_event_handler = dml_event_handler
+        self._traces_per_chunk = traces_per_chunk
+        self._seconds_between_chunks = seconds_between_chunks
+        self._enable_prometheus = enable_prometheus
 
     async def _run(self) -> None:
         """Check hourly and apply policies."""
+        # The time at which each policy was last applied is stored with the policy, so a
+        # sweep that was interrupted by a restart, or missed while the server was down, is
+        # caught up on the first check after startup, while other policies keep waiting
+        # for their next scheduled run.
         while self._running:
             await self._sleep_until_next_hour()
             if not (policies := await self._get_policies()):
                 continue
-            current_hour = self._current_hour()
+            now = self._now()
             if tasks := [
-                create_task(self._apply(policy))
+                create_task(self._apply(policy, now))
                 for policy in policies
-                if self._should_apply(policy, current_hour)
+                if self._should_apply(policy, now)
             ]:
                 await gather(*tasks, return_exceptions=True)
 
@@ -47,17 +75,16 @@ class TraceDataSweeper(DaemonTask):
     def _now() -> datetime:
         return datetime.now(timezone.utc)
 
-    def _current_hour(self) -> int:
-        return hour_of_week(self._now())
-
-    def _should_apply(self, policy: ProjectTraceRetentionPolicy, current_hour: int) -> bool:
-        if current_hour != policy.cron_expression.get_hour_of_prev_run():
-            return False
+    def _should_apply(self, policy: ProjectTraceRetentionPolicy, now: datetime) -> bool:
         if policy.id != DEFAULT_PROJECT_TRACE_RETENTION_POLICY_ID and not policy.projects:
             return False
-        return True
+        prev_run = policy.cron_expression.get_time_of_prev_run(now)
+        if policy.last_applied_at is None:
+            # a policy that was never applied waits for its first scheduled run
+            return prev_run == now.replace(minute=0, second=0, microsecond=0)
+        return policy.last_applied_at < prev_run
 
-    async def _apply(self, policy: ProjectTraceRetentionPolicy) -> None:
+    async def _apply(self, policy: ProjectTraceRetentionPolicy, now: datetime) -> None:
         project_rowids = (
             (
                 sa.select(Project.id)
@@ -67,9 +94,51 @@ class TraceDataSweeper(DaemonTask):
             if policy.id == DEFAULT_PROJECT_TRACE_RETENTION_POLICY_ID
             else [p.id for p in policy.projects]
         )
+        # Delete the oldest traces first, in chunks, each in its own transaction, so that
+        # locks are held briefly and the progress survives an interruption.
+        chunk = (
+            sa.select(Trace.id)
+            .where(Trace.project_rowid.in_(project_rowids))
+            .where(policy.rule.trace_filter)
+            .order_by(Trace.start_time)
+            .limit(self._traces_per_chunk)
+        )
+        num_deleted = 0
+        while self._running:
+            async with self._db() as session:
+                result: Sequence[int] = []
+                if trace_rowids := (await session.scalars(chunk)).all():
+                    await subtract_traces(session, Trace.id.in_(trace_rowids))
+                    result = (
+                        await session.scalars(
+                            sa.delete(Trace)
+                            .where(Trace.id.in_(trace_rowids))
+                            .returning(Trace.project_rowid)
+                        )
+                    ).all()
+            if result:
+                num_deleted += len(result)
+                self._dml_event_handler.put(SpanDeleteEvent(tuple(set(result))))
+                if self._enable_prometheus:
+                    from phoenix.server.prometheus import RETENTION_POLICY_DELETED_TRACES
+
+                    RETENTION_POLICY_DELETED_TRACES.inc(len(result))
+                logger.debug(
+                    f"Trace retention policy {policy.id} has deleted {num_deleted} traces so far"
+                )
+            if len(result) < self._traces_per_chunk:
+                break
+            await sleep(self._seconds_between_chunks)
+        if not self._running:
+            return
         async with self._db() as session:
-            result = await policy.rule.delete_traces(session, project_rowids)
-        self._dml_event_handler.put(SpanDeleteEvent(tuple(result)))
+            await session.execute(
+                sa.update(ProjectTraceRetentionPolicy)
+                .where(ProjectTraceRetentionPolicy.id == policy.id)
+                .values(last_applied_at=now)
+            )
+        if num_deleted:
+            logger.info(f"Trace retention policy {policy.id} deleted {num_deleted} traces")
 
     async def _sleep_until_next_hour(self) -> None:
         next_hour = self._now().replace(minute=0, second=0, microsecond=0) + timedelta(hours=1)
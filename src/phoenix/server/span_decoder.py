@@ -0,0 +1,137 @@
+import asyncio
+import os
+from collections.abc import Iterable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain
+from typing import Any, Optional
+
+import opentelemetry.proto.trace.v1.trace_pb2 as otlp
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+from opentelemetry.proto.trace.v1.trace_pb2 import ResourceSpans
+from typing_extensions import TypeAlias
+
+from phoenix.trace.otel import decode_otlp_span
+from phoenix.trace.schemas import Span
+from phoenix.utilities.project import get_project_name
+
+ProjectName: TypeAlias = str
+
+DEFAULT_MAX_PROCESSES = 4
+DEFAULT_MAX_SPANS_PER_TASK = 100
+
+
+class SpanDecoder:
+    """
+    Decodes OTLP export requests into spans on a pool of workers, so that decoding large
+    requests doesn't stall the event loop. The spans of each `ResourceSpans` are handed to
+    the pool in batches, and the decoded spans are returned as a single list.
+
+    With a thread pool, decoding still contends with the event loop for the GIL, so adding
+    threads beyond the first only adds contention. A process pool decodes in parallel at
+    the cost of serializing the OTLP spans in and the decoded spans out.
+
+    Decoding happens on the event loop if the pool is disabled (i.e. `max_workers` is 0)
+    or if the decoder is used outside of its async context.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        *,
+        use_processes: bool = False,
+        max_spans_per_task: int = DEFAULT_MAX_SPANS_PER_TASK,
+    ) -> None:
+        """
+        :param max_workers: The number of workers in the pool. Defaults to 1 for a thread
+        pool, and to the lesser of 4 and the number of CPUs for a process pool. Set to 0 to
+        decode on the event loop.
+        :param use_processes: Whether to use a process pool instead of a thread pool.
+        :param max_spans_per_task: The maximum number of spans decoded per task.
+        """
+        if max_workers is None:
+            max_workers = min(DEFAULT_MAX_PROCESSES, os.cpu_count() or 1) if use_processes else 1
+        if max_workers < 0:
+            raise ValueError("max_workers must be non-negative")
+        if max_spans_per_task < 1:
+            raise ValueError("max_spans_per_task must be positive")
+        self._max_workers = max_workers
+        self._use_processes = use_processes
+        self._max_spans_per_task = max_spans_per_task
+        self._executor: Optional[Executor] = None
+
+    async def __aenter__(self) -> None:
+        if not self._max_workers:
+            return
+        self._executor = (
+            ProcessPoolExecutor(self._max_workers)
+            if self._use_processes
+            else ThreadPoolExecutor(self._max_workers, thread_name_prefix="span-decoder")
+        )
+
+    async def __aexit__(self, *args: Any, **kwargs: Any) -> None:
+        if self._executor is None:
+            return
+        executor, self._executor = self._executor, None
+        await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
+
+    async def decode(self, request: ExportTraceServiceRequest) -> list[tuple[Span, ProjectName]]:
+        if (executor := self._executor) is None:
+            return list(
+                chain.from_iterable(map(decode_otlp_resource_spans, request.resource_spans))
+            )
+        loop = asyncio.get_running_loop()
+        futures: list[asyncio.Future[list[tuple[Span, ProjectName]]]] = []
+        for resource_spans in request.resource_spans:
+            project_name = get_project_name(resource_spans.resource.attributes)
+            otlp_spans = [
+                s for scope_spans in resource_spans.scope_spans for s in scope_spans.spans
+            ]
+            for i in range(0, len(otlp_spans), self._max_spans_per_task):
+                batch = otlp_spans[i : i + self._max_spans_per_task]
+                if self._use_processes:
+                    futures.append(
+                        loop.run_in_executor(
+                            executor,
+                            _decode_serialized_otlp_spans,
+                            [otlp_span.SerializeToString() for otlp_span in batch],
+                            project_name,
+                        )
+                    )
+                    # Yield between batches, since serialization happens on the event loop.
+                    await asyncio.sleep(0)
+                else:
+                    futures.append(
+                        loop.run_in_executor(executor, _decode_otlp_spans, batch, project_name)
+                    )
+        return list(chain.from_iterable(await asyncio.gather(*futures)))
+
+
+def count_otlp_spans(request: ExportTraceServiceRequest) -> int:
+    return sum(
+        len(scope_spans.spans)
+        for resource_spans in request.resource_spans
+        for scope_spans in resource_spans.scope_spans
+    )
+
+
+def decode_otlp_resource_spans(resource_spans: ResourceSpans) -> list[tuple[Span, ProjectName]]:
+    project_name = get_project_name(resource_spans.resource.attributes)
+    return [
+        (decode_otlp_span(otlp_span), project_name)
+        for scope_spans in resource_spans.scope_spans
+        for otlp_span in scope_spans.spans
+    ]
+
+
+def _decode_otlp_spans(
+    otlp_spans: Iterable[otlp.Span],
+    project_name: ProjectName,
+) -> list[tuple[Span, ProjectName]]:
+    return [(decode_otlp_span(otlp_span), project_name) for otlp_span in otlp_spans]
+
+
+def _decode_serialized_otlp_spans(
+    data: Iterable[bytes],
+    project_name: ProjectName,
+) -> list[tuple[Span, ProjectName]]:
+    return _decode_otlp_spans(map(otlp.Span.FromString, data), project_name)
@@ -0,0 +1,337 @@
+"""
+Write-ahead spool for OTLP trace export requests.
+
+When the spool is enabled, the OTLP receivers append each export request to the spool and
+acknowledge it once it is on disk, instead of handing the decoded spans to the
+`BulkInserter` directly. A `SpanSpoolReader` feeds the spooled requests to the
+`BulkInserter` as fast as its span buffer allows, and the `BulkInserter` commits the
+spool up to the last request it has inserted, at which point fully inserted segments are
+deleted. Whatever has not been committed is replayed when the server starts again.
+
+The spool is a directory of append-only segment files, named after the position (i.e.
+the byte offset in the spool as a whole) of their first record. Each record is an
+`ExportTraceServiceRequest`, prefixed with its length and CRC-32. The files are only
+written on a dedicated thread, so that appends and commits don't block the event loop.
+Appends are fsync'd in groups, so that concurrent requests share the cost of an fsync. The
+committed position is kept in a checkpoint file, which is not fsync'd: losing it only
+causes requests to be replayed, and spans that already exist are skipped on insertion.
+"""
+
+import asyncio
+import logging
+import os
+import struct
+import zlib
+from asyncio import QueueFull
+from bisect import bisect_right
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, BinaryIO, Optional, TypeVar
+
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+from typing_extensions import TypeAlias
+
+from phoenix.db.insertion.constants import DEFAULT_MAX_SPAN_SPOOL_BYTES
+from phoenix.server.span_decoder import SpanDecoder, count_otlp_spans
+from phoenix.server.types import DaemonTask
+from phoenix.trace.schemas import Span
+
+logger = logging.getLogger(__name__)
+
+ProjectName: TypeAlias = str
+Position: TypeAlias = int
+
+DEFAULT_MAX_SEGMENT_BYTES = 16 * 2**20
+DEFAULT_MAX_BYTES_PER_READ = 4 * 2**20
+
+_HEADER = struct.Struct("<II")  # payload length, CRC-32 of payload
+_SEGMENT_SUFFIX = ".spool"
+_CHECKPOINT = "checkpoint"
+
+_T = TypeVar("_T")
+
+
+class SpanSpool:
+    def __init__(
+        self,
+        directory: Path,
+        *,
+        max_bytes: int = DEFAULT_MAX_SPAN_SPOOL_BYTES,
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+        enable_prometheus: bool = False,
+    ) -> None:
+        """
+        :param directory: The directory holding the spool's files.
+        :param max_bytes: The maximum number of uncommitted bytes in the spool before
+        appends are rejected.
+        :param max_segment_bytes: The size in bytes beyond which a new segment is started.
+        :param enable_prometheus: Whether Prometheus is enabled.
+        """
+        self._directory = Path(directory)
+        self._max_bytes = max_bytes
+        self._max_segment_bytes = max_segment_bytes
+        self._enable_prometheus = enable_prometheus
+        self._segments: list[Position] = []
+        self._file: Optional[BinaryIO] = None
+        self._unsynced_files: list[BinaryIO] = []
+        self._directory_unsynced = False
+        self._end_position: Position = 0
+        self._pending_bytes = 0
+        self._synced_position: Position = 0
+        self._committed_position: Position = 0
+        self._sync_lock = asyncio.Lock()
+        self._synced = asyncio.Event()
+        # All writes to the spool's files happen on this one thread, in the order in which
+        # they are submitted, so that the event loop never blocks on the disk.
+        self._writer: Optional[ThreadPoolExecutor] = None
+
+    async def __aenter__(self) -> None:
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="SpanSpool")
+        await self._run_in_writer(self._recover)
+        self._update_metrics()
+
+    async def __aexit__(self, *args: Any, **kwargs: Any) -> None:
+        if self._writer is None:
+            return
+        try:
+            if self._file is not None:
+                await self._sync(self._end_position)
+                await self._run_in_writer(self._close)
+        finally:
+            self._writer.shutdown()
+            self._writer = None
+
+    @property
+    def committed_position(self) -> Position:
+        return self._committed_position
+
+    @property
+    def num_bytes(self) -> int:
+        """The number of bytes appended but not yet committed."""
+        return self._end_position - self._committed_position
+
+    async def append(self, data: bytes) -> None:
+        """
+        Appends a serialized `ExportTraceServiceRequest` and returns once it is on disk.
+        Raises `QueueFull` if the spool has no room for it.
+        """
+        assert self._file is not None, "spool is not open"
+        size = _HEADER.size + len(data)
+        num_bytes = self.num_bytes + self._pending_bytes
+        if num_bytes and num_bytes + size > self._max_bytes:
+            if self._enable_prometheus:
+                from phoenix.server.prometheus import BULK_LOADER_SHED_REQUESTS
+
+                BULK_LOADER_SHED_REQUESTS.inc()
+            raise QueueFull
+        self._pending_bytes += size
+        try:
+            end = await self._run_in_writer(self._write, data)
+        finally:
+            self._pending_bytes -= size
+        self._update_metrics()
+        await self._sync(end)
+
+    def read(
+        self,
+        position: Position,
+        max_bytes: int = DEFAULT_MAX_BYTES_PER_READ,
+    ) -> list[tuple[bytes, Position]]:
+        """
+        Reads the records on disk from the given position onward, up to about `max_bytes`.
+        Returns each record along with the position following it. This is a blocking call.
+        """
+        records: list[tuple[bytes, Position]] = []
+        num_bytes, end, segments = 0, self._synced_position, self._segments
+        while position < end and num_bytes < max_bytes:
+            i = bisect_right(segments, position) - 1
+            start = segments[i]
+            segment_end = min(end, segments[i + 1]) if i + 1 < len(segments) else end
+            with open(self._segment_path(start), "rb") as f:
+                f.seek(position - start)
+                while position < segment_end and num_bytes < max_bytes:
+                    length, _ = _HEADER.unpack(f.read(_HEADER.size))
+                    records.append((f.read(length), position := position + _HEADER.size + length))
+                    num_bytes += length
+        return records
+
+    async def wait(self, position: Position) -> None:
+        """
+        Waits until there are records on disk beyond the given position.
+        """
+        while self._synced_position <= position:
+            self._synced.clear()
+            await self._synced.wait()
+
+    async def commit(self, position: Position) -> None:
+        """
+        Marks the records before the given position as inserted, and deletes the segments
+        that only contain such records.
+        """
+        if position <= self._committed_position:
+            return
+        self._committed_position = position
+        await self._run_in_writer(self._checkpoint, position)
+        self._update_metrics()
+
+    async def _run_in_writer(self, func: Callable[..., _T], *args: Any) -> _T:
+        assert self._writer is not None, "spool is not open"
+        return await asyncio.get_running_loop().run_in_executor(self._writer, func, *args)
+
+    def _write(self, data: bytes) -> Position:
+        """Writes a record on the writer thread, and returns the position following it."""
+        assert self._file is not None
+        if self._end_position - self._segments[-1] >= self._max_segment_bytes:
+            self._start_segment()
+        self._file.write(_HEADER.pack(len(data), zlib.crc32(data)))
+        self._file.write(data)
+        self._end_position += _HEADER.size + len(data)
+        return self._end_position
+
+    def _checkpoint(self, position: Position) -> None:
+        checkpoint = self._directory / _CHECKPOINT
+        tmp = checkpoint.with_suffix(".tmp")
+        tmp.write_text(str(position))
+        os.replace(tmp, checkpoint)
+        # The list is replaced rather than modified, since `read` may be using it.
+        segments = self._segments
+        num_deleted = 0
+        while num_deleted + 1 < len(segments) and segments[num_deleted + 1] <= position:
+            self._segment_path(segments[num_deleted]).unlink(missing_ok=True)
+            num_deleted += 1
+        if num_deleted:
+            self._segments = segments[num_deleted:]
+
+    def _start_segment(self) -> None:
+        if self._file is not None:
+            self._unsynced_files.append(self._file)
+        self._file = open(self._segment_path(self._end_position), "ab")
+        self._segments = [*self._segments, self._end_position]
+        self._directory_unsynced = True
+
+    async def _sync(self, position: Position) -> None:
+        async with self._sync_lock:
+            if position <= self._synced_position:
+                # Another append's fsync covered this one.
+                return
+            self._synced_position = await self._run_in_writer(self._fsync)
+            self._synced.set()
+
+    def _fsync(self) -> Position:
+        """
+        Flushes and fsyncs everything written so far on the writer thread, and returns the
+        position up to which the spool is on disk.
+        """
+        assert self._file is not None
+        files, self._unsynced_files = [*self._unsynced_files, self._file], []
+        sync_directory, self._directory_unsynced = self._directory_unsynced, False
+        for f in files:
+            f.flush()
+            os.fsync(f.fileno())
+            if f is not self._file:
+                f.close()
+        if sync_directory and hasattr(os, "O_DIRECTORY"):
+            fd = os.open(self._directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        return self._end_position
+
+    def _close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _recover(self) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        checkpoint = self._directory / _CHECKPOINT
+        committed = int(checkpoint.read_text()) if checkpoint.exists() else 0
+        segments = sorted(int(path.stem) for path in self._directory.glob(f"*{_SEGMENT_SUFFIX}"))
+        while len(segments) > 1 and segments[1] <= committed:
+            self._segment_path(segments.pop(0)).unlink()
+        if not segments:
+            segments = [committed]
+            self._segment_path(committed).touch()
+        # Only the last segment can end with a torn write.
+        last = self._segment_path(segments[-1])
+        size = _valid_size(last)
+        if size < last.stat().st_size:
+            logger.warning(f"Truncating torn write at the end of span spool segment {last}")
+            os.truncate(last, size)
+        self._segments = segments
+        self._end_position = self._synced_position = segments[-1] + size
+        self._committed_position = min(max(committed, segments[0]), self._end_position)
+        self._file = open(last, "ab")
+        if self.num_bytes:
+            logger.info(f"Replaying {self.num_bytes} bytes of spooled spans")
+
+    def _segment_path(self, start: Position) -> Path:
+        return self._directory / f"{start:020d}{_SEGMENT_SUFFIX}"
+
+    def _update_metrics(self) -> None:
+        if self._enable_prometheus:
+            from phoenix.server.prometheus import SPAN_SPOOL_BYTES
+
+            SPAN_SPOOL_BYTES.set(self.num_bytes)
+
+
+class SpanSpoolReader(DaemonTask):
+    """
+    Feeds the requests in the spool to the `BulkInserter`, starting from the committed
+    position, as fast as the span buffer of the `BulkInserter` allows.
+    """
+
+    def __init__(
+        self,
+        spool: SpanSpool,
+        span_decoder: SpanDecoder,
+        queue_spans: Callable[
+            [Iterable[tuple[Span, ProjectName]], int, Optional[Position]], Awaitable[None]
+        ],
+        has_span_capacity: Callable[[int, int], bool],
+        sleep_seconds: float = 0.1,
+    ) -> None:
+        super().__init__()
+        self._spool = spool
+        self._span_decoder = span_decoder
+        self._queue_spans = queue_spans
+        self._has_span_capacity = has_span_capacity
+        self._seconds = sleep_seconds
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        position = self._spool.committed_position
+        while self._running:
+            await self._spool.wait(position)
+            records = await loop.run_in_executor(None, self._spool.read, position)
+            for data, end in records:
+                try:
+                    request = ExportTraceServiceRequest.FromString(data)
+                    num_spans = count_otlp_spans(request)
+                    while not self._has_span_capacity(num_spans, len(data)):
+                        await asyncio.sleep(self._seconds)
+                    spans = await self._span_decoder.decode(request)
+                except asyncio.CancelledError:
+                    raise
+                except Exception:
+                    logger.exception("Failed to decode spooled spans")
+                    spans = []
+                await self._queue_spans(spans, len(data), end)
+                position = end
+
+
+def _valid_size(path: Path) -> int:
+    """
+    Returns the size of the prefix of the segment that consists of complete records.
+    """
+    size = 0
+    with open(path, "rb") as f:
+        while len(header := f.read(_HEADER.size)) == _HEADER.size:
+            length, crc = _HEADER.unpack(header)
+            data = f.read(length)
+            if len(data) < length or zlib.crc32(data) != crc:
+                break
+            size += _HEADER.size + length
+    return size
@@ -6,7 +6,9 @@ from collections import defaultdict
 from collections.abc import Callable, Iterator
 from contextlib import AbstractAsyncContextManager
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from time import monotonic
 from typing import Any, Generic, Optional, Protocol, TypeVar, final
 
 from cachetools import LRUCache
@@ -25,18 +27,111 @@ class CanGetLastUpdatedAt(Protocol):
     def get(self, table: type[models.Base], id_: Optional[int] = None) -> Optional[datetime]: ...
 
 
+DEFAULT_READ_YOUR_WRITES_SECONDS = 5.0
+
+
 class DbSessionFactory:
+    """
+    Opens sessions on the primary database, which is where all writes go, and, given a
+    read-only replica, opens read sessions on the replica, so that heavy reads don't compete
+    with writes. Replicas may lag behind the primary, so for a while after a user writes,
+    that user's read sessions are opened on the primary, so that they read their own writes.
+    """
+
     def __init__(
         self,
         db: Callable[[], AbstractAsyncContextManager[AsyncSession]],
         dialect: str,
+        read_replica: Optional[Callable[[], AbstractAsyncContextManager[AsyncSession]]] = None,
+        read_your_writes_seconds: float = DEFAULT_READ_YOUR_WRITES_SECONDS,
+        enable_prometheus: bool = False,
     ):
         self._db = db
         self.dialect = SupportedSQLDialect(dialect)
+        self._read_replica = read_replica
+        self._read_your_writes_seconds = read_your_writes_seconds
+        self._enable_prometheus = enable_prometheus
+        self._last_write_times: LRUCache[Optional[UserId], float] = LRUCache(maxsize=10_000)
+        self._primary: Optional[DbSessionFactory] = None
 
     def __call__(self) -> AbstractAsyncContextManager[AsyncSession]:
+        """
+        Opens a session on the primary database, for writes, and for reads that have to be
+        up to date.
+        """
         return self._db()
 
+    @property
+    def has_read_replica(self) -> bool:
+        return self._read_replica is not None
+
+    def read(self, user_id: Optional[UserId] = None) -> AbstractAsyncContextManager[AsyncSession]:
+        """
+        Opens a session for reads on behalf of a user, or on behalf of anonymous users if
+        authentication is disabled, on the read replica, unless there is none or the user
+        wrote recently, in which case the session is opened on the primary.
+        """
+        if self._read_replica is None:
+            return self._db()
+        last_write_time = self._last_write_times.get(user_id)
+        if last_write_time is not None and (
+            monotonic() - last_write_time < self._read_your_writes_seconds
+        ):
+            pool, db = "primary", self._db
+        else:
+            pool, db = "replica", self._read_replica
+        if self._enable_prometheus:
+            from phoenix.server.prometheus import DB_READ_SESSIONS
+
+            DB_READ_SESSIONS.labels(pool=pool).inc()
+        return db()
+
+    def reader(self, user_id: Optional[UserId] = None) -> DbSessionFactory:
+        """
+        A factory whose sessions are the read sessions of a user, for code that takes a
+        factory, such as data loaders. Whether a session goes to the replica is decided each
+        time one is opened.
+        """
+        if self._primary is not None:
+            return self._primary.reader(user_id)
+        if self._read_replica is None:
+            return self
+        reader = DbSessionFactory(db=partial(self.read, user_id), dialect=self.dialect.value)
+        reader._primary = self
+        return reader
+
+    def read_from_primary(self) -> None:
+        """
+        Makes a reader open all of its sessions from now on on the primary, e.g. for the rest
+        of a request that writes, or that has to see the latest writes of any user.
+        """
+        if self._primary is not None:
+            self._db = self._primary._db
+
+    def read_updates_since(self, updated_at: Optional[datetime]) -> None:
+        """
+        Makes a reader open all of its sessions from now on on the primary if what it is about
+        to read was updated, as of `updated_at`, so recently that the replica may not have
+        caught up yet, e.g. when the UI refetches a project because it was streamed new spans.
+        """
+        if (
+            (primary := self._primary) is not None
+            and updated_at is not None
+            and datetime.now(timezone.utc) - updated_at
+            < timedelta(seconds=primary._read_your_writes_seconds)
+        ):
+            self.read_from_primary()
+
+    def record_write(self, user_id: Optional[UserId] = None) -> None:
+        """
+        Records that a user wrote to the primary, so that their reads go to the primary for a
+        while.
+        """
+        if self._primary is not None:
+            self._primary.record_write(user_id)
+        elif self._read_replica is not None:
+            self._last_write_times[user_id] = monotonic()
+
 
 _AnyT = TypeVar("_AnyT")
 _ItemT_contra = TypeVar("_ItemT_contra", contravariant=True)
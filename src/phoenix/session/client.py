@@ -2,10 +2,10 @@ import csv
 import gzip
 import logging
 import re
-from collections import Counter
-from collections.abc import Iterable, Mapping, Sequence
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from datetime import datetime
-from io import BytesIO
+from io import BufferedReader, BytesIO, RawIOBase
 from pathlib import Path
 from typing import Any, BinaryIO, Literal, Optional, Union, cast
 from urllib.parse import quote, urljoin
@@ -40,6 +40,11 @@ from phoenix.utilities.json import decode_df_from_json_string
 logger = logging.getLogger(__name__)
 
 DEFAULT_TIMEOUT_IN_SECONDS = 5
+DEFAULT_SPAN_CHUNK_SIZE = 10_000
+
+# The key in the schema metadata of each chunk of a streamed span query response that
+# holds the index of the query the chunk belongs to.
+_QUERY_INDEX_METADATA_KEY = b"phoenix.query_index"
 
 DatasetAction: TypeAlias = Literal["create", "append"]
 
@@ -123,6 +128,7 @@ class Client(TraceDataExtractor):
         stop_time: Optional[datetime] = None,
         timeout: Optional[int] = DEFAULT_TIMEOUT_IN_SECONDS,
         orphan_span_as_root_span: bool = True,
+        chunk_size: Optional[int] = None,
     ) -> Optional[Union[pd.DataFrame, list[pd.DataFrame]]]:
         """
         Queries spans from the Phoenix server or active session based on specified criteria.
@@ -138,6 +144,10 @@ class Client(TraceDataExtractor):
             project_name (str, optional): The project name to query spans for. This can be set
                 using environment variables. If not provided, falls back to the default project.
             timeout (int, optional): The number of seconds to wait for the server to respond.
+            chunk_size (int, optional): If provided, the server streams the results in chunks
+                of up to this many spans, so that large results need not be held in the
+                server's memory all at once. The chunks are concatenated as they arrive. See
+                also `iter_spans_dataframes`. Default None.
 
         Returns:
             Union[pd.DataFrame, list[pd.DataFrame]]:
@@ -153,6 +163,30 @@ class Client(TraceDataExtractor):
                 "stop_time is deprecated. Use end_time instead.",
             )
             end_time = end_time or stop_time
+        request_body = {
+            "queries": [q.to_dict() for q in queries],
+            "start_time": _to_iso_format(normalize_datetime(start_time)),
+            "end_time": _to_iso_format(normalize_datetime(end_time)),
+            "limit": limit,
+            "root_spans_only": root_spans_only,
+            "orphan_span_as_root_span": orphan_span_as_root_span,
+        }
+        if chunk_size is not None:
+            chunks: defaultdict[int, list[pd.DataFrame]] = defaultdict(list)
+            for i, df in self._query_span_chunks(
+                project_name, {**request_body, "chunk_size": chunk_size}, timeout
+            ):
+                chunks[i].append(df)
+            if not chunks:
+                return None
+            results = [
+                pd.concat(chunks[i]) if len(chunks[i]) > 1 else chunks[i][0]
+                for i in range(len(queries))
+            ]
+            if len(results) == 1:
+                df = results[0]
+                return None if df.shape == (0, 0) else df
+            return results
         try:
             response = self._client.post(
                 url="v1/spans",
@@ -161,31 +195,11 @@ class Client(TraceDataExtractor):
                     "project_name": project_name,
                     "project-name": project_name,  # for backward-compatibility
                 },
-                json={
-                    "queries": [q.to_dict() for q in queries],
-                    "start_time": _to_iso_format(normalize_datetime(start_time)),
-                    "end_time": _to_iso_format(normalize_datetime(end_time)),
-                    "limit": limit,
-                    "root_spans_only": root_spans_only,
-                    "orphan_span_as_root_span": orphan_span_as_root_span,
-                },
+                json=request_body,
                 timeout=timeout,
             )
         except httpx.TimeoutException as error:
-            error_message = (
-                (
-                    f"The request timed out after {timeout} seconds. The timeout can be increased "
-                    "by passing a larger value to the `timeout` parameter "
-                    "and can be disabled altogether by passing `None`."
-                )
-                if timeout is not None
-                else (
-                    "The request timed out. The timeout can be adjusted by "
-                    "passing a number of seconds to the `timeout` parameter "
-                    "and can be disabled altogether by passing `None`."
-                )
-            )
-            raise TimeoutError(error_message) from error
+            raise TimeoutError(_timeout_error_message(timeout)) from error
         if response.status_code == 404:
             logger.info("No spans found.")
             return None
@@ -223,6 +237,88 @@ class Client(TraceDataExtractor):
             return None if df.shape == (0, 0) else df
         return results
 
+    def iter_spans_dataframes(
+        self,
+        query: Optional[SpanQuery] = None,
+        *,
+        chunk_size: int = DEFAULT_SPAN_CHUNK_SIZE,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: Optional[int] = DEFAULT_SPAN_LIMIT,
+        root_spans_only: Optional[bool] = None,
+        project_name: Optional[str] = None,
+        timeout: Optional[int] = DEFAULT_TIMEOUT_IN_SECONDS,
+        orphan_span_as_root_span: bool = True,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Queries spans from the Phoenix server and yields the results in chunks as the server
+        streams them, so that neither the server nor the client needs to hold all of the
+        results in memory at once.
+
+        Args:
+            query (SpanQuery, optional): The query to run. Defaults to all spans.
+            chunk_size (int): The maximum number of spans in each chunk. Default 10,000.
+            start_time (datetime, optional): The start time for the query range. Default None.
+            end_time (datetime, optional): The end time for the query range. Default None.
+            limit (int, optional): The maximum number of spans to return. Default 1000.
+            root_spans_only (bool, optional): If True, only root spans are returned. Default None.
+            project_name (str, optional): The project name to query spans for. This can be set
+                using environment variables. If not provided, falls back to the default project.
+            timeout (int, optional): The number of seconds to wait for each chunk.
+            orphan_span_as_root_span (bool): If True, orphan spans are treated as root spans.
+                Default True.
+
+        Yields:
+            pd.DataFrame: The queried span data, in chunks of up to `chunk_size` spans. The
+                attribute columns of each chunk are those present in that chunk.
+        """
+        project_name = project_name or get_env_project_name()
+        request_body = {
+            "queries": [(query or SpanQuery()).to_dict()],
+            "start_time": _to_iso_format(normalize_datetime(start_time)),
+            "end_time": _to_iso_format(normalize_datetime(end_time)),
+            "limit": limit,
+            "root_spans_only": root_spans_only,
+            "orphan_span_as_root_span": orphan_span_as_root_span,
+            "chunk_size": chunk_size,
+        }
+        for _, df in self._query_span_chunks(project_name, request_body, timeout):
+            if not df.empty:
+                yield df
+
+    def _query_span_chunks(
+        self,
+        project_name: str,
+        request_body: Mapping[str, Any],
+        timeout: Optional[int],
+    ) -> Iterator[tuple[int, pd.DataFrame]]:
+        """
+        Yields the index of the query and the DataFrame of each chunk of the span query
+        results streamed by the server.
+        """
+        try:
+            with self._client.stream(
+                "POST",
+                url="v1/spans",
+                headers={"accept": "application/x-pandas-arrow"},
+                params={"project_name": project_name},
+                json=request_body,
+                timeout=timeout,
+            ) as response:
+                if response.status_code == 404:
+                    logger.info("No spans found.")
+                    return
+                elif response.status_code == 422:
+                    raise ValueError(response.read().decode())
+                response.raise_for_status()
+                source = BufferedReader(_ResponseStream(response.iter_bytes()))
+                while source.peek(1):
+                    with pa.ipc.open_stream(source) as reader:
+                        query_index = int(reader.schema.metadata[_QUERY_INDEX_METADATA_KEY])
+                        yield query_index, reader.read_pandas()
+        except httpx.TimeoutException as error:
+            raise TimeoutError(_timeout_error_message(timeout)) from error
+
     def get_evaluations(
         self,
         project_name: Optional[str] = None,
@@ -868,6 +964,45 @@ def _infer_keys(
     )
 
 
+class _ResponseStream(RawIOBase):
+    """
+    A readable file over the chunks of bytes of a streaming response, so that the Arrow
+    IPC streams in the response can be read as they arrive.
+    """
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = chunks
+        self._chunk = b""
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._chunk:
+            if (chunk := next(self._chunks, None)) is None:
+                return 0
+            self._chunk = chunk
+        size = min(len(buffer), len(self._chunk))
+        buffer[:size], self._chunk = self._chunk[:size], self._chunk[size:]
+        return size
+
+
+def _timeout_error_message(timeout: Optional[int]) -> str:
+    return (
+        (
+            f"The request timed out after {timeout} seconds. The timeout can be increased "
+            "by passing a larger value to the `timeout` parameter "
+            "and can be disabled altogether by passing `None`."
+        )
+        if timeout is not None
+        else (
+            "The request timed out. The timeout can be adjusted by "
+            "passing a number of seconds to the `timeout` parameter "
+            "and can be disabled altogether by passing `None`."
+        )
+    )
+
+
 def _to_iso_format(value: Optional[datetime]) -> Optional[str]:
     return value.isoformat() if value else None
 
@@ -4,13 +4,14 @@ import sys
 import typing
 from dataclasses import dataclass, field
 from difflib import SequenceMatcher
+from functools import lru_cache
 from itertools import chain
-from types import MappingProxyType
+from types import CodeType, MappingProxyType
 from uuid import uuid4
 
 import sqlalchemy
 from sqlalchemy import case, literal
-from sqlalchemy.orm import Mapped, aliased
+from sqlalchemy.orm import aliased
 from sqlalchemy.orm.util import AliasedClass
 from sqlalchemy.sql.expression import ColumnElement, Select
 from typing_extensions import TypeAlias, TypeGuard, assert_never
@@ -153,32 +154,25 @@ class SpanFilter:
     translated: ast.Expression = field(init=False, repr=False)
     compiled: typing.Any = field(init=False, repr=False)
     _aliased_annotation_relations: tuple[AliasedAnnotationRelation] = field(init=False, repr=False)
-    _aliased_annotation_attributes: dict[str, Mapped[typing.Any]] = field(init=False, repr=False)
+    _aliased_annotation_attributes: dict[str, ColumnElement[typing.Any]] = field(
+        init=False, repr=False
+    )
 
     def __bool__(self) -> bool:
         return bool(self.condition)
 
     def __post_init__(self) -> None:
-        if not (source := self.condition):
+        if not self.condition:
             return
-        root = ast.parse(source, mode="eval")
-        _validate_expression(root, valid_eval_names=self.valid_eval_names)
-        source, aliased_annotation_relations = _apply_eval_aliasing(source)
-        root = ast.parse(source, mode="eval")
-        translated = _FilterTranslator(
-            reserved_keywords=(
-                alias
-                for aliased_annotation in aliased_annotation_relations
-                for alias, _ in aliased_annotation.attributes
-            ),
-        ).visit(root)
-        ast.fix_missing_locations(translated)
-        compiled = compile(translated, filename="", mode="eval")
-        aliased_annotation_attributes = {
-            alias: attribute
-            for aliased_annotation in aliased_annotation_relations
-            for alias, attribute in aliased_annotation.attributes
-        }
+        (
+            translated,
+            compiled,
+            aliased_annotation_relations,
+            aliased_annotation_attributes,
+        ) = _compile_filter(
+            self.condition,
+            None if self.valid_eval_names is None else tuple(self.valid_eval_names),
+        )
         object.__setattr__(self, "translated", translated)
         object.__setattr__(self, "compiled", compiled)
         object.__setattr__(self, "_aliased_annotation_relations", aliased_annotation_relations)
@@ -200,6 +194,7 @@ class SpanFilter:
                     "Float": sqlalchemy.Float,
                     "String": sqlalchemy.String,
                     "TextContains": models.TextContains,
+                    "span_io_value_contains": models.span_io_value_contains,
                 },
             )
         )
@@ -249,6 +244,41 @@ class SpanFilter:
         return stmt
 
 
+@lru_cache(maxsize=256)
+def _compile_filter(
+    condition: str,
+    valid_eval_names: typing.Optional[tuple[str, ...]],
+) -> tuple[
+    ast.Expression,
+    CodeType,
+    tuple[AliasedAnnotationRelation, ...],
+    dict[str, ColumnElement[typing.Any]],
+]:
+    """
+    Validates and translates a filter condition. The result is cached, and callers must not
+    mutate it.
+    """
+    root = ast.parse(condition, mode="eval")
+    _validate_expression(root, valid_eval_names=valid_eval_names)
+    source, aliased_annotation_relations = _apply_eval_aliasing(condition)
+    root = ast.parse(source, mode="eval")
+    translated = _FilterTranslator(
+        reserved_keywords=(
+            alias
+            for aliased_annotation in aliased_annotation_relations
+            for alias, _ in aliased_annotation.attributes
+        ),
+    ).visit(root)
+    ast.fix_missing_locations(translated)
+    compiled = compile(translated, filename="", mode="eval")
+    aliased_annotation_attributes = {
+        alias: attribute
+        for aliased_annotation in aliased_annotation_relations
+        for alias, attribute in aliased_annotation.attributes
+    }
+    return translated, compiled, aliased_annotation_relations, aliased_annotation_attributes
+
+
 @dataclass(frozen=True)
 class Projector:
     expression: str
@@ -256,12 +286,9 @@ class Projector:
     compiled: typing.Any = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
-        if not (source := self.expression):
+        if not self.expression:
             raise ValueError("missing expression")
-        root = ast.parse(source, mode="eval")
-        translated = _ProjectionTranslator(source).visit(root)
-        ast.fix_missing_locations(translated)
-        compiled = compile(translated, filename="", mode="eval")
+        translated, compiled = _compile_projection(self.expression)
         object.__setattr__(self, "translated", translated)
         object.__setattr__(self, "compiled", compiled)
 
@@ -272,6 +299,17 @@ class Projector:
         )
 
 
+@lru_cache(maxsize=1024)
+def _compile_projection(expression: str) -> tuple[ast.Expression, CodeType]:
+    """
+    Translates a projection. The result is cached, and callers must not mutate it.
+    """
+    root = ast.parse(expression, mode="eval")
+    translated = _ProjectionTranslator(expression).visit(root)
+    ast.fix_missing_locations(translated)
+    return translated, compile(translated, filename="", mode="eval")
+
+
 def _is_string_constant(node: typing.Any) -> TypeGuard[ast.Constant]:
     return isinstance(node, ast.Constant) and isinstance(node.value, str)
 
@@ -291,6 +329,21 @@ def _is_string_attribute(node: typing.Any) -> TypeGuard[ast.Call]:
     )
 
 
+def _get_io_value_key(node: typing.Any) -> typing.Optional[str]:
+    # e.g. `attributes[['input', 'value']].as_string()` -> `'input'`
+    if not _is_string_attribute(node):
+        return None
+    keys = _get_attribute_keys_list(typing.cast(ast.Attribute, node.func).value)
+    if (
+        keys
+        and len(keys) == 2
+        and keys[1].value == "value"
+        and keys[0].value in ("input", "output")
+    ):
+        return typing.cast(str, keys[0].value)
+    return None
+
+
 def _is_float_attribute(node: typing.Any) -> TypeGuard[ast.Call]:
     return (
         isinstance(node, ast.Call)
@@ -461,6 +514,17 @@ class _FilterTranslator(_ProjectionTranslator):
         elif not _is_float(left) and _is_float(right):
             left = _cast_as("Float", left)
         if isinstance(op, (ast.In, ast.NotIn)):
+            if (
+                isinstance(op, ast.In)
+                and isinstance(left, ast.Constant)
+                and isinstance(left.value, str)
+                and (key := _get_io_value_key(right))
+            ):
+                return ast.Call(
+                    func=ast.Name(id="span_io_value_contains", ctx=ast.Load()),
+                    args=[ast.Constant(value=key), left],
+                    keywords=[],
+                )
             if _is_string_attribute(right) or ast.unparse(right) in _NAMES:
                 call = ast.Call(
                     func=ast.Name(id="TextContains", ctx=ast.Load()),
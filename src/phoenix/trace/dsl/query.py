@@ -1,6 +1,6 @@
 import warnings
 from collections import defaultdict
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass, field, replace
 from datetime import datetime
 from functools import cached_property
@@ -11,7 +11,18 @@ from typing import Any, Optional, cast
 
 import pandas as pd
 from openinference.semconv.trace import SpanAttributes
-from sqlalchemy import JSON, Column, Label, Select, SQLColumnExpression, and_, func, or_, select
+from sqlalchemy import (
+    JSON,
+    Column,
+    Connection,
+    Label,
+    Select,
+    SQLColumnExpression,
+    and_,
+    func,
+    or_,
+    select,
+)
 from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.orm import Session
 from typing_extensions import assert_never
@@ -523,7 +534,8 @@ class SpanQuery(_HasTmpSuffix):
                 If not provided, uses the default project name. Default None.
             start_time (datetime, optional): The start time for the query range. Default None.
             end_time (datetime, optional): The end time for the query range. Default None.
-            limit (int, optional): Maximum number of spans to return. Defaults to DEFAULT_SPAN_LIMIT.
+            limit (int, optional): Maximum number of spans to return.
+                Defaults to DEFAULT_SPAN_LIMIT.
             root_spans_only (bool, optional): If True, only root spans are returned. Default None.
             stop_time (datetime, optional): Deprecated. Use end_time instead. Default None.
             orphan_span_as_root_span (bool): If True, orphan spans are treated as root spans. An
@@ -543,6 +555,69 @@ class SpanQuery(_HasTmpSuffix):
             The query execution is optimized based on the database dialect (SQLite or PostgreSQL).
             Some operations may be performed in pandas after fetching the data from SQLite.
         """  # noqa: E501
+        return next(
+            self._iter_dataframes(
+                session,
+                project_name,
+                start_time,
+                end_time,
+                limit,
+                root_spans_only,
+                stop_time,
+                orphan_span_as_root_span=orphan_span_as_root_span,
+            )
+        )
+
+    def iter_dataframes(
+        self,
+        session: Session,
+        project_name: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: Optional[int] = DEFAULT_SPAN_LIMIT,
+        root_spans_only: Optional[bool] = None,
+        *,
+        orphan_span_as_root_span: bool = True,
+        chunk_size: int,
+    ) -> Iterator[pd.DataFrame]:
+        """Execute the span query and yield the results in chunks of up to `chunk_size` rows.
+
+        The query is executed with a server-side cursor, so that only one chunk of results
+        is held in memory at a time. The arguments are the same as those of `__call__`, and
+        concatenating the chunks gives the same DataFrame as `__call__`, except that the
+        columns of each chunk only include the attributes present in that chunk. At least
+        one, possibly empty, chunk is yielded.
+
+        Note:
+            Queries with `explode` or `concat` need all of their rows to be post-processed
+            together, so their results are yielded in a single chunk.
+        """
+        assert chunk_size > 0
+        return self._iter_dataframes(
+            session,
+            project_name,
+            start_time,
+            end_time,
+            limit,
+            root_spans_only,
+            orphan_span_as_root_span=orphan_span_as_root_span,
+            chunk_size=chunk_size,
+        )
+
+    def _iter_dataframes(
+        self,
+        session: Session,
+        project_name: Optional[str] = None,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        limit: Optional[int] = DEFAULT_SPAN_LIMIT,
+        root_spans_only: Optional[bool] = None,
+        # Deprecated
+        stop_time: Optional[datetime] = None,
+        *,
+        orphan_span_as_root_span: bool = True,
+        chunk_size: Optional[int] = None,
+    ) -> Iterator[pd.DataFrame]:
         if not project_name:
             project_name = DEFAULT_PROJECT_NAME
         if stop_time:
@@ -553,7 +628,7 @@ class SpanQuery(_HasTmpSuffix):
             )
             end_time = end_time or stop_time
         if not (self._select or self._explode or self._concat):
-            return _get_spans_dataframe(
+            yield from _iter_spans_dataframes(
                 session,
                 project_name,
                 span_filter=self._filter,
@@ -562,7 +637,9 @@ class SpanQuery(_HasTmpSuffix):
                 limit=limit,
                 root_spans_only=root_spans_only,
                 orphan_span_as_root_span=orphan_span_as_root_span,
+                chunk_size=chunk_size,
             )
+            return
         assert session.bind is not None
         dialect = SupportedSQLDialect(session.bind.dialect.name)
         row_id = models.Span.id.label(self._pk_tmp_col_label)
@@ -615,7 +692,13 @@ class SpanQuery(_HasTmpSuffix):
         # processing in pandas. It's kept separate for simplicity.
         df_concat: Optional[pd.DataFrame] = None
         conn = session.connection()
-        if self._explode or not self._concat:
+        if not (self._explode or self._concat):
+            if index.name not in stmt.selected_columns.keys():
+                stmt = stmt.add_columns(index)
+            for df in _read_sql_query(stmt, conn, self._pk_tmp_col_label, chunk_size):
+                yield self._update_df(df, dialect)
+            return
+        if self._explode:
             if index.name not in stmt.selected_columns.keys():
                 stmt = stmt.add_columns(index)
             df = pd.read_sql_query(stmt, conn, self._pk_tmp_col_label)
@@ -644,7 +727,11 @@ class SpanQuery(_HasTmpSuffix):
             df = df_concat
         elif df_concat is not None:
             df = _outer_join(df, df_concat)
-        assert df is not None and self._pk_tmp_col_label not in df.columns
+        assert df is not None
+        yield self._update_df(df, dialect)
+
+    def _update_df(self, df: pd.DataFrame, dialect: SupportedSQLDialect) -> pd.DataFrame:
+        assert self._pk_tmp_col_label not in df.columns
         df = df.rename(self._remove_tmp_suffix, axis=1)
         if self._explode:
             df = self._explode.update_df(df, dialect)
@@ -704,7 +791,11 @@ class SpanQuery(_HasTmpSuffix):
                 else {}
             ),
             **(
-                {"_concat": Concatenation.from_dict(cast(Mapping[str, Any], concat))}  # type: ignore
+                {
+                    "_concat": Concatenation.from_dict(
+                        cast(Mapping[str, Any], concat),
+                    )
+                }  # type: ignore
                 if (concat := obj.get("concat"))
                 and concat.get("key")  # check `key` for backward-compatible truthiness
                 else {}
@@ -722,7 +813,7 @@ class SpanQuery(_HasTmpSuffix):
         )
 
 
-def _get_spans_dataframe(
+def _iter_spans_dataframes(
     session: Session,
     project_name: str,
     /,
@@ -733,14 +824,16 @@ def _get_spans_dataframe(
     limit: Optional[int] = DEFAULT_SPAN_LIMIT,
     root_spans_only: Optional[bool] = None,
     orphan_span_as_root_span: bool = True,
+    chunk_size: Optional[int] = None,
     # Deprecated
     stop_time: Optional[datetime] = None,
-) -> pd.DataFrame:
-    """Retrieve spans from the database and return them as a pandas DataFrame.
+) -> Iterator[pd.DataFrame]:
+    """Retrieve spans from the database and yield them as pandas DataFrames.
 
-    This function queries the database for spans matching the specified criteria and returns
-    them as a pandas DataFrame. The spans are joined with their associated traces and projects,
-    and their attributes are flattened into columns.
+    This function queries the database for spans matching the specified criteria and yields
+    them as pandas DataFrames, either all at once or in chunks of up to `chunk_size` rows.
+    The spans are joined with their associated traces and projects, and their attributes are
+    flattened into columns.
 
     Args:
         session (Session): The SQLAlchemy database session to use for the query.
@@ -753,10 +846,12 @@ def _get_spans_dataframe(
         orphan_span_as_root_span (bool): If True, orphan spans are treated as root spans. An
             orphan span has a non-null `parent_id` but a span with that ID is currently not
             found in the database. Default True.
+        chunk_size (int, optional): If provided, the spans are read with a server-side cursor
+            and yielded in chunks of up to this many rows. Default None.
         stop_time (datetime, optional): Deprecated. Use end_time instead. Default None.
 
-    Returns:
-        pd.DataFrame: A DataFrame containing the spans data with the following columns:
+    Yields:
+        pd.DataFrame: DataFrames containing the spans data with the following columns:
             - name: The span name
             - span_kind: The kind of span
             - parent_id: The ID of the parent span
@@ -828,21 +923,43 @@ def _get_spans_dataframe(
     if limit is not None:
         stmt = stmt.limit(limit)
     conn = session.connection()
-    # set `drop=False` for backward-compatibility
-    df = pd.read_sql_query(stmt, conn).set_index(span_id_label, drop=False)
-    if df.empty:
-        return df.drop("attributes", axis=1)
-    df_attributes = pd.DataFrame.from_records(
-        df.attributes.map(_flatten_semantic_conventions),
-    ).set_axis(df.index, axis=0)
-    df = pd.concat(
-        [
-            df.drop("attributes", axis=1),
-            df_attributes.add_prefix("attributes" + "."),
-        ],
-        axis=1,
+    for df in _read_sql_query(stmt, conn, chunk_size=chunk_size):
+        # set `drop=False` for backward-compatibility
+        df = df.set_index(span_id_label, drop=False)
+        if df.empty:
+            yield df.drop("attributes", axis=1)
+            continue
+        df_attributes = pd.DataFrame.from_records(
+            df.attributes.map(_flatten_semantic_conventions),
+        ).set_axis(df.index, axis=0)
+        yield pd.concat(
+            [
+                df.drop("attributes", axis=1),
+                df_attributes.add_prefix("attributes" + "."),
+            ],
+            axis=1,
+        )
+
+
+def _read_sql_query(
+    stmt: Select[Any],
+    conn: Connection,
+    index_col: Optional[str] = None,
+    chunk_size: Optional[int] = None,
+) -> Iterator[pd.DataFrame]:
+    """Read the query results into a single DataFrame, or, if `chunk_size` is provided,
+    into DataFrames of up to `chunk_size` rows fetched through a server-side cursor. At
+    least one, possibly empty, DataFrame is yielded.
+    """
+    if chunk_size is None:
+        yield pd.read_sql_query(stmt, conn, index_col)
+        return
+    yield from pd.read_sql_query(
+        stmt.execution_options(yield_per=chunk_size),
+        conn,
+        index_col,
+        chunksize=chunk_size,
     )
-    return df
 
 
 def _outer_join(left: pd.DataFrame, right: pd.DataFrame) -> pd.DataFrame:
@@ -313,3 +313,38 @@ def test_up_and_down_migrations(
         _up(_engine, _alembic_config, "6a88424799fe")
         _down(_engine, _alembic_config, "8a3764fe7f1a")
     _up(_engine, _alembic_config, "6a88424799fe")
+
+    for _ in range(2):
+        _up(_engine, _alembic_config, "c0b5f5b1b5a7")
+        _down(_engine, _alembic_config, "6a88424799fe")
+    _up(_engine, _alembic_config, "c0b5f5b1b5a7")
+
+    for _ in range(2):
+        _up(_engine, _alembic_config, "e6a3a31c6bb5")
+        _down(_engine, _alembic_config, "c0b5f5b1b5a7")
+    _up(_engine, _alembic_config, "e6a3a31c6bb5")
+
+    for _ in range(2):
+        _up(_engine, _alembic_config, "0b1320ef514e")
+        _down(_engine, _alembic_config, "e6a3a31c6bb5")
+    _up(_engine, _alembic_config, "0b1320ef514e")
+
+    for _ in range(2):
+        _up(_engine, _alembic_config, "46adf8e94951")
+        _down(_engine, _alembic_config, "0b1320ef514e")
+    _up(_engine, _alembic_config, "46adf8e94951")
+
+    for _ in range(2):
+        _up(_engine, _alembic_config, "ad288ae2bf44")
+        _down(_engine, _alembic_config, "46adf8e94951")
+    _up(_engine, _alembic_config, "ad288ae2bf44")
+
+    for _ in range(2):
+        _up(_engine, _alembic_config, "604296618771")
+        _down(_engine, _alembic_config, "ad288ae2bf44")
+    _up(_engine, _alembic_config, "604296618771")
+
+    for _ in range(2):
+        _up(_engine, _alembic_config, "1c4e8c1fd2b5")
+        _down(_engine, _alembic_config, "604296618771")
+    _up(_engine, _alembic_config, "1c4e8c1fd2b5")
@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from strawberry.relay import GlobalID
 
 from phoenix.db import models
+from phoenix.db.span_tree import add_spans
 from phoenix.server.api.types.ProjectSession import ProjectSession
 from phoenix.server.api.types.Span import Span
 
@@ -132,6 +133,11 @@ async def _add_span(
     session.add(span)
     await session.flush()
     assert isinstance(await _get_record_by_id(session, models.Span, span.id), models.Span)
+    project_rowid = await session.scalar(
+        select(models.Trace.project_rowid).where(models.Trace.id == trace_rowid)
+    )
+    assert project_rowid is not None
+    await add_spans(session, [(span.id, span.span_id, span.parent_id, project_rowid, start_time)])
     return span
 
 
@@ -3,11 +3,11 @@ import contextlib
 import os
 import tempfile
 from asyncio import AbstractEventLoop
-from collections.abc import AsyncIterator, Awaitable, Callable, Iterator
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
 from functools import partial
 from importlib.metadata import version
 from random import getrandbits
-from typing import Any, Literal
+from typing import Any, Literal, Optional
 
 import httpx
 import pytest
@@ -30,7 +30,7 @@ from phoenix.client import Client
 from phoenix.config import EXPORT_DIR
 from phoenix.core.model_schema_adapter import create_model_from_inferences
 from phoenix.db import models
-from phoenix.db.bulk_inserter import BulkInserter
+from phoenix.db.bulk_inserter import BulkInserter, QueueSpans
 from phoenix.db.engines import aio_postgresql_engine, aio_sqlite_engine
 from phoenix.db.insertion.helpers import DataManipulation
 from phoenix.inferences.inferences import EMPTY_INFERENCES
@@ -298,6 +298,7 @@ class TestBulkInserter(BulkInserter):
     ) -> tuple[
         Callable[..., Awaitable[None]],
         Callable[[Span, str], Awaitable[None]],
+        QueueSpans,
         Callable[[pb.Evaluation], Awaitable[None]],
         Callable[[DataManipulation], None],
     ]:
@@ -305,6 +306,7 @@ class TestBulkInserter(BulkInserter):
         return (
             self._enqueue_immediate,
             self._queue_span_immediate,
+            self._queue_spans_immediate,
             self._queue_evaluation_immediate,
             self._enqueue_operation_immediate,
         )
@@ -325,6 +327,14 @@ class TestBulkInserter(BulkInserter):
     async def _queue_span_immediate(self, span: Span, project_name: str) -> None:
         await self._insert_spans([(span, project_name)])
 
+    async def _queue_spans_immediate(
+        self,
+        spans: Iterable[tuple[Span, str]],
+        num_bytes: int = 0,
+        spool_position: Optional[int] = None,
+    ) -> None:
+        await self._insert_spans(list(spans))
+
     async def _queue_evaluation_immediate(self, evaluation: pb.Evaluation) -> None:
         await self._insert_evaluations([evaluation])
 
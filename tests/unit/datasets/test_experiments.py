@@ -27,12 +27,13 @@ from phoenix.experiments.types import (
     ExperimentRun,
     JSONSerializable,
 )
+from phoenix.experiments.uploads import BatchUploader
 from phoenix.server.api.types.node import from_global_id_with_expected_type
 from phoenix.server.types import DbSessionFactory
 
 
 @pytest.mark.skipif(platform.system() in ("Windows", "Darwin"), reason="Flaky on CI")
-@patch("opentelemetry.sdk.trace.export.SimpleSpanProcessor.on_end")
+@patch("opentelemetry.sdk.trace.export.BatchSpanProcessor.on_end")
 async def test_run_experiment(
     _: Any,
     db: DbSessionFactory,
@@ -108,7 +109,7 @@ async def test_run_experiment(
 
 
 @pytest.mark.skipif(platform.system() in ("Windows", "Darwin"), reason="Flaky on CI")
-@patch("opentelemetry.sdk.trace.export.SimpleSpanProcessor.on_end")
+@patch("opentelemetry.sdk.trace.export.BatchSpanProcessor.on_end")
 async def test_run_experiment_with_llm_eval(
     _: Any,
     db: DbSessionFactory,
@@ -188,7 +189,7 @@ async def test_run_experiment_with_llm_eval(
 
 
 @pytest.mark.skipif(platform.system() in ("Windows", "Darwin"), reason="Flaky on CI")
-@patch("opentelemetry.sdk.trace.export.SimpleSpanProcessor.on_end")
+@patch("opentelemetry.sdk.trace.export.BatchSpanProcessor.on_end")
 async def test_run_evaluation(
     _: Any,
     db: DbSessionFactory,
@@ -331,3 +332,41 @@ async def test_get_experiment_client_method(
     experiment = legacy_px_client.get_experiment(experiment_id=str(experiment_gid))
     assert experiment
     assert isinstance(experiment, Experiment)
+
+
+def test_batch_uploader_posts_records_in_batches() -> None:
+    batches: list[list[int]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        records = json.loads(request.content)["data"]
+        batches.append([record["n"] for record in records])
+        if any(record["n"] < 0 for record in records):
+            return httpx.Response(500)
+        ids = [str(record["n"]) if record["n"] % 3 else None for record in records]
+        return httpx.Response(200, json={"data": [{"id": id_} for id_ in ids]})
+
+    def client() -> httpx.AsyncClient:
+        return httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="http://test")
+
+    with BatchUploader("/batch", client(), max_batch_size=2, max_delay_seconds=60) as uploader:
+        futures = [uploader.submit({"n": n}) for n in range(1, 6)]
+    assert sorted(batches) == [[1, 2], [3, 4], [5]]
+    assert [future.result() for future in futures] == ["1", "2", None, "4", "5"]
+    assert uploader._client.is_closed
+
+    batches.clear()
+    with BatchUploader("/batch", client(), max_delay_seconds=0.01) as uploader:
+        future = uploader.submit({"n": -1})
+        with pytest.raises(httpx.HTTPStatusError):
+            future.result(timeout=5)  # posted before the uploader is closed
+        assert uploader.submit({"n": 1}).result(timeout=5) == "1"
+    assert batches == [[-1], [1]]
+    with pytest.raises(RuntimeError):
+        uploader.submit({"n": 1})
+
+
+def test_batch_uploader_raises_if_it_fails_to_start() -> None:
+    client = httpx.AsyncClient(base_url="http://test")
+    with pytest.raises(RuntimeError, match="Failed to start"):
+        BatchUploader("/batch", client, max_concurrent_requests=-1)
+    assert client.is_closed
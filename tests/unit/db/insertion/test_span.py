@@ -0,0 +1,384 @@
+from datetime import datetime, timedelta, timezone
+from random import Random
+from typing import Any, Optional
+
+import pytest
+from openinference.semconv.trace import SpanAttributes
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from phoenix.db import models
+from phoenix.db.insertion.cache import InsertionCache
+from phoenix.db.insertion.span import insert_span, insert_spans
+from phoenix.db.rollups import clear_rollups, rebuild_rollups, subtract_traces
+from phoenix.db.span_tree import rebuild_span_tree, rowids_in_path
+from phoenix.server.types import DbSessionFactory
+from phoenix.trace.attributes import unflatten
+from phoenix.trace.schemas import Span, SpanContext, SpanKind, SpanStatusCode
+
+_T0 = datetime(2021, 1, 1, tzinfo=timezone.utc)
+
+
+def _span(
+    span_id: str,
+    trace_id: str,
+    parent_id: Optional[str],
+    offset: int,
+    *,
+    error: bool = False,
+    prompt: int = 0,
+    completion: int = 0,
+    session_id: Optional[str] = None,
+) -> Span:
+    attributes: dict[str, Any] = {
+        SpanAttributes.LLM_TOKEN_COUNT_PROMPT: prompt,
+        SpanAttributes.LLM_TOKEN_COUNT_COMPLETION: completion,
+    }
+    if session_id is not None:
+        attributes[SpanAttributes.SESSION_ID] = session_id
+    return Span(
+        name=span_id,
+        context=SpanContext(trace_id=trace_id, span_id=span_id),
+        span_kind=SpanKind.LLM,
+        parent_id=parent_id,
+        start_time=_T0 + timedelta(seconds=offset),
+        end_time=_T0 + timedelta(seconds=offset + 1),
+        status_code=SpanStatusCode.ERROR if error else SpanStatusCode.OK,
+        status_message="",
+        attributes=unflatten(attributes.items()),
+        events=[],
+        conversation=None,
+    )
+
+
+def _spans(seed: int) -> list[tuple[Span, str]]:
+    rng = Random(seed)
+    spans: list[tuple[Span, str]] = []
+    for t in range(5):
+        trace_id = f"trace-{t}"
+        session_id = f"session-{t % 2}" if t < 4 else None
+        span_ids: list[str] = []
+        for s in range(20):
+            span_id = f"{trace_id}-span-{s}"
+            parent_id = rng.choice(span_ids) if span_ids else None
+            span_ids.append(span_id)
+            span = _span(
+                span_id,
+                trace_id,
+                parent_id,
+                offset=10 * t + s,
+                error=rng.random() < 0.3,
+                prompt=rng.randint(0, 100),
+                completion=rng.randint(0, 100),
+                session_id=session_id,
+            )
+            spans.append((span, f"project-{t % 3}"))
+    rng.shuffle(spans)
+    return spans
+
+
+async def _snapshot(db: DbSessionFactory) -> dict[str, Any]:
+    async with db() as session:
+        spans = {
+            span_id: values
+            for span_id, *values in await session.execute(
+                select(
+                    models.Span.span_id,
+                    models.Project.name,
+                    models.Trace.start_time,
+                    models.Trace.end_time,
+                    models.ProjectSession.session_id,
+                    models.ProjectSession.start_time,
+                    models.ProjectSession.end_time,
+                    models.Span.cumulative_error_count,
+                    models.Span.cumulative_llm_token_count_prompt,
+                    models.Span.cumulative_llm_token_count_completion,
+                    models.Span.llm_token_count_prompt,
+                    models.Span.llm_token_count_completion,
+                )
+                .join(models.Trace, models.Span.trace_rowid == models.Trace.id)
+                .join(models.Project, models.Trace.project_rowid == models.Project.id)
+                .outerjoin(
+                    models.ProjectSession,
+                    models.Trace.project_session_rowid == models.ProjectSession.id,
+                )
+            )
+        }
+        num_projects = len((await session.scalars(select(models.Project))).all())
+        num_sessions = len((await session.scalars(select(models.ProjectSession))).all())
+        rollups = await _rollups(session)
+        latency_buckets = await _latency_buckets(session)
+        tree = await _tree(session)
+    return dict(
+        spans=spans,
+        num_projects=num_projects,
+        num_sessions=num_sessions,
+        rollups=rollups,
+        latency_buckets=latency_buckets,
+        tree=tree,
+    )
+
+
+async def _rollups(session: AsyncSession) -> dict[tuple[str, datetime], tuple[int, ...]]:
+    table = models.ProjectHourlyRollup
+    return {
+        (name, hour): tuple(counts)
+        for name, hour, *counts in await session.execute(
+            select(
+                models.Project.name,
+                table.hour,
+                table.span_count,
+                table.trace_count,
+                table.error_count,
+                table.llm_token_count_prompt,
+                table.llm_token_count_completion,
+            ).join(models.Project)
+        )
+    }
+
+
+async def _latency_buckets(session: AsyncSession) -> dict[tuple[Any, ...], int]:
+    table = models.ProjectHourlyLatencyBucket
+    return {
+        tuple(key): count
+        for *key, count in await session.execute(
+            select(models.Project.name, table.kind, table.hour, table.bucket, table.count).join(
+                models.Project
+            )
+        )
+    }
+
+
+async def _tree(session: AsyncSession) -> dict[str, tuple[str, datetime, int, list[str]]]:
+    # Row ids differ between runs, so paths are compared as lists of span_ids.
+    span_ids = {
+        rowid: span_id
+        for rowid, span_id in await session.execute(select(models.Span.id, models.Span.span_id))
+    }
+    return {
+        span_ids[rowid]: (name, start_time, depth, [span_ids[r] for r in rowids_in_path(path)])
+        for rowid, name, start_time, depth, path in await session.execute(
+            select(
+                models.SpanTreeNode.span_rowid,
+                models.Project.name,
+                models.SpanTreeNode.start_time,
+                models.SpanTreeNode.depth,
+                models.SpanTreeNode.path,
+            ).join_from(
+                models.SpanTreeNode,
+                models.Project,
+                models.Project.id == models.SpanTreeNode.project_rowid,
+            )
+        )
+    }
+
+
+async def _truncate(db: DbSessionFactory) -> None:
+    async with db() as session:
+        for table in (
+            models.ProjectHourlyRollup,
+            models.ProjectHourlyLatencyBucket,
+            models.SpanTreeNode,
+            models.Span,
+            models.Trace,
+            models.ProjectSession,
+            models.Project,
+        ):
+            await session.execute(table.__table__.delete())
+
+
+class TestInsertSpans:
+    @pytest.mark.parametrize("use_cache", [False, True])
+    @pytest.mark.parametrize("batch_size", [1, 7, 1000])
+    @pytest.mark.parametrize("seed", [0, 1])
+    async def test_matches_insert_span(
+        self,
+        db: DbSessionFactory,
+        batch_size: int,
+        seed: int,
+        use_cache: bool,
+    ) -> None:
+        spans = _spans(seed)
+        for span, project_name in spans:
+            async with db() as session:
+                await insert_span(session, span, project_name)
+        expected = await _snapshot(db)
+        await _truncate(db)
+        cache = InsertionCache() if use_cache else None
+        for i in range(0, len(spans), batch_size):
+            async with db() as session:
+                events = await insert_spans(session, spans[i : i + batch_size], cache)
+            if cache is not None:
+                cache.commit()
+            assert len(events) == len(spans[i : i + batch_size])
+        actual = await _snapshot(db)
+        assert actual == expected
+        if cache is not None and batch_size < len(spans):
+            assert cache.traces.hits > 0
+        async with db() as session:
+            await rebuild_rollups(session)
+            assert await _rollups(session) == actual["rollups"]
+            assert await _latency_buckets(session) == actual["latency_buckets"]
+            await rebuild_span_tree(session)
+            assert await _tree(session) == actual["tree"]
+
+    async def test_stale_cache_does_not_shrink_time_bounds(
+        self,
+        db: DbSessionFactory,
+    ) -> None:
+        cache = InsertionCache()
+        async with db() as session:
+            await insert_spans(
+                session, [(_span("a", "trace", None, 10, session_id="s"), "abc")], cache
+            )
+        # another writer widens the time bounds without updating this cache
+        async with db() as session:
+            await insert_span(session, _span("b", "trace", "a", 20, session_id="s"), "abc")
+        async with db() as session:
+            await insert_spans(
+                session, [(_span("c", "trace", "a", 15, session_id="s"), "abc")], cache
+            )
+        async with db() as session:
+            trace = await session.scalar(select(models.Trace))
+            project_session = await session.scalar(select(models.ProjectSession))
+        assert trace is not None and project_session is not None
+        assert trace.end_time == project_session.end_time == _T0 + timedelta(seconds=21)
+
+    async def test_cache_entries_are_staged_until_commit(
+        self,
+        db: DbSessionFactory,
+    ) -> None:
+        cache = InsertionCache()
+        async with db() as session:
+            await insert_spans(session, [(_span("a", "trace", None, 10), "abc")], cache)
+        assert cache.projects.get("abc") is not None
+        assert len(cache.projects) == len(cache.traces) == 0
+        cache.commit()
+        assert len(cache.projects) == len(cache.traces) == 1
+        with pytest.raises(RuntimeError):
+            async with db() as session:
+                await insert_spans(session, [(_span("b", "trace2", None, 10), "xyz")], cache)
+                raise RuntimeError("rolled back")
+        cache.clear()
+        assert cache.projects.get("xyz") is None
+        assert cache.traces.get("trace2") is None
+
+    async def test_skips_duplicates(
+        self,
+        db: DbSessionFactory,
+    ) -> None:
+        parent = _span("parent", "trace", None, 0, error=True)
+        child = _span("child", "trace", "parent", 1, error=True)
+        async with db() as session:
+            assert len(await insert_spans(session, [(child, "abc"), (child, "abc")])) == 1
+        async with db() as session:
+            assert len(await insert_spans(session, [(child, "abc"), (parent, "abc")])) == 1
+        async with db() as session:
+            assert not await insert_spans(session, [(parent, "abc"), (child, "abc")])
+            counts = dict(
+                (
+                    await session.execute(
+                        select(models.Span.span_id, models.Span.cumulative_error_count)
+                    )
+                ).all()
+            )
+        assert counts == {"parent": 2, "child": 1}
+
+    @pytest.mark.parametrize("bulk", [False, True])
+    async def test_events_carry_time_bounds_of_traces(
+        self,
+        db: DbSessionFactory,
+        bulk: bool,
+    ) -> None:
+        spans = [
+            (_span("b", "trace", "a", 10), "abc"),
+            (_span("a", "trace", None, 0), "abc"),
+            (_span("c", "trace", "a", 20), "abc"),
+        ]
+        bounds: list[tuple[datetime, datetime]] = []
+        for span, project_name in spans:
+            async with db() as session:
+                if bulk:
+                    events = await insert_spans(session, [(span, project_name)])
+                else:
+                    event = await insert_span(session, span, project_name)
+                    events = [event] if event else []
+            bounds.extend((event.start_time, event.end_time) for event in events)
+        # The bounds contain the start times of the ancestors, whose cumulative counts change.
+        assert bounds == [
+            (_T0 + timedelta(seconds=10), _T0 + timedelta(seconds=11)),
+            (_T0, _T0 + timedelta(seconds=11)),
+            (_T0, _T0 + timedelta(seconds=21)),
+        ]
+
+
+class TestRollups:
+    @pytest.mark.parametrize("bulk", [False, True])
+    async def test_trace_moving_to_another_project_moves_its_spans(
+        self,
+        db: DbSessionFactory,
+        bulk: bool,
+    ) -> None:
+        spans = [
+            (_span("a", "trace", None, 0, error=True, prompt=1), "abc"),
+            (_span("b", "trace", "a", 3600, prompt=2), "abc"),
+            (_span("c", "trace", "a", 7200, completion=3), "xyz"),
+        ]
+        for span, project_name in spans:
+            async with db() as session:
+                if bulk:
+                    await insert_spans(session, [(span, project_name)])
+                else:
+                    await insert_span(session, span, project_name)
+        async with db() as session:
+            actual = await _rollups(session)
+            latency_buckets = await _latency_buckets(session)
+            await rebuild_rollups(session)
+            assert await _rollups(session) == actual
+            assert await _latency_buckets(session) == latency_buckets
+            assert {name for name, *_ in (await _tree(session)).values()} == {"xyz"}
+        assert actual == {
+            ("xyz", _T0): (1, 1, 1, 1, 0),
+            ("xyz", _T0 + timedelta(hours=1)): (1, 0, 0, 2, 0),
+            ("xyz", _T0 + timedelta(hours=2)): (1, 0, 0, 0, 3),
+        }
+
+    async def test_subtracted_traces_are_removed(
+        self,
+        db: DbSessionFactory,
+    ) -> None:
+        async with db() as session:
+            await insert_spans(session, _spans(0))
+        async with db() as session:
+            condition = models.Trace.trace_id.in_(["trace-0", "trace-3"])
+            await subtract_traces(session, condition)
+            await session.execute(models.Trace.__table__.delete().where(condition))
+        async with db() as session:
+            actual = await _rollups(session)
+            latency_buckets = await _latency_buckets(session)
+            await rebuild_rollups(session)
+            assert await _rollups(session) == actual
+            assert await _latency_buckets(session) == latency_buckets
+        assert {name for name, _ in actual} == {"project-1", "project-2"}
+
+    async def test_cleared_projects_have_no_rollups(
+        self,
+        db: DbSessionFactory,
+    ) -> None:
+        async with db() as session:
+            await insert_spans(session, _spans(0))
+        async with db() as session:
+            project_rowid = await session.scalar(
+                select(models.Project.id).where(models.Project.name == "project-1")
+            )
+            assert project_rowid is not None
+            condition = models.Trace.project_rowid == project_rowid
+            await clear_rollups(session, (project_rowid,))
+            await session.execute(models.Trace.__table__.delete().where(condition))
+        async with db() as session:
+            actual = await _rollups(session)
+            latency_buckets = await _latency_buckets(session)
+            await rebuild_rollups(session)
+            assert await _rollups(session) == actual
+            assert await _latency_buckets(session) == latency_buckets
+        assert {name for name, _ in actual} == {"project-0", "project-2"}
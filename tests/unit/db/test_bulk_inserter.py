@@ -0,0 +1,78 @@
+from asyncio import QueueFull, sleep
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import func, select
+
+from phoenix.db import models
+from phoenix.db.bulk_inserter import BulkInserter
+from phoenix.server.dml_event import DmlEvent
+from phoenix.server.types import DbSessionFactory
+from phoenix.trace.schemas import Span, SpanContext, SpanKind, SpanStatusCode
+
+
+class _EventQueue:
+    def __init__(self) -> None:
+        self.events: list[DmlEvent] = []
+
+    def put(self, item: DmlEvent) -> None:
+        self.events.append(item)
+
+
+def _span(i: int) -> Span:
+    start_time = datetime(2021, 1, 1, tzinfo=timezone.utc)
+    return Span(
+        name="span",
+        context=SpanContext(trace_id=f"{i:032x}", span_id=f"{i + 1:016x}"),
+        span_kind=SpanKind.CHAIN,
+        parent_id=None,
+        start_time=start_time,
+        end_time=start_time,
+        status_code=SpanStatusCode.OK,
+        status_message="",
+        attributes={},
+        events=[],
+        conversation=None,
+    )
+
+
+class TestSpanCapacity:
+    async def test_check_span_capacity(self, db: DbSessionFactory) -> None:
+        bulk_inserter = BulkInserter(
+            db,
+            event_queue=_EventQueue(),
+            max_spans_buffered=10,
+            max_span_bytes_buffered=1000,
+        )
+        # an empty buffer admits any request, so that a large request can't be stuck
+        bulk_inserter.check_span_capacity(100, 10_000)
+        await bulk_inserter._queue_spans([(_span(i), "abc") for i in range(5)], 500)
+        bulk_inserter.check_span_capacity(5, 500)
+        with pytest.raises(QueueFull):
+            bulk_inserter.check_span_capacity(6, 0)
+        with pytest.raises(QueueFull):
+            bulk_inserter.check_span_capacity(0, 501)
+
+    async def test_capacity_is_released_after_insertion(self, db: DbSessionFactory) -> None:
+        bulk_inserter = BulkInserter(
+            db,
+            event_queue=_EventQueue(),
+            sleep=0.01,
+            max_spans_buffered=10,
+            max_span_bytes_buffered=1000,
+        )
+        async with bulk_inserter as (_, _, queue_spans, _, _):
+            await queue_spans([(_span(i), "abc") for i in range(10)], 1000)
+            with pytest.raises(QueueFull):
+                bulk_inserter.check_span_capacity(1, 0)
+            for _ in range(100):
+                await sleep(0.05)
+                try:
+                    bulk_inserter.check_span_capacity(10, 1000)
+                except QueueFull:
+                    continue
+                break
+            else:
+                pytest.fail("span capacity was not released")
+        async with db() as session:
+            assert await session.scalar(select(func.count(models.Span.id))) == 10
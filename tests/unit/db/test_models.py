@@ -1,6 +1,6 @@
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 
 from phoenix.db import models
 from phoenix.server.types import DbSessionFactory
@@ -36,3 +36,66 @@ async def test_empty_projects(
     async with db() as session:
         result = (await session.execute(statement)).scalars().first()
     assert not result
+
+
+async def test_dataset_snapshot_ranges_follow_revisions(
+    db: DbSessionFactory,
+) -> None:
+    async with db() as session:
+        dataset_id = await session.scalar(
+            insert(models.Dataset).values(name="dataset", metadata_={}).returning(models.Dataset.id)
+        )
+        v1, v2, v3 = [
+            await session.scalar(
+                insert(models.DatasetVersion)
+                .values(dataset_id=dataset_id, metadata_={})
+                .returning(models.DatasetVersion.id)
+            )
+            for _ in range(3)
+        ]
+        e1, e2 = [
+            await session.scalar(
+                insert(models.DatasetExample)
+                .values(dataset_id=dataset_id)
+                .returning(models.DatasetExample.id)
+            )
+            for _ in range(2)
+        ]
+        revisions = {}
+        # the patch at v2 is inserted after the patch at v3, as if it were backfilled
+        for example_id, version_id, revision_kind in [
+            (e1, v1, "CREATE"),
+            (e2, v1, "CREATE"),
+            (e1, v3, "PATCH"),
+            (e2, v2, "DELETE"),
+            (e1, v2, "PATCH"),
+        ]:
+            revisions[example_id, version_id] = await session.scalar(
+                insert(models.DatasetExampleRevision)
+                .values(
+                    dataset_example_id=example_id,
+                    dataset_version_id=version_id,
+                    input={},
+                    output={},
+                    metadata_={},
+                    revision_kind=revision_kind,
+                )
+                .returning(models.DatasetExampleRevision.id)
+            )
+        ranges = (
+            await session.execute(
+                select(
+                    models.DatasetSnapshotRange.dataset_example_revision_id,
+                    models.DatasetSnapshotRange.from_version_id,
+                    models.DatasetSnapshotRange.to_version_id,
+                ).where(models.DatasetSnapshotRange.dataset_id == dataset_id)
+            )
+        ).all()
+    assert sorted(ranges) == sorted(
+        [
+            (revisions[e1, v1], v1, v2),
+            (revisions[e2, v1], v1, v2),
+            (revisions[e1, v2], v2, v3),
+            (revisions[e1, v3], v3, None),
+        ]
+    )
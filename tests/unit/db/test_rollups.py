@@ -0,0 +1,38 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import pytest
+
+from phoenix.db.rollups import TimeInterval, split_time_range
+
+_H0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+_H1 = _H0 + timedelta(hours=1)
+_H2 = _H0 + timedelta(hours=2)
+_M = timedelta(minutes=30)
+
+
+@pytest.mark.parametrize(
+    "start_time,end_time,expected",
+    [
+        pytest.param(None, None, ((None, None), []), id="unbounded"),
+        pytest.param(_H0, _H2, ((_H0, _H2), []), id="aligned"),
+        pytest.param(
+            _H0 - _M, _H2 + _M, ((_H0, _H2), [(_H0 - _M, _H0), (_H2, _H2 + _M)]), id="ragged"
+        ),
+        pytest.param(_H0 + _M, None, ((_H1, None), [(_H0 + _M, _H1)]), id="ragged-start"),
+        pytest.param(None, _H1 + _M, ((None, _H1), [(_H1, _H1 + _M)]), id="ragged-end"),
+        pytest.param(_H0 + _M, _H1 + _M, (None, [(_H0 + _M, _H1 + _M)]), id="no-whole-hour"),
+        pytest.param(
+            _H0 + _M,
+            _H0 + 2 * _M - timedelta(minutes=1),
+            (None, [(_H0 + _M, _H0 + 2 * _M - timedelta(minutes=1))]),
+            id="within-an-hour",
+        ),
+    ],
+)
+def test_split_time_range(
+    start_time: Optional[datetime],
+    end_time: Optional[datetime],
+    expected: tuple[Optional[TimeInterval], list[TimeInterval]],
+) -> None:
+    assert split_time_range(start_time, end_time) == expected
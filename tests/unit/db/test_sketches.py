@@ -0,0 +1,31 @@
+from random import Random
+
+import numpy as np
+import pytest
+
+from phoenix.db.sketches import RELATIVE_ACCURACY, LatencySketch, bucket_of, value_of
+
+
+@pytest.mark.parametrize("value", [-1e6, -1.5, 0.0, 1e-3, 1.0, 250.0, 3.6e6])
+def test_value_of_bucket_is_within_relative_accuracy(value: float) -> None:
+    assert value_of(bucket_of(value)) == pytest.approx(value, rel=RELATIVE_ACCURACY)
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_merged_sketches_estimate_quantiles_within_relative_accuracy(seed: int) -> None:
+    rng = Random(seed)
+    values = [rng.lognormvariate(5, 2) for _ in range(1000)]
+    sketches = [LatencySketch() for _ in range(3)]
+    for i, value in enumerate(values):
+        sketches[i % 3].add(value)
+    merged = LatencySketch()
+    for sketch in sketches:
+        merged.merge(sketch)
+    assert merged.count == len(values)
+    for probability in (0.0, 0.01, 0.5, 0.9, 0.99, 1.0):
+        expected = np.quantile(values, probability)
+        assert merged.quantile(probability) == pytest.approx(expected, rel=RELATIVE_ACCURACY)
+
+
+def test_empty_sketch_has_no_quantiles() -> None:
+    assert LatencySketch().quantile(0.5) is None
@@ -0,0 +1,146 @@
+from datetime import datetime, timezone
+from typing import Optional
+
+import pytest
+from sqlalchemy import insert, select
+
+from phoenix.db import models
+from phoenix.db.span_tree import add_spans, rebuild_span_tree, rowids_in_path
+from phoenix.server.types import DbSessionFactory
+
+_T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+# a
+# ├── b
+# │   └── c
+# │       └── e
+# └── d
+# f (orphan)
+_PARENTS: dict[str, Optional[str]] = {
+    "a": None,
+    "b": "a",
+    "c": "b",
+    "d": "a",
+    "e": "c",
+    "f": "missing",
+}
+_PATHS = {
+    "a": ["a"],
+    "b": ["a", "b"],
+    "c": ["a", "b", "c"],
+    "d": ["a", "d"],
+    "e": ["a", "b", "c", "e"],
+    "f": ["f"],
+}
+
+
+async def _insert(
+    db: DbSessionFactory,
+    batches: list[list[str]],
+    parents: dict[str, Optional[str]] = _PARENTS,
+) -> None:
+    async with db() as session:
+        project_rowid = await session.scalar(
+            insert(models.Project).values(name="abc").returning(models.Project.id)
+        )
+        assert project_rowid is not None
+        trace_rowid = await session.scalar(
+            insert(models.Trace)
+            .values(trace_id="xyz", project_rowid=project_rowid, start_time=_T0, end_time=_T0)
+            .returning(models.Trace.id)
+        )
+    for batch in batches:
+        async with db() as session:
+            rowids = await session.scalars(
+                insert(models.Span).returning(models.Span.id),
+                [
+                    dict(
+                        trace_rowid=trace_rowid,
+                        span_id=span_id,
+                        parent_id=parents[span_id],
+                        name=span_id,
+                        span_kind="CHAIN",
+                        start_time=_T0,
+                        end_time=_T0,
+                        attributes={},
+                        events=[],
+                        status_code="OK",
+                        status_message="",
+                        cumulative_error_count=0,
+                        cumulative_llm_token_count_prompt=0,
+                        cumulative_llm_token_count_completion=0,
+                    )
+                    for span_id in batch
+                ],
+            )
+            await add_spans(
+                session,
+                [
+                    (rowid, span_id, parents[span_id], project_rowid, _T0)
+                    for rowid, span_id in zip(rowids.all(), batch)
+                ],
+            )
+
+
+async def _tree(db: DbSessionFactory) -> dict[str, tuple[str, int, list[str]]]:
+    async with db() as session:
+        span_ids = {
+            rowid: span_id
+            for rowid, span_id in await session.execute(select(models.Span.id, models.Span.span_id))
+        }
+        return {
+            span_ids[rowid]: (
+                span_ids[root_span_rowid],
+                depth,
+                [span_ids[r] for r in rowids_in_path(path)],
+            )
+            for rowid, root_span_rowid, depth, path in await session.execute(
+                select(
+                    models.SpanTreeNode.span_rowid,
+                    models.SpanTreeNode.root_span_rowid,
+                    models.SpanTreeNode.depth,
+                    models.SpanTreeNode.path,
+                )
+            )
+        }
+
+
+@pytest.mark.parametrize(
+    "batches",
+    [
+        pytest.param([["a", "b", "c", "d", "e", "f"]], id="parents-first"),
+        pytest.param([["f", "e", "d", "c", "b", "a"]], id="children-first"),
+        pytest.param([["e"], ["c"], ["b"], ["d"], ["a"], ["f"]], id="children-first-one-by-one"),
+        pytest.param([["c", "e"], ["a", "f"], ["d", "b"]], id="subtree-before-root"),
+        pytest.param([["b"], ["e", "a"], ["d"], ["f", "c"]], id="interleaved"),
+    ],
+)
+async def test_tree_is_independent_of_arrival_order(
+    db: DbSessionFactory,
+    batches: list[list[str]],
+) -> None:
+    await _insert(db, batches)
+    tree = await _tree(db)
+    assert {span_id: path for span_id, (_, _, path) in tree.items()} == _PATHS
+    for root, depth, path in tree.values():
+        assert root == path[0]
+        assert depth == len(path) - 1
+    async with db() as session:
+        await rebuild_span_tree(session)
+    assert await _tree(db) == tree
+
+
+@pytest.mark.parametrize(
+    "batches",
+    [
+        pytest.param([["x", "y"]], id="same-batch"),
+        pytest.param([["x"], ["y"]], id="separate-batches"),
+    ],
+)
+async def test_cycles_are_broken(
+    db: DbSessionFactory,
+    batches: list[list[str]],
+) -> None:
+    await _insert(db, batches, parents={"x": "y", "y": "x"})
+    (root,), (_, child) = sorted(path for _, _, path in (await _tree(db)).values())
+    assert {root, child} == {"x", "y"}
@@ -18,6 +18,7 @@ from phoenix.db.types.trace_retention import (
     _MaxCount,
     _MaxDays,
     _time_of_next_run,
+    _time_of_prev_run,
 )
 from phoenix.server.types import DbSessionFactory
 
@@ -277,6 +278,50 @@ def test_time_of_next_run(
         assert actual == expected
 
 
+@pytest.mark.parametrize(
+    "cron_expression, at, expected_time",
+    [
+        pytest.param(
+            "0 * * * *",
+            "2023-01-01 10:30:00+00:00",
+            "2023-01-01 10:00:00+00:00",
+            id="hourly",
+        ),
+        pytest.param(
+            "0 0,12 * * *",
+            "2023-01-01 12:00:00+00:00",
+            "2023-01-01 12:00:00+00:00",
+            id="twice-daily-at-noon",
+        ),
+        pytest.param(
+            "0 0,12 * * *",
+            "2023-01-01 11:59:59+00:00",
+            "2023-01-01 00:00:00+00:00",
+            id="twice-daily-before-noon",
+        ),
+        pytest.param(
+            "0 3 * * 0",
+            "2023-01-07 13:30:00+00:00",  # Saturday
+            "2023-01-01 03:00:00+00:00",  # Sunday
+            id="sunday-3am",
+        ),
+        pytest.param(
+            "0 12 * * *",
+            "2023-01-01 06:00:00-08:00",
+            "2023-01-01 12:00:00+00:00",
+            id="non-utc",
+        ),
+    ],
+)
+def test_time_of_prev_run(
+    cron_expression: str,
+    at: str,
+    expected_time: str,
+) -> None:
+    actual = _time_of_prev_run(cron_expression, datetime.fromisoformat(at))
+    assert actual == datetime.fromisoformat(expected_time)
+
+
 @pytest.mark.parametrize(
     "cron_expression, expected_error_msg",
     [
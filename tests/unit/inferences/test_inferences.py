@@ -9,6 +9,7 @@ from collections.abc import Iterator
 from contextlib import contextmanager
 from dataclasses import replace
 from datetime import datetime
+from pathlib import Path
 
 import numpy as np
 import pandas as pd
@@ -18,6 +19,7 @@ from pandas import DataFrame, Series, Timestamp
 from pytest import LogCaptureFixture, raises
 
 import phoenix.inferences.errors as err
+import phoenix.inferences.inferences
 from phoenix.inferences.errors import DatasetError
 from phoenix.inferences.inferences import (
     Inferences,
@@ -29,6 +31,7 @@ from phoenix.inferences.schema import (
     RetrievalEmbeddingColumnNames,
     Schema,
 )
+from phoenix.inferences.vectors import VectorArray
 
 
 class TestParseDataFrameAndSchema:
@@ -1397,3 +1400,36 @@ def test_inferences_with_arize_schema() -> None:
     assert (inferences.schema.embedding_feature_column_names or {})[
         "embedding"
     ].vector_column_name == "embedding"
+
+
+def test_inferences_embedding_vectors_are_saved_as_matrices(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(phoenix.inferences.inferences, "INFERENCES_DIR", tmp_path)
+    input_df = DataFrame(
+        {
+            "prediction_id": ["0", "1", "2"],
+            "timestamp": [
+                pd.Timestamp(year=2023, month=1, day=1, hour=2, second=30),
+                pd.Timestamp(year=2023, month=1, day=10, hour=6, second=20),
+                pd.Timestamp(year=2023, month=1, day=5, hour=4, second=25),
+            ],
+            "embedding/vector": [np.array([1.0, 2.0]), None, np.array([5.0, 6.0])],
+        }
+    )
+    input_schema = Schema(
+        prediction_id_column_name="prediction_id",
+        timestamp_column_name="timestamp",
+        embedding_feature_column_names={
+            "embedding": EmbeddingColumnNames(vector_column_name="embedding/vector"),
+        },
+    )
+    Inferences(dataframe=input_df, schema=input_schema, name="saved").to_disc()
+    assert "embedding/vector" not in pd.read_parquet(tmp_path / "saved" / "data.parquet").columns
+    inferences = Inferences.from_name("saved")
+    vectors = inferences.dataframe["embedding/vector"].array
+    assert isinstance(vectors, VectorArray)
+    assert isinstance(vectors.matrix, np.memmap)
+    assert inferences.dataframe["prediction_id"].tolist() == ["0", "2", "1"]
+    assert vectors.matrix.tolist() == [[1, 2], [5, 6], [0, 0]]
+    assert vectors.mask.tolist() == [True, True, False]
@@ -0,0 +1,51 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from phoenix.inferences.vectors import VectorArray, VectorDtype
+
+
+@pytest.fixture
+def vectors() -> VectorArray:
+    return VectorArray.from_vectors(
+        [np.array([1.0, 2.0]), None, [3.0, 4.0], np.nan, np.array([5.0, 6.0])]
+    )
+
+
+def test_from_vectors(vectors: VectorArray) -> None:
+    assert vectors.matrix.dtype == np.float32
+    assert vectors.matrix.tolist() == [[1, 2], [0, 0], [3, 4], [0, 0], [5, 6]]
+    assert vectors.mask.tolist() == [True, False, True, False, True]
+    with pytest.raises(ValueError):
+        VectorArray.from_vectors([[1.0, 2.0], [3.0]])
+
+
+def test_series_of_vectors(vectors: VectorArray) -> None:
+    series = pd.Series(vectors)
+    assert isinstance(series.dtype, VectorDtype)
+    assert series.notna().tolist() == [True, False, True, False, True]
+    assert series.iloc[2].tolist() == [3, 4]
+    assert np.isnan(series.iloc[1])
+    assert series.iloc[1:3].array.matrix.base is vectors.matrix
+    assert series.iloc[[4, 0]].array.matrix.tolist() == [[5, 6], [1, 2]]
+    assert series.dropna().array.mask.all()
+    assert np.mean(series).tolist() == [3, 4]
+    assert np.isnan(series.mean(skipna=False))
+    assert pd.concat([series, series.iloc[:0], series]).array.mask.sum() == 6
+
+
+def test_take_with_fill(vectors: VectorArray) -> None:
+    taken = vectors.take([-1, 0, 1], allow_fill=True)
+    assert taken.mask.tolist() == [False, True, False]
+    assert taken.matrix.tolist() == [[0, 0], [1, 2], [0, 0]]
+
+
+def test_save_and_load(vectors: VectorArray, tmp_path: Path) -> None:
+    vectors.save(tmp_path)
+    loaded = VectorArray.load(tmp_path)
+    assert isinstance(loaded.matrix, np.memmap)
+    assert not loaded.matrix.flags.writeable
+    assert np.array_equal(loaded.matrix, vectors.matrix)
+    assert np.array_equal(loaded.mask, vectors.mask)
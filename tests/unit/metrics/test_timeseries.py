@@ -7,8 +7,23 @@ import numpy.typing as npt
 import pandas as pd
 
 from phoenix.core.model_schema import Column
+from phoenix.inferences.vectors import VectorArray
 from phoenix.metrics import Metric
-from phoenix.metrics.metrics import CountNotNull, EuclideanDistance, Mean, VectorMean, VectorSum
+from phoenix.metrics.binning import QuantileBinning
+from phoenix.metrics.metrics import (
+    PSI,
+    Count,
+    CountNotNull,
+    EuclideanDistance,
+    JSDistance,
+    KLDivergence,
+    Mean,
+    PercentEmpty,
+    Quantile,
+    Sum,
+    VectorMean,
+    VectorSum,
+)
 from phoenix.metrics.timeseries import timeseries
 
 
@@ -319,3 +334,100 @@ def compare(expected: pd.DataFrame, actual: pd.DataFrame) -> None:
                 test.metric.get_value(result),
                 equal_nan=True,
             )
+
+
+def test_timeseries_decomposed_metrics_match_their_calculations() -> None:
+    rng = np.random.default_rng(12345)
+    size = 1000
+    index = pd.DatetimeIndex(
+        np.sort(rng.integers(0, 30 * 24 * 3600, size=size)) * 10**9 + start.value,
+        tz="UTC",
+    )
+    x = rng.normal(size=size)
+    x[rng.random(size=size) < 0.1] = np.nan
+    y = rng.choice(np.array(["A", "B", "C", np.nan], dtype=object), size=size)
+    v = [rng.normal(size=3) if rng.random() < 0.9 else np.nan for _ in range(size)]
+    df = pd.DataFrame({"x": x, "y": y, "v": v}, index=index)
+    reference = df.iloc[: size // 3]
+    metrics = (
+        Count(),
+        CountNotNull(operand=Column("x")),
+        Sum(operand=Column("x")),
+        Mean(operand=Column("x")),
+        PercentEmpty(operand=Column("x")),
+        VectorSum(operand=Column("v"), shape=3),
+        VectorMean(operand=Column("v"), shape=3),
+        EuclideanDistance(operand=Column("v"), reference_data=reference),
+        PSI(operand=Column("y"), reference_data=reference),
+        JSDistance(
+            operand=Column("x"),
+            reference_data=reference,
+            binning_method=QuantileBinning(reference_series=reference["x"]),
+        ),
+        KLDivergence(
+            operand=Column("x"),
+            reference_data=reference,
+            binning_method=QuantileBinning(),  # not decomposable
+        ),
+        Quantile(operand=Column("x")),  # not decomposable
+    )
+    evaluation_window = timedelta(hours=72)
+    for sampling_interval in (timedelta(hours=24), timedelta(hours=50)):
+        actual = df.pipe(
+            timeseries(
+                start_time=start,
+                end_time=start + timedelta(days=30),
+                evaluation_window=evaluation_window,
+                sampling_interval=sampling_interval,
+            ),
+            metrics=metrics,
+        )
+        assert len(actual)
+        for timestamp, row in actual.iterrows():
+            window = df.loc[
+                (df.index >= timestamp - evaluation_window) & (df.index < timestamp)  # type: ignore
+            ]
+            for metric in metrics:
+                assert np.allclose(
+                    metric.get_value(row.to_dict()),
+                    metric.calc(window),
+                    equal_nan=True,
+                )
+
+
+def test_timeseries_of_vector_metrics_over_vector_arrays() -> None:
+    rng = np.random.default_rng(12345)
+    size = 1000
+    index = pd.DatetimeIndex(
+        np.sort(rng.integers(0, 30 * 24 * 3600, size=size)) * 10**9 + start.value,
+        tz="UTC",
+    )
+    v = [rng.normal(size=3) if rng.random() < 0.9 else np.nan for _ in range(size)]
+    df = pd.DataFrame({"v": v}, index=index)
+    df_of_arrays = pd.DataFrame({"v": VectorArray.from_vectors(df["v"])}, index=index)
+    metrics = (
+        VectorSum(operand=Column("v"), shape=3),
+        VectorMean(operand=Column("v"), shape=3),
+        EuclideanDistance(operand=Column("v"), reference_data=df.iloc[: size // 3]),
+    )
+    metrics_of_arrays = (
+        *metrics[:2],
+        EuclideanDistance(operand=Column("v"), reference_data=df_of_arrays.iloc[: size // 3]),
+    )
+    parameters = dict(
+        start_time=start,
+        end_time=start + timedelta(days=30),
+        evaluation_window=timedelta(hours=72),
+        sampling_interval=timedelta(hours=24),
+    )
+    expected = df.pipe(timeseries(**parameters), metrics=metrics)
+    actual = df_of_arrays.pipe(timeseries(**parameters), metrics=metrics_of_arrays)
+    assert len(actual) == len(expected)
+    for (_, row), (_, expected_row) in zip(actual.iterrows(), expected.iterrows()):
+        for metric, expected_metric in zip(metrics_of_arrays, metrics):
+            assert np.allclose(
+                metric.get_value(row.to_dict()),
+                expected_metric.get_value(expected_row.to_dict()),
+                atol=1e-5,
+            )
+    assert np.allclose(metrics[1].calc(df), metrics[1].calc(df_of_arrays), atol=1e-5)
@@ -0,0 +1,87 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+import numpy.typing as npt
+
+from phoenix.pointcloud.service import PointCloudService
+
+
+@dataclass
+class MockFittedProjector:
+    embedding: npt.NDArray[np.float64]
+    transformed: list[int] = field(default_factory=list)
+
+    def transform(self, mat: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        self.transformed.append(len(mat))
+        return np.full((len(mat), self.embedding.shape[1]), -1.0)
+
+
+@dataclass(frozen=True)
+class MockDimensionalityReducer:
+    fitted: list[MockFittedProjector] = field(default_factory=list, compare=False, hash=False)
+
+    def fit(self, mat: npt.NDArray[np.float64], n_components: int) -> MockFittedProjector:
+        projector = MockFittedProjector(mat[:, :n_components].copy())
+        self.fitted.append(projector)
+        return projector
+
+
+@dataclass(frozen=True)
+class MockClustersFinder:
+    num_clusters: int
+
+    def find_clusters(self, mat: npt.NDArray[np.float64]) -> list[set[int]]:
+        return [set(range(i, len(mat), self.num_clusters)) for i in range(self.num_clusters)]
+
+
+def _data(ids: range) -> dict[int, npt.NDArray[np.float64]]:
+    return {i: np.full(4, float(i)) for i in ids}
+
+
+def test_clusters_are_found_again_without_projecting_again() -> None:
+    service = PointCloudService()
+    reducer = MockDimensionalityReducer()
+    points, clusters = service.generate("x", _data(range(10)), reducer, MockClustersFinder(2))
+    assert len(reducer.fitted) == 1
+    assert set(points) == set(range(10))
+    assert len(clusters) == 2
+    points_again, clusters = service.generate("x", _data(range(10)), reducer, MockClustersFinder(5))
+    assert len(reducer.fitted) == 1
+    assert len(clusters) == 5
+    assert all(np.array_equal(points[i], points_again[i]) for i in points)
+
+
+def test_new_points_are_transformed_by_the_fitted_model() -> None:
+    service = PointCloudService()
+    reducer = MockDimensionalityReducer()
+    points, _ = service.generate("x", _data(range(10)), reducer, MockClustersFinder(1))
+    shifted, _ = service.generate("x", _data(range(3, 13)), reducer, MockClustersFinder(1))
+    assert len(reducer.fitted) == 1
+    assert reducer.fitted[0].transformed == [3]
+    assert all(np.array_equal(points[i], shifted[i]) for i in range(3, 10))
+    assert all((shifted[i] == -1).all() for i in range(10, 13))
+
+
+def test_model_is_fitted_again_when_most_points_are_new() -> None:
+    service = PointCloudService()
+    reducer = MockDimensionalityReducer()
+    service.generate("x", _data(range(10)), reducer, MockClustersFinder(1))
+    service.generate("x", _data(range(6, 16)), reducer, MockClustersFinder(1))
+    assert len(reducer.fitted) == 2
+    assert reducer.fitted[0].transformed == []
+
+
+def test_models_are_not_shared_across_dimensions_or_components() -> None:
+    service = PointCloudService()
+    reducer = MockDimensionalityReducer()
+    service.generate("x", _data(range(10)), reducer, MockClustersFinder(1))
+    service.generate("y", _data(range(10)), reducer, MockClustersFinder(1))
+    points, _ = service.generate("x", _data(range(10)), reducer, MockClustersFinder(1), 2)
+    assert len(reducer.fitted) == 3
+    assert all(len(point) == 2 for point in points.values())
+
+
+def test_empty_data() -> None:
+    reducer = MockDimensionalityReducer()
+    assert PointCloudService().generate("x", {}, reducer, MockClustersFinder(1)) == ({}, {})
+    assert not reducer.fitted
@@ -5,6 +5,7 @@ import pytest
 from sqlalchemy import insert
 
 from phoenix.db import models
+from phoenix.db.rollups import rebuild_rollups
 from phoenix.server.types import DbSessionFactory
 
 
@@ -114,6 +115,7 @@ async def data_for_testing_dataloaders(
                                     user_id=None,
                                 )
                             )
+        await rebuild_rollups(session)
 
 
 @pytest.fixture
@@ -7,6 +7,7 @@ import pytest
 from sqlalchemy import select
 
 from phoenix.db import models
+from phoenix.db.sketches import RELATIVE_ACCURACY
 from phoenix.server.api.dataloaders import LatencyMsQuantileDataLoader
 from phoenix.server.api.dataloaders.latency_ms_quantile import Key
 from phoenix.server.api.input_types.TimeRange import TimeRange
@@ -63,4 +64,60 @@ async def test_latency_ms_quantiles_p25_p50_p75(
         for probability in (0.25, 0.50, 0.75)
     ]
     actual = await LatencyMsQuantileDataLoader(db)._load_fn(keys)
-    assert actual == pytest.approx(expected, 1e-7)
+    # unfiltered quantiles are estimated from sketches
+    num_trace_keys = len(trace_df["project_rowid"].unique()) * 3
+    for a, e, t in zip(
+        actual[:num_trace_keys], expected[:num_trace_keys], _tolerances(trace_df, 3)
+    ):
+        assert a == pytest.approx(e, abs=t)
+    assert actual[num_trace_keys:] == pytest.approx(expected[num_trace_keys:], 1e-7)
+
+
+@pytest.mark.parametrize("kind", ["span", "trace"])
+async def test_latency_ms_quantiles_from_hourly_sketches(
+    db: DbSessionFactory,
+    data_for_testing_dataloaders: None,
+    kind: Literal["span", "trace"],
+) -> None:
+    # whole hours are read from the sketches, and the partial hour at the start from the spans
+    start_time = datetime.fromisoformat("2020-12-31T23:30:00.000+00:00")
+    end_time = datetime.fromisoformat("2021-01-01T02:00:00.000+00:00")
+    pid = models.Trace.project_rowid
+    table = models.Trace if kind == "trace" else models.Span
+    async with db() as session:
+        df = await session.run_sync(
+            lambda s: pd.read_sql_query(
+                select(pid, table.latency_ms.label("latency_ms")).join_from(models.Trace, table)
+                if kind == "span"
+                else select(pid, table.latency_ms.label("latency_ms")),
+                s.connection(),
+            )
+        )
+    probabilities = (0.01, 0.5, 0.99)
+    expected = (
+        df.groupby("project_rowid")["latency_ms"]
+        .quantile(np.array(probabilities))
+        .sort_index()
+        .to_list()
+    )
+    keys: list[Key] = [
+        (kind, id_ + 1, TimeRange(start=start_time, end=end_time), None, probability)
+        for id_ in range(10)
+        for probability in probabilities
+    ]
+    actual = await LatencyMsQuantileDataLoader(db)._load_fn(keys)
+    for a, e, t in zip(actual, expected, _tolerances(df, len(probabilities))):
+        assert a == pytest.approx(e, abs=t)
+
+
+def _tolerances(df: pd.DataFrame, num_probabilities: int) -> list[float]:
+    """
+    Quantiles interpolated between two latencies estimated by a sketch are within the
+    relative accuracy of the largest of them.
+    """
+    max_abs_latencies = df["latency_ms"].abs().groupby(df["project_rowid"]).max().sort_index()
+    return [
+        RELATIVE_ACCURACY * max_abs_latency
+        for max_abs_latency in max_abs_latencies
+        for _ in range(num_probabilities)
+    ]
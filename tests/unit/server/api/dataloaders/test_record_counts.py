@@ -56,3 +56,34 @@ async def test_record_counts(
 
     actual = await RecordCountDataLoader(db)._load_fn(keys)
     assert actual == expected
+
+
+async def test_record_counts_from_hourly_rollups(
+    db: DbSessionFactory,
+    data_for_testing_dataloaders: None,
+) -> None:
+    # whole hours are read from the rollups, and the partial hour at the start from the spans
+    start_time = datetime.fromisoformat("2020-12-31T23:30:00.000+00:00")
+    end_time = datetime.fromisoformat("2021-01-01T02:00:00.000+00:00")
+    pid = models.Trace.project_rowid
+    async with db() as session:
+        span_counts = dict(
+            (
+                await session.execute(
+                    select(pid, func.count()).join_from(models.Trace, models.Span).group_by(pid)
+                )
+            ).all()
+        )
+        trace_counts = dict((await session.execute(select(pid, func.count()).group_by(pid))).all())
+    kinds: list[Literal["span", "trace"]] = ["trace", "span"]
+    keys: list[Key] = [
+        (kind, id_ + 1, TimeRange(start=start_time, end=end_time), None)
+        for kind in kinds
+        for id_ in range(10)
+    ]
+    expected = [
+        (trace_counts if kind == "trace" else span_counts)[project_rowid]
+        for kind, project_rowid, *_ in keys
+    ]
+    actual = await RecordCountDataLoader(db)._load_fn(keys)
+    assert actual == expected
@@ -55,3 +55,42 @@ async def test_token_counts(
     ]
     actual = await TokenCountDataLoader(db)._load_fn(keys)
     assert actual == expected
+
+
+async def test_token_counts_from_hourly_rollups(
+    db: DbSessionFactory,
+    data_for_testing_dataloaders: None,
+) -> None:
+    # whole hours are read from the rollups, and the partial hour at the start from the spans
+    start_time = datetime.fromisoformat("2020-12-31T23:30:00.000+00:00")
+    end_time = datetime.fromisoformat("2021-01-01T02:00:00.000+00:00")
+    pid = models.Trace.project_rowid
+    async with db() as session:
+        sums = {
+            project_rowid: (prompt, completion)
+            for project_rowid, prompt, completion in await session.execute(
+                select(
+                    pid,
+                    func.sum(models.Span.llm_token_count_prompt),
+                    func.sum(models.Span.llm_token_count_completion),
+                )
+                .join_from(models.Trace, models.Span)
+                .group_by(pid)
+            )
+        }
+    kinds: list[Literal["prompt", "completion", "total"]] = ["prompt", "completion", "total"]
+    keys: list[Key] = [
+        (kind, id_ + 1, TimeRange(start=start_time, end=end_time), None)
+        for kind in kinds
+        for id_ in range(10)
+    ]
+    expected = [
+        sums[project_rowid][0]
+        if kind == "prompt"
+        else sums[project_rowid][1]
+        if kind == "completion"
+        else sum(sums[project_rowid])
+        for kind, project_rowid, *_ in keys
+    ]
+    actual = await TokenCountDataLoader(db)._load_fn(keys)
+    assert actual == expected
@@ -543,6 +543,64 @@ async def test_post_dataset_upload_csv_create_then_append(
     assert revisions[1].metadata_ == {"c": "33", "d": "44", "e": "55"}
 
 
+async def test_post_dataset_upload_jsonl(
+    httpx_client: httpx.AsyncClient,
+    db: DbSessionFactory,
+) -> None:
+    name = inspect.stack()[0][3]
+    file = gzip.compress(
+        b'{"a": 1, "b": {"x": [2]}, "c": "3"}\n' b"\n" b'{"a": 11, "c": "33", "d": null}\n'
+    )
+    response = await httpx_client.post(
+        url="v1/datasets/upload?sync=true",
+        files={"file": (" ", file, "application/jsonl", {"Content-Encoding": "gzip"})},
+        data={
+            "action": "create",
+            "name": name,
+            "input_keys[]": ["a", "b"],
+            "output_keys[]": ["c"],
+        },
+    )
+    assert response.status_code == 200
+    async with db() as session:
+        revisions = list(
+            await session.scalars(
+                select(models.DatasetExampleRevision)
+                .join(models.DatasetExample)
+                .join_from(models.DatasetExample, models.Dataset)
+                .where(models.Dataset.name == name)
+                .order_by(models.DatasetExample.id)
+            )
+        )
+    assert len(revisions) == 2
+    assert revisions[0].input == {"a": 1, "b": {"x": [2]}}
+    assert revisions[0].output == {"c": "3"}
+    assert revisions[0].metadata_ == {}
+    assert revisions[1].input == {"a": 11, "b": None}
+    assert revisions[1].output == {"c": "33"}
+    for file, detail in [
+        (b'{"a": 1}\n', "output keys not found"),
+        (b'{"a": 1, "c": 2}\n[1, 2]\n', "should be a JSON object"),
+        (b'{"a": 1, "c": 2}\n{"a": \n', "Expecting value"),
+    ]:
+        response = await httpx_client.post(
+            url="v1/datasets/upload?sync=true",
+            files={"file": (" ", file, "application/jsonl", {})},
+            data={
+                "action": "create",
+                "name": f"{name}_invalid",
+                "input_keys[]": ["a"],
+                "output_keys[]": ["c"],
+            },
+        )
+        assert response.status_code == 422
+        assert detail in response.text
+    async with db() as session:
+        assert not await session.scalar(
+            select(models.Dataset.id).where(models.Dataset.name == f"{name}_invalid")
+        )
+
+
 async def test_post_dataset_upload_pyarrow_create_then_append(
     httpx_client: httpx.AsyncClient,
     db: DbSessionFactory,
@@ -797,6 +855,37 @@ async def test_list_dataset_with_revisions_examples(
         assert example_subset == expected
 
 
+async def test_list_dataset_examples_with_limit_and_cursor(
+    httpx_client: httpx.AsyncClient,
+    dataset_with_revisions: Any,
+) -> None:
+    global_id = GlobalID("Dataset", str(2))
+    response = await httpx_client.get(f"/v1/datasets/{global_id}/examples", params={"limit": 2})
+    assert response.status_code == 200
+    result = response.json()
+    assert [example["id"] for example in result["data"]["examples"]] == [
+        str(GlobalID("DatasetExample", str(3))),
+        str(GlobalID("DatasetExample", str(4))),
+    ]
+    assert result["next_cursor"] == str(GlobalID("DatasetExample", str(5)))
+    response = await httpx_client.get(
+        f"/v1/datasets/{global_id}/examples",
+        params={"limit": 2, "cursor": result["next_cursor"]},
+    )
+    assert response.status_code == 200
+    result = response.json()
+    assert [example["id"] for example in result["data"]["examples"]] == [
+        str(GlobalID("DatasetExample", str(5))),
+    ]
+    assert result["next_cursor"] is None
+    response = await httpx_client.get(
+        f"/v1/datasets/{global_id}/examples",
+        params={"cursor": str(GlobalID("Dataset", str(2)))},
+    )
+    assert response.status_code == 422
+    assert response.content.decode() == f"Invalid cursor: {GlobalID('Dataset', str(2))}"
+
+
 async def test_list_dataset_with_revisions_examples_at_each_version(
     httpx_client: httpx.AsyncClient,
     dataset_with_revisions: Any,
@@ -289,3 +289,102 @@ async def test_deleting_dataset_also_deletes_experiments(
     assert len((await httpx_client.get(runs_url)).json()["data"]) == 0
     with pytest.raises(HTTPStatusError):
         (await httpx_client.get(exp_url)).raise_for_status()
+
+
+async def test_creating_experiment_runs_and_evaluations_in_bulk(
+    httpx_client: httpx.AsyncClient,
+    simple_dataset: Any,
+) -> None:
+    dataset_gid = GlobalID("Dataset", "0")
+    example_gid = GlobalID("DatasetExample", "0")
+    experiment_gid = (
+        await httpx_client.post(
+            f"/v1/datasets/{dataset_gid}/experiments",
+            json={"version_id": None, "repetitions": 2},
+        )
+    ).json()["data"]["id"]
+    runs_url = f"/v1/experiments/{experiment_gid}/runs"
+
+    def run_payload(repetition_number: int) -> dict[str, Any]:
+        return {
+            "dataset_example_id": str(example_gid),
+            "output": f"output {repetition_number}",
+            "repetition_number": repetition_number,
+            "start_time": datetime.datetime.now().isoformat(),
+            "end_time": datetime.datetime.now().isoformat(),
+        }
+
+    # run IDs are returned in order, and runs already submitted have none
+    response = await httpx_client.post(
+        f"{runs_url}/batch",
+        json={"data": [run_payload(2), run_payload(1), run_payload(2)]},
+    )
+    assert response.status_code == 200
+    run_ids = [run["id"] for run in response.json()["data"]]
+    assert run_ids[0] and run_ids[1] and run_ids[0] != run_ids[1]
+    assert run_ids[2] is None
+    response = await httpx_client.post(f"{runs_url}/batch", json={"data": [run_payload(1)]})
+    assert response.json()["data"] == [{"id": None}]
+    runs = {run["id"]: run for run in (await httpx_client.get(runs_url)).json()["data"]}
+    assert len(runs) == 2
+    assert runs[run_ids[0]]["output"] == "output 2"
+    assert runs[run_ids[1]]["output"] == "output 1"
+
+    # missing experiments and examples are rejected as a whole
+    response = await httpx_client.post(
+        f"/v1/experiments/{GlobalID('Experiment', '9000')}/runs/batch",
+        json={"data": [run_payload(3)]},
+    )
+    assert response.status_code == 404
+    response = await httpx_client.post(
+        f"{runs_url}/batch",
+        json={"data": [run_payload(3), {**run_payload(3), "dataset_example_id": "bad"}]},
+    )
+    assert response.status_code == 404
+    response = await httpx_client.post(
+        f"{runs_url}/batch",
+        json={
+            "data": [
+                run_payload(3),
+                {**run_payload(3), "dataset_example_id": str(GlobalID("DatasetExample", "9"))},
+            ]
+        },
+    )
+    assert response.status_code == 404
+    assert len((await httpx_client.get(runs_url)).json()["data"]) == 2
+
+    # evaluation IDs are returned in order, and evaluations are upserted
+    def evaluation_payload(run_id: str, score: float) -> dict[str, Any]:
+        return {
+            "experiment_run_id": run_id,
+            "name": "some_evaluation_name",
+            "annotator_kind": "CODE",
+            "result": {"score": score},
+            "start_time": datetime.datetime.now().isoformat(),
+            "end_time": datetime.datetime.now().isoformat(),
+        }
+
+    evaluations_url = "/v1/experiment_evaluations/batch"
+    response = await httpx_client.post(
+        evaluations_url,
+        json={"data": [evaluation_payload(run_ids[1], 0.0), evaluation_payload(run_ids[0], 1.0)]},
+    )
+    assert response.status_code == 200
+    evaluation_ids = [evaluation["id"] for evaluation in response.json()["data"]]
+    assert len(set(evaluation_ids)) == 2
+    response = await httpx_client.post(
+        evaluations_url,
+        json={"data": [evaluation_payload(run_ids[0], 0.5), evaluation_payload(run_ids[0], 0.75)]},
+    )
+    assert [evaluation["id"] for evaluation in response.json()["data"]] == [evaluation_ids[1]] * 2
+    annotations = {
+        run["repetition_number"]: run["annotations"]
+        for run in (await httpx_client.get(f"/v1/experiments/{experiment_gid}/json")).json()
+    }
+    assert annotations[1][0]["score"] == 0.0
+    assert annotations[2][0]["score"] == 0.75
+    response = await httpx_client.post(
+        evaluations_url,
+        json={"data": [evaluation_payload(str(GlobalID("ExperimentRun", "9000")), 0.0)]},
+    )
+    assert response.status_code == 404
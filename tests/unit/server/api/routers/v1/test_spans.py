@@ -5,13 +5,14 @@ from typing import Any, cast
 
 import httpx
 import pandas as pd
+import pyarrow as pa
 import pytest
 from faker import Faker
 from sqlalchemy import insert, select
 
 from phoenix import Client as LegacyClient
 from phoenix import TraceDataset
-from phoenix.client import Client
+from phoenix.client import AsyncClient, Client
 from phoenix.db import models
 from phoenix.server.api.routers.v1.spans import OtlpAnyValue, OtlpSpan, OtlpStatus
 from phoenix.server.types import DbSessionFactory
@@ -51,6 +52,100 @@ async def test_querying_spans_with_new_client(
     assert legacy_df.equals(df)
 
 
+@pytest.fixture
+async def spans_with_varying_attributes(db: DbSessionFactory) -> None:
+    async with db() as session:
+        project = models.Project(name="default")
+        session.add(project)
+        await session.flush()
+        start_time = datetime.fromisoformat("2021-01-01T00:00:00+00:00")
+        for i in range(5):
+            trace = models.Trace(
+                project_rowid=project.id,
+                trace_id=f"{i:032x}",
+                start_time=start_time,
+                end_time=start_time,
+            )
+            session.add(trace)
+            await session.flush()
+            session.add(
+                models.Span(
+                    trace_rowid=trace.id,
+                    span_id=f"{i:016x}",
+                    name=f"span-{i}",
+                    span_kind="LLM" if i % 2 else "CHAIN",
+                    start_time=start_time + timedelta(seconds=i),
+                    end_time=start_time + timedelta(seconds=i + 1),
+                    # the attributes differ from span to span, and hence from chunk to chunk
+                    attributes=(
+                        {"input": {"value": f"in-{i}"}}
+                        if i % 2
+                        else {"output": {"value": f"out-{i}"}}
+                    ),
+                    events=[],
+                    status_code="OK",
+                    status_message="",
+                    cumulative_error_count=0,
+                    cumulative_llm_token_count_prompt=0,
+                    cumulative_llm_token_count_completion=0,
+                )
+            )
+
+
+async def test_querying_spans_in_chunks(
+    legacy_px_client: LegacyClient,
+    px_client: Client,
+    httpx_client: httpx.AsyncClient,
+    spans_with_varying_attributes: Any,
+) -> None:
+    queries = [SpanQuery(), SpanQuery().select("name", "input.value").where("span_kind == 'LLM'")]
+    expected = cast(list[pd.DataFrame], legacy_px_client.query_spans(*queries, limit=100))
+    actual = cast(
+        list[pd.DataFrame], legacy_px_client.query_spans(*queries, limit=100, chunk_size=2)
+    )
+    assert len(actual) == len(expected) == 2
+    for df, expected_df in zip(actual, expected):
+        pd.testing.assert_frame_equal(df[expected_df.columns], expected_df, check_dtype=False)
+    chunks = list(legacy_px_client.iter_spans_dataframes(limit=100, chunk_size=2))
+    assert [len(df) for df in chunks] == [2, 2, 1]
+    assert "attributes.input.value" not in chunks[-1].columns
+    pd.testing.assert_frame_equal(
+        cast(pd.DataFrame, px_client.spans.get_spans_dataframe(limit=5, chunk_size=2))[
+            expected[0].columns
+        ],
+        expected[0],
+        check_dtype=False,
+    )
+    pd.testing.assert_frame_equal(
+        (await AsyncClient(http_client=httpx_client).spans.get_spans_dataframe(chunk_size=2))[
+            expected[0].columns
+        ],
+        expected[0],
+        check_dtype=False,
+    )
+    chunks = list(px_client.spans.iter_spans_dataframes(query=queries[1], chunk_size=1))
+    assert [df.index.tolist() for df in chunks] == [[f"{1:016x}"], [f"{3:016x}"]]
+
+
+async def test_querying_spans_in_chunks_streams_arrow_ipc(
+    httpx_client: httpx.AsyncClient,
+    spans_with_varying_attributes: Any,
+) -> None:
+    response = await httpx_client.post(
+        "v1/spans",
+        json={"queries": [{}, {"filter": {"condition": "span_kind == 'NONE'"}}], "chunk_size": 2},
+    )
+    assert response.status_code == 200
+    source = pa.BufferReader(response.content)
+    query_indices = []
+    while source.tell() < source.size():
+        with pa.ipc.open_stream(source) as reader:
+            query_indices.append(reader.schema.metadata[b"phoenix.query_index"])
+            assert reader.read_all().num_rows <= 2
+    # the query that matches no spans still gets an (empty) chunk
+    assert query_indices == [b"0", b"0", b"0", b"1"]
+
+
 @pytest.mark.parametrize("sync", [False, True])
 async def test_rest_span_annotation(
     db: DbSessionFactory,
@@ -1,14 +1,23 @@
-from asyncio import sleep
+from asyncio import QueueFull, sleep
 from datetime import datetime
 from typing import Any
 
 import httpx
 import pytest
 from faker import Faker
-from sqlalchemy import insert, select
+from openinference.semconv.resource import ResourceAttributes
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+from opentelemetry.proto.common.v1.common_pb2 import AnyValue, KeyValue
+from opentelemetry.proto.resource.v1.resource_pb2 import Resource
+from opentelemetry.proto.trace.v1.trace_pb2 import ResourceSpans, ScopeSpans
+from sqlalchemy import func, insert, select
 
 from phoenix.db import models
+from phoenix.db.bulk_inserter import BulkInserter
+from phoenix.db.insertion.constants import DEFAULT_SPAN_BUFFER_RETRY_AFTER_SEC
 from phoenix.server.types import DbSessionFactory
+from phoenix.trace.otel import encode_span_to_otlp
+from phoenix.trace.schemas import Span, SpanContext, SpanKind, SpanStatusCode
 
 
 @pytest.fixture
@@ -102,3 +111,94 @@ async def test_rest_trace_annotation(
     assert orm_annotation.identifier == "identifier-name"
     assert orm_annotation.source == "APP"
     assert orm_annotation.user_id is None
+
+
+def _export_trace_service_request() -> ExportTraceServiceRequest:
+    start_time = datetime.fromisoformat("2021-01-01T00:00:00.000+00:00")
+    return ExportTraceServiceRequest(
+        resource_spans=[
+            ResourceSpans(
+                resource=Resource(
+                    attributes=[
+                        KeyValue(
+                            key=ResourceAttributes.PROJECT_NAME,
+                            value=AnyValue(string_value=f"project-{i}"),
+                        )
+                    ]
+                ),
+                scope_spans=[
+                    ScopeSpans(
+                        spans=[
+                            encode_span_to_otlp(
+                                Span(
+                                    name="span",
+                                    context=SpanContext(
+                                        trace_id=f"{i:032x}", span_id=f"{i * 10 + j + 1:016x}"
+                                    ),
+                                    span_kind=SpanKind.CHAIN,
+                                    parent_id=None,
+                                    start_time=start_time,
+                                    end_time=start_time,
+                                    status_code=SpanStatusCode.OK,
+                                    status_message="",
+                                    attributes={},
+                                    events=[],
+                                    conversation=None,
+                                )
+                            )
+                            for j in range(3)
+                        ]
+                    )
+                ],
+            )
+            for i in range(2)
+        ]
+    )
+
+
+async def test_post_traces(
+    db: DbSessionFactory,
+    httpx_client: httpx.AsyncClient,
+) -> None:
+    response = await httpx_client.post(
+        "v1/traces",
+        content=_export_trace_service_request().SerializeToString(),
+        headers={"content-type": "application/x-protobuf"},
+    )
+    assert response.status_code == 200
+    async with db() as session:
+        num_spans_by_project = dict(
+            (
+                await session.execute(
+                    select(models.Project.name, func.count(models.Span.id))
+                    .join(models.Trace, models.Trace.project_rowid == models.Project.id)
+                    .join(models.Span, models.Span.trace_rowid == models.Trace.id)
+                    .group_by(models.Project.name)
+                )
+            ).all()
+        )
+    assert num_spans_by_project == {"project-0": 3, "project-1": 3}
+
+
+@pytest.fixture
+def full_span_buffer(monkeypatch: pytest.MonkeyPatch) -> None:
+    def check_span_capacity(self: BulkInserter, num_spans: int, num_bytes: int) -> None:
+        raise QueueFull
+
+    monkeypatch.setattr(BulkInserter, "check_span_capacity", check_span_capacity)
+
+
+async def test_post_traces_when_span_buffer_is_full(
+    full_span_buffer: None,
+    db: DbSessionFactory,
+    httpx_client: httpx.AsyncClient,
+) -> None:
+    response = await httpx_client.post(
+        "v1/traces",
+        content=_export_trace_service_request().SerializeToString(),
+        headers={"content-type": "application/x-protobuf"},
+    )
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == str(DEFAULT_SPAN_BUFFER_RETRY_AFTER_SEC)
+    async with db() as session:
+        assert await session.scalar(select(func.count(models.Span.id))) == 0
@@ -259,6 +259,94 @@ class TestDatasetExamplesResolver:
         assert not response.errors
         assert response.data == {"node": {"examples": {"edges": []}}}
 
+    async def test_paginates_examples(
+        self,
+        gql_client: AsyncGraphQLClient,
+        dataset_with_patch_revision: Any,
+    ) -> None:
+        query = """
+          query ($datasetId: ID!, $after: String = null) {
+            node(id: $datasetId) {
+              ... on Dataset {
+                examples(first: 1, after: $after) {
+                  edges {
+                    node {
+                      id
+                    }
+                  }
+                  pageInfo {
+                    hasPreviousPage
+                    hasNextPage
+                    endCursor
+                  }
+                }
+              }
+            }
+          }
+        """
+        dataset_id = str(GlobalID("Dataset", str(1)))
+        response = await gql_client.execute(query=query, variables={"datasetId": dataset_id})
+        assert not response.errors
+        assert (data := response.data) is not None
+        examples = data["node"]["examples"]
+        assert examples["edges"] == [{"node": {"id": str(GlobalID("DatasetExample", str(2)))}}]
+        assert not examples["pageInfo"]["hasPreviousPage"]
+        assert examples["pageInfo"]["hasNextPage"]
+        response = await gql_client.execute(
+            query=query,
+            variables={"datasetId": dataset_id, "after": examples["pageInfo"]["endCursor"]},
+        )
+        assert not response.errors
+        assert (data := response.data) is not None
+        examples = data["node"]["examples"]
+        assert examples["edges"] == [{"node": {"id": str(GlobalID("DatasetExample", str(1)))}}]
+        assert not examples["pageInfo"]["hasNextPage"]
+        assert examples["pageInfo"]["hasPreviousPage"]
+
+    async def test_paginates_examples_backward(
+        self,
+        gql_client: AsyncGraphQLClient,
+        dataset_with_patch_revision: Any,
+    ) -> None:
+        query = """
+          query ($datasetId: ID!, $before: String = null) {
+            node(id: $datasetId) {
+              ... on Dataset {
+                examples(last: 1, before: $before) {
+                  edges {
+                    node {
+                      id
+                    }
+                  }
+                  pageInfo {
+                    hasPreviousPage
+                    hasNextPage
+                    startCursor
+                  }
+                }
+              }
+            }
+          }
+        """
+        dataset_id = str(GlobalID("Dataset", str(1)))
+        response = await gql_client.execute(query=query, variables={"datasetId": dataset_id})
+        assert not response.errors
+        assert (data := response.data) is not None
+        examples = data["node"]["examples"]
+        assert examples["edges"] == [{"node": {"id": str(GlobalID("DatasetExample", str(1)))}}]
+        assert examples["pageInfo"]["hasPreviousPage"]
+        assert not examples["pageInfo"]["hasNextPage"]
+        response = await gql_client.execute(
+            query=query,
+            variables={"datasetId": dataset_id, "before": examples["pageInfo"]["startCursor"]},
+        )
+        assert not response.errors
+        assert (data := response.data) is not None
+        examples = data["node"]["examples"]
+        assert examples["edges"] == [{"node": {"id": str(GlobalID("DatasetExample", str(2)))}}]
+        assert not examples["pageInfo"]["hasPreviousPage"]
+        assert examples["pageInfo"]["hasNextPage"]
+
     async def test_returns_latest_revisions_up_to_specified_version(
         self,
         gql_client: AsyncGraphQLClient,
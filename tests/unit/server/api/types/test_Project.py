@@ -12,6 +12,8 @@ from strawberry.relay import GlobalID
 
 from phoenix.config import DEFAULT_PROJECT_NAME
 from phoenix.db import models
+from phoenix.db.rollups import rebuild_rollups
+from phoenix.db.span_tree import rebuild_span_tree
 from phoenix.server.api.types.pagination import Cursor, CursorSortColumn, CursorSortColumnDataType
 from phoenix.server.api.types.Project import Project
 from phoenix.server.types import DbSessionFactory
@@ -1067,6 +1069,7 @@ async def llama_index_rag_spans(db: DbSessionFactory) -> None:
                 ],
             )
         ).all()
+        await rebuild_span_tree(session)
         await session.execute(
             insert(models.SpanAnnotation),
             [
@@ -1308,6 +1311,7 @@ class TestProject:
                     )
             session.add_all(spans)
             await session.flush()
+            await rebuild_span_tree(session)
 
         return _Data(
             spans=spans,
@@ -1768,6 +1772,7 @@ class TestProject:
 
             session.add_all(spans)
             await session.flush()
+            await rebuild_rollups(session)
 
         return _Data(
             spans=spans,
@@ -1901,6 +1906,9 @@ class TestProject:
             return
 
         # Verify the data points
+        assert {
+            datetime.fromisoformat(data_point["timestamp"]) for data_point in res["data"]
+        } == set(expected_counts), f"Unexpected hours for {description}"
         for data_point in res["data"]:
             timestamp = datetime.fromisoformat(data_point["timestamp"])
             value = data_point["value"]
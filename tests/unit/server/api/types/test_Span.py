@@ -13,6 +13,7 @@ from strawberry.relay import GlobalID
 from typing_extensions import TypeAlias
 
 from phoenix.db import models
+from phoenix.db.span_tree import rebuild_span_tree
 from phoenix.server.api.types.node import from_global_id_with_expected_type
 from phoenix.server.api.types.Project import Project
 from phoenix.server.api.types.Span import Span
@@ -112,6 +113,39 @@ async def test_querying_spans_not_contained_in_datasets(
     assert actual_contained_in_dataset is False
 
 
+async def test_llm_fields_are_loaded_without_whole_attributes(
+    gql_client: AsyncGraphQLClient,
+    _llm_span: None,
+) -> None:
+    query = """
+      query ($spanId: ID!) {
+        span: node(id: $spanId) {
+          ... on Span {
+            tokenPromptDetails {
+              cacheRead
+              cacheWrite
+              audio
+            }
+            invocationParameters {
+              ... on InvocationParameterBase {
+                invocationName
+              }
+            }
+          }
+        }
+      }
+    """
+    span_id = str(GlobalID(Span.__name__, str(1)))
+    response = await gql_client.execute(query=query, variables={"spanId": span_id})
+    assert not response.errors
+    assert (data := response.data) is not None
+    assert data["span"]["tokenPromptDetails"] == {"cacheRead": 3, "cacheWrite": None, "audio": 1}
+    assert {p["invocationName"] for p in data["span"]["invocationParameters"]} == {
+        "temperature",
+        "max_tokens",
+    }
+
+
 async def test_span_fields(
     gql_client: AsyncGraphQLClient,
     _span_data: tuple[models.Project, Mapping[int, models.Trace], Mapping[int, models.Span]],
@@ -456,6 +490,7 @@ async def _span_data(
             await session.flush()
             for span in trace_spans:
                 spans[span.id] = span
+        await rebuild_span_tree(session)
     return project, traces, spans
 
 
@@ -505,6 +540,58 @@ async def project_with_a_single_trace_and_span(
         )
 
 
+@pytest.fixture
+async def _llm_span(
+    db: DbSessionFactory,
+) -> None:
+    """
+    Contains a single LLM span with large input and output values.
+    """
+    async with db() as session:
+        project_rowid = await session.scalar(
+            insert(models.Project).values(name="project-name").returning(models.Project.id)
+        )
+        trace_rowid = await session.scalar(
+            insert(models.Trace)
+            .values(
+                trace_id="1",
+                project_rowid=project_rowid,
+                start_time=datetime.fromisoformat("2021-01-01T00:00:00.000+00:00"),
+                end_time=datetime.fromisoformat("2021-01-01T00:01:00.000+00:00"),
+            )
+            .returning(models.Trace.id)
+        )
+        await session.execute(
+            insert(models.Span).values(
+                trace_rowid=trace_rowid,
+                span_id="1",
+                parent_id=None,
+                name="llm span",
+                span_kind="LLM",
+                start_time=datetime.fromisoformat("2021-01-01T00:00:00.000+00:00"),
+                end_time=datetime.fromisoformat("2021-01-01T00:00:30.000+00:00"),
+                attributes={
+                    "input": {"value": "x" * 100_000},
+                    "output": {"value": "y" * 100_000},
+                    "llm": {
+                        "provider": "openai",
+                        "model_name": "gpt-4o",
+                        "invocation_parameters": json.dumps(
+                            {"temperature": 0.5, "max_tokens": 10, "unsupported": True}
+                        ),
+                        "token_count": {"prompt_details": {"cache_read": 3, "audio": 1}},
+                    },
+                },
+                events=[],
+                status_code="OK",
+                status_message="okay",
+                cumulative_error_count=0,
+                cumulative_llm_token_count_prompt=0,
+                cumulative_llm_token_count_completion=0,
+            )
+        )
+
+
 @pytest.fixture
 async def simple_dataset(
     db: DbSessionFactory,
@@ -0,0 +1,109 @@
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from typing import Callable
+
+import httpx
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from phoenix.server.types import DbSessionFactory
+from tests.unit.conftest import db_session_factory
+
+
+class TestDbSessionRouting:
+    """
+    `DbSessionRouter` and `DbWriteRecorder`, with the same SQLite database standing in for
+    both the primary and the read replica.
+    """
+
+    @pytest.fixture
+    def opened(self) -> list[str]:
+        return []
+
+    @pytest.fixture
+    def db(self, sqlite_engine: AsyncEngine, opened: list[str]) -> DbSessionFactory:
+        db = db_session_factory(sqlite_engine)
+
+        def pool(name: str) -> Callable[[], AbstractAsyncContextManager[AsyncSession]]:
+            @asynccontextmanager
+            async def factory() -> AsyncIterator[AsyncSession]:
+                opened.append(name)
+                async with db() as session:
+                    yield session
+
+            return factory
+
+        return DbSessionFactory(
+            db=pool("primary"),
+            dialect=db.dialect.value,
+            read_replica=pool("replica"),
+        )
+
+    async def test_queries_read_from_replica(
+        self,
+        httpx_client: httpx.AsyncClient,
+        opened: list[str],
+    ) -> None:
+        opened.clear()  # of the sessions of the app's startup
+        response = await httpx_client.post(
+            "/graphql",
+            json={"query": "query { projects { edges { node { name } } } }"},
+        )
+        assert response.status_code == 200
+        assert not response.json().get("errors")
+        assert opened and set(opened) == {"replica"}
+
+    async def test_mutations_use_primary_and_later_reads_follow(
+        self,
+        httpx_client: httpx.AsyncClient,
+        opened: list[str],
+    ) -> None:
+        opened.clear()  # of the sessions of the app's startup
+        response = await httpx_client.post(
+            "/graphql",
+            json={"query": 'mutation { createDataset(input: {name: "d"}) { dataset { name } } }'},
+        )
+        assert response.status_code == 200
+        assert not response.json().get("errors")
+        assert opened and set(opened) == {"primary"}
+        opened.clear()
+        response = await httpx_client.post(
+            "/graphql",
+            json={"query": "query { datasets { edges { node { name } } } }"},
+        )
+        assert response.status_code == 200
+        assert response.json()["data"]["datasets"]["edges"] == [{"node": {"name": "d"}}]
+        assert opened and set(opened) == {"primary"}
+
+    async def test_rest_writes_are_recorded(
+        self,
+        httpx_client: httpx.AsyncClient,
+        opened: list[str],
+    ) -> None:
+        opened.clear()  # of the sessions of the app's startup
+        response = await httpx_client.get("/v1/projects")
+        assert response.status_code == 200
+        assert opened == ["replica"]
+        opened.clear()
+        response = await httpx_client.post(
+            "/v1/datasets/upload?sync=true",
+            json={"action": "create", "name": "d", "inputs": [{"a": 1}], "outputs": [{}]},
+        )
+        assert response.status_code == 200
+        opened.clear()
+        response = await httpx_client.get("/v1/datasets")
+        assert response.status_code == 200
+        assert opened == ["primary"]
+
+    async def test_span_queries_are_not_recorded_as_writes(
+        self,
+        httpx_client: httpx.AsyncClient,
+        opened: list[str],
+    ) -> None:
+        opened.clear()  # of the sessions of the app's startup
+        response = await httpx_client.post("/v1/spans", json={"queries": [{}]})
+        assert response.status_code == 200
+        opened.clear()
+        response = await httpx_client.get("/v1/projects")
+        assert response.status_code == 200
+        assert opened == ["replica"]
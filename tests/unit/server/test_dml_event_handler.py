@@ -0,0 +1,123 @@
+from asyncio import get_running_loop
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import pytest
+from prometheus_client import REGISTRY
+
+from phoenix.server.api.dataloaders import CacheForDataLoaders
+from phoenix.server.api.dataloaders.cache import TimeBounds
+from phoenix.server.api.dataloaders.record_counts import Key
+from phoenix.server.api.input_types.TimeRange import TimeRange
+from phoenix.server.dml_event import SpanDeleteEvent, SpanDmlEvent, SpanInsertEvent
+from phoenix.server.dml_event_handler import _merge_time_bounds, _SpanDmlEventHandler
+from phoenix.server.types import DbSessionFactory, LastUpdatedAt
+
+_T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _hour(hour: int) -> TimeRange:
+    return TimeRange(start=_T0 + timedelta(hours=hour), end=_T0 + timedelta(hours=hour + 1))
+
+
+_KEYS: list[Key] = [
+    ("span", 1, _hour(0), None),
+    ("span", 1, _hour(1), None),
+    ("span", 1, _hour(2), None),
+    ("trace", 1, _hour(1), "span_kind == 'LLM'"),
+    ("span", 1, None, None),
+    ("span", 1, TimeRange(start=_T0 + timedelta(hours=2)), None),
+    ("span", 2, _hour(1), None),
+]
+
+
+class TestSpanDmlEventHandler:
+    @pytest.mark.parametrize(
+        "event,expected",
+        [
+            pytest.param(
+                SpanInsertEvent(
+                    (1,),
+                    {
+                        1: (
+                            _T0 + timedelta(hours=1, minutes=30),
+                            _T0 + timedelta(hours=1, minutes=31),
+                        )
+                    },
+                ),
+                [True, False, True, False, False, True, True],
+                id="insert-with-time-bounds",
+            ),
+            pytest.param(
+                SpanInsertEvent((1,)),
+                [False, False, False, False, False, False, True],
+                id="insert-without-time-bounds",
+            ),
+            pytest.param(
+                SpanDeleteEvent((1,)),
+                [False, False, False, False, False, False, True],
+                id="delete",
+            ),
+        ],
+    )
+    async def test_only_overlapping_intervals_are_invalidated(
+        self,
+        db: DbSessionFactory,
+        event: SpanDmlEvent,
+        expected: list[bool],
+    ) -> None:
+        cache = CacheForDataLoaders(enable_prometheus=True)
+        for key in _KEYS:
+            cache.record_count.set(key, get_running_loop().create_future())
+        handler = _SpanDmlEventHandler(
+            db=db,
+            last_updated_at=LastUpdatedAt(),
+            cache_for_dataloaders=cache,
+        )
+        handler.put(event)
+        await handler()
+        hits, misses = _dataloader_cache_lookups("record_count")
+        assert [cache.record_count.get(key) is not None for key in _KEYS] == expected
+        assert cache.record_count.hits == sum(expected)
+        assert cache.record_count.misses == len(expected) - sum(expected)
+        assert _dataloader_cache_lookups("record_count") == (
+            hits + sum(expected),
+            misses + len(expected) - sum(expected),
+        )
+
+
+@pytest.mark.parametrize(
+    "events,expected",
+    [
+        pytest.param(
+            [
+                SpanInsertEvent((1, 2), {1: (_T0, _T0), 2: (_T0, _T0)}),
+                SpanInsertEvent((1,), {1: (_T0 + timedelta(hours=1), _T0 + timedelta(hours=2))}),
+            ],
+            {1: (_T0, _T0 + timedelta(hours=2)), 2: (_T0, _T0)},
+            id="union",
+        ),
+        pytest.param(
+            [
+                SpanInsertEvent((1, 2), {1: (_T0, _T0), 2: (_T0, _T0)}),
+                SpanInsertEvent((1,)),
+                SpanDeleteEvent((2,)),
+            ],
+            {1: None, 2: None},
+            id="unbounded",
+        ),
+    ],
+)
+def test_merge_time_bounds(
+    events: list[SpanDmlEvent],
+    expected: dict[int, Optional[TimeBounds]],
+) -> None:
+    assert _merge_time_bounds(events) == expected
+
+
+def _dataloader_cache_lookups(cache: str) -> tuple[float, float]:
+    """The hits and misses of a data loader cache reported to Prometheus."""
+    return (
+        REGISTRY.get_sample_value("dataloader_cache_hits_total", {"cache": cache}) or 0,
+        REGISTRY.get_sample_value("dataloader_cache_misses_total", {"cache": cache}) or 0,
+    )
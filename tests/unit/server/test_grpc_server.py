@@ -0,0 +1,103 @@
+from asyncio import QueueFull
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from pathlib import Path
+
+import grpc
+import pytest
+from google.rpc.error_details_pb2 import RetryInfo
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2_grpc import (
+    TraceServiceStub,
+    add_TraceServiceServicer_to_server,
+)
+from opentelemetry.proto.trace.v1.trace_pb2 import ResourceSpans, ScopeSpans
+
+from phoenix.db.insertion.constants import DEFAULT_SPAN_BUFFER_RETRY_AFTER_SEC
+from phoenix.server.grpc_server import Servicer
+from phoenix.server.span_decoder import SpanDecoder
+from phoenix.server.span_spool import SpanSpool
+from phoenix.trace.otel import encode_span_to_otlp
+from phoenix.trace.schemas import Span, SpanContext, SpanKind, SpanStatusCode
+
+
+def _request() -> ExportTraceServiceRequest:
+    span = Span(
+        name="span",
+        context=SpanContext(trace_id=f"{1:032x}", span_id=f"{1:016x}"),
+        span_kind=SpanKind.CHAIN,
+        parent_id=None,
+        start_time=datetime(2021, 1, 1, tzinfo=timezone.utc),
+        end_time=datetime(2021, 1, 1, tzinfo=timezone.utc),
+        status_code=SpanStatusCode.OK,
+        status_message="",
+        attributes={},
+        events=[],
+        conversation=None,
+    )
+    return ExportTraceServiceRequest(
+        resource_spans=[ResourceSpans(scope_spans=[ScopeSpans(spans=[encode_span_to_otlp(span)])])]
+    )
+
+
+class TestServicer:
+    @pytest.mark.parametrize("full", [False, True])
+    async def test_export(self, full: bool) -> None:
+        queued: list[tuple[list[tuple[Span, str]], int]] = []
+
+        async def queue_spans(spans: Iterable[tuple[Span, str]], num_bytes: int) -> None:
+            queued.append((list(spans), num_bytes))
+
+        def check_span_capacity(num_spans: int, num_bytes: int) -> None:
+            assert num_spans == 1
+            if full:
+                raise QueueFull
+
+        server = grpc.aio.server()
+        port = server.add_insecure_port("127.0.0.1:0")
+        servicer = Servicer(queue_spans, SpanDecoder(0), check_span_capacity)
+        add_TraceServiceServicer_to_server(servicer, server)  # type: ignore[no-untyped-call,unused-ignore]
+        await server.start()
+        request = _request()
+        try:
+            async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+                stub = TraceServiceStub(channel)  # type: ignore[no-untyped-call,unused-ignore]
+                if not full:
+                    await stub.Export(request)
+                    assert len(queued) == 1
+                    spans, num_bytes = queued[0]
+                    assert [span.context.span_id for span, _ in spans] == [f"{1:016x}"]
+                    assert num_bytes == request.ByteSize()
+                    return
+                with pytest.raises(grpc.aio.AioRpcError) as exc_info:
+                    await stub.Export(request)
+        finally:
+            await server.stop(None)
+        assert not queued
+        assert exc_info.value.code() is grpc.StatusCode.RESOURCE_EXHAUSTED
+        metadata = dict(exc_info.value.trailing_metadata() or ())
+        retry_info = RetryInfo.FromString(metadata["google.rpc.retryinfo-bin"])
+        assert retry_info.retry_delay.seconds == DEFAULT_SPAN_BUFFER_RETRY_AFTER_SEC
+
+    async def test_export_to_span_spool(self, tmp_path: Path) -> None:
+        async def queue_spans(spans: Iterable[tuple[Span, str]], num_bytes: int) -> None:
+            pytest.fail("spans should be spooled instead of queued")
+
+        def check_span_capacity(num_spans: int, num_bytes: int) -> None:
+            pytest.fail("span capacity should not be checked when spans are spooled")
+
+        server = grpc.aio.server()
+        port = server.add_insecure_port("127.0.0.1:0")
+        spool = SpanSpool(tmp_path)
+        servicer = Servicer(queue_spans, SpanDecoder(0), check_span_capacity, spool)
+        add_TraceServiceServicer_to_server(servicer, server)  # type: ignore[no-untyped-call,unused-ignore]
+        await server.start()
+        request = _request()
+        try:
+            async with spool, grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+                stub = TraceServiceStub(channel)  # type: ignore[no-untyped-call,unused-ignore]
+                await stub.Export(request)
+                ((data, _),) = spool.read(0)
+        finally:
+            await server.stop(None)
+        assert ExportTraceServiceRequest.FromString(data) == request
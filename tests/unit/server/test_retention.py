@@ -2,7 +2,7 @@ import sys
 from asyncio import Event, sleep
 from datetime import datetime, timedelta, timezone
 from secrets import token_hex
-from typing import Any, AsyncIterator
+from typing import Any, AsyncIterator, Optional, cast
 from unittest.mock import patch
 
 import pytest
@@ -14,9 +14,12 @@ from phoenix.db import models
 from phoenix.db.constants import DEFAULT_PROJECT_TRACE_RETENTION_POLICY_ID
 from phoenix.db.types.trace_retention import (
     MaxCountRule,
+    MaxDaysRule,
     TraceRetentionCronExpression,
     TraceRetentionRule,
 )
+from phoenix.server.dml_event import DmlEvent, SpanDeleteEvent
+from phoenix.server.dml_event_handler import DmlEventHandler
 from phoenix.server.retention import TraceDataSweeper
 from phoenix.server.types import DbSessionFactory
 
@@ -29,6 +32,7 @@ class TestTraceDataSweeper:
         sweeper_trigger: Event,
         db: DbSessionFactory,
         app: ASGIApp,
+        clock: list[datetime],
     ) -> None:
         """Test that TraceDataSweeper correctly enforces trace retention policies.
 
@@ -118,7 +122,8 @@ class TestTraceDataSweeper:
                 traces_before_sweep == initial_traces
             ), f"Initial trace count mismatch in cycle {retention_cycle}"  # noqa: E501
 
-            # Execute sweeper
+            # Execute sweeper, an hour after the previous sweep
+            clock[0] += timedelta(hours=1)
             sweeper_trigger.set()
             # Use longer wait time on Windows for CI
             wait_time = 1.0 if sys.platform == "win32" else 0.1
@@ -140,6 +145,133 @@ class TestTraceDataSweeper:
 
             current_trace_count = traces_after_sweep
 
+    async def test_traces_are_deleted_in_chunks(
+        self,
+        sweeper_trigger: Event,
+        db: DbSessionFactory,
+    ) -> None:
+        now = datetime.now(timezone.utc)
+        async with db() as session:
+            project = models.Project(name=token_hex(8))
+            session.add(project)
+            await session.flush()
+            session.add(
+                models.ProjectTraceRetentionPolicy(
+                    name=token_hex(8),
+                    rule=TraceRetentionRule(root=MaxDaysRule(max_days=1)),
+                    # not due this hour, but its last run was missed
+                    cron_expression=TraceRetentionCronExpression(
+                        root=f"0 {(now.hour + 12) % 24} * * *"
+                    ),
+                    last_applied_at=now - timedelta(days=2),
+                    projects=[project],
+                )
+            )
+            session.add_all(
+                [
+                    models.Trace(
+                        project_rowid=project.id,
+                        trace_id=token_hex(16),
+                        start_time=now - timedelta(days=i, hours=-12),
+                        end_time=now - timedelta(days=i, hours=-12),
+                    )
+                    for i in range(8)
+                ]
+            )
+        events: list[DmlEvent] = []
+
+        class _EventQueue:
+            def put(self, item: DmlEvent) -> None:
+                events.append(item)
+
+        sweeper = TraceDataSweeper(
+            db,
+            cast(DmlEventHandler, _EventQueue()),
+            traces_per_chunk=2,
+            seconds_between_chunks=0,
+        )
+        async with sweeper:
+            sweeper_trigger.set()
+            for _ in range(100):
+                if len(events) == 3:
+                    break
+                await sleep(0.05)
+        # 6 traces are older than a day, and the last chunk comes up short
+        assert events == [SpanDeleteEvent((project.id,))] * 3
+        async with db() as session:
+            count = await session.scalar(
+                sa.select(func.count(models.Trace.id)).filter_by(project_rowid=project.id)
+            )
+        assert count == 2
+
+    @pytest.mark.parametrize(
+        "last_applied_at",
+        [
+            pytest.param(None, id="never-applied"),
+            pytest.param(timedelta(hours=-1), id="applied-after-last-run"),
+        ],
+    )
+    async def test_policies_are_not_applied_until_due(
+        self,
+        last_applied_at: Optional[timedelta],
+        sweeper_trigger: Event,
+        db: DbSessionFactory,
+    ) -> None:
+        now = datetime.now(timezone.utc)
+        async with db() as session:
+            project = models.Project(name=token_hex(8))
+            session.add(project)
+            await session.flush()
+            policy = models.ProjectTraceRetentionPolicy(
+                name=token_hex(8),
+                rule=TraceRetentionRule(root=MaxDaysRule(max_days=1)),
+                cron_expression=TraceRetentionCronExpression(
+                    root=f"0 {(now.hour + 12) % 24} * * *"
+                ),
+                last_applied_at=now + last_applied_at if last_applied_at else None,
+                projects=[project],
+            )
+            session.add(policy)
+            session.add(
+                models.Trace(
+                    project_rowid=project.id,
+                    trace_id=token_hex(16),
+                    start_time=now - timedelta(days=2),
+                    end_time=now - timedelta(days=2),
+                )
+            )
+        events: list[DmlEvent] = []
+
+        class _EventQueue:
+            def put(self, item: DmlEvent) -> None:
+                events.append(item)
+
+        sweeper = TraceDataSweeper(db, cast(DmlEventHandler, _EventQueue()))
+        async with sweeper:
+            sweeper_trigger.set()
+            await sleep(0.1)
+        assert not events
+        async with db() as session:
+            count = await session.scalar(
+                sa.select(func.count(models.Trace.id)).filter_by(project_rowid=project.id)
+            )
+            assert count == 1
+            assert (
+                await session.scalar(
+                    sa.select(models.ProjectTraceRetentionPolicy.last_applied_at).filter_by(
+                        id=policy.id
+                    )
+                )
+            ) == policy.last_applied_at
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[datetime]:
+    """The current time of the TraceDataSweeper, which the test can move forward."""
+    clock = [datetime.now(timezone.utc)]
+    monkeypatch.setattr(TraceDataSweeper, "_now", staticmethod(lambda: clock[0]))
+    return clock
+
 
 @pytest.fixture
 async def sweeper_trigger() -> AsyncIterator[Event]:
@@ -0,0 +1,99 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from openinference.semconv.resource import ResourceAttributes
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+from opentelemetry.proto.common.v1.common_pb2 import AnyValue, KeyValue
+from opentelemetry.proto.resource.v1.resource_pb2 import Resource
+from opentelemetry.proto.trace.v1.trace_pb2 import ResourceSpans, ScopeSpans
+
+from phoenix.config import DEFAULT_PROJECT_NAME
+from phoenix.server.span_decoder import SpanDecoder
+from phoenix.trace.otel import encode_span_to_otlp
+from phoenix.trace.schemas import Span, SpanContext, SpanKind, SpanStatusCode
+
+_T0 = datetime(2021, 1, 1, tzinfo=timezone.utc)
+
+
+def _span(i: int) -> Span:
+    return Span(
+        name=f"span-{i}",
+        context=SpanContext(trace_id=f"{i // 10:032x}", span_id=f"{i + 1:016x}"),
+        span_kind=SpanKind.LLM,
+        parent_id=None,
+        start_time=_T0 + timedelta(seconds=i),
+        end_time=_T0 + timedelta(seconds=i + 1),
+        status_code=SpanStatusCode.OK,
+        status_message="",
+        attributes={"input": {"value": f"input-{i}"}, "openinference": {"span": {"kind": "LLM"}}},
+        events=[],
+        conversation=None,
+    )
+
+
+def _request() -> ExportTraceServiceRequest:
+    return ExportTraceServiceRequest(
+        resource_spans=[
+            ResourceSpans(
+                resource=Resource(
+                    attributes=[
+                        KeyValue(
+                            key=ResourceAttributes.PROJECT_NAME,
+                            value=AnyValue(string_value="abc"),
+                        )
+                    ]
+                ),
+                scope_spans=[
+                    ScopeSpans(spans=[encode_span_to_otlp(_span(i)) for i in range(0, 20)]),
+                    ScopeSpans(spans=[encode_span_to_otlp(_span(i)) for i in range(20, 30)]),
+                ],
+            ),
+            ResourceSpans(
+                scope_spans=[
+                    ScopeSpans(spans=[encode_span_to_otlp(_span(i)) for i in range(30, 35)]),
+                ],
+            ),
+        ]
+    )
+
+
+class TestSpanDecoder:
+    @pytest.mark.parametrize(
+        "max_workers,use_processes",
+        [
+            pytest.param(0, False, id="inline"),
+            pytest.param(2, False, id="threads"),
+            pytest.param(2, True, id="processes"),
+        ],
+    )
+    @pytest.mark.parametrize("max_spans_per_task", [1, 7, 100])
+    async def test_decode(
+        self,
+        max_workers: int,
+        use_processes: bool,
+        max_spans_per_task: int,
+    ) -> None:
+        decoder = SpanDecoder(
+            max_workers,
+            use_processes=use_processes,
+            max_spans_per_task=max_spans_per_task,
+        )
+        async with decoder:
+            decoded = await decoder.decode(_request())
+        assert [(span.name, project_name) for span, project_name in decoded] == [
+            *((f"span-{i}", "abc") for i in range(30)),
+            *((f"span-{i}", DEFAULT_PROJECT_NAME) for i in range(30, 35)),
+        ]
+        span, _ = decoded[7]
+        assert span.context == _span(7).context
+        assert span.start_time == _span(7).start_time
+        assert span.attributes["input"]["value"] == "input-7"
+
+    async def test_decode_outside_of_context(self) -> None:
+        assert len(await SpanDecoder(2).decode(_request())) == 35
+
+    def test_invalid_arguments(self) -> None:
+        with pytest.raises(ValueError):
+            SpanDecoder(-1)
+        with pytest.raises(ValueError):
+            SpanDecoder(max_spans_per_task=0)
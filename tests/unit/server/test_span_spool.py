@@ -0,0 +1,175 @@
+from asyncio import QueueFull, gather, sleep
+from datetime import datetime, timezone
+from pathlib import Path
+from threading import current_thread
+from typing import Any
+
+import pytest
+from opentelemetry.proto.collector.trace.v1.trace_service_pb2 import ExportTraceServiceRequest
+from opentelemetry.proto.trace.v1.trace_pb2 import ResourceSpans, ScopeSpans
+from sqlalchemy import func, select
+
+from phoenix.db import models
+from phoenix.db.bulk_inserter import BulkInserter
+from phoenix.server.dml_event import DmlEvent
+from phoenix.server.span_decoder import SpanDecoder
+from phoenix.server.span_spool import SpanSpool, SpanSpoolReader
+from phoenix.server.types import DbSessionFactory
+from phoenix.trace.otel import encode_span_to_otlp
+from phoenix.trace.schemas import Span, SpanContext, SpanKind, SpanStatusCode
+
+
+class _EventQueue:
+    def __init__(self) -> None:
+        self.events: list[DmlEvent] = []
+
+    def put(self, item: DmlEvent) -> None:
+        self.events.append(item)
+
+
+def _request(*ids: int) -> bytes:
+    start_time = datetime(2021, 1, 1, tzinfo=timezone.utc)
+    spans = [
+        encode_span_to_otlp(
+            Span(
+                name="span",
+                context=SpanContext(trace_id=f"{i:032x}", span_id=f"{i + 1:016x}"),
+                span_kind=SpanKind.CHAIN,
+                parent_id=None,
+                start_time=start_time,
+                end_time=start_time,
+                status_code=SpanStatusCode.OK,
+                status_message="",
+                attributes={},
+                events=[],
+                conversation=None,
+            )
+        )
+        for i in ids
+    ]
+    request = ExportTraceServiceRequest(
+        resource_spans=[ResourceSpans(scope_spans=[ScopeSpans(spans=spans)])]
+    )
+    data: bytes = request.SerializeToString()
+    return data
+
+
+def _segments(directory: Path) -> list[str]:
+    return sorted(path.name for path in directory.glob("*.spool"))
+
+
+class TestSpanSpool:
+    async def test_append_read_and_commit(self, tmp_path: Path) -> None:
+        spool = SpanSpool(tmp_path, max_segment_bytes=1)
+        async with spool:
+            for i in range(3):
+                await spool.append(f"record-{i}".encode())
+            records = spool.read(0)
+            assert [data for data, _ in records] == [b"record-0", b"record-1", b"record-2"]
+            assert spool.read(records[0][1]) == records[1:]
+            assert spool.read(records[-1][1]) == []
+            assert len(_segments(tmp_path)) == 3
+            await spool.commit(records[1][1])
+            assert spool.committed_position == records[1][1]
+            assert len(_segments(tmp_path)) == 1
+            assert spool.num_bytes == records[2][1] - records[1][1]
+
+    async def test_uncommitted_records_survive_restart(self, tmp_path: Path) -> None:
+        async with (spool := SpanSpool(tmp_path)):
+            await spool.append(b"committed")
+            await spool.append(b"uncommitted")
+            await spool.commit(spool.read(0)[0][1])
+        async with (spool := SpanSpool(tmp_path)):
+            assert [data for data, _ in spool.read(spool.committed_position)] == [b"uncommitted"]
+            await spool.append(b"appended")
+            assert [data for data, _ in spool.read(spool.committed_position)] == [
+                b"uncommitted",
+                b"appended",
+            ]
+
+    async def test_torn_write_is_truncated(self, tmp_path: Path) -> None:
+        async with (spool := SpanSpool(tmp_path)):
+            await spool.append(b"complete")
+        (segment,) = tmp_path.glob("*.spool")
+        with open(segment, "ab") as f:
+            f.write(b"\xff\x00\x00\x00torn")
+        async with (spool := SpanSpool(tmp_path)):
+            await spool.append(b"appended")
+            assert [data for data, _ in spool.read(0)] == [b"complete", b"appended"]
+
+    async def test_append_raises_queue_full(self, tmp_path: Path) -> None:
+        async with (spool := SpanSpool(tmp_path, max_bytes=100)):
+            # an empty spool admits any record, so that a large request can't be stuck
+            await spool.append(b"x" * 200)
+            with pytest.raises(QueueFull):
+                await spool.append(b"x")
+            await spool.commit(spool.read(0)[0][1])
+            await spool.append(b"x")
+
+    async def test_files_are_written_off_the_event_loop(
+        self,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        threads: set[str] = set()
+        for name in ("_write", "_fsync", "_checkpoint"):
+            method = getattr(SpanSpool, name)
+
+            def record_thread(*args: Any, _method: Any = method, **kwargs: Any) -> Any:
+                threads.add(current_thread().name)
+                return _method(*args, **kwargs)
+
+            monkeypatch.setattr(SpanSpool, name, record_thread)
+        async with (spool := SpanSpool(tmp_path)):
+            await gather(*(spool.append(f"record-{i}".encode()) for i in range(3)))
+            await spool.commit(spool.read(0)[-1][1])
+        assert threads and current_thread().name not in threads
+
+
+class TestSpanSpoolReader:
+    @pytest.mark.parametrize("num_failures", [0, 2])
+    async def test_spans_are_inserted_and_committed(
+        self,
+        db: DbSessionFactory,
+        tmp_path: Path,
+        num_failures: int,
+    ) -> None:
+        spool = SpanSpool(tmp_path)
+        bulk_inserter = BulkInserter(
+            db,
+            event_queue=_EventQueue(),
+            sleep=0.01,
+            retry_delay_sec=0.01,
+            max_spans_buffered=3,
+            span_spool=spool,
+        )
+        insert_spans = bulk_inserter._insert_spans
+        failures = iter(range(num_failures))
+
+        async def fail_to_insert_spans(spans: list[tuple[Span, str]]) -> bool:
+            if next(failures, None) is not None:
+                return False
+            return await insert_spans(spans)
+
+        bulk_inserter._insert_spans = fail_to_insert_spans  # type: ignore[method-assign]
+        async with spool:
+            for i in range(0, 10, 2):
+                await spool.append(_request(i, i + 1))
+            end = spool.read(0)[-1][1]
+            async with bulk_inserter as (_, _, queue_spans, _, _):
+                async with SpanSpoolReader(
+                    spool,
+                    SpanDecoder(0),
+                    queue_spans,
+                    bulk_inserter.has_span_capacity,
+                    sleep_seconds=0.01,
+                ):
+                    for _ in range(100):
+                        if spool.committed_position == end:
+                            break
+                        await sleep(0.05)
+                    else:
+                        pytest.fail("span spool was not committed")
+        assert next(failures, None) is None
+        async with db() as session:
+            assert await session.scalar(select(func.count(models.Span.id))) == 10
@@ -0,0 +1,114 @@
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+import pytest
+
+from phoenix.server.types import DbSessionFactory, UserId
+
+
+def _db(name: str, opened: list[str]) -> Callable[[], AbstractAsyncContextManager[Any]]:
+    @asynccontextmanager
+    async def factory() -> AsyncIterator[Any]:
+        opened.append(name)
+        yield name
+
+    return factory
+
+
+class TestDbSessionFactory:
+    @pytest.fixture
+    def now(self, monkeypatch: pytest.MonkeyPatch) -> list[float]:
+        now = [100.0]
+        monkeypatch.setattr("phoenix.server.types.monotonic", lambda: now[0])
+        return now
+
+    async def test_reads_go_to_primary_without_replica(self) -> None:
+        opened: list[str] = []
+        db = DbSessionFactory(db=_db("primary", opened), dialect="postgresql")
+        assert not db.has_read_replica
+        assert db.reader(UserId(1)) is db
+        db.record_write(UserId(1))
+        async with db.read(UserId(1)):
+            pass
+        assert opened == ["primary"]
+
+    async def test_reads_go_to_primary_after_write_by_same_user(self, now: list[float]) -> None:
+        opened: list[str] = []
+        db = DbSessionFactory(
+            db=_db("primary", opened),
+            dialect="postgresql",
+            read_replica=_db("replica", opened),
+            read_your_writes_seconds=5,
+        )
+        assert db.has_read_replica
+        async with db.read(UserId(1)):
+            pass
+        db.record_write(UserId(1))
+        async with db.read(UserId(1)):
+            pass
+        async with db.read(UserId(2)):
+            pass
+        async with db.read():
+            pass
+        now[0] += 5
+        async with db.read(UserId(1)):
+            pass
+        async with db():
+            pass
+        assert opened == ["replica", "primary", "replica", "replica", "replica", "primary"]
+
+    async def test_reader_decides_on_each_session(self, now: list[float]) -> None:
+        opened: list[str] = []
+        db = DbSessionFactory(
+            db=_db("primary", opened),
+            dialect="postgresql",
+            read_replica=_db("replica", opened),
+            read_your_writes_seconds=5,
+        )
+        reader = db.reader(None)
+        assert reader.dialect is db.dialect
+        async with reader():
+            pass
+        db.record_write(None)
+        async with reader():
+            pass
+        assert opened == ["replica", "primary"]
+
+    async def test_reader_reads_recent_updates_from_primary(self) -> None:
+        opened: list[str] = []
+        db = DbSessionFactory(
+            db=_db("primary", opened),
+            dialect="postgresql",
+            read_replica=_db("replica", opened),
+            read_your_writes_seconds=5,
+        )
+        reader = db.reader(None)
+        now = datetime.now(timezone.utc)
+        reader.read_updates_since(None)
+        reader.read_updates_since(now - timedelta(seconds=10))
+        async with reader():
+            pass
+        reader.read_updates_since(now)
+        async with reader():
+            pass
+        async with db.reader(None)():
+            pass
+        assert opened == ["replica", "primary", "replica"]
+
+    async def test_reader_records_writes_on_primary(self) -> None:
+        opened: list[str] = []
+        db = DbSessionFactory(
+            db=_db("primary", opened),
+            dialect="postgresql",
+            read_replica=_db("replica", opened),
+            read_your_writes_seconds=5,
+        )
+        reader = db.reader(UserId(1))
+        reader.record_write(UserId(1))
+        async with db.read(UserId(1)):
+            pass
+        async with reader.reader(UserId(2))():
+            pass
+        assert opened == ["primary", "replica"]
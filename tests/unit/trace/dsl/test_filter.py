@@ -11,7 +11,13 @@ from sqlalchemy import select
 import phoenix.trace.dsl.filter
 from phoenix.db import models
 from phoenix.server.types import DbSessionFactory
-from phoenix.trace.dsl.filter import SpanFilter, _apply_eval_aliasing, _get_attribute_keys_list
+from phoenix.trace.dsl.filter import (
+    Projector,
+    SpanFilter,
+    _apply_eval_aliasing,
+    _compile_filter,
+    _get_attribute_keys_list,
+)
 
 
 @pytest.mark.parametrize(
@@ -101,6 +107,10 @@ def test_get_attribute_keys_list(expression: str, expected: Optional[list[str]])
             "first.value in (1,) and second.value in ('2',) and '3' in third.value",
             "and_(attributes[['first', 'value']].as_float().in_((1,)), attributes[['second', 'value']].as_string().in_(('2',)), TextContains(attributes[['third', 'value']].as_string(), '3'))",  # noqa E501
         ),
+        (
+            "'abc' in input.value and 'ab' in output.value and 'abc' not in output.value",
+            "and_(span_io_value_contains('input', 'abc'), span_io_value_contains('output', 'ab'), not_(TextContains(attributes[['output', 'value']].as_string(), 'abc')))",  # noqa E501
+        ),
         (
             "'1.0' < my.value < 2.0",
             "and_('1.0' < attributes[['my', 'value']].as_string(), attributes[['my', 'value']].as_float() < 2.0)"  # noqa E501
@@ -157,6 +167,7 @@ async def test_filter_translated(
         "uuid4",
         return_value=UUID(hex="00000000000000000000000000000000"),
     ):
+        _compile_filter.cache_clear()
         f = SpanFilter(expression)
     assert unparse(f.translated).strip() == expected
     # next line is only to test that the syntax is accepted
@@ -253,3 +264,17 @@ def test_apply_eval_aliasing(filter_condition: str, expected: str) -> None:
     ):
         aliased, _ = _apply_eval_aliasing(filter_condition)
     assert aliased == expected
+
+
+def test_compiled_filters_are_cached() -> None:
+    condition = "span_kind == 'LLM' and evals['Q&A'].score > 0.5"
+    f = SpanFilter(condition)
+    assert SpanFilter(condition).compiled is f.compiled
+    assert SpanFilter(condition, valid_eval_names=["Q&A"]).compiled is not f.compiled
+    with pytest.raises(SyntaxError):
+        SpanFilter(condition, valid_eval_names=["Hallucination"])
+    with pytest.raises(SyntaxError):
+        SpanFilter(condition, valid_eval_names=["Hallucination"])
+    assert Projector("attributes['input.value']").compiled is (
+        Projector("attributes['input.value']").compiled
+    )
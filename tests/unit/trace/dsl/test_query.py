@@ -128,6 +128,36 @@ async def test_select(
     )
 
 
+@pytest.mark.parametrize(
+    "sq",
+    [
+        pytest.param(SpanQuery(), id="all"),
+        pytest.param(SpanQuery().select("name", tcp="llm.token_count.prompt"), id="select"),
+        pytest.param(
+            SpanQuery().explode("retrieval.documents", content="document.content"), id="explode"
+        ),
+    ],
+)
+async def test_iter_dataframes(
+    sq: SpanQuery,
+    db: DbSessionFactory,
+    default_project: Any,
+    abc_project: Any,
+) -> None:
+    async with db() as session:
+        expected = await session.run_sync(sq, project_name="abc")
+        actual = await session.run_sync(
+            lambda s: list(sq.iter_dataframes(s, project_name="abc", chunk_size=3))
+        )
+    # explosions are post-processed in pandas, so they come in a single chunk
+    assert [len(df) for df in actual] == ([len(expected)] if sq._explode else [3, 1])
+    assert_frame_equal(
+        pd.concat(actual)[expected.columns].sort_index(),
+        expected.sort_index(),
+        check_dtype=False,
+    )
+
+
 async def test_select_parent_id_as_span_id(
     db: DbSessionFactory,
     default_project: Any,
@@ -428,6 +458,32 @@ async def test_filter_for_not_substring_case_sensitive_not_glob_not_like(
     )
 
 
+async def test_filter_for_negated_substring_excludes_missing_values(
+    db: DbSessionFactory,
+    default_project: Any,
+    abc_project: Any,
+) -> None:
+    sq = (
+        SpanQuery()
+        .select("input.value")
+        .where(
+            "not ('y%*' in input.value)",
+        )
+    )
+    expected = pd.DataFrame(
+        {
+            "context.span_id": ["234", "345"],
+            "input.value": ["xy%z*", "XY%*Z"],
+        }
+    ).set_index("context.span_id")
+    async with db() as session:
+        actual = await session.run_sync(sq, project_name="abc")
+    assert_frame_equal(
+        actual.sort_index().sort_index(axis=1),
+        expected.sort_index().sort_index(axis=1),
+    )
+
+
 async def test_filter_on_nonexistent_is_not_none(
     db: DbSessionFactory,
     default_project: Any,